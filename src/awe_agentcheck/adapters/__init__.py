@@ -5,6 +5,7 @@ import shutil as shutil
 import subprocess as subprocess
 import time as time
 
+from awe_agentcheck.adapters.async_runner import AsyncParticipantRunner
 from awe_agentcheck.adapters.base import (
     AdapterResult,
     DEFAULT_COMMANDS,
@@ -21,11 +22,18 @@ from awe_agentcheck.adapters.base import (
     parse_verdict,
     split_extra_args,
 )
+from awe_agentcheck.adapters.circuit_breaker import (
+    PROVIDER_CIRCUIT_BREAKER,
+    ProviderCircuitBreaker,
+    parse_provider_fallbacks,
+)
 from awe_agentcheck.adapters.claude import ClaudeAdapter
 from awe_agentcheck.adapters.codex import CodexAdapter, normalize_codex_exec_output
 from awe_agentcheck.adapters.factory import ProviderFactory
 from awe_agentcheck.adapters.gemini import GeminiAdapter
+from awe_agentcheck.adapters.response_cache import ParticipantResponseCache, normalize_cache_mode
 from awe_agentcheck.adapters.runner import ParticipantRunner
+from awe_agentcheck.adapters.scheduler import PROVIDER_SCHEDULER, ProviderLimit, ProviderScheduler, parse_provider_limits
 
 __all__ = [
     'AdapterResult',
@@ -38,6 +46,16 @@ __all__ = [
     'GeminiAdapter',
     'ProviderFactory',
     'ParticipantRunner',
+    'AsyncParticipantRunner',
+    'ProviderScheduler',
+    'ProviderLimit',
+    'PROVIDER_SCHEDULER',
+    'parse_provider_limits',
+    'ProviderCircuitBreaker',
+    'PROVIDER_CIRCUIT_BREAKER',
+    'parse_provider_fallbacks',
+    'ParticipantResponseCache',
+    'normalize_cache_mode',
     'parse_verdict',
     'parse_next_action',
     'split_extra_args',
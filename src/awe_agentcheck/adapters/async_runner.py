@@ -0,0 +1,489 @@
+from __future__ import annotations
+
+import asyncio
+import codecs
+from collections import deque
+from concurrent.futures import CancelledError as FutureCancelledError
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+import contextvars
+from dataclasses import replace
+from pathlib import Path
+import subprocess
+import threading
+import time
+from typing import Callable
+
+from awe_agentcheck.adapters.base import AdapterResult, ProviderAdapter
+from awe_agentcheck.adapters.runner import _MIN_ATTEMPT_TIMEOUT_SECONDS, ParticipantCancelled, ParticipantRunner
+from awe_agentcheck.adapters.scheduler import AdmissionTicket
+from awe_agentcheck.observability import get_logger, get_round_no, get_task_id, set_task_context
+from awe_agentcheck.participants import Participant
+
+_log = get_logger('awe_agentcheck.adapters.async_runner')
+
+_READ_CHUNK_BYTES = 64 * 1024
+_KILL_GRACE_SECONDS = 2.0
+# Fallback poll cadence for coalescing callbacks that do not expose their window.
+_DEFAULT_POLL_SECONDS = 0.1
+_STREAM_RELAY_WORKERS = 8
+# How often a blocked synchronous caller checks its stop signal.
+_STOP_POLL_SECONDS = 0.1
+
+
+class _EventLoopThread:
+    """One daemon thread running an asyncio loop shared by every async runner."""
+
+    def __init__(self, name: str):
+        self._name = name
+        self._lock = threading.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None or self._loop.is_closed():
+                loop = asyncio.new_event_loop()
+                ready = threading.Event()
+
+                def _serve() -> None:
+                    asyncio.set_event_loop(loop)
+                    loop.call_soon(ready.set)
+                    loop.run_forever()
+
+                threading.Thread(target=_serve, name=self._name, daemon=True).start()
+                ready.wait()
+                self._loop = loop
+            return self._loop
+
+
+_SHARED_LOOP = _EventLoopThread('awe-async-runner')
+# Relay drains get their own threads: in the loop's default executor they
+# could queue behind work that is itself waiting for this call to finish.
+_STREAM_RELAY_EXECUTOR = ThreadPoolExecutor(max_workers=_STREAM_RELAY_WORKERS, thread_name_prefix='awe-stream-relay')
+
+
+class _StreamRelay:
+    """Runs one call's stream callbacks off the event loop, in order.
+
+    Callbacks may write events to the database, so running them on the
+    shared loop thread would stall every concurrent call. Each call queues
+    its callbacks here and at most one executor job drains the queue at a
+    time, which keeps chunks in the order they were read.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop):
+        self._loop = loop
+        self._lock = threading.Lock()
+        self._pending: deque[Callable[[], object]] = deque()
+        self._draining: asyncio.Future | None = None
+
+    def submit(self, callback: Callable[[], object]) -> None:
+        with self._lock:
+            self._pending.append(callback)
+            if self._draining is not None:
+                return
+            # Set under the lock so _drain cannot finish before we record it.
+            self._draining = self._loop.run_in_executor(
+                _STREAM_RELAY_EXECUTOR,
+                contextvars.copy_context().run,
+                self._drain,
+            )
+
+    async def wait(self) -> None:
+        draining = self._draining
+        if draining is not None:
+            await draining
+
+    def _drain(self) -> None:
+        while True:
+            with self._lock:
+                if not self._pending:
+                    self._draining = None
+                    return
+                callback = self._pending.popleft()
+            try:
+                callback()
+            except Exception:
+                _log.exception('stream_callback_failed')
+
+
+class AsyncParticipantRunner(ParticipantRunner):
+    """Participant runner on ``asyncio`` subprocesses.
+
+    :meth:`arun` reads both pipes with native stream readers on the event
+    loop, enforces the deadline with ``asyncio.wait_for`` and kills the child
+    on timeout, so a streamed call no longer needs its own pump threads or a
+    polling caller. :meth:`run` is the synchronous facade used by
+    ``WorkflowEngine``: it submits :meth:`arun` to one shared loop thread and
+    blocks for the result; a caller's stop signal cancels that task, which
+    kills the child. Argument handling, retries and result parsing are
+    inherited from :class:`ParticipantRunner`.
+    """
+
+    def _run_live(
+        self,
+        *,
+        participant: Participant,
+        prompt: str,
+        cwd: Path,
+        timeout_seconds: int = 900,
+        model: str | None = None,
+        model_params: str | None = None,
+        claude_team_agents: bool = False,
+        codex_multi_agents: bool = False,
+        on_stream: Callable[[str, str], None] | None = None,
+        hedge_delay_seconds: float | None = None,
+        should_stop: Callable[[], bool] | None = None,
+    ) -> AdapterResult:
+        if hedge_delay_seconds is not None:
+            # Hedged calls race two processes and cancel the loser; that path lives on the thread runner.
+            return super()._run_live(
+                participant=participant,
+                prompt=prompt,
+                cwd=cwd,
+                timeout_seconds=timeout_seconds,
+                model=model,
+                model_params=model_params,
+                claude_team_agents=claude_team_agents,
+                codex_multi_agents=codex_multi_agents,
+                on_stream=on_stream,
+                hedge_delay_seconds=hedge_delay_seconds,
+                should_stop=should_stop,
+            )
+        task_id, round_no = get_task_id(), get_round_no()
+        settled = threading.Event()
+
+        async def _call() -> AdapterResult:
+            # Loop tasks start from the loop thread's context; carry the caller's over.
+            set_task_context(task_id=task_id, round_no=round_no)
+            try:
+                return await self.arun(
+                    participant=participant,
+                    prompt=prompt,
+                    cwd=cwd,
+                    timeout_seconds=timeout_seconds,
+                    model=model,
+                    model_params=model_params,
+                    claude_team_agents=claude_team_agents,
+                    codex_multi_agents=codex_multi_agents,
+                    on_stream=on_stream,
+                    should_stop=should_stop,
+                )
+            finally:
+                settled.set()
+
+        future = asyncio.run_coroutine_threadsafe(_call(), _SHARED_LOOP.loop())
+        if should_stop is None:
+            return future.result()
+        while True:
+            try:
+                return future.result(timeout=_STOP_POLL_SECONDS)
+            except FutureTimeoutError:
+                if not should_stop():
+                    continue
+            except FutureCancelledError:
+                pass
+            future.cancel()
+            # Cancellation reaches the loop asynchronously; wait for the child to be killed.
+            settled.wait(timeout=_KILL_GRACE_SECONDS + 1.0)
+            raise ParticipantCancelled(participant.provider)
+
+    async def arun(
+        self,
+        *,
+        participant: Participant,
+        prompt: str,
+        cwd: Path,
+        timeout_seconds: int = 900,
+        model: str | None = None,
+        model_params: str | None = None,
+        claude_team_agents: bool = False,
+        codex_multi_agents: bool = False,
+        on_stream: Callable[[str, str], None] | None = None,
+        should_stop: Callable[[], bool] | None = None,
+    ) -> AdapterResult:
+        task_id = get_task_id()
+        routed = self._route_participant(
+            participant=participant,
+            model=model,
+            model_params=model_params,
+            task_id=task_id,
+        )
+        if isinstance(routed, AdapterResult):
+            return routed
+        participant, model, model_params = routed
+        prepared = self._prepare_run(
+            participant=participant,
+            model=model,
+            model_params=model_params,
+            claude_team_agents=claude_team_agents,
+            codex_multi_agents=codex_multi_agents,
+        )
+        if isinstance(prepared, AdapterResult):
+            self.circuit_breaker.release_probe(participant.provider, model=model)
+            return prepared
+        provider, adapter, argv, effective_command = prepared
+        try:
+            ticket = await self._admit(
+                provider,
+                model=model,
+                task_id=task_id,
+                timeout=timeout_seconds,
+                should_stop=should_stop,
+            )
+        except asyncio.CancelledError:
+            self.circuit_breaker.release_probe(provider, model=model)
+            raise
+        if ticket is None:
+            self.circuit_breaker.release_probe(provider, model=model)
+            if should_stop is not None and should_stop():
+                raise ParticipantCancelled(provider)
+            return self._queue_timeout_result(provider=provider, timeout_seconds=timeout_seconds)
+        try:
+            result = await self._arun_attempts(
+                provider=provider,
+                adapter=adapter,
+                argv=argv,
+                effective_command=effective_command,
+                prompt=prompt,
+                cwd=cwd,
+                timeout_seconds=timeout_seconds,
+                on_stream=on_stream,
+            )
+            result = replace(result, provider=provider)
+        except asyncio.CancelledError:
+            self.circuit_breaker.release_probe(provider, model=model)
+            raise
+        finally:
+            self.scheduler.release(ticket)
+        self.circuit_breaker.record(
+            provider,
+            model=model,
+            returncode=result.returncode,
+            output=result.output,
+            task_id=task_id,
+        )
+        return result
+
+    async def _admit(
+        self,
+        provider: str,
+        *,
+        model: str | None,
+        task_id: str | None,
+        timeout: float,
+        should_stop: Callable[[], bool] | None = None,
+    ) -> AdmissionTicket | None:
+        """Wait for a provider slot on a thread of its own, like a caller of the thread runner.
+
+        Queued calls may wait for minutes; parked in a shared executor they
+        would take the threads the admitted calls need to finish and release
+        their slots.
+        """
+        loop = asyncio.get_running_loop()
+        admitted: asyncio.Future = loop.create_future()
+
+        def deliver(ticket: AdmissionTicket | None, error: BaseException | None) -> None:
+            if admitted.cancelled():
+                self.scheduler.release(ticket)
+            elif error is not None:
+                admitted.set_exception(error)
+            else:
+                admitted.set_result(ticket)
+
+        def wait() -> None:
+            try:
+                ticket = self.scheduler.acquire(
+                    provider,
+                    model=model,
+                    task_id=task_id,
+                    timeout=timeout,
+                    should_stop=lambda: admitted.cancelled() or (should_stop is not None and should_stop()),
+                )
+            except Exception as exc:
+                loop.call_soon_threadsafe(deliver, None, exc)
+                return
+            loop.call_soon_threadsafe(deliver, ticket, None)
+
+        context = contextvars.copy_context()
+        threading.Thread(target=context.run, args=(wait,), name='awe-admission', daemon=True).start()
+        return await admitted
+
+    async def _arun_attempts(
+        self,
+        *,
+        provider: str,
+        adapter: ProviderAdapter,
+        argv: list[str],
+        effective_command: str,
+        prompt: str,
+        cwd: Path,
+        timeout_seconds: int,
+        on_stream: Callable[[str, str], None] | None,
+    ) -> AdapterResult:
+        attempts = self.timeout_retries + 1
+        current_prompt = prompt
+        started = time.monotonic()
+        deadline = started + max(0.05, float(timeout_seconds))
+        completed = None
+        attempts_made = 0
+
+        for attempt in range(1, attempts + 1):
+            remaining_budget = self._remaining_timeout_budget_seconds(deadline=deadline)
+            if remaining_budget <= 0:
+                break
+            attempt_timeout = self._compute_attempt_timeout_seconds(
+                remaining_budget=remaining_budget,
+                attempts_left=attempts - attempt + 1,
+            )
+            if attempt_timeout <= 0:
+                break
+
+            attempts_made += 1
+            runtime_argv, runtime_input = adapter.prepare_runtime_invocation(argv=argv, prompt=current_prompt)
+            try:
+                completed = await self._arun_process(
+                    argv=runtime_argv,
+                    runtime_input=runtime_input,
+                    cwd=cwd,
+                    timeout_seconds=attempt_timeout,
+                    on_stream=on_stream,
+                    env=self._build_subprocess_env(cwd),
+                )
+                break
+            except FileNotFoundError:
+                return self._runtime_error_result(
+                    reason=f'command_not_found provider={provider} command={effective_command}',
+                    duration_seconds=(time.monotonic() - started),
+                )
+            except subprocess.TimeoutExpired:
+                if attempt >= attempts:
+                    break
+                current_prompt = self._clip_prompt_for_retry(current_prompt)
+                remaining = self._remaining_timeout_budget_seconds(deadline=deadline)
+                pause = min(
+                    max(0.0, remaining - min(_MIN_ATTEMPT_TIMEOUT_SECONDS, remaining)),
+                    self._timeout_retry_backoff_seconds(attempt=attempt),
+                )
+                if pause > 0:
+                    await asyncio.sleep(pause)
+                if self._remaining_timeout_budget_seconds(deadline=deadline) <= 0:
+                    break
+
+        return self._finish_run(
+            provider=provider,
+            adapter=adapter,
+            effective_command=effective_command,
+            completed=completed,
+            elapsed=time.monotonic() - started,
+            timeout_seconds=timeout_seconds,
+            attempts=attempts,
+            attempts_made=attempts_made,
+        )
+
+    @staticmethod
+    async def _arun_process(
+        *,
+        argv: list[str],
+        runtime_input: str,
+        cwd: Path,
+        timeout_seconds: float,
+        on_stream: Callable[[str, str], None] | None = None,
+        env: dict[str, str] | None = None,
+    ) -> subprocess.CompletedProcess:
+        process = await asyncio.create_subprocess_exec(
+            *argv,
+            stdin=asyncio.subprocess.PIPE if runtime_input else asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            cwd=str(cwd),
+            env=env,
+        )
+        stdout_chunks: list[str] = []
+        stderr_chunks: list[str] = []
+        relay = _StreamRelay(asyncio.get_running_loop()) if on_stream is not None else None
+
+        async def feed() -> None:
+            if not runtime_input or process.stdin is None:
+                return
+            try:
+                process.stdin.write(runtime_input.encode('utf-8'))
+                await process.stdin.drain()
+            except (BrokenPipeError, ConnectionResetError):
+                pass
+            finally:
+                process.stdin.close()
+
+        async def pump(reader: asyncio.StreamReader | None, stream_name: str, sink: list[str]) -> None:
+            if reader is None:
+                return
+            decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+            while True:
+                data = await reader.read(_READ_CHUNK_BYTES)
+                text = decoder.decode(data, final=not data)
+                if text:
+                    sink.append(text)
+                    if relay is not None:
+                        relay.submit(lambda text=text: on_stream(stream_name, text))
+                if not data:
+                    return
+
+        poll_stream = getattr(on_stream, 'poll', None)
+        flush_stream = getattr(on_stream, 'flush', None)
+
+        async def tick() -> None:
+            # Emit coalescing windows that expire while the participant is silent.
+            interval = getattr(on_stream, 'window_seconds', None)
+            interval = max(0.05, float(interval)) if interval else _DEFAULT_POLL_SECONDS
+            while True:
+                await asyncio.sleep(interval)
+                relay.submit(poll_stream)
+
+        ticker = asyncio.ensure_future(tick()) if callable(poll_stream) else None
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(
+                    feed(),
+                    pump(process.stdout, 'stdout', stdout_chunks),
+                    pump(process.stderr, 'stderr', stderr_chunks),
+                    process.wait(),
+                ),
+                timeout=max(0.05, float(timeout_seconds)),
+            )
+        except asyncio.TimeoutError:
+            try:
+                process.kill()
+            except ProcessLookupError:
+                pass
+            try:
+                await asyncio.wait_for(process.wait(), timeout=_KILL_GRACE_SECONDS)
+            except asyncio.TimeoutError:
+                pass
+            raise subprocess.TimeoutExpired(cmd=argv, timeout=timeout_seconds) from None
+        finally:
+            if process.returncode is None:
+                # Cancelled by the caller: do not leave the child running.
+                try:
+                    process.kill()
+                except ProcessLookupError:
+                    pass
+                try:
+                    await asyncio.wait_for(process.wait(), timeout=_KILL_GRACE_SECONDS)
+                except asyncio.TimeoutError:
+                    pass
+            if ticker is not None:
+                ticker.cancel()
+            if relay is not None:
+                if callable(flush_stream):
+                    relay.submit(flush_stream)
+                await relay.wait()
+
+        return subprocess.CompletedProcess(
+            args=argv,
+            returncode=int(process.returncode or 0),
+            stdout=''.join(stdout_chunks),
+            stderr=''.join(stderr_chunks),
+        )
+
+
+__all__ = ['AsyncParticipantRunner']
@@ -19,6 +19,8 @@ class AdapterResult:
     next_action: str | None
     returncode: int
     duration_seconds: float
+    # Provider that actually served the call (a breaker fallback or hedge leg may differ from the participant's).
+    provider: str | None = None
 
 
 DEFAULT_PROVIDER_REGISTRY = {
@@ -0,0 +1,300 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+import threading
+import time
+from typing import Callable, Collection
+
+from awe_agentcheck.adapters.listeners import WeakListeners
+from awe_agentcheck.adapters.scheduler import limit_key
+from awe_agentcheck.observability import get_logger
+
+_log = get_logger('awe_agentcheck.adapters.circuit_breaker')
+
+CIRCUIT_CLOSED = 'closed'
+CIRCUIT_OPEN = 'open'
+CIRCUIT_HALF_OPEN = 'half_open'
+DEFAULT_BREAKER_COOLDOWN_SECONDS = 300.0
+# Only failures that say the provider itself is degraded trip the breaker;
+# ``command_failed`` is just as often caused by the prompt or workspace.
+_TRIP_REASONS = ('provider_limit', 'command_timeout')
+
+
+@dataclass(frozen=True)
+class CircuitRoute:
+    """Where a participant call should go; ``blocked`` carries the error when nowhere can take it."""
+
+    provider: str
+    model: str | None = None
+    model_params: str | None = None
+    fallback_from: str | None = None
+    blocked: str = ''
+
+
+@dataclass
+class _Circuit:
+    state: str = CIRCUIT_CLOSED
+    failures: int = 0
+    opened_at: float = 0.0
+    probe_started: float | None = None
+    last_reason: str = ''
+    trips: int = 0
+    fallbacks: int = 0
+
+
+def parse_provider_fallbacks(raw: dict[str, object] | None) -> dict[str, tuple[str, ...]]:
+    """Normalize ``{"claude": "codex", "gemini": ["codex", "claude"]}`` into ordered fallback tuples."""
+    fallbacks: dict[str, tuple[str, ...]] = {}
+    for raw_key, value in (raw or {}).items():
+        provider = str(raw_key or '').strip().lower()
+        items = value if isinstance(value, (list, tuple)) else [value]
+        chain = tuple(
+            dict.fromkeys(
+                item
+                for item in (str(entry or '').strip().lower() for entry in items)
+                if item and item != provider
+            )
+        )
+        if provider and chain:
+            fallbacks[provider] = chain
+    return fallbacks
+
+
+class ProviderCircuitBreaker:
+    """In-process circuit breaker per provider, or per provider/model when a model is pinned.
+
+    ``failure_threshold`` consecutive provider-limit or timeout results open
+    the circuit. While open, :meth:`route` sends calls to the first configured
+    fallback whose own circuit admits them, or blocks them outright, instead
+    of letting them wait out another full participant timeout. After
+    ``cooldown_seconds`` one probe call is let through (half-open): success
+    closes the circuit, another trip-worthy failure re-opens it. A threshold
+    of 0 disables the breaker.
+
+    Listeners receive ``provider_circuit_state`` payloads on every transition
+    and ``provider_fallback_routed`` payloads when a call is rerouted.
+    """
+
+    def __init__(
+        self,
+        *,
+        failure_threshold: int = 0,
+        cooldown_seconds: float = DEFAULT_BREAKER_COOLDOWN_SECONDS,
+        fallbacks: dict[str, tuple[str, ...]] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._circuits: dict[str, _Circuit] = {}
+        self._listeners = WeakListeners()
+        self.failure_threshold = 0
+        self.cooldown_seconds = DEFAULT_BREAKER_COOLDOWN_SECONDS
+        self.fallbacks: dict[str, tuple[str, ...]] = {}
+        self.configure(failure_threshold=failure_threshold, cooldown_seconds=cooldown_seconds, fallbacks=fallbacks)
+
+    def configure(
+        self,
+        *,
+        failure_threshold: int = 0,
+        cooldown_seconds: float = DEFAULT_BREAKER_COOLDOWN_SECONDS,
+        fallbacks: dict[str, tuple[str, ...]] | None = None,
+    ) -> None:
+        with self._lock:
+            self.failure_threshold = max(0, int(failure_threshold))
+            self.cooldown_seconds = max(0.0, float(cooldown_seconds))
+            self.fallbacks = dict(fallbacks or {})
+            self._circuits.clear()
+
+    @property
+    def enabled(self) -> bool:
+        return self.failure_threshold > 0
+
+    def add_listener(self, listener: Callable[[dict], None]) -> None:
+        self._listeners.add(listener)
+
+    def state(self, provider: str, model: str | None = None) -> str:
+        with self._lock:
+            circuit = self._circuits.get(limit_key(provider, model))
+            return circuit.state if circuit is not None else CIRCUIT_CLOSED
+
+    def route(
+        self,
+        provider: str,
+        *,
+        model: str | None = None,
+        model_params: str | None = None,
+        available: Collection[str] = (),
+        participant_id: str = '',
+        task_id: str | None = None,
+    ) -> CircuitRoute:
+        primary = CircuitRoute(provider=provider, model=model, model_params=model_params)
+        if not self.enabled:
+            return primary
+        events: list[dict] = []
+        key = limit_key(provider, model)
+        with self._lock:
+            now = self._clock()
+            if self._admit(key, now, events, task_id):
+                route = primary
+            else:
+                route = None
+                for fallback in self.fallbacks.get(limit_key(provider), ()):
+                    if fallback not in available or not self._admit(fallback, now, events, task_id):
+                        continue
+                    self._circuits[key].fallbacks += 1
+                    route = CircuitRoute(provider=fallback, fallback_from=provider)
+                    events.append(
+                        {
+                            'type': 'provider_fallback_routed',
+                            'participant': participant_id,
+                            'provider': provider,
+                            'model': model or '',
+                            'fallback_provider': fallback,
+                            'task_id': task_id,
+                        }
+                    )
+                    break
+                if route is None:
+                    circuit = self._circuits[key]
+                    retry_in = max(0.0, circuit.opened_at + self.cooldown_seconds - now)
+                    route = CircuitRoute(
+                        provider=provider,
+                        model=model,
+                        model_params=model_params,
+                        blocked=(
+                            f'provider_circuit_open provider={provider} key={key} '
+                            f'retry_in_seconds={int(retry_in)} last_reason={circuit.last_reason or "unknown"}'
+                        ),
+                    )
+        for event in events:
+            self._listeners.notify(event)
+        return route
+
+    def record(
+        self,
+        provider: str,
+        *,
+        model: str | None = None,
+        returncode: int,
+        output: str,
+        task_id: str | None = None,
+    ) -> None:
+        """Feed one call's outcome back; a success closes the circuit, a provider failure counts toward opening it."""
+        if not self.enabled:
+            return
+        key = limit_key(provider, model)
+        text = str(output or '').lstrip()
+        reason = next((item for item in _TRIP_REASONS if text.startswith(item)), '')
+        events: list[dict] = []
+        with self._lock:
+            circuit = self._circuits.setdefault(key, _Circuit())
+            now = self._clock()
+            if int(returncode) == 0:
+                circuit.failures = 0
+                circuit.probe_started = None
+                if circuit.state != CIRCUIT_CLOSED:
+                    self._transition(key, circuit, CIRCUIT_CLOSED, events, task_id)
+            elif reason:
+                circuit.failures += 1
+                circuit.last_reason = reason
+                circuit.probe_started = None
+                if circuit.state == CIRCUIT_HALF_OPEN or (
+                    circuit.state == CIRCUIT_CLOSED and circuit.failures >= self.failure_threshold
+                ):
+                    circuit.opened_at = now
+                    circuit.trips += 1
+                    self._transition(key, circuit, CIRCUIT_OPEN, events, task_id)
+            elif circuit.state == CIRCUIT_HALF_OPEN:
+                # Inconclusive probe; let the next call try again.
+                circuit.probe_started = None
+        for event in events:
+            self._listeners.notify(event)
+
+    def release_probe(self, provider: str, *, model: str | None = None) -> None:
+        """Free a half-open probe slot whose call ended without an outcome (queue timeout, cancelled)."""
+        if not self.enabled:
+            return
+        with self._lock:
+            circuit = self._circuits.get(limit_key(provider, model))
+            if circuit is not None and circuit.state == CIRCUIT_HALF_OPEN:
+                circuit.probe_started = None
+
+    def snapshot(self) -> dict[str, dict]:
+        with self._lock:
+            now = self._clock()
+            return {
+                key: {
+                    'state': circuit.state,
+                    'consecutive_failures': circuit.failures,
+                    'last_reason': circuit.last_reason,
+                    'trips': circuit.trips,
+                    'fallbacks': circuit.fallbacks,
+                    'retry_in_seconds': (
+                        round(max(0.0, circuit.opened_at + self.cooldown_seconds - now), 3)
+                        if circuit.state == CIRCUIT_OPEN
+                        else 0.0
+                    ),
+                }
+                for key, circuit in sorted(self._circuits.items())
+            }
+
+    def _admit(self, key: str, now: float, events: list[dict], task_id: str | None) -> bool:
+        circuit = self._circuits.setdefault(key, _Circuit())
+        if circuit.state == CIRCUIT_CLOSED:
+            return True
+        if circuit.state == CIRCUIT_OPEN:
+            if now - circuit.opened_at < self.cooldown_seconds:
+                return False
+            self._transition(key, circuit, CIRCUIT_HALF_OPEN, events, task_id)
+        # Half-open: one probe at a time; a probe that never reported back expires after a cool-down.
+        if circuit.probe_started is not None and now - circuit.probe_started < self.cooldown_seconds:
+            return False
+        circuit.probe_started = now
+        return True
+
+    def _transition(
+        self,
+        key: str,
+        circuit: _Circuit,
+        state: str,
+        events: list[dict],
+        task_id: str | None,
+    ) -> None:
+        previous = circuit.state
+        circuit.state = state
+        provider, _, model = key.partition(':')
+        _log.warning(
+            'provider_circuit_state key=%s previous=%s state=%s failures=%s reason=%s',
+            key,
+            previous,
+            state,
+            circuit.failures,
+            circuit.last_reason,
+        )
+        events.append(
+            {
+                'type': 'provider_circuit_state',
+                'provider': provider,
+                'model': model,
+                'state': state,
+                'previous_state': previous,
+                'consecutive_failures': circuit.failures,
+                'last_reason': circuit.last_reason,
+                'cooldown_seconds': self.cooldown_seconds,
+                'task_id': task_id,
+            }
+        )
+
+
+PROVIDER_CIRCUIT_BREAKER = ProviderCircuitBreaker()
+
+
+__all__ = [
+    'CIRCUIT_CLOSED',
+    'CIRCUIT_HALF_OPEN',
+    'CIRCUIT_OPEN',
+    'CircuitRoute',
+    'PROVIDER_CIRCUIT_BREAKER',
+    'ProviderCircuitBreaker',
+    'parse_provider_fallbacks',
+]
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import threading
+from typing import Callable
+import weakref
+
+from awe_agentcheck.observability import get_logger
+
+_log = get_logger('awe_agentcheck.adapters.listeners')
+
+
+class WeakListeners:
+    """Event callbacks for process-wide runner state; bound methods are held weakly.
+
+    Services subscribe on construction, so a weak reference keeps a discarded
+    service (tests build many) from being kept alive or called.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._refs: list[Callable[[], Callable[[dict], None] | None]] = []
+
+    def add(self, listener: Callable[[dict], None]) -> None:
+        ref: Callable[[], Callable[[dict], None] | None]
+        if hasattr(listener, '__self__') and hasattr(listener, '__func__'):
+            ref = weakref.WeakMethod(listener)  # type: ignore[arg-type]
+        else:
+            ref = lambda: listener  # noqa: E731
+        with self._lock:
+            self._refs = [item for item in self._refs if item() is not None]
+            self._refs.append(ref)
+
+    def notify(self, payload: dict) -> None:
+        with self._lock:
+            refs = list(self._refs)
+        for ref in refs:
+            listener = ref()
+            if listener is None:
+                continue
+            try:
+                listener(dict(payload))
+            except Exception:
+                _log.exception('runner_listener_failed type=%s', payload.get('type'))
@@ -0,0 +1,297 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import asdict
+import hashlib
+import json
+import os
+from pathlib import Path
+import threading
+import time
+from typing import Callable
+
+from awe_agentcheck.adapters.base import AdapterResult
+from awe_agentcheck.fusion import IGNORED_PATH_PARTS
+from awe_agentcheck.observability import get_logger
+from awe_agentcheck.workspace_walk import walk_workspace
+
+_log = get_logger('awe_agentcheck.adapters.response_cache')
+
+CACHE_MODE_OFF = 'off'
+CACHE_MODE_RECORD = 'record'
+CACHE_MODE_REPLAY = 'replay'
+CACHE_MODES = (CACHE_MODE_OFF, CACHE_MODE_RECORD, CACHE_MODE_REPLAY)
+DEFAULT_CACHE_TTL_SECONDS = 7 * 24 * 3600
+DEFAULT_CACHE_MAX_BYTES = 256 * 1024 * 1024
+# Only stages that leave the workspace untouched are cached: replaying an
+# implementation would return its text without reapplying its edits.
+CACHEABLE_STAGES = frozenset(
+    {
+        'review',
+        'debate_review',
+        'discussion',
+        'proposal_review',
+        'proposal_precheck_review',
+        'proposal_discussion',
+    }
+)
+# Per-file hashes remembered by WorkspaceFingerprint across all workspaces.
+DEFAULT_FINGERPRINT_MEMO_FILES = 200_000
+_HASH_CHUNK_BYTES = 1024 * 1024
+
+
+def normalize_cache_mode(value: str | None) -> str:
+    text = str(value or '').strip().lower()
+    return text if text in CACHE_MODES else CACHE_MODE_OFF
+
+
+class WorkspaceFingerprint:
+    """Content digest of a workspace tree, with per-file hashes memoized on (size, mtime_ns, inode).
+
+    The memo is an LRU of at most *max_files* paths, so sandboxes that come
+    and go do not accumulate entries.
+    """
+
+    def __init__(self, *, max_files: int = DEFAULT_FINGERPRINT_MEMO_FILES):
+        self.max_files = max(1, int(max_files))
+        self._lock = threading.Lock()
+        self._files: OrderedDict[str, tuple[int, int, int, str]] = OrderedDict()
+
+    def __call__(self, root: Path) -> str:
+        base = Path(root)
+        digest = hashlib.sha256()
+        for rel, info in walk_workspace(base, ignore_names=IGNORED_PATH_PARTS):
+            path = str(base / rel)
+            key = (int(info.st_size), int(info.st_mtime_ns), int(info.st_ino))
+            with self._lock:
+                memo = self._files.get(path)
+                if memo is not None:
+                    self._files.move_to_end(path)
+            if memo is not None and memo[:3] == key:
+                file_digest = memo[3]
+            else:
+                file_digest = self._hash_file(path)
+                if not file_digest:
+                    continue
+                with self._lock:
+                    self._files[path] = (*key, file_digest)
+                    self._files.move_to_end(path)
+                    while len(self._files) > self.max_files:
+                        self._files.popitem(last=False)
+            digest.update(f'{rel}\0{file_digest}\n'.encode('utf-8'))
+        return digest.hexdigest()
+
+    @staticmethod
+    def _hash_file(path: str) -> str:
+        digest = hashlib.sha256()
+        try:
+            with open(path, 'rb') as handle:
+                for chunk in iter(lambda: handle.read(_HASH_CHUNK_BYTES), b''):
+                    digest.update(chunk)
+        except OSError:
+            return ''
+        return digest.hexdigest()
+
+
+class ParticipantResponseCache:
+    """On-disk cache of participant results for deterministic re-runs.
+
+    Only calls from :data:`CACHEABLE_STAGES` are cached. Entries are keyed
+    by provider, model, model params, agent toggles, the prompt and a
+    content digest of the workspace, and stored as
+    ``<root>/<aa>/<key>.json``. ``record`` mode serves fresh entries and
+    records every successful miss; ``replay`` mode only serves entries and
+    never reaches a provider. Entries older than ``ttl_seconds`` are dropped
+    on read (0 keeps them forever); once the store grows past ``max_bytes``
+    the least recently used entries are evicted. Reads bump the entry's
+    mtime, which is what the LRU order is built from.
+    """
+
+    VERSION = 1
+
+    def __init__(
+        self,
+        root: Path,
+        *,
+        mode: str = CACHE_MODE_RECORD,
+        ttl_seconds: float = DEFAULT_CACHE_TTL_SECONDS,
+        max_bytes: int = DEFAULT_CACHE_MAX_BYTES,
+        fingerprint: Callable[[Path], str] | None = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.root = Path(root)
+        self.mode = normalize_cache_mode(mode)
+        self.ttl_seconds = max(0.0, float(ttl_seconds))
+        self.max_bytes = max(0, int(max_bytes))
+        self.fingerprint = fingerprint if fingerprint is not None else WorkspaceFingerprint()
+        self._clock = clock
+        self._lock = threading.Lock()
+        # key -> [size, last_used]; loaded from disk on first use.
+        self._index: dict[str, list[float]] | None = None
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.mode != CACHE_MODE_OFF
+
+    def caches(self, stage: str | None) -> bool:
+        return self.enabled and str(stage or '') in CACHEABLE_STAGES
+
+    @property
+    def replay_only(self) -> bool:
+        return self.mode == CACHE_MODE_REPLAY
+
+    def key_for(
+        self,
+        *,
+        provider: str,
+        model: str | None,
+        model_params: str | None,
+        claude_team_agents: bool,
+        codex_multi_agents: bool,
+        prompt: str,
+        cwd: Path,
+    ) -> str:
+        material = {
+            'version': self.VERSION,
+            'provider': str(provider or '').strip().lower(),
+            'model': str(model or '').strip(),
+            'model_params': str(model_params or '').strip(),
+            'claude_team_agents': bool(claude_team_agents),
+            'codex_multi_agents': bool(codex_multi_agents),
+            'prompt_sha256': hashlib.sha256(str(prompt or '').encode('utf-8')).hexdigest(),
+            'workspace_sha256': self.fingerprint(Path(cwd)),
+        }
+        return hashlib.sha256(json.dumps(material, sort_keys=True).encode('utf-8')).hexdigest()
+
+    def path_for(self, key: str) -> Path:
+        return self.root / key[:2] / f'{key}.json'
+
+    def get(self, key: str) -> AdapterResult | None:
+        path = self.path_for(key)
+        try:
+            data = json.loads(path.read_text(encoding='utf-8'))
+            result = AdapterResult(**data['result'])
+            created_at = float(data.get('created_at') or 0.0)
+        except (OSError, ValueError, KeyError, TypeError):
+            with self._lock:
+                self.misses += 1
+            return None
+        now = self._clock()
+        if self.ttl_seconds and now - created_at > self.ttl_seconds:
+            self._remove(key)
+            with self._lock:
+                self.misses += 1
+            return None
+        try:
+            os.utime(path, (now, now))
+        except OSError:
+            pass
+        with self._lock:
+            self.hits += 1
+            index = self._load_index()
+            if key in index:
+                index[key][1] = now
+        return result
+
+    def put(self, key: str, result: AdapterResult, *, provider: str, model: str | None) -> None:
+        path = self.path_for(key)
+        now = self._clock()
+        payload = json.dumps(
+            {
+                'version': self.VERSION,
+                'key': key,
+                'created_at': now,
+                'provider': provider,
+                'model': model or '',
+                'result': asdict(result),
+            },
+            separators=(',', ':'),
+        ).encode('utf-8')
+        tmp = path.with_name(f'{path.name}.{threading.get_ident()}.tmp')
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_bytes(payload)
+            os.replace(tmp, path)
+        except OSError:
+            _log.warning('response_cache_store_failed key=%s', key)
+            tmp.unlink(missing_ok=True)
+            return
+        with self._lock:
+            index = self._load_index()
+            previous = index.get(key)
+            if previous is not None:
+                self._bytes -= int(previous[0])
+            index[key] = [len(payload), now]
+            self._bytes += len(payload)
+            self.stores += 1
+            victims = self._select_victims(keep=key)
+        for victim in victims:
+            self._remove(victim)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            index = self._load_index()
+            return {
+                'mode': self.mode,
+                'entries': len(index),
+                'bytes': self._bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'stores': self.stores,
+                'evictions': self.evictions,
+            }
+
+    def _load_index(self) -> dict[str, list[float]]:
+        if self._index is None:
+            self._index = {}
+            self._bytes = 0
+            for path in self.root.glob('*/*.json'):
+                try:
+                    info = path.stat()
+                except OSError:
+                    continue
+                self._index[path.stem] = [info.st_size, info.st_mtime]
+                self._bytes += info.st_size
+        return self._index
+
+    def _select_victims(self, *, keep: str) -> list[str]:
+        if not self.max_bytes or self._bytes <= self.max_bytes:
+            return []
+        victims: list[str] = []
+        remaining = self._bytes
+        for key, (size, _) in sorted(self._index.items(), key=lambda item: item[1][1]):
+            if remaining <= self.max_bytes:
+                break
+            if key == keep:
+                continue
+            victims.append(key)
+            remaining -= int(size)
+        return victims
+
+    def _remove(self, key: str) -> None:
+        try:
+            self.path_for(key).unlink(missing_ok=True)
+        except OSError:
+            return
+        with self._lock:
+            entry = self._load_index().pop(key, None)
+            if entry is not None:
+                self._bytes -= int(entry[0])
+                self.evictions += 1
+
+
+__all__ = [
+    'CACHEABLE_STAGES',
+    'CACHE_MODES',
+    'CACHE_MODE_OFF',
+    'CACHE_MODE_RECORD',
+    'CACHE_MODE_REPLAY',
+    'ParticipantResponseCache',
+    'WorkspaceFingerprint',
+    'normalize_cache_mode',
+]
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import contextvars
+from dataclasses import replace
 from queue import Empty, Queue
 import os
 from pathlib import Path
@@ -7,12 +9,13 @@ import random
 import shutil
 import subprocess
 import time
-from threading import Thread
+from threading import Event, Thread
 from typing import Callable
 
 from awe_agentcheck.adapters.base import (
     AdapterResult,
     DEFAULT_PROVIDER_REGISTRY,
+    ProviderAdapter,
     has_agents_flag,
     has_codex_multi_agent_config_token,
     has_codex_multi_agent_flag,
@@ -23,8 +26,12 @@ from awe_agentcheck.adapters.base import (
     parse_verdict,
     split_extra_args,
 )
+from awe_agentcheck.adapters.circuit_breaker import PROVIDER_CIRCUIT_BREAKER, ProviderCircuitBreaker
 from awe_agentcheck.adapters.codex import normalize_codex_exec_output
 from awe_agentcheck.adapters.factory import ProviderFactory
+from awe_agentcheck.adapters.response_cache import ParticipantResponseCache
+from awe_agentcheck.adapters.scheduler import PROVIDER_SCHEDULER, ProviderScheduler
+from awe_agentcheck.observability import get_logger, get_task_id
 from awe_agentcheck.participants import Participant
 
 _LIMIT_PATTERNS = (
@@ -39,6 +46,40 @@ _LIMIT_PATTERNS = (
     'insufficient_quota',
 )
 _MIN_ATTEMPT_TIMEOUT_SECONDS = 0.05
+_HEDGE_JOIN_SECONDS = 5.0
+_log = get_logger('awe_agentcheck.adapters.runner')
+
+
+class ParticipantCancelled(Exception):
+    """Raised out of a participant call stopped by its caller (a losing hedge leg, a stopped fan-out); the process is already killed."""
+
+
+class _FirstOutputProbe:
+    """Stream callback wrapper that records whether the participant has produced any output yet."""
+
+    def __init__(self, target: Callable[[str, str], None] | None):
+        self.target = target
+        self.seen = Event()
+
+    def __call__(self, stream_name: str, chunk: str) -> None:
+        if chunk:
+            self.seen.set()
+        if self.target is not None:
+            self.target(stream_name, chunk)
+
+    def poll(self) -> None:
+        poll = getattr(self.target, 'poll', None)
+        if callable(poll):
+            poll()
+
+    def flush(self) -> None:
+        flush = getattr(self.target, 'flush', None)
+        if callable(flush):
+            flush()
+
+
+def _discard_stream(_stream_name: str, _chunk: str) -> None:
+    return None
 
 
 class ParticipantRunner:
@@ -48,6 +89,9 @@ class ParticipantRunner:
         command_overrides: dict[str, str] | None = None,
         dry_run: bool = False,
         timeout_retries: int = 1,
+        scheduler: ProviderScheduler | None = None,
+        circuit_breaker: ProviderCircuitBreaker | None = None,
+        response_cache: ParticipantResponseCache | None = None,
     ):
         self.provider_registry = {
             provider: {
@@ -83,6 +127,9 @@ class ParticipantRunner:
         self.provider_factory = ProviderFactory()
         self.dry_run = dry_run
         self.timeout_retries = max(0, int(timeout_retries))
+        self.scheduler = scheduler if scheduler is not None else PROVIDER_SCHEDULER
+        self.circuit_breaker = circuit_breaker if circuit_breaker is not None else PROVIDER_CIRCUIT_BREAKER
+        self.response_cache = response_cache
 
     def run(
         self,
@@ -96,54 +143,390 @@ class ParticipantRunner:
         claude_team_agents: bool = False,
         codex_multi_agents: bool = False,
         on_stream: Callable[[str, str], None] | None = None,
+        hedge_delay_seconds: float | None = None,
+        stage: str | None = None,
+        should_stop: Callable[[], bool] | None = None,
     ) -> AdapterResult:
-        if self.dry_run:
-            simulated = (
-                f'[dry-run participant={participant.participant_id}]\\n'
-                '{"verdict":"NO_BLOCKER","next_action":"pass","issue":"n/a","impact":"n/a","next":"n/a"}\\n'
-                'Evidence:\\n'
-                '- src/awe_agentcheck/service.py\\n'
-                '- src/awe_agentcheck/adapters/base.py\\n'
-                '- tests/unit/test_service.py\\n'
-                'Verification:\\n'
-                '- py -m pytest -q tests/unit/test_service.py\\n'
-                '- py -m ruff check src/awe_agentcheck'
+        """Run one participant call.
+
+        With *hedge_delay_seconds*, a call whose participant stays silent that
+        long is raced against the provider's first configured fallback; see
+        :meth:`_run_hedged`. With a response cache, a read-only *stage*
+        (review, proposal, discussion) with a cached result for the same
+        request and workspace returns it without launching anything. Once
+        *should_stop* returns true the call stops waiting for admission or
+        kills its process and raises :class:`ParticipantCancelled`.
+        """
+        cache = self.response_cache
+        cache_key = None
+        if cache is not None and cache.caches(stage):
+            cache_key = cache.key_for(
+                provider=participant.provider,
+                model=model,
+                model_params=model_params,
+                claude_team_agents=claude_team_agents,
+                codex_multi_agents=codex_multi_agents,
+                prompt=prompt,
+                cwd=cwd,
             )
-            return AdapterResult(
-                output=simulated,
-                verdict='no_blocker',
-                next_action='pass',
-                returncode=0,
-                duration_seconds=0.01,
-            )
-
-        provider = str(participant.provider or '').strip().lower()
-        command = self.commands.get(provider)
-        if not command:
-            return self._runtime_error_result(
-                reason=f'command_not_configured provider={provider}',
-                duration_seconds=0.0,
-            )
-
-        provider_spec = dict(self.provider_registry.get(provider) or {})
-        adapter = self.provider_factory.create(provider=provider, provider_spec=provider_spec)
+            cached = cache.get(cache_key)
+            if cached is not None:
+                _log.info(
+                    'response_cache_hit participant=%s provider=%s key=%s',
+                    participant.participant_id,
+                    participant.provider,
+                    cache_key[:12],
+                )
+                if on_stream is not None and cached.output:
+                    on_stream('stdout', cached.output)
+                return cached
+            # Replay never reaches a provider; dry runs still get their simulated answer.
+            if cache.replay_only and not self.dry_run:
+                return self._runtime_error_result(
+                    reason=f'response_cache_miss provider={participant.provider} key={cache_key[:12]}',
+                    duration_seconds=0.0,
+                )
+        result = self._run_live(
+            participant=participant,
+            prompt=prompt,
+            cwd=cwd,
+            timeout_seconds=timeout_seconds,
+            model=model,
+            model_params=model_params,
+            claude_team_agents=claude_team_agents,
+            codex_multi_agents=codex_multi_agents,
+            on_stream=on_stream,
+            hedge_delay_seconds=hedge_delay_seconds,
+            should_stop=should_stop,
+        )
+        if cache_key is not None and not cache.replay_only and not self.dry_run and int(result.returncode) == 0:
+            cache.put(cache_key, result, provider=participant.provider, model=model)
+        return result
 
-        argv = adapter.build_argv(
-            command=command,
+    def _run_live(
+        self,
+        *,
+        participant: Participant,
+        prompt: str,
+        cwd: Path,
+        timeout_seconds: int = 900,
+        model: str | None = None,
+        model_params: str | None = None,
+        claude_team_agents: bool = False,
+        codex_multi_agents: bool = False,
+        on_stream: Callable[[str, str], None] | None = None,
+        hedge_delay_seconds: float | None = None,
+        should_stop: Callable[[], bool] | None = None,
+    ) -> AdapterResult:
+        task_id = get_task_id()
+        routed = self._route_participant(
+            participant=participant,
+            model=model,
+            model_params=model_params,
+            task_id=task_id,
+        )
+        if isinstance(routed, AdapterResult):
+            return routed
+        participant, model, model_params = routed
+        prepared = self._prepare_run(
+            participant=participant,
             model=model,
             model_params=model_params,
             claude_team_agents=claude_team_agents,
             codex_multi_agents=codex_multi_agents,
         )
-        argv = self._resolve_executable(argv)
-        effective_command = self._format_command(argv)
+        if isinstance(prepared, AdapterResult):
+            self.circuit_breaker.release_probe(participant.provider, model=model)
+            return prepared
+        provider, adapter, argv, effective_command = prepared
+        ticket = self.scheduler.acquire(
+            provider,
+            model=model,
+            task_id=task_id,
+            timeout=timeout_seconds,
+            should_stop=should_stop,
+        )
+        if ticket is None:
+            self.circuit_breaker.release_probe(provider, model=model)
+            if should_stop is not None and should_stop():
+                raise ParticipantCancelled(provider)
+            return self._queue_timeout_result(provider=provider, timeout_seconds=timeout_seconds)
+        try:
+            if hedge_delay_seconds is not None:
+                return self._run_hedged(
+                    participant=participant,
+                    provider=provider,
+                    adapter=adapter,
+                    argv=argv,
+                    effective_command=effective_command,
+                    model=model,
+                    prompt=prompt,
+                    cwd=cwd,
+                    timeout_seconds=timeout_seconds,
+                    on_stream=on_stream,
+                    hedge_delay_seconds=hedge_delay_seconds,
+                    task_id=task_id,
+                    should_stop=should_stop,
+                )
+            result = self._run_attempts(
+                provider=provider,
+                adapter=adapter,
+                argv=argv,
+                effective_command=effective_command,
+                prompt=prompt,
+                cwd=cwd,
+                timeout_seconds=timeout_seconds,
+                on_stream=on_stream,
+                should_stop=should_stop,
+            )
+            result = replace(result, provider=provider)
+        except ParticipantCancelled:
+            self.circuit_breaker.release_probe(provider, model=model)
+            raise
+        finally:
+            self.scheduler.release(ticket)
+        self.circuit_breaker.record(
+            provider,
+            model=model,
+            returncode=result.returncode,
+            output=result.output,
+            task_id=task_id,
+        )
+        return result
+
+    def _route_participant(
+        self,
+        *,
+        participant: Participant,
+        model: str | None,
+        model_params: str | None,
+        task_id: str | None,
+    ) -> AdapterResult | tuple[Participant, str | None, str | None]:
+        """Apply the circuit breaker: keep the participant, move it to a fallback provider, or refuse the call."""
+        if self.dry_run:
+            return participant, model, model_params
+        route = self.circuit_breaker.route(
+            participant.provider,
+            model=model,
+            model_params=model_params,
+            available=self.commands,
+            participant_id=participant.participant_id,
+            task_id=task_id,
+        )
+        if route.blocked:
+            return self._runtime_error_result(reason=route.blocked, duration_seconds=0.0)
+        if route.fallback_from is None:
+            return participant, model, model_params
+        return replace(participant, provider=route.provider), route.model, route.model_params
+
+    def _run_hedged(
+        self,
+        *,
+        participant: Participant,
+        provider: str,
+        adapter: ProviderAdapter,
+        argv: list[str],
+        effective_command: str,
+        model: str | None,
+        prompt: str,
+        cwd: Path,
+        timeout_seconds: int,
+        on_stream: Callable[[str, str], None] | None,
+        hedge_delay_seconds: float,
+        task_id: str | None,
+        should_stop: Callable[[], bool] | None = None,
+    ) -> AdapterResult:
+        """Race the primary call against a secondary provider once the primary has been silent too long.
+
+        The primary starts at once. If it has streamed nothing after
+        *hedge_delay_seconds*, the same prompt goes to the first fallback
+        provider (``AWE_PROVIDER_FALLBACKS_JSON``) that is configured, has a
+        closed circuit and a free admission slot. The first usable result
+        (exit 0 with a parsed verdict) wins and the other process is killed;
+        if neither is usable, the primary's result is returned. Only the
+        primary's output is streamed. *should_stop* stops both legs and
+        raises :class:`ParticipantCancelled`.
+        """
+        probe = _FirstOutputProbe(on_stream)
+        finished: Queue[tuple[str, AdapterResult | None]] = Queue()
+        stop = {'primary': Event(), 'hedge': Event()}
+        legs: list[Thread] = []
+
+        def stopped() -> bool:
+            return should_stop is not None and should_stop()
+
+        def launch(
+            name: str,
+            leg_provider: str,
+            leg_adapter: ProviderAdapter,
+            leg_argv: list[str],
+            leg_command: str,
+            leg_model: str | None,
+            stream: Callable[[str, str], None] | None,
+            ticket=None,
+        ) -> None:
+            def leg() -> None:
+                result: AdapterResult | None = None
+                try:
+                    result = self._run_attempts(
+                        provider=leg_provider,
+                        adapter=leg_adapter,
+                        argv=leg_argv,
+                        effective_command=leg_command,
+                        prompt=prompt,
+                        cwd=cwd,
+                        timeout_seconds=timeout_seconds,
+                        on_stream=stream,
+                        should_stop=lambda: stop[name].is_set() or stopped(),
+                    )
+                    result = replace(result, provider=leg_provider)
+                    self.circuit_breaker.record(
+                        leg_provider,
+                        model=leg_model,
+                        returncode=result.returncode,
+                        output=result.output,
+                        task_id=task_id,
+                    )
+                except ParticipantCancelled:
+                    self.circuit_breaker.release_probe(leg_provider, model=leg_model)
+                    result = None
+                except Exception as exc:
+                    _log.exception('participant_hedge_leg_failed leg=%s provider=%s', name, leg_provider)
+                    result = self._runtime_error_result(
+                        reason=f'hedge_leg_failed provider={leg_provider} error={exc}',
+                        duration_seconds=0.0,
+                    )
+                finally:
+                    if ticket is not None:
+                        self.scheduler.release(ticket)
+                    finished.put((name, result))
+
+            thread = Thread(
+                target=contextvars.copy_context().run,
+                args=(leg,),
+                name=f'awe-hedge-{name}',
+                daemon=True,
+            )
+            legs.append(thread)
+            thread.start()
+
+        started = time.monotonic()
+        launch('primary', provider, adapter, argv, effective_command, model, probe)
+        pending = {'primary'}
+        hedge_at = started + max(0.0, float(hedge_delay_seconds))
+        hedge_checked = False
+        winner: AdapterResult | None = None
+        fallback: AdapterResult | None = None
+        while pending:
+            wait = None if hedge_checked else max(0.0, hedge_at - time.monotonic())
+            try:
+                name, result = finished.get(timeout=wait)
+            except Empty:
+                hedge_checked = True
+                if not probe.seen.is_set() and not stopped():
+                    hedge = self._prepare_hedge(participant=participant, provider=provider, task_id=task_id)
+                    if hedge is not None:
+                        launch('hedge', *hedge)
+                        pending.add('hedge')
+                continue
+            pending.discard(name)
+            if result is None:
+                continue
+            if self._is_usable_result(result):
+                winner = result
+                if name == 'hedge':
+                    _log.info(
+                        'participant_hedge_won participant=%s provider=%s elapsed=%.3f',
+                        participant.participant_id,
+                        provider,
+                        time.monotonic() - started,
+                    )
+                break
+            if fallback is None or name == 'primary':
+                fallback = result
+        for name in pending:
+            stop[name].set()
+        for thread in legs:
+            thread.join(timeout=_HEDGE_JOIN_SECONDS)
+        if winner is None and stopped():
+            raise ParticipantCancelled(provider)
+        if winner is not None:
+            return winner
+        if fallback is not None:
+            return fallback
+        return self._runtime_error_result(
+            reason=f'hedge_no_result provider={provider}',
+            duration_seconds=time.monotonic() - started,
+        )
+
+    def _prepare_hedge(
+        self,
+        *,
+        participant: Participant,
+        provider: str,
+        task_id: str | None,
+    ) -> tuple | None:
+        """Pick and admit a secondary provider for a hedge leg; None when no fallback can start right now."""
+        for candidate in self.circuit_breaker.fallbacks.get(provider, ()):
+            if candidate == provider or candidate not in self.commands:
+                continue
+            routed = self._route_participant(
+                participant=replace(participant, provider=candidate),
+                model=None,
+                model_params=None,
+                task_id=task_id,
+            )
+            if isinstance(routed, AdapterResult) or routed[0].provider == provider:
+                continue
+            hedge_participant, hedge_model, hedge_model_params = routed
+            prepared = self._prepare_run(
+                participant=hedge_participant,
+                model=hedge_model,
+                model_params=hedge_model_params,
+                claude_team_agents=False,
+                codex_multi_agents=False,
+            )
+            if isinstance(prepared, AdapterResult):
+                self.circuit_breaker.release_probe(hedge_participant.provider, model=hedge_model)
+                continue
+            hedge_provider, hedge_adapter, hedge_argv, hedge_command = prepared
+            # A hedge is only worth it if it can start now; never queue behind other tasks.
+            ticket = self.scheduler.acquire(hedge_provider, model=hedge_model, task_id=task_id, timeout=0)
+            if ticket is None:
+                self.circuit_breaker.release_probe(hedge_provider, model=hedge_model)
+                continue
+            _log.info(
+                'participant_hedge_started participant=%s provider=%s hedge_provider=%s',
+                participant.participant_id,
+                provider,
+                hedge_provider,
+            )
+            return hedge_provider, hedge_adapter, hedge_argv, hedge_command, hedge_model, None, ticket
+        return None
+
+    @staticmethod
+    def _is_usable_result(result: AdapterResult) -> bool:
+        return int(result.returncode) == 0 and str(result.verdict or '') in {'no_blocker', 'blocker'}
+
+    def _run_attempts(
+        self,
+        *,
+        provider: str,
+        adapter: ProviderAdapter,
+        argv: list[str],
+        effective_command: str,
+        prompt: str,
+        cwd: Path,
+        timeout_seconds: int,
+        on_stream: Callable[[str, str], None] | None,
+        should_stop: Callable[[], bool] | None = None,
+    ) -> AdapterResult:
         attempts = self.timeout_retries + 1
         current_prompt = prompt
         started = time.monotonic()
         deadline = started + max(0.05, float(timeout_seconds))
         completed = None
         attempts_made = 0
-        last_timeout: subprocess.TimeoutExpired | None = None
 
         for attempt in range(1, attempts + 1):
             remaining_budget = self._remaining_timeout_budget_seconds(deadline=deadline)
@@ -157,10 +540,12 @@ class ParticipantRunner:
             if attempt_timeout <= 0:
                 break
 
+            if should_stop is not None and should_stop():
+                raise ParticipantCancelled(provider)
             attempts_made += 1
             runtime_argv, runtime_input = adapter.prepare_runtime_invocation(argv=argv, prompt=current_prompt)
             try:
-                if on_stream is None:
+                if on_stream is None and should_stop is None:
                     completed = subprocess.run(
                         runtime_argv,
                         input=runtime_input,
@@ -173,13 +558,15 @@ class ParticipantRunner:
                         env=self._build_subprocess_env(cwd),
                     )
                 else:
+                    stop_kwargs = {'should_stop': should_stop} if should_stop is not None else {}
                     completed = self._run_streaming(
                         argv=runtime_argv,
                         runtime_input=runtime_input,
                         cwd=cwd,
                         timeout_seconds=attempt_timeout,
-                        on_stream=on_stream,
+                        on_stream=on_stream or _discard_stream,
                         env=self._build_subprocess_env(cwd),
+                        **stop_kwargs,
                     )
                 break
             except FileNotFoundError:
@@ -187,26 +574,97 @@ class ParticipantRunner:
                     reason=f'command_not_found provider={provider} command={effective_command}',
                     duration_seconds=(time.monotonic() - started),
                 )
-            except subprocess.TimeoutExpired as exc:
-                last_timeout = exc
+            except subprocess.TimeoutExpired:
                 if attempt >= attempts:
                     break
                 current_prompt = self._clip_prompt_for_retry(current_prompt)
                 if not self._sleep_before_timeout_retry(attempt=attempt, deadline=deadline):
                     break
 
+        return self._finish_run(
+            provider=provider,
+            adapter=adapter,
+            effective_command=effective_command,
+            completed=completed,
+            elapsed=time.monotonic() - started,
+            timeout_seconds=timeout_seconds,
+            attempts=attempts,
+            attempts_made=attempts_made,
+        )
+
+    def _prepare_run(
+        self,
+        *,
+        participant: Participant,
+        model: str | None,
+        model_params: str | None,
+        claude_team_agents: bool,
+        codex_multi_agents: bool,
+    ) -> AdapterResult | tuple[str, ProviderAdapter, list[str], str]:
+        """Resolve provider, adapter and argv; returns an :class:`AdapterResult` when there is nothing to run."""
+        if self.dry_run:
+            simulated = (
+                f'[dry-run participant={participant.participant_id}]\\n'
+                '{"verdict":"NO_BLOCKER","next_action":"pass","issue":"n/a","impact":"n/a","next":"n/a"}\\n'
+                'Evidence:\\n'
+                '- src/awe_agentcheck/service.py\\n'
+                '- src/awe_agentcheck/adapters/base.py\\n'
+                '- tests/unit/test_service.py\\n'
+                'Verification:\\n'
+                '- py -m pytest -q tests/unit/test_service.py\\n'
+                '- py -m ruff check src/awe_agentcheck'
+            )
+            return AdapterResult(
+                output=simulated,
+                verdict='no_blocker',
+                next_action='pass',
+                returncode=0,
+                duration_seconds=0.01,
+            )
+
+        provider = str(participant.provider or '').strip().lower()
+        command = self.commands.get(provider)
+        if not command:
+            return self._runtime_error_result(
+                reason=f'command_not_configured provider={provider}',
+                duration_seconds=0.0,
+            )
+
+        provider_spec = dict(self.provider_registry.get(provider) or {})
+        adapter = self.provider_factory.create(provider=provider, provider_spec=provider_spec)
+
+        argv = adapter.build_argv(
+            command=command,
+            model=model,
+            model_params=model_params,
+            claude_team_agents=claude_team_agents,
+            codex_multi_agents=codex_multi_agents,
+        )
+        argv = self._resolve_executable(argv)
+        return provider, adapter, argv, self._format_command(argv)
+
+    def _finish_run(
+        self,
+        *,
+        provider: str,
+        adapter: ProviderAdapter,
+        effective_command: str,
+        completed: subprocess.CompletedProcess | None,
+        elapsed: float,
+        timeout_seconds: float,
+        attempts: int,
+        attempts_made: int,
+    ) -> AdapterResult:
         if completed is None:
             reason = (
                 f'command_timeout provider={provider} command={effective_command} '
                 f'timeout_seconds={timeout_seconds} attempts={attempts} attempts_made={attempts_made}'
             )
-            _ = last_timeout
             return self._runtime_error_result(
                 reason=reason,
-                duration_seconds=(time.monotonic() - started),
+                duration_seconds=elapsed,
             )
 
-        elapsed = time.monotonic() - started
         output = (completed.stdout or '').strip()
         if completed.returncode != 0:
             stderr = (completed.stderr or '').strip()
@@ -238,6 +696,13 @@ class ParticipantRunner:
             duration_seconds=elapsed,
         )
 
+    @classmethod
+    def _queue_timeout_result(cls, *, provider: str, timeout_seconds: float) -> AdapterResult:
+        return cls._runtime_error_result(
+            reason=f'provider_queue_timeout provider={provider} timeout_seconds={timeout_seconds}',
+            duration_seconds=float(timeout_seconds),
+        )
+
     @staticmethod
     def _runtime_error_result(*, reason: str, duration_seconds: float) -> AdapterResult:
         text = str(reason or '').strip() or 'adapter_runtime_error'
@@ -387,6 +852,7 @@ class ParticipantRunner:
         timeout_seconds: float,
         on_stream: Callable[[str, str], None],
         env: dict[str, str] | None = None,
+        should_stop: Callable[[], bool] | None = None,
     ) -> subprocess.CompletedProcess:
         stdin_pipe = subprocess.PIPE if runtime_input else subprocess.DEVNULL
         process = subprocess.Popen(
@@ -435,28 +901,40 @@ class ParticipantRunner:
         for worker in workers:
             worker.start()
 
+        # Coalescing callbacks expose poll()/flush() to emit windows that
+        # expire while the participant is silent and whatever is left at exit.
+        poll_stream = getattr(on_stream, 'poll', None)
+        flush_stream = getattr(on_stream, 'flush', None)
         deadline = time.monotonic() + max(0.05, float(timeout_seconds))
-        while True:
-            remaining = deadline - time.monotonic()
-            if remaining <= 0:
-                process.kill()
+        try:
+            while True:
+                remaining = deadline - time.monotonic()
+                stopped = should_stop is not None and should_stop()
+                if remaining <= 0 or stopped:
+                    process.kill()
+                    try:
+                        process.wait(timeout=2)
+                    except Exception:
+                        pass
+                    if stopped:
+                        raise ParticipantCancelled(argv[0] if argv else '')
+                    raise subprocess.TimeoutExpired(cmd=argv, timeout=timeout_seconds)
+
+                timeout = min(0.1, max(0.01, remaining))
                 try:
-                    process.wait(timeout=2)
-                except Exception:
-                    pass
-                raise subprocess.TimeoutExpired(cmd=argv, timeout=timeout_seconds)
-
-            timeout = min(0.1, max(0.01, remaining))
-            try:
-                stream_name, chunk = queue.get(timeout=timeout)
-                on_stream(stream_name, chunk)
-            except Empty:
-                pass
-
-            finished = process.poll() is not None
-            drained = queue.empty() and all(not worker.is_alive() for worker in workers)
-            if finished and drained:
-                break
+                    stream_name, chunk = queue.get(timeout=timeout)
+                    on_stream(stream_name, chunk)
+                except Empty:
+                    if callable(poll_stream):
+                        poll_stream()
+
+                finished = process.poll() is not None
+                drained = queue.empty() and all(not worker.is_alive() for worker in workers)
+                if finished and drained:
+                    break
+        finally:
+            if callable(flush_stream):
+                flush_stream()
 
         for worker in workers:
             worker.join(timeout=0.2)
@@ -496,4 +974,4 @@ class ParticipantRunner:
         return env
 
 
-__all__ = ['ParticipantRunner']
+__all__ = ['ParticipantCancelled', 'ParticipantRunner']
@@ -0,0 +1,343 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import threading
+import time
+from typing import Callable
+
+from awe_agentcheck.adapters.listeners import WeakListeners
+from awe_agentcheck.observability import get_logger
+
+_log = get_logger('awe_agentcheck.adapters.scheduler')
+
+# Fair-queueing bookkeeping is dropped for idle tasks once this many are tracked.
+_MAX_TRACKED_TASKS = 1024
+# How often a queued caller with a stop signal re-checks it.
+_STOP_POLL_SECONDS = 0.1
+
+
+@dataclass(frozen=True)
+class ProviderLimit:
+    """Admission limits for one provider (``codex``) or provider/model pair (``codex:gpt-5``).
+
+    ``concurrency`` caps simultaneous processes; ``rate_per_minute`` feeds a
+    token bucket holding up to ``burst`` launches. Zero means unlimited.
+    """
+
+    concurrency: int = 0
+    rate_per_minute: float = 0.0
+    burst: int = 0
+
+    @property
+    def bucket_size(self) -> float:
+        return float(self.burst or max(1, self.concurrency))
+
+
+def limit_key(provider: str, model: str | None = None) -> str:
+    key = str(provider or '').strip().lower()
+    model_text = str(model or '').strip().lower()
+    return f'{key}:{model_text}' if model_text else key
+
+
+def parse_provider_limits(raw: dict[str, object] | None) -> dict[str, ProviderLimit]:
+    """Normalize ``{"codex": {"concurrency": 2, "rate_per_minute": 30}}``-style config; bad entries are dropped."""
+    limits: dict[str, ProviderLimit] = {}
+    for raw_key, spec in (raw or {}).items():
+        key = str(raw_key or '').strip().lower()
+        if not key:
+            continue
+        if isinstance(spec, (int, float)) and not isinstance(spec, bool):
+            spec = {'concurrency': spec}
+        if not isinstance(spec, dict):
+            continue
+        try:
+            limits[key] = ProviderLimit(
+                concurrency=max(0, int(spec.get('concurrency') or 0)),
+                rate_per_minute=max(0.0, float(spec.get('rate_per_minute') or 0.0)),
+                burst=max(0, int(spec.get('burst') or 0)),
+            )
+        except (TypeError, ValueError):
+            continue
+    return limits
+
+
+@dataclass
+class AdmissionTicket:
+    provider: str
+    model: str | None
+    task_id: str | None
+    keys: tuple[str, ...]
+    wait_seconds: float = 0.0
+    limited_by: str = ''
+    released: bool = False
+
+
+@dataclass
+class _Waiter:
+    seq: int
+    provider: str
+    task: str
+    keys: tuple[str, ...]
+    enqueued_at: float
+
+
+@dataclass
+class _KeyStats:
+    admitted: int = 0
+    waited: int = 0
+    timeouts: int = 0
+    wait_seconds_total: float = 0.0
+    wait_seconds_max: float = 0.0
+    bucket: list[float] = field(default_factory=list)  # [tokens, last refill]
+
+
+class ProviderScheduler:
+    """Process-wide admission control for participant CLI launches.
+
+    Every launch must hold a concurrency slot and a rate token for its
+    provider, and for its provider/model pair when that pair has its own
+    limit; all of them are taken together under one lock, so a caller never
+    sits on half its permits. When several tasks queue for the same provider,
+    the next admissible caller is the one whose task was served least
+    recently, so one busy task cannot starve the others.
+
+    Listeners receive a ``provider_admission_wait`` payload whenever a caller
+    had to queue.
+    """
+
+    def __init__(
+        self,
+        *,
+        limits: dict[str, ProviderLimit] | None = None,
+        default_concurrency: int = 0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._clock = clock
+        self._cond = threading.Condition()
+        self._limits: dict[str, ProviderLimit] = {}
+        self._default = ProviderLimit()
+        self._active: dict[str, int] = {}
+        self._stats: dict[str, _KeyStats] = {}
+        self._waiters: list[_Waiter] = []
+        self._last_served: dict[tuple[str, str], int] = {}
+        self._seq = 0
+        self._grants = 0
+        self._listeners = WeakListeners()
+        self.configure(limits=limits, default_concurrency=default_concurrency)
+
+    def configure(self, *, limits: dict[str, ProviderLimit] | None = None, default_concurrency: int = 0) -> None:
+        with self._cond:
+            self._limits = dict(limits or {})
+            self._default = ProviderLimit(concurrency=max(0, int(default_concurrency)))
+            for stats in self._stats.values():
+                stats.bucket = []
+            self._cond.notify_all()
+
+    def add_listener(self, listener: Callable[[dict], None]) -> None:
+        self._listeners.add(listener)
+
+    def limit_for(self, key: str) -> ProviderLimit:
+        limit = self._limits.get(key)
+        if limit is not None:
+            return limit
+        return self._default if ':' not in key else ProviderLimit()
+
+    def acquire(
+        self,
+        provider: str,
+        *,
+        model: str | None = None,
+        task_id: str | None = None,
+        timeout: float | None = None,
+        should_stop: Callable[[], bool] | None = None,
+    ) -> AdmissionTicket | None:
+        """Block until the launch is admitted; None when *timeout* expires or *should_stop* turns true first."""
+        provider_key = limit_key(provider)
+        keys = [provider_key]
+        model_key = limit_key(provider, model)
+        if model_key != provider_key and model_key in self._limits:
+            keys.append(model_key)
+        started = self._clock()
+        deadline = None if timeout is None else started + max(0.0, float(timeout))
+        limited_by = ''
+        with self._cond:
+            self._seq += 1
+            waiter = _Waiter(
+                seq=self._seq,
+                provider=provider_key,
+                task=str(task_id or ''),
+                keys=tuple(keys),
+                enqueued_at=started,
+            )
+            self._waiters.append(waiter)
+            try:
+                while True:
+                    now = self._clock()
+                    reason, retry_after = self._blocked(waiter.keys, now)
+                    if reason is None and self._has_priority(waiter, now):
+                        self._grant(waiter, now)
+                        break
+                    limited_by = reason or 'fairness'
+                    if should_stop is not None and should_stop():
+                        return None
+                    if deadline is not None and now >= deadline:
+                        for key in waiter.keys:
+                            self._stats_for(key).timeouts += 1
+                        _log.warning(
+                            'provider_admission_timeout provider=%s model=%s waited=%.3f limited_by=%s',
+                            provider_key,
+                            model or '',
+                            now - started,
+                            limited_by,
+                        )
+                        return None
+                    wait_for = retry_after
+                    if deadline is not None:
+                        wait_for = min(wait_for, deadline - now) if wait_for is not None else deadline - now
+                    if should_stop is not None:
+                        wait_for = min(wait_for, _STOP_POLL_SECONDS) if wait_for is not None else _STOP_POLL_SECONDS
+                    self._cond.wait(timeout=wait_for)
+            finally:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+                self._cond.notify_all()
+            waited = self._clock() - started if limited_by else 0.0
+            for key in waiter.keys:
+                stats = self._stats_for(key)
+                stats.admitted += 1
+                if limited_by:
+                    stats.waited += 1
+                    stats.wait_seconds_total += waited
+                    stats.wait_seconds_max = max(stats.wait_seconds_max, waited)
+
+        ticket = AdmissionTicket(
+            provider=provider_key,
+            model=model,
+            task_id=task_id,
+            keys=tuple(keys),
+            wait_seconds=waited,
+            limited_by=limited_by,
+        )
+        if limited_by:
+            _log.info(
+                'provider_admission_wait provider=%s model=%s waited=%.3f limited_by=%s',
+                provider_key,
+                model or '',
+                waited,
+                limited_by,
+            )
+            self._listeners.notify(
+                {
+                    'type': 'provider_admission_wait',
+                    'provider': ticket.provider,
+                    'model': ticket.model or '',
+                    'task_id': ticket.task_id,
+                    'wait_seconds': round(ticket.wait_seconds, 3),
+                    'limited_by': ticket.limited_by,
+                }
+            )
+        return ticket
+
+    def release(self, ticket: AdmissionTicket | None) -> None:
+        if ticket is None:
+            return
+        with self._cond:
+            if ticket.released:
+                return
+            ticket.released = True
+            for key in ticket.keys:
+                self._active[key] = max(0, self._active.get(key, 0) - 1)
+            self._cond.notify_all()
+
+    def snapshot(self) -> dict[str, dict]:
+        """Per-key admission metrics: live slots and queue depth plus cumulative wait totals."""
+        with self._cond:
+            queued: dict[str, int] = {}
+            for waiter in self._waiters:
+                for key in waiter.keys:
+                    queued[key] = queued.get(key, 0) + 1
+            out: dict[str, dict] = {}
+            for key in sorted(set(self._stats) | set(queued)):
+                stats = self._stats_for(key)
+                limit = self.limit_for(key)
+                out[key] = {
+                    'concurrency': limit.concurrency,
+                    'rate_per_minute': limit.rate_per_minute,
+                    'active': self._active.get(key, 0),
+                    'queued': queued.get(key, 0),
+                    'admitted': stats.admitted,
+                    'waited': stats.waited,
+                    'timeouts': stats.timeouts,
+                    'wait_seconds_total': round(stats.wait_seconds_total, 3),
+                    'wait_seconds_max': round(stats.wait_seconds_max, 3),
+                    'wait_seconds_avg': round(stats.wait_seconds_total / stats.waited, 3) if stats.waited else 0.0,
+                }
+            return out
+
+    def _stats_for(self, key: str) -> _KeyStats:
+        stats = self._stats.get(key)
+        if stats is None:
+            stats = self._stats[key] = _KeyStats()
+        return stats
+
+    def _tokens(self, key: str, limit: ProviderLimit, now: float) -> float:
+        stats = self._stats_for(key)
+        size = limit.bucket_size
+        if not stats.bucket:
+            stats.bucket = [size, now]
+        tokens, last = stats.bucket
+        tokens = min(size, tokens + max(0.0, now - last) * limit.rate_per_minute / 60.0)
+        stats.bucket = [tokens, now]
+        return tokens
+
+    def _blocked(self, keys: tuple[str, ...], now: float) -> tuple[str | None, float | None]:
+        """Why *keys* cannot be admitted right now, and when a rate token will next be available."""
+        for key in keys:
+            limit = self.limit_for(key)
+            if limit.concurrency and self._active.get(key, 0) >= limit.concurrency:
+                return 'concurrency', None
+        for key in keys:
+            limit = self.limit_for(key)
+            if not limit.rate_per_minute:
+                continue
+            tokens = self._tokens(key, limit, now)
+            if tokens < 1.0:
+                return 'rate', (1.0 - tokens) * 60.0 / limit.rate_per_minute
+        return None, None
+
+    def _priority(self, waiter: _Waiter) -> tuple[int, int]:
+        return self._last_served.get((waiter.provider, waiter.task), -1), waiter.seq
+
+    def _has_priority(self, waiter: _Waiter, now: float) -> bool:
+        mine = self._priority(waiter)
+        for other in self._waiters:
+            if other is waiter or other.provider != waiter.provider:
+                continue
+            if self._priority(other) < mine and self._blocked(other.keys, now)[0] is None:
+                return False
+        return True
+
+    def _grant(self, waiter: _Waiter, now: float) -> None:
+        for key in waiter.keys:
+            self._active[key] = self._active.get(key, 0) + 1
+            limit = self.limit_for(key)
+            if limit.rate_per_minute:
+                self._stats_for(key).bucket[0] -= 1.0
+        self._last_served[(waiter.provider, waiter.task)] = self._grants
+        self._grants += 1
+        if len(self._last_served) > _MAX_TRACKED_TASKS:
+            waiting = {(item.provider, item.task) for item in self._waiters}
+            self._last_served = {key: value for key, value in self._last_served.items() if key in waiting}
+
+
+PROVIDER_SCHEDULER = ProviderScheduler()
+
+
+__all__ = [
+    'AdmissionTicket',
+    'PROVIDER_SCHEDULER',
+    'ProviderLimit',
+    'ProviderScheduler',
+    'limit_key',
+    'parse_provider_limits',
+]
@@ -11,13 +11,14 @@ from typing import Literal
 
 from fastapi import BackgroundTasks, Depends, FastAPI, HTTPException, Query, Request
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi.responses import FileResponse, JSONResponse, StreamingResponse
 from pydantic import BaseModel, Field
 
 from awe_agentcheck.domain.models import ReviewVerdict
 from awe_agentcheck.domain.models import TaskStatus
 from awe_agentcheck.repository import InMemoryTaskRepository, TaskRepository
 from awe_agentcheck.service import CreateTaskInput, GateInput, InputValidationError, OrchestratorService
+from awe_agentcheck.service_layers import format_sse
 from awe_agentcheck.storage.artifacts import ArtifactStore
 
 _log = logging.getLogger(__name__)
@@ -45,6 +46,7 @@ class CreateTaskRequest(BaseModel):
     plain_mode: bool = Field(default=True)
     stream_mode: bool = Field(default=True)
     debate_mode: bool = Field(default=True)
+    parallel_reviews: bool = Field(default=False)
     sandbox_mode: bool = Field(default=True)
     sandbox_workspace_path: str | None = Field(default=None, max_length=400)
     sandbox_cleanup_on_pass: bool = Field(default=True)
@@ -121,6 +123,7 @@ class TaskResponse(BaseModel):
     plain_mode: bool
     stream_mode: bool
     debate_mode: bool
+    parallel_reviews: bool
     sandbox_mode: bool
     sandbox_workspace_path: str | None
     sandbox_generated: bool
@@ -296,6 +299,45 @@ class AnalyticsReviewerDriftResponse(BaseModel):
     drift_score: float
 
 
+class AnalyticsProviderAdmissionResponse(BaseModel):
+    concurrency: int
+    rate_per_minute: float
+    active: int
+    queued: int
+    admitted: int
+    waited: int
+    timeouts: int
+    wait_seconds_total: float
+    wait_seconds_max: float
+    wait_seconds_avg: float
+
+
+class AnalyticsProviderCircuitResponse(BaseModel):
+    state: str
+    consecutive_failures: int
+    last_reason: str
+    trips: int
+    fallbacks: int
+    retry_in_seconds: float
+
+
+class AnalyticsResponseCacheResponse(BaseModel):
+    mode: str
+    entries: int
+    bytes: int
+    hits: int
+    misses: int
+    stores: int
+    evictions: int
+
+
+class AnalyticsManifestCacheResponse(BaseModel):
+    workspaces: int
+    hits: int
+    misses: int
+    pruned: int
+
+
 class AnalyticsResponse(BaseModel):
     generated_at: str
     window_tasks: int
@@ -304,6 +346,10 @@ class AnalyticsResponse(BaseModel):
     failure_taxonomy_trend: list[AnalyticsFailureTrendRowResponse]
     reviewer_global: AnalyticsReviewerGlobalResponse
     reviewer_drift: list[AnalyticsReviewerDriftResponse]
+    provider_admission: dict[str, AnalyticsProviderAdmissionResponse] = Field(default_factory=dict)
+    provider_circuits: dict[str, AnalyticsProviderCircuitResponse] = Field(default_factory=dict)
+    response_cache: AnalyticsResponseCacheResponse | None = None
+    manifest_cache: AnalyticsManifestCacheResponse | None = None
 
 
 class GitHubSummaryArtifactResponse(BaseModel):
@@ -417,6 +463,7 @@ def _to_task_response(task) -> TaskResponse:
         plain_mode=task.plain_mode,
         stream_mode=task.stream_mode,
         debate_mode=task.debate_mode,
+        parallel_reviews=task.parallel_reviews,
         sandbox_mode=task.sandbox_mode,
         sandbox_workspace_path=task.sandbox_workspace_path,
         sandbox_generated=task.sandbox_generated,
@@ -690,6 +737,7 @@ def create_app(
                 plain_mode=payload.plain_mode,
                 stream_mode=payload.stream_mode,
                 debate_mode=payload.debate_mode,
+                parallel_reviews=payload.parallel_reviews,
                 sandbox_mode=payload.sandbox_mode,
                 sandbox_workspace_path=payload.sandbox_workspace_path,
                 sandbox_cleanup_on_pass=payload.sandbox_cleanup_on_pass,
@@ -717,8 +765,11 @@ def create_app(
         return [_to_task_response(r) for r in rows]
 
     @app.get('/api/stats', response_model=StatsResponse)
-    def get_stats(service: OrchestratorService = Depends(get_service)) -> StatsResponse:
-        stats = service.get_stats()
+    def get_stats(
+        service: OrchestratorService = Depends(get_service),
+        refresh: bool = Query(default=False),
+    ) -> StatsResponse:
+        stats = service.get_stats(refresh=refresh)
         return StatsResponse(
             total_tasks=stats.total_tasks,
             status_counts=stats.status_counts,
@@ -1021,9 +1072,20 @@ def create_app(
         return PromoteRoundResponse(**result)
 
     @app.get('/api/tasks/{task_id}/events', response_model=list[EventResponse])
-    def list_events(task_id: str, service: OrchestratorService = Depends(get_service)) -> list[EventResponse]:
+    def list_events(
+        task_id: str,
+        service: OrchestratorService = Depends(get_service),
+        after_seq: int = Query(default=0, ge=0),
+        limit: int | None = Query(default=None, ge=1, le=5000),
+        types: list[str] | None = Query(default=None),
+    ) -> list[EventResponse]:
         try:
-            rows = service.list_events(task_id)
+            rows = service.list_events(
+                task_id,
+                after_seq=after_seq,
+                limit=limit,
+                event_types=types,
+            )
         except KeyError as exc:
             raise HTTPException(status_code=404, detail='task not found') from exc
         return [
@@ -1038,6 +1100,33 @@ def create_app(
             for row in rows
         ]
 
+    @app.get('/api/events/stream')
+    def stream_events(
+        request: Request,
+        service: OrchestratorService = Depends(get_service),
+        task_id: str | None = Query(default=None, max_length=64),
+        after_seq: int = Query(default=0, ge=0),
+        max_seconds: float | None = Query(default=None, gt=0, le=86_400),
+    ) -> StreamingResponse:
+        cursor = int(after_seq)
+        last_event_id = str(request.headers.get('last-event-id') or '').strip()
+        if last_event_id.isdigit():
+            # EventSource reconnects replay from the last delivered seq.
+            cursor = max(cursor, int(last_event_id))
+        key = str(task_id or '').strip() or None
+        if key is not None and service.get_task(key) is None:
+            try:
+                service.list_events(key, limit=1)
+            except KeyError as exc:
+                raise HTTPException(status_code=404, detail='task not found') from exc
+        # Async so an idle subscriber waits on the broker instead of pinning a threadpool worker.
+        messages = service.astream_task_updates(task_id=key, after_seq=cursor, max_seconds=max_seconds)
+        return StreamingResponse(
+            (format_sse(message) async for message in messages),
+            media_type='text/event-stream',
+            headers={'cache-control': 'no-cache', 'x-accel-buffering': 'no'},
+        )
+
     @app.post('/api/tasks/{task_id}/gate', response_model=TaskResponse)
     def evaluate_gate(task_id: str, payload: GateRequest, service: OrchestratorService = Depends(get_service)) -> TaskResponse:
         try:
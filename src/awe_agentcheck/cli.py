@@ -71,6 +71,7 @@ def build_parser() -> argparse.ArgumentParser:
     run.add_argument('--plain-mode', action=argparse.BooleanOptionalAction, default=True, help='Enable beginner-friendly plain output formatting (default: on)')
     run.add_argument('--stream-mode', action=argparse.BooleanOptionalAction, default=True, help='Enable streaming conversation events (default: on)')
     run.add_argument('--debate-mode', action=argparse.BooleanOptionalAction, default=True, help='Enable pre-implementation reviewer/author debate (default: on)')
+    run.add_argument('--parallel-reviews', action=argparse.BooleanOptionalAction, default=False, help='Run reviewers concurrently within a round (default: off)')
     run.add_argument('--auto-merge', action=argparse.BooleanOptionalAction, default=True, help='Enable auto-fusion/changelog/snapshot after passed (default: on)')
     run.add_argument('--merge-target-path', default='', help='Optional path to receive auto-merged changes')
     run.add_argument('--workspace-path', default='.', help='Target repository/workspace path')
@@ -85,7 +86,8 @@ def build_parser() -> argparse.ArgumentParser:
     tasks = sub.add_parser('tasks', help='List tasks')
     tasks.add_argument('--limit', type=int, default=20)
 
-    sub.add_parser('stats', help='Show aggregated stats')
+    stats = sub.add_parser('stats', help='Show aggregated stats')
+    stats.add_argument('--refresh', action='store_true', help='Rebuild the stats aggregate from the database first')
 
     analytics = sub.add_parser('analytics', help='Show advanced analytics')
     analytics.add_argument('--limit', type=int, default=300)
@@ -130,6 +132,9 @@ def build_parser() -> argparse.ArgumentParser:
 
     events = sub.add_parser('events', help='List task events')
     events.add_argument('task_id', help='Task id')
+    events.add_argument('--after-seq', type=int, default=0, help='Only return events with seq greater than this cursor')
+    events.add_argument('--limit', type=int, default=0, help='Maximum events to return (0 = all)')
+    events.add_argument('--type', dest='event_types', action='append', default=[], help='Event type filter (repeatable)')
 
     gh = sub.add_parser('github-summary', help='Generate GitHub/PR summary markdown for a task')
     gh.add_argument('task_id', help='Task id')
@@ -351,6 +356,7 @@ def main(argv: list[str] | None = None) -> int:
                     'plain_mode': bool(args.plain_mode),
                     'stream_mode': bool(args.stream_mode),
                     'debate_mode': bool(args.debate_mode),
+                    'parallel_reviews': bool(args.parallel_reviews),
                     'sandbox_mode': int(args.sandbox_mode) == 1,
                     'sandbox_workspace_path': (args.sandbox_workspace_path.strip() or None),
                     'self_loop_mode': int(args.self_loop_mode),
@@ -368,7 +374,7 @@ def main(argv: list[str] | None = None) -> int:
         elif args.command == 'tasks':
             response = client.get(f'{base}/api/tasks', params={'limit': int(args.limit)})
         elif args.command == 'stats':
-            response = client.get(f'{base}/api/stats')
+            response = client.get(f'{base}/api/stats', params=({'refresh': 'true'} if args.refresh else None))
         elif args.command == 'analytics':
             response = client.get(f'{base}/api/analytics', params={'limit': int(args.limit)})
         elif args.command == 'policy-templates':
@@ -394,7 +400,14 @@ def main(argv: list[str] | None = None) -> int:
                 },
             )
         elif args.command == 'events':
-            response = client.get(f'{base}/api/tasks/{args.task_id}/events')
+            params: dict[str, object] = {}
+            if int(args.after_seq) > 0:
+                params['after_seq'] = int(args.after_seq)
+            if int(args.limit) > 0:
+                params['limit'] = int(args.limit)
+            if args.event_types:
+                params['types'] = list(args.event_types)
+            response = client.get(f'{base}/api/tasks/{args.task_id}/events', params=params or None)
         elif args.command == 'github-summary':
             response = client.get(f'{base}/api/tasks/{args.task_id}/github-summary')
         elif args.command == 'tree':
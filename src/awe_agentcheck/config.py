@@ -5,6 +5,12 @@ import json
 import os
 from pathlib import Path
 
+from awe_agentcheck.adapters.circuit_breaker import parse_provider_fallbacks
+from awe_agentcheck.adapters.response_cache import normalize_cache_mode
+from awe_agentcheck.adapters.scheduler import ProviderLimit, parse_provider_limits
+from awe_agentcheck.round_snapshots import normalize_snapshot_mode
+from awe_agentcheck.sandbox_strategies import normalize_sandbox_strategy
+
 
 @dataclass(frozen=True)
 class Settings:
@@ -19,9 +25,33 @@ class Settings:
     participant_timeout_seconds: int
     command_timeout_seconds: int
     participant_timeout_retries: int
+    participant_runner: str
+    provider_max_concurrency: int
+    provider_limits: dict[str, ProviderLimit]
+    provider_breaker_failures: int
+    provider_breaker_cooldown_seconds: int
+    provider_fallbacks: dict[str, tuple[str, ...]]
+    response_cache_mode: str
+    response_cache_dir: Path
+    response_cache_ttl_seconds: int
+    response_cache_max_mb: int
     max_concurrent_running_tasks: int
     workflow_backend: str
     extra_provider_commands: dict[str, str]
+    event_batch_max_rows: int
+    event_batch_interval_ms: int
+    stream_window_ms: int
+    stream_max_bytes: int
+    parallel_reviews: bool
+    parallel_debate: bool
+    parallel_proposal_reviews: bool
+    review_max_workers: int
+    review_hedge: bool
+    manifest_hash_workers: int
+    round_snapshot_mode: str
+    sandbox_strategy: str
+    sandbox_pool_size: int
+    sandbox_pool_projects: list[str]
 
 
 def _env_int(name: str, default: int, *, minimum: int = 1) -> int:
@@ -57,6 +87,17 @@ def _env_provider_commands(name: str) -> dict[str, str]:
     return out
 
 
+def _env_json_object(name: str) -> dict:
+    raw = str(os.getenv(name, '') or '').strip()
+    if not raw:
+        return {}
+    try:
+        parsed = json.loads(raw)
+    except json.JSONDecodeError:
+        return {}
+    return parsed if isinstance(parsed, dict) else {}
+
+
 def load_settings() -> Settings:
     database_url = os.getenv(
         'AWE_DATABASE_URL',
@@ -79,11 +120,46 @@ def load_settings() -> Settings:
     participant_timeout_seconds = _env_int('AWE_PARTICIPANT_TIMEOUT_SECONDS', 3600, minimum=10)
     command_timeout_seconds = _env_int('AWE_COMMAND_TIMEOUT_SECONDS', 300, minimum=10)
     participant_timeout_retries = _env_int('AWE_PARTICIPANT_TIMEOUT_RETRIES', 1, minimum=0)
+    participant_runner = str(os.getenv('AWE_PARTICIPANT_RUNNER', 'thread') or 'thread').strip().lower()
+    if participant_runner not in {'thread', 'async'}:
+        participant_runner = 'thread'
+    # Process-wide cap on simultaneous CLI launches per provider (0 = unlimited).
+    provider_max_concurrency = _env_int('AWE_PROVIDER_MAX_CONCURRENCY', 4, minimum=0)
+    provider_limits = parse_provider_limits(_env_json_object('AWE_PROVIDER_LIMITS_JSON'))
+    # Consecutive provider_limit/command_timeout results that open a provider's circuit (0 = breaker off).
+    provider_breaker_failures = _env_int('AWE_PROVIDER_BREAKER_FAILURES', 0, minimum=0)
+    provider_breaker_cooldown_seconds = _env_int('AWE_PROVIDER_BREAKER_COOLDOWN_SECONDS', 300, minimum=1)
+    provider_fallbacks = parse_provider_fallbacks(_env_json_object('AWE_PROVIDER_FALLBACKS_JSON'))
+    response_cache_mode = normalize_cache_mode(os.getenv('AWE_RESPONSE_CACHE_MODE'))
+    response_cache_dir = Path(
+        os.getenv('AWE_RESPONSE_CACHE_DIR', '') or (artifact_root / 'response-cache')
+    ).resolve()
+    # 0 keeps cached responses until they are evicted for space.
+    response_cache_ttl_seconds = _env_int('AWE_RESPONSE_CACHE_TTL_SECONDS', 7 * 24 * 3600, minimum=0)
+    response_cache_max_mb = _env_int('AWE_RESPONSE_CACHE_MAX_MB', 256, minimum=0)
     max_concurrent_running_tasks = _env_int('AWE_MAX_CONCURRENT_RUNNING_TASKS', 1, minimum=0)
     workflow_backend = str(os.getenv('AWE_WORKFLOW_BACKEND', 'langgraph') or 'langgraph').strip().lower()
     if workflow_backend not in {'langgraph', 'classic'}:
         workflow_backend = 'langgraph'
     extra_provider_commands = _env_provider_commands('AWE_PROVIDER_ADAPTERS_JSON')
+    # 0 disables group commit and writes every event in its own transaction.
+    event_batch_max_rows = _env_int('AWE_EVENT_BATCH_MAX_ROWS', 200, minimum=0)
+    event_batch_interval_ms = _env_int('AWE_EVENT_BATCH_INTERVAL_MS', 50, minimum=1)
+    # participant_stream chunks are merged per stream until either limit is hit (0 ms = one event per chunk).
+    stream_window_ms = _env_int('AWE_STREAM_COALESCE_MS', 250, minimum=0)
+    stream_max_bytes = _env_int('AWE_STREAM_COALESCE_BYTES', 4096, minimum=1)
+    parallel_reviews = os.getenv('AWE_PARALLEL_REVIEWS', '').strip().lower() in {'1', 'true', 'yes', 'on'}
+    parallel_debate = os.getenv('AWE_PARALLEL_DEBATE', '').strip().lower() in {'1', 'true', 'yes', 'on'}
+    parallel_proposal_reviews = os.getenv('AWE_PARALLEL_PROPOSAL_REVIEWS', '').strip().lower() in {'1', 'true', 'yes', 'on'}
+    review_max_workers = _env_int('AWE_REVIEW_MAX_WORKERS', 4, minimum=1)
+    review_hedge = os.getenv('AWE_REVIEW_HEDGE', '').strip().lower() in {'1', 'true', 'yes', 'on'}
+    manifest_hash_workers = _env_int('AWE_MANIFEST_HASH_WORKERS', 0, minimum=0)
+    round_snapshot_mode = normalize_snapshot_mode(os.getenv('AWE_ROUND_SNAPSHOT_MODE'))
+    sandbox_strategy = normalize_sandbox_strategy(os.getenv('AWE_SANDBOX_STRATEGY'))
+    sandbox_pool_size = _env_int('AWE_SANDBOX_POOL_SIZE', 0, minimum=0)
+    sandbox_pool_projects = [
+        item.strip() for item in os.getenv('AWE_SANDBOX_POOL_PROJECTS', '').split(os.pathsep) if item.strip()
+    ]
     return Settings(
         database_url=database_url,
         artifact_root=artifact_root,
@@ -96,7 +172,31 @@ def load_settings() -> Settings:
         participant_timeout_seconds=participant_timeout_seconds,
         command_timeout_seconds=command_timeout_seconds,
         participant_timeout_retries=participant_timeout_retries,
+        participant_runner=participant_runner,
+        provider_max_concurrency=provider_max_concurrency,
+        provider_limits=provider_limits,
+        provider_breaker_failures=provider_breaker_failures,
+        provider_breaker_cooldown_seconds=provider_breaker_cooldown_seconds,
+        provider_fallbacks=provider_fallbacks,
+        response_cache_mode=response_cache_mode,
+        response_cache_dir=response_cache_dir,
+        response_cache_ttl_seconds=response_cache_ttl_seconds,
+        response_cache_max_mb=response_cache_max_mb,
         max_concurrent_running_tasks=max_concurrent_running_tasks,
         workflow_backend=workflow_backend,
         extra_provider_commands=extra_provider_commands,
+        event_batch_max_rows=event_batch_max_rows,
+        event_batch_interval_ms=event_batch_interval_ms,
+        stream_window_ms=stream_window_ms,
+        stream_max_bytes=stream_max_bytes,
+        parallel_reviews=parallel_reviews,
+        parallel_debate=parallel_debate,
+        parallel_proposal_reviews=parallel_proposal_reviews,
+        review_max_workers=review_max_workers,
+        review_hedge=review_hedge,
+        manifest_hash_workers=manifest_hash_workers,
+        round_snapshot_mode=round_snapshot_mode,
+        sandbox_strategy=sandbox_strategy,
+        sandbox_pool_size=sandbox_pool_size,
+        sandbox_pool_projects=sandbox_pool_projects,
     )
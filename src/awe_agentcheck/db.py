@@ -1,8 +1,12 @@
 from __future__ import annotations
 
 from contextlib import contextmanager
+from dataclasses import dataclass
 from datetime import datetime, timezone
 import json
+import logging
+import queue
+import threading
 import time
 from typing import Iterator
 from uuid import uuid4
@@ -28,7 +32,19 @@ from sqlalchemy.exc import IntegrityError, OperationalError
 from sqlalchemy.orm import DeclarativeBase, Mapped, Session, mapped_column, relationship, sessionmaker
 
 from awe_agentcheck.domain.events import EventType, normalize_event_type
-from awe_agentcheck.repository import TaskCreateRecord, decode_task_meta, encode_task_meta
+from awe_agentcheck.repository import (
+    TASK_CHANGE_CREATED,
+    TASK_CHANGE_DELETED,
+    TASK_CHANGE_EVENT,
+    TASK_CHANGE_UPDATED,
+    TaskChangeNotifier,
+    TaskCreateRecord,
+    decode_task_meta,
+    encode_task_meta,
+    normalize_event_type_filter,
+)
+
+_log = logging.getLogger(__name__)
 
 
 def _iso_utc(value: datetime) -> str:
@@ -131,9 +147,307 @@ class Database:
             conn.exec_driver_sql('PRAGMA busy_timeout=30000')
 
 
-class SqlTaskRepository:
-    def __init__(self, db: Database):
+@dataclass(frozen=True)
+class _PendingEvent:
+    ticket: int
+    task_id: str
+    seq: int
+    event_type: str
+    round_number: int | None
+    payload_json: str
+    created_at: datetime
+
+
+_FLUSH_MARKER = object()
+_STOP_MARKER = object()
+
+
+class BatchedEventWriter:
+    """Group-commit writer behind :meth:`SqlTaskRepository.append_event`.
+
+    ``seq`` values are assigned per task in memory when an event is submitted,
+    so callers get them back immediately and ordering within a task follows
+    submission order. A single writer thread drains the queue and inserts up
+    to *max_batch_rows* events per transaction, committing at least every
+    *flush_interval_ms*. :meth:`flush` is a barrier: once it returns, every
+    event submitted before the call is committed.
+
+    At most *queue_size* events are in flight; submitters wait for room
+    before taking the seq lock, so a full queue never blocks the writer
+    thread, and the writer thread itself never waits for room (change
+    listeners may append events). Seq counters are loaded from the database
+    outside the lock.
+
+    In-memory seq assignment assumes one writing process per database.
+    """
+
+    def __init__(
+        self,
+        repository: SqlTaskRepository,
+        *,
+        max_batch_rows: int = 200,
+        flush_interval_ms: int = 50,
+        queue_size: int = 10_000,
+    ):
+        self._repository = repository
+        self._max_batch_rows = max(1, int(max_batch_rows))
+        self._flush_interval = max(1, int(flush_interval_ms)) / 1000.0
+        self._max_in_flight = max(1, int(queue_size))
+        # Unbounded: capacity is enforced by _room before the seq lock is taken.
+        self._queue: queue.Queue = queue.Queue()
+        self._submit_lock = threading.Lock()
+        self._room = threading.Condition()
+        self._in_flight = 0
+        self._next_seq: dict[str, int] = {}
+        # Tasks whose in-memory seq collided with the database; reloaded on next submit.
+        self._stale_lock = threading.Lock()
+        self._stale_tasks: set[str] = set()
+        self._submitted = 0
+        self._persisted = 0
+        self._failed = 0
+        self._persisted_cond = threading.Condition()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name='awe-event-writer', daemon=True)
+        self._thread.start()
+
+    @property
+    def failed_events(self) -> int:
+        """Events that could not be written at all (the task was not deleted)."""
+        return self._failed
+
+    def submit(
+        self,
+        task_id: str,
+        *,
+        event_type: str | EventType,
+        payload: dict,
+        round_number: int | None = None,
+    ) -> dict:
+        created_at = datetime.now(timezone.utc)
+        normalized_type = normalize_event_type(event_type)
+        payload_json = json.dumps(payload, ensure_ascii=True)
+        if self._closed:
+            raise RuntimeError('event_writer_closed')
+        self._wait_for_room()
+        try:
+            seq = self._assign_seq(task_id, payload_json, normalized_type, round_number, created_at)
+        except BaseException:
+            self._release_room(1)
+            raise
+        return {
+            'id': None,
+            'task_id': task_id,
+            'seq': seq,
+            'type': normalized_type,
+            'round': round_number,
+            'payload': json.loads(payload_json),
+            'created_at': _iso_utc(created_at),
+        }
+
+    def _assign_seq(
+        self,
+        task_id: str,
+        payload_json: str,
+        event_type: str,
+        round_number: int | None,
+        created_at: datetime,
+    ) -> int:
+        with self._stale_lock:
+            stale = task_id in self._stale_tasks
+            self._stale_tasks.discard(task_id)
+        loaded: int | None = None
+        with self._submit_lock:
+            if stale:
+                self._next_seq.pop(task_id, None)
+            known = task_id in self._next_seq
+        if not known:
+            # Database read outside the lock; a concurrent first submit may win the race.
+            loaded = self._repository._load_next_event_seq(task_id)
+        with self._submit_lock:
+            if self._closed:
+                raise RuntimeError('event_writer_closed')
+            seq = self._next_seq.get(task_id)
+            if seq is None:
+                seq = int(loaded) if loaded is not None else self._repository._load_next_event_seq(task_id)
+            self._next_seq[task_id] = seq + 1
+            self._submitted += 1
+            # Never blocks (unbounded queue), so queue order matches seq order per task.
+            self._queue.put_nowait(
+                _PendingEvent(
+                    ticket=self._submitted,
+                    task_id=task_id,
+                    seq=seq,
+                    event_type=event_type,
+                    round_number=round_number,
+                    payload_json=payload_json,
+                    created_at=created_at,
+                )
+            )
+        return seq
+
+    def _wait_for_room(self) -> None:
+        with self._room:
+            if threading.current_thread() is not self._thread:
+                self._room.wait_for(lambda: self._in_flight < self._max_in_flight or self._closed)
+            self._in_flight += 1
+
+    def _release_room(self, count: int) -> None:
+        with self._room:
+            self._in_flight = max(0, self._in_flight - count)
+            self._room.notify_all()
+
+    def flush(self, *, timeout: float | None = None) -> bool:
+        """Block until everything submitted so far is committed."""
+        if threading.current_thread() is self._thread:
+            # Change listeners run on the writer thread; never wait on ourselves.
+            return True
+        with self._submit_lock:
+            target = self._submitted
+        with self._persisted_cond:
+            if self._persisted >= target:
+                return True
+        if not self._thread.is_alive():
+            return False
+        self._queue.put(_FLUSH_MARKER)
+        with self._persisted_cond:
+            return self._persisted_cond.wait_for(
+                lambda: self._persisted >= target or not self._thread.is_alive(),
+                timeout=timeout,
+            ) and self._persisted >= target
+
+    def forget(self, task_ids: list[str]) -> None:
+        with self._submit_lock:
+            for task_id in task_ids:
+                self._next_seq.pop(task_id, None)
+
+    def close(self, *, timeout: float | None = 10.0) -> None:
+        with self._submit_lock:
+            if self._closed:
+                return
+            self._closed = True
+        with self._room:
+            self._room.notify_all()
+        self._queue.put(_STOP_MARKER)
+        self._thread.join(timeout)
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is _STOP_MARKER:
+                return
+            batch: list[_PendingEvent] = []
+            stop = False
+            if item is not _FLUSH_MARKER:
+                batch.append(item)
+                deadline = time.monotonic() + self._flush_interval
+                while len(batch) < self._max_batch_rows:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    try:
+                        item = self._queue.get(timeout=remaining)
+                    except queue.Empty:
+                        break
+                    if item is _FLUSH_MARKER:
+                        break
+                    if item is _STOP_MARKER:
+                        stop = True
+                        break
+                    batch.append(item)
+            if batch:
+                try:
+                    self._write(batch)
+                finally:
+                    self._release_room(len(batch))
+            with self._persisted_cond:
+                self._persisted_cond.notify_all()
+            if stop:
+                return
+
+    def _write(self, batch: list[_PendingEvent]) -> None:
+        try:
+            created = self._repository._insert_event_batch(batch)
+        except Exception:
+            _log.exception('event batch write failed; retrying %s events one by one', len(batch))
+            created = self._write_individually(batch)
+        # Notify before releasing flush waiters so listeners see events ahead
+        # of the status transition that triggered the barrier.
+        for event in created:
+            self._repository._notify_change(TASK_CHANGE_EVENT, event)
+        with self._persisted_cond:
+            self._persisted = max(self._persisted, batch[-1].ticket)
+            self._persisted_cond.notify_all()
+
+    def _write_individually(self, batch: list[_PendingEvent]) -> list[dict]:
+        created: list[dict] = []
+        stale_tasks: set[str] = set()
+        for pending in batch:
+            try:
+                created.extend(self._repository._insert_event_batch([pending]))
+                continue
+            except IntegrityError:
+                stale_tasks.add(pending.task_id)
+            except Exception:
+                _log.exception(
+                    'event write failed task_id=%s seq=%s; retrying with a reserved seq',
+                    pending.task_id,
+                    pending.seq,
+                )
+                stale_tasks.add(pending.task_id)
+            # The in-memory seq collided with a row written elsewhere, or the
+            # row could not be written as assigned; fall back to the
+            # counter-reserved path so the event is not lost.
+            try:
+                created.append(
+                    self._repository._append_event_now(
+                        pending.task_id,
+                        event_type=pending.event_type,
+                        payload=json.loads(pending.payload_json),
+                        round_number=pending.round_number,
+                        notify=False,
+                    )
+                )
+            except KeyError:
+                _log.warning('dropping event for deleted task task_id=%s', pending.task_id)
+            except Exception:
+                self._failed += 1
+                _log.exception('event lost task_id=%s seq=%s', pending.task_id, pending.seq)
+        if stale_tasks:
+            # Runs on the writer thread: never take _submit_lock here.
+            with self._stale_lock:
+                self._stale_tasks.update(stale_tasks)
+        return created
+
+
+class SqlTaskRepository(TaskChangeNotifier):
+    def __init__(
+        self,
+        db: Database,
+        *,
+        event_batch_rows: int = 0,
+        event_batch_interval_ms: int = 50,
+        event_queue_size: int = 10_000,
+    ):
         self.db = db
+        self._init_change_listeners()
+        self._event_writer: BatchedEventWriter | None = None
+        if int(event_batch_rows) > 0:
+            self._event_writer = BatchedEventWriter(
+                self,
+                max_batch_rows=event_batch_rows,
+                flush_interval_ms=event_batch_interval_ms,
+                queue_size=event_queue_size,
+            )
+
+    def flush_events(self, *, timeout: float | None = None) -> bool:
+        """Persist every event appended so far. No-op without batching."""
+        if self._event_writer is None:
+            return True
+        return self._event_writer.flush(timeout=timeout)
+
+    def close(self) -> None:
+        if self._event_writer is not None:
+            self._event_writer.close()
 
     def _sqlite_lock_retry_attempts(self) -> int:
         return 8 if self.db.engine.dialect.name == 'sqlite' else 1
@@ -174,6 +488,7 @@ class SqlTaskRepository:
                 plain_mode=record.plain_mode,
                 stream_mode=record.stream_mode,
                 debate_mode=record.debate_mode,
+                parallel_reviews=record.parallel_reviews,
                 auto_merge=record.auto_merge,
                 merge_target_path=record.merge_target_path,
                 sandbox_mode=record.sandbox_mode,
@@ -197,13 +512,34 @@ class SqlTaskRepository:
         )
         with self.db.session() as session:
             session.add(task)
-        return self._task_to_dict(task)
+        created = self._task_to_dict(task)
+        self._notify_change(TASK_CHANGE_CREATED, created)
+        return created
 
     def list_tasks(self, *, limit: int = 100) -> list[dict]:
         with self.db.session() as session:
             rows = session.execute(select(TaskEntity).order_by(TaskEntity.created_at.desc()).limit(limit)).scalars().all()
             return [self._task_to_dict(r) for r in rows]
 
+    def count_tasks_by_status(self, statuses: list[str] | None = None) -> dict[str, int]:
+        with self.db.session() as session:
+            stmt = select(TaskEntity.status, func.count()).group_by(TaskEntity.status)
+            if statuses is not None:
+                stmt = stmt.where(TaskEntity.status.in_(list(statuses)))
+            return {str(status): int(count) for status, count in session.execute(stmt).all()}
+
+    def list_task_ids_by_status(self, status: str, *, limit: int | None = None) -> list[str]:
+        # Served from ix_tasks_status_created_at without loading or decoding task meta.
+        with self.db.session() as session:
+            stmt = (
+                select(TaskEntity.task_id)
+                .where(TaskEntity.status == status)
+                .order_by(TaskEntity.created_at.desc())
+            )
+            if limit is not None:
+                stmt = stmt.limit(max(0, int(limit)))
+            return [str(task_id) for task_id in session.execute(stmt).scalars().all()]
+
     def get_task(self, task_id: str) -> dict | None:
         with self.db.session() as session:
             row = session.get(TaskEntity, task_id)
@@ -219,6 +555,7 @@ class SqlTaskRepository:
         reason: str | None,
         rounds_completed: int | None = None,
     ) -> dict:
+        self.flush_events()
         attempts = self._sqlite_lock_retry_attempts()
         for attempt in range(1, attempts + 1):
             try:
@@ -233,7 +570,9 @@ class SqlTaskRepository:
                     row.updated_at = datetime.now(timezone.utc)
                     session.add(row)
                     session.flush()
-                    return self._task_to_dict(row)
+                    updated = self._task_to_dict(row)
+                self._notify_change(TASK_CHANGE_UPDATED, updated)
+                return updated
             except OperationalError as exc:
                 if (not self._is_sqlite_lock_error(exc)) or attempt >= attempts:
                     raise
@@ -250,6 +589,7 @@ class SqlTaskRepository:
         rounds_completed: int | None = None,
         set_cancel_requested: bool | None = None,
     ) -> dict | None:
+        self.flush_events()
         attempts = self._sqlite_lock_retry_attempts()
         for attempt in range(1, attempts + 1):
             try:
@@ -283,7 +623,9 @@ class SqlTaskRepository:
                     row = session.get(TaskEntity, task_id)
                     if row is None:
                         raise KeyError(task_id)
-                    return self._task_to_dict(row)
+                    updated = self._task_to_dict(row)
+                self._notify_change(TASK_CHANGE_UPDATED, updated)
+                return updated
             except OperationalError as exc:
                 if (not self._is_sqlite_lock_error(exc)) or attempt >= attempts:
                     raise
@@ -291,6 +633,7 @@ class SqlTaskRepository:
         raise RuntimeError('update_task_status_if_retry_exhausted')
 
     def set_cancel_requested(self, task_id: str, *, requested: bool) -> dict:
+        self.flush_events()
         attempts = self._sqlite_lock_retry_attempts()
         for attempt in range(1, attempts + 1):
             try:
@@ -302,7 +645,9 @@ class SqlTaskRepository:
                     row.updated_at = datetime.now(timezone.utc)
                     session.add(row)
                     session.flush()
-                    return self._task_to_dict(row)
+                    updated = self._task_to_dict(row)
+                self._notify_change(TASK_CHANGE_UPDATED, updated)
+                return updated
             except OperationalError as exc:
                 if (not self._is_sqlite_lock_error(exc)) or attempt >= attempts:
                     raise
@@ -331,6 +676,29 @@ class SqlTaskRepository:
         event_type: str | EventType,
         payload: dict,
         round_number: int | None = None,
+    ) -> dict:
+        if self._event_writer is not None:
+            return self._event_writer.submit(
+                task_id,
+                event_type=event_type,
+                payload=payload,
+                round_number=round_number,
+            )
+        return self._append_event_now(
+            task_id,
+            event_type=event_type,
+            payload=payload,
+            round_number=round_number,
+        )
+
+    def _append_event_now(
+        self,
+        task_id: str,
+        *,
+        event_type: str | EventType,
+        payload: dict,
+        round_number: int | None = None,
+        notify: bool = True,
     ) -> dict:
         now = datetime.now(timezone.utc)
         max_attempts = max(3, self._sqlite_lock_retry_attempts())
@@ -352,7 +720,10 @@ class SqlTaskRepository:
                     )
                     session.add(event)
                     session.flush()
-                    return self._event_to_dict(event)
+                    created = self._event_to_dict(event)
+                if notify:
+                    self._notify_change(TASK_CHANGE_EVENT, created)
+                return created
             except IntegrityError:
                 if attempt + 1 >= max_attempts:
                     raise
@@ -362,16 +733,81 @@ class SqlTaskRepository:
                 time.sleep(self._sqlite_lock_backoff_seconds(attempt + 1))
         raise RuntimeError('append_event_retry_exhausted')
 
-    def list_events(self, task_id: str) -> list[dict]:
+    def _load_next_event_seq(self, task_id: str) -> int:
+        with self.db.session() as session:
+            if session.get(TaskEntity, task_id) is None:
+                raise KeyError(task_id)
+            counter = session.get(TaskEventCounterEntity, task_id)
+            if counter is not None:
+                return int(counter.next_seq)
+            max_seq = session.execute(
+                select(func.coalesce(func.max(TaskEventEntity.seq), 0))
+                .where(TaskEventEntity.task_id == task_id)
+            ).scalar_one()
+            return int(max_seq) + 1
+
+    def _insert_event_batch(self, batch: list[_PendingEvent]) -> list[dict]:
+        last_seq: dict[str, int] = {}
+        for pending in batch:
+            last_seq[pending.task_id] = max(last_seq.get(pending.task_id, 0), pending.seq)
+        attempts = self._sqlite_lock_retry_attempts()
+        for attempt in range(1, attempts + 1):
+            try:
+                with self.db.session() as session:
+                    rows = [
+                        TaskEventEntity(
+                            task_id=pending.task_id,
+                            seq=pending.seq,
+                            event_type=pending.event_type,
+                            round_number=pending.round_number,
+                            payload_json=pending.payload_json,
+                            created_at=pending.created_at,
+                        )
+                        for pending in batch
+                    ]
+                    session.add_all(rows)
+                    # Keep the counter table in step so the unbatched path and
+                    # future writers continue after the last batched seq.
+                    for task_id, seq in last_seq.items():
+                        counter = session.get(TaskEventCounterEntity, task_id)
+                        if counter is None:
+                            session.add(TaskEventCounterEntity(task_id=task_id, next_seq=seq + 1))
+                        elif int(counter.next_seq) <= seq:
+                            counter.next_seq = seq + 1
+                    session.flush()
+                    return [self._event_to_dict(row) for row in rows]
+            except OperationalError as exc:
+                if (not self._is_sqlite_lock_error(exc)) or attempt >= attempts:
+                    raise
+                time.sleep(self._sqlite_lock_backoff_seconds(attempt))
+        raise RuntimeError('insert_event_batch_retry_exhausted')
+
+    def list_events(
+        self,
+        task_id: str,
+        *,
+        after_seq: int | None = None,
+        limit: int | None = None,
+        event_types: list[str] | None = None,
+    ) -> list[dict]:
+        self.flush_events()
         with self.db.session() as session:
             task = session.get(TaskEntity, task_id)
             if task is None:
                 raise KeyError(task_id)
-            rows = session.execute(
-                select(TaskEventEntity)
-                .where(TaskEventEntity.task_id == task_id)
-                .order_by(TaskEventEntity.seq.asc())
-            ).scalars().all()
+            # (task_id, seq) is covered by uq_task_events_task_id_seq, so the
+            # cursor turns into a range scan on that index.
+            stmt = select(TaskEventEntity).where(TaskEventEntity.task_id == task_id)
+            cursor = max(0, int(after_seq or 0))
+            if cursor > 0:
+                stmt = stmt.where(TaskEventEntity.seq > cursor)
+            types = normalize_event_type_filter(event_types)
+            if types:
+                stmt = stmt.where(TaskEventEntity.event_type.in_(types))
+            stmt = stmt.order_by(TaskEventEntity.seq.asc())
+            if limit is not None:
+                stmt = stmt.limit(max(0, int(limit)))
+            rows = session.execute(stmt).scalars().all()
             return [self._event_to_dict(r) for r in rows]
 
     def delete_tasks(self, task_ids: list[str]) -> int:
@@ -386,6 +822,7 @@ class SqlTaskRepository:
         if not unique_ids:
             return 0
 
+        self.flush_events()
         deleted = 0
         with self.db.session() as session:
             session.execute(
@@ -394,10 +831,16 @@ class SqlTaskRepository:
             rows = session.execute(
                 select(TaskEntity).where(TaskEntity.task_id.in_(unique_ids))
             ).scalars().all()
+            deleted_ids: list[str] = []
             for row in rows:
+                deleted_ids.append(row.task_id)
                 session.delete(row)
                 deleted += 1
             session.flush()
+        if self._event_writer is not None:
+            self._event_writer.forget(unique_ids)
+        if deleted_ids:
+            self._notify_change(TASK_CHANGE_DELETED, {'task_ids': deleted_ids})
         return deleted
 
     @staticmethod
@@ -491,6 +934,7 @@ class SqlTaskRepository:
             'plain_mode': bool(meta.get('plain_mode', True)),
             'stream_mode': bool(meta.get('stream_mode', True)),
             'debate_mode': bool(meta.get('debate_mode', True)),
+            'parallel_reviews': bool(meta.get('parallel_reviews', False)),
             'auto_merge': bool(meta.get('auto_merge', True)),
             'merge_target_path': meta.get('merge_target_path'),
             'sandbox_mode': bool(meta.get('sandbox_mode', False)),
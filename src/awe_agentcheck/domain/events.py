@@ -62,6 +62,9 @@ class EventType(str, Enum):
     PROPOSAL_REVIEW_PARTIAL = 'proposal_review_partial'
     PROPOSAL_REVIEW_STARTED = 'proposal_review_started'
     PROPOSAL_REVIEW_UNAVAILABLE = 'proposal_review_unavailable'
+    PROVIDER_ADMISSION_WAIT = 'provider_admission_wait'
+    PROVIDER_CIRCUIT_STATE = 'provider_circuit_state'
+    PROVIDER_FALLBACK_ROUTED = 'provider_fallback_routed'
     REGRESSION_CASE_RECORDED = 'regression_case_recorded'
     REVIEW = 'review'
     REVIEW_ERROR = 'review_error'
@@ -1,13 +1,26 @@
 from __future__ import annotations
 
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
 import hashlib
 import json
+import os
 from pathlib import Path
-import shutil
+import re
+import threading
+import time
+from typing import Iterator
 import zipfile
 
+from awe_agentcheck.fusion_merge import MergeTransaction
+from awe_agentcheck.observability import get_logger
+from awe_agentcheck.storage.content_store import ContentStore
+from awe_agentcheck.workspace_walk import walk_workspace
+
+_log = get_logger("awe_agentcheck.fusion")
+
 
 IGNORED_PATH_PARTS = {
     ".git",
@@ -23,6 +36,133 @@ IGNORED_PATH_PARTS = {
 }
 
 
+# Files modified this recently are hashed but not cached: a same-size rewrite
+# within the filesystem's mtime granularity would otherwise look unchanged.
+_RACY_MTIME_WINDOW_NS = 2_000_000_000
+# Hash jobs queued ahead of the in-order consumer, per worker.
+_HASH_PREFETCH_PER_WORKER = 4
+# Workspace cache files kept before the least recently saved are pruned.
+DEFAULT_MANIFEST_CACHE_WORKSPACES = 512
+
+
+def default_hash_workers() -> int:
+    return max(1, min(8, os.cpu_count() or 1))
+
+
+class ManifestHashCache:
+    """Persistent file-hash cache, one JSON file per workspace under *root*.
+
+    Entries are keyed by relative path and only reused while the file's
+    (size, mtime_ns, inode) still match, so unchanged files skip rehashing.
+    Sandboxes and round snapshots come and go, so :meth:`forget` drops a
+    removed workspace's file and the directory is capped at
+    *max_workspaces* files, pruning the least recently saved first.
+    """
+
+    VERSION = 1
+
+    def __init__(self, root: Path, *, max_workspaces: int = DEFAULT_MANIFEST_CACHE_WORKSPACES):
+        self.root = Path(root)
+        self.max_workspaces = max(1, int(max_workspaces))
+        self.hits = 0
+        self.misses = 0
+        self.pruned = 0
+        self._lock = threading.Lock()
+        # Number of cache files on disk; counted on first save.
+        self._files: int | None = None
+
+    def path_for(self, workspace: Path) -> Path:
+        resolved = str(Path(workspace).resolve(strict=False))
+        key = hashlib.sha256(resolved.encode("utf-8")).hexdigest()[:24]
+        return self.root / f"{key}.json"
+
+    def load(self, workspace: Path) -> dict[str, list]:
+        path = self.path_for(workspace)
+        try:
+            with self._lock:
+                data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get("version") != self.VERSION:
+            return {}
+        entries = data.get("entries")
+        return entries if isinstance(entries, dict) else {}
+
+    def save(self, workspace: Path, entries: dict[str, list]) -> None:
+        path = self.path_for(workspace)
+        payload = {
+            "version": self.VERSION,
+            "workspace": str(Path(workspace).resolve(strict=False)),
+            "entries": entries,
+        }
+        tmp = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+        try:
+            with self._lock:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                created = not path.exists()
+                tmp.write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+                os.replace(tmp, path)
+                if created:
+                    self._files = self._count_files() if self._files is None else self._files + 1
+                if self._files is not None and self._files > self.max_workspaces:
+                    self._prune_locked()
+        except OSError:
+            _log.debug("manifest_cache_save_failed path=%s", str(path))
+            tmp.unlink(missing_ok=True)
+
+    def forget(self, workspace: Path) -> bool:
+        """Drop the cache file of a workspace that is being removed."""
+        path = self.path_for(workspace)
+        with self._lock:
+            try:
+                path.unlink()
+            except OSError:
+                return False
+            if self._files is not None:
+                self._files = max(0, self._files - 1)
+        return True
+
+    def record(self, *, hits: int, misses: int) -> None:
+        with self._lock:
+            self.hits += hits
+            self.misses += misses
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            if self._files is None:
+                self._files = self._count_files()
+            return {
+                "workspaces": self._files,
+                "hits": self.hits,
+                "misses": self.misses,
+                "pruned": self.pruned,
+            }
+
+    def _count_files(self) -> int:
+        try:
+            return sum(1 for _ in self.root.glob("*.json"))
+        except OSError:
+            return 0
+
+    def _prune_locked(self) -> None:
+        files: list[tuple[float, Path]] = []
+        for path in self.root.glob("*.json"):
+            try:
+                files.append((path.stat().st_mtime, path))
+            except OSError:
+                continue
+        files.sort(key=lambda item: item[0])
+        excess = len(files) - self.max_workspaces
+        for _, path in files[: max(0, excess)]:
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            self.pruned += 1
+        self._files = self._count_files()
+        _log.debug("manifest_cache_pruned root=%s pruned=%d", str(self.root), max(0, excess))
+
+
 @dataclass(frozen=True)
 class FusionResult:
     source_path: str
@@ -37,17 +177,113 @@ class FusionResult:
 
 
 class AutoFusionManager:
-    def __init__(self, *, snapshot_root: Path):
+    def __init__(
+        self,
+        *,
+        snapshot_root: Path,
+        hash_cache_root: Path | None = None,
+        hash_workers: int = 0,
+        content_store: ContentStore | None = None,
+    ):
         self.snapshot_root = Path(snapshot_root)
         self.snapshot_root.mkdir(parents=True, exist_ok=True)
+        self.hash_cache = ManifestHashCache(hash_cache_root) if hash_cache_root is not None else None
+        # 0 picks a default from the CPU count; 1 hashes on the calling thread.
+        self.hash_workers = int(hash_workers) if int(hash_workers) > 0 else default_hash_workers()
+        # With a content store, snapshot archives carry blob digests instead of file bodies.
+        self.content_store = content_store
+
+    def build_manifest(
+        self,
+        root: Path,
+        *,
+        full_rehash: bool = False,
+        seed_root: Path | None = None,
+    ) -> dict[str, str]:
+        """Map each workspace file to its SHA-256.
+
+        With a hash cache, files whose stat is unchanged reuse the cached
+        digest; *full_rehash* ignores the cache and rebuilds it from scratch.
+        *seed_root* also consults that tree's cache, which lets a snapshot
+        hardlinked from *seed_root* (same inode, size and mtime) skip hashing.
+        """
+        return dict(self.iter_manifest(root, full_rehash=full_rehash, seed_root=seed_root))
 
-    def build_manifest(self, root: Path) -> dict[str, str]:
+    def forget_manifest(self, root: Path) -> None:
+        """Drop the cached hashes of a workspace that is being removed."""
+        if self.hash_cache is not None:
+            self.hash_cache.forget(Path(root))
+
+    def iter_manifest(
+        self,
+        root: Path,
+        *,
+        full_rehash: bool = False,
+        seed_root: Path | None = None,
+    ) -> Iterator[tuple[str, str]]:
+        """Stream ``(rel_path, sha256)`` pairs in walk order.
+
+        Cache misses are hashed on ``hash_workers`` threads with a bounded
+        look-ahead, so very large trees never hold more than a small window
+        of pending work. The hash cache is only rewritten once the walk has
+        been fully consumed.
+        """
         base = Path(root)
-        manifest: dict[str, str] = {}
-        for path in self._iter_files(base):
-            rel = path.relative_to(base).as_posix()
-            manifest[rel] = self._hash_file(path)
-        return manifest
+        cache = self.hash_cache
+        cached: dict[str, list] = {}
+        if cache is not None and not full_rehash:
+            if seed_root is not None:
+                cached.update(cache.load(Path(seed_root)))
+            cached.update(cache.load(base))
+        fresh: dict[str, list] = {}
+        hits = 0
+        misses = 0
+        racy_after = time.time_ns() - _RACY_MTIME_WINDOW_NS
+        executor = (
+            ThreadPoolExecutor(max_workers=self.hash_workers, thread_name_prefix="awe-hash")
+            if self.hash_workers > 1
+            else None
+        )
+        max_pending = self.hash_workers * _HASH_PREFETCH_PER_WORKER
+        window: deque[tuple[str, list, Future | str]] = deque()
+
+        def settle() -> tuple[str, str]:
+            rel, key, pending = window.popleft()
+            digest = pending.result() if isinstance(pending, Future) else pending
+            if key[1] < racy_after:
+                fresh[rel] = [*key, digest]
+            return rel, digest
+
+        try:
+            for rel, info in walk_workspace(base, ignore_names=IGNORED_PATH_PARTS):
+                key = [int(info.st_size), int(info.st_mtime_ns), int(info.st_ino)]
+                entry = cached.get(rel)
+                if isinstance(entry, list) and len(entry) == 4 and entry[:3] == key:
+                    window.append((rel, key, str(entry[3])))
+                    hits += 1
+                else:
+                    path = base / rel
+                    job = executor.submit(self._hash_file, path) if executor is not None else self._hash_file(path)
+                    window.append((rel, key, job))
+                    misses += 1
+                while len(window) > max_pending:
+                    yield settle()
+            while window:
+                yield settle()
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True, cancel_futures=True)
+        if cache is not None:
+            cache.save(base, fresh)
+            cache.record(hits=hits, misses=misses)
+            _log.debug(
+                "manifest_built root=%s files=%d hits=%d workers=%d full_rehash=%s",
+                str(base),
+                hits + misses,
+                hits,
+                self.hash_workers,
+                full_rehash,
+            )
 
     def run(
         self,
@@ -76,17 +312,14 @@ class AutoFusionManager:
         mode = "in_place" if source_resolved == target_resolved else "cross_repo"
 
         if mode == "cross_repo":
-            for rel in changed_files:
-                src = source / rel
-                dst = target / rel
-                if src.exists():
-                    dst.parent.mkdir(parents=True, exist_ok=True)
-                    shutil.copy2(src, dst)
-                    copied_files.append(rel)
-            for rel in deleted_files:
-                dst = target / rel
-                if dst.exists() and dst.is_file():
-                    dst.unlink()
+            copied_files = [rel for rel in changed_files if (source / rel).exists()]
+            # Copies are staged and fsynced first, then renamed into place under a
+            # journal; the transaction holds the target's merge lock throughout.
+            MergeTransaction(target, workers=self.hash_workers).run(
+                source,
+                copies=copied_files,
+                deletes=[rel for rel in deleted_files if (target / rel).is_file()],
+            )
 
         merged_at = datetime.now(timezone.utc).isoformat()
         if not changed_files and not deleted_files:
@@ -199,22 +432,30 @@ class AutoFusionManager:
             "deleted_files": deleted_files,
             "mode": mode,
         }
+        if self.content_store is not None:
+            files: dict[str, str] = {}
+            with self.content_store.writing():
+                for rel in changed_files:
+                    file_path = target_root / rel
+                    if file_path.exists() and file_path.is_file():
+                        files[rel] = self.content_store.put_file(file_path)
+                # Fusion archives are never pruned, so their refs are permanent and
+                # keep these blobs out of content-store GC.
+                ref = "fusion/" + re.sub(r"[^A-Za-z0-9._-]", "_", archive.stem)
+                self.content_store.write_ref(ref, files, meta={"archive": str(archive)})
+            meta["content_store"] = {"root": str(self.content_store.root), "ref": ref, "files": files}
         with zipfile.ZipFile(archive, mode="w", compression=zipfile.ZIP_DEFLATED) as zf:
             zf.writestr("meta.json", json.dumps(meta, ensure_ascii=True, indent=2))
-            for rel in changed_files:
-                file_path = target_root / rel
-                if file_path.exists() and file_path.is_file():
-                    zf.write(file_path, arcname=f"files/{rel}")
+            if self.content_store is None:
+                for rel in changed_files:
+                    file_path = target_root / rel
+                    if file_path.exists() and file_path.is_file():
+                        zf.write(file_path, arcname=f"files/{rel}")
         return archive
 
     def _iter_files(self, root: Path):
-        for path in root.rglob("*"):
-            if not path.is_file():
-                continue
-            rel_parts = path.relative_to(root).parts
-            if any(part in IGNORED_PATH_PARTS for part in rel_parts):
-                continue
-            yield path
+        for rel, _ in walk_workspace(root, ignore_names=IGNORED_PATH_PARTS):
+            yield root / rel
 
     @staticmethod
     def _hash_file(path: Path) -> str:
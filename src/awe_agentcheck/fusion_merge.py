@@ -0,0 +1,352 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+import json
+import os
+from pathlib import Path
+import shutil
+import threading
+import time
+from uuid import uuid4
+
+try:  # pragma: no cover - platform dependent
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+    import msvcrt
+
+from awe_agentcheck.observability import get_logger
+
+_log = get_logger("awe_agentcheck.fusion_merge")
+
+# Lives under the target's ``.agents`` dir: same filesystem as the target (so
+# renames are atomic) and already ignored by manifests and sandbox copies.
+MERGE_TXN_DIRNAME = Path(".agents") / "merge-txn"
+JOURNAL_NAME = "journal.json"
+MERGE_LOCK_NAME = Path(".agents") / "merge-txn.lock"
+
+STATE_STAGING = "staging"
+STATE_APPLYING = "applying"
+STATE_COMMITTED = "committed"
+
+
+def _fsync_path(path: Path, *, directory: bool = False) -> None:
+    if directory and os.name == "nt":
+        return
+    flags = os.O_RDONLY | (getattr(os, "O_DIRECTORY", 0) if directory else 0)
+    try:
+        fd = os.open(path, flags)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+# One thread lock per target; the OS lock alone does not exclude threads on every platform.
+_LOCAL_LOCKS: dict[str, threading.Lock] = {}
+_LOCAL_LOCKS_GUARD = threading.Lock()
+
+
+def _local_lock(key: str) -> threading.Lock:
+    with _LOCAL_LOCKS_GUARD:
+        return _LOCAL_LOCKS.setdefault(key, threading.Lock())
+
+
+def _lock_fd(fd: int, *, blocking: bool) -> bool:
+    if fcntl is not None:
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | (0 if blocking else fcntl.LOCK_NB))
+        except BlockingIOError:
+            return False
+        return True
+    while True:  # pragma: no cover - Windows
+        try:
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+            return True
+        except OSError:
+            if not blocking:
+                return False
+            time.sleep(0.05)
+
+
+def _unlock_fd(fd: int) -> None:
+    if fcntl is not None:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+    else:  # pragma: no cover - Windows
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+
+
+class MergeLock:
+    """Exclusive merge lock for one target, held from ``begin`` to ``commit``.
+
+    It is a thread lock plus an OS lock on ``<target>/.agents/merge-txn.lock``.
+    The OS drops the lock when its process dies, so a journal found while
+    holding the lock belongs to an owner that is gone.
+    """
+
+    def __init__(self, target_root: Path):
+        self.path = Path(target_root) / MERGE_LOCK_NAME
+        self._local = _local_lock(str(Path(target_root).resolve(strict=False)))
+        self._fd: int | None = None
+
+    @property
+    def held(self) -> bool:
+        return self._fd is not None
+
+    def acquire(self, *, blocking: bool = True) -> bool:
+        if not self._local.acquire(blocking=blocking):
+            return False
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        except OSError:
+            self._local.release()
+            raise
+        try:
+            locked = _lock_fd(fd, blocking=blocking)
+        except OSError:
+            os.close(fd)
+            self._local.release()
+            raise
+        if not locked:
+            os.close(fd)
+            self._local.release()
+            return False
+        self._fd = fd
+        return True
+
+    def release(self) -> None:
+        if self._fd is None:
+            return
+        fd, self._fd = self._fd, None
+        try:
+            _unlock_fd(fd)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+            self._local.release()
+
+
+class MergeTransaction:
+    """Apply a set of copies and deletions to *target* as one recoverable unit.
+
+    Changed files are first copied (in parallel) into a staging dir next to
+    the target and fsynced. The journal then flips to ``applying`` and each
+    file is moved into place with ``os.replace``; whatever it displaces is
+    moved to a backup dir, so the transaction can be undone. A journal left in
+    ``staging`` is discarded on recovery (the target was never touched); one
+    left in ``applying`` is rolled forward, or back with ``roll_back=True``.
+    A :class:`MergeLock` on the target is held from :meth:`begin` until the
+    transaction commits or rolls back, so merges into one target never
+    interleave.
+    """
+
+    def __init__(self, target_root: Path, txn_id: str | None = None, *, workers: int = 1):
+        self.target = Path(target_root)
+        self.txn_id = txn_id or f"{datetime.now(timezone.utc).strftime('%Y%m%d-%H%M%S')}-{uuid4().hex[:8]}"
+        self.root = self.target / MERGE_TXN_DIRNAME / self.txn_id
+        self.staged_root = self.root / "staged"
+        self.backup_root = self.root / "backup"
+        self.workers = max(1, int(workers))
+        self.copies: list[str] = []
+        self.deletes: list[str] = []
+        self.state = ""
+        self.lock = MergeLock(self.target)
+
+    @property
+    def journal_path(self) -> Path:
+        return self.root / JOURNAL_NAME
+
+    def begin(self, *, copies: list[str], deletes: list[str]) -> None:
+        self.copies = list(copies)
+        self.deletes = list(deletes)
+        self.lock.acquire()
+        try:
+            self.root.mkdir(parents=True, exist_ok=True)
+            self._set_state(STATE_STAGING)
+        except Exception:
+            shutil.rmtree(self.root, ignore_errors=True)
+            self.lock.release()
+            raise
+
+    def stage(self, source_root: Path) -> None:
+        source = Path(source_root)
+
+        def stage_one(rel: str) -> None:
+            staged = self.staged_root / rel
+            staged.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(source / rel, staged)
+            _fsync_path(staged)
+
+        if self.workers > 1 and len(self.copies) > 1:
+            with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="awe-merge") as executor:
+                # list() re-raises the first staging error.
+                list(executor.map(stage_one, self.copies))
+        else:
+            for rel in self.copies:
+                stage_one(rel)
+
+    def apply(self, *, resume: bool = False) -> None:
+        """Move staged files into place; *resume* tolerates copies a crashed run already moved."""
+        self._set_state(STATE_APPLYING)
+        for rel in self.copies:
+            self._apply_copy(rel, resume=resume)
+        for rel in self.deletes:
+            self._apply_delete(rel)
+        for parent in sorted({(self.target / rel).parent for rel in [*self.copies, *self.deletes]}):
+            _fsync_path(parent, directory=True)
+
+    def commit(self) -> None:
+        try:
+            self._set_state(STATE_COMMITTED)
+            shutil.rmtree(self.root, ignore_errors=True)
+        finally:
+            self.lock.release()
+
+    def roll_back(self) -> None:
+        """Undo applied operations and discard the transaction."""
+        for rel in reversed(self.deletes):
+            backup = self.backup_root / rel
+            if backup.exists():
+                (self.target / rel).parent.mkdir(parents=True, exist_ok=True)
+                os.replace(backup, self.target / rel)
+        for rel in reversed(self.copies):
+            backup = self.backup_root / rel
+            target = self.target / rel
+            if backup.exists():
+                target.parent.mkdir(parents=True, exist_ok=True)
+                os.replace(backup, target)
+            elif not (self.staged_root / rel).exists() and target.exists():
+                # The file was new and has already been moved into place.
+                target.unlink()
+        shutil.rmtree(self.root, ignore_errors=True)
+        self.lock.release()
+
+    def run(self, source_root: Path, *, copies: list[str], deletes: list[str]) -> None:
+        self.begin(copies=copies, deletes=deletes)
+        try:
+            self.stage(source_root)
+        except Exception:
+            shutil.rmtree(self.root, ignore_errors=True)
+            self.lock.release()
+            raise
+        try:
+            self.apply()
+        except Exception:
+            _log.exception("fusion_merge_apply_failed txn=%s target=%s", self.txn_id, str(self.target))
+            try:
+                self.roll_back()
+            except OSError:
+                _log.exception("fusion_merge_rollback_failed txn=%s; journal kept for recovery", self.txn_id)
+                self.lock.release()
+            raise
+        self.commit()
+
+    @classmethod
+    def load(cls, journal_path: Path) -> MergeTransaction | None:
+        try:
+            payload = json.loads(Path(journal_path).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if not isinstance(payload, dict):
+            return None
+        txn_root = Path(journal_path).parent
+        target = txn_root.parent.parent.parent
+        txn = cls(target, txn_root.name)
+        txn.copies = [str(item) for item in payload.get("copies") or []]
+        txn.deletes = [str(item) for item in payload.get("deletes") or []]
+        txn.state = str(payload.get("state") or "")
+        return txn
+
+    def _apply_copy(self, rel: str, *, resume: bool = False) -> None:
+        staged = self.staged_root / rel
+        if not staged.exists():
+            if resume:
+                # Moved into place before the crash.
+                return
+            raise FileNotFoundError(f"staged file missing for {rel}: {staged}")
+        target = self.target / rel
+        backup = self.backup_root / rel
+        if target.is_file() and not backup.exists():
+            backup.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(target, backup)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(staged, target)
+
+    def _apply_delete(self, rel: str) -> None:
+        target = self.target / rel
+        if not target.is_file():
+            return
+        backup = self.backup_root / rel
+        if backup.exists():
+            target.unlink()
+            return
+        backup.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(target, backup)
+
+    def _set_state(self, state: str) -> None:
+        self.state = state
+        payload = {
+            "txn_id": self.txn_id,
+            "state": state,
+            "target": str(self.target),
+            "updated_at": datetime.now(timezone.utc).isoformat(),
+            "copies": self.copies,
+            "deletes": self.deletes,
+        }
+        tmp = self.journal_path.with_name(f"{JOURNAL_NAME}.tmp")
+        with tmp.open("w", encoding="utf-8") as f:
+            f.write(json.dumps(payload, ensure_ascii=True))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.journal_path)
+        _fsync_path(self.root, directory=True)
+
+
+def recover_merges(target_root: Path, *, roll_back: bool = False) -> list[dict[str, str]]:
+    """Finish or undo merge transactions an earlier process left behind in *target_root*.
+
+    Runs under the target's :class:`MergeLock`; while another merge holds it
+    nothing is touched, since its journal still has a live owner.
+    """
+    txn_base = Path(target_root) / MERGE_TXN_DIRNAME
+    if not txn_base.is_dir():
+        return []
+    lock = MergeLock(target_root)
+    if not lock.acquire(blocking=False):
+        _log.info("fusion_merge_recovery_skipped target=%s reason=merge_in_progress", str(target_root))
+        return []
+    try:
+        return _recover_locked(txn_base, roll_back=roll_back)
+    finally:
+        lock.release()
+
+
+def _recover_locked(txn_base: Path, *, roll_back: bool) -> list[dict[str, str]]:
+    recovered: list[dict[str, str]] = []
+    for journal in sorted(txn_base.glob(f"*/{JOURNAL_NAME}")):
+        txn = MergeTransaction.load(journal)
+        if txn is None:
+            continue
+        state = txn.state
+        if state == STATE_APPLYING and not roll_back:
+            txn.apply(resume=True)
+            txn.commit()
+            action = "rolled_forward"
+        elif state == STATE_APPLYING:
+            txn.roll_back()
+            action = "rolled_back"
+        else:
+            # Staging never touched the target; committed only missed its cleanup.
+            shutil.rmtree(txn.root, ignore_errors=True)
+            action = "discarded"
+        _log.warning("fusion_merge_recovered txn=%s state=%s action=%s", txn.txn_id, state, action)
+        recovered.append({"txn_id": txn.txn_id, "state": state, "action": action})
+    return recovered
@@ -6,7 +6,14 @@ import re
 import subprocess
 
 
-def run_git_command(*, root: Path, args: list[str]) -> tuple[bool, str]:
+def run_git_command(
+    *,
+    root: Path,
+    args: list[str],
+    env: dict[str, str] | None = None,
+    timeout_seconds: float = 5,
+    strip_output: bool = True,
+) -> tuple[bool, str]:
     try:
         completed = subprocess.run(
             ['git', *args],
@@ -15,13 +22,15 @@ def run_git_command(*, root: Path, args: list[str]) -> tuple[bool, str]:
             text=True,
             encoding='utf-8',
             errors='replace',
-            timeout=5,
+            timeout=timeout_seconds,
+            env={**os.environ, **env} if env else None,
         )
     except (OSError, subprocess.SubprocessError):
         return False, ''
     if completed.returncode != 0:
         return False, (completed.stderr or completed.stdout or '').strip()
-    return True, (completed.stdout or '').strip()
+    output = completed.stdout or ''
+    return True, output.strip() if strip_output else output
 
 
 def read_git_head_sha(root: Path | None) -> str | None:
@@ -39,6 +48,96 @@ def read_git_head_sha(root: Path | None) -> str | None:
     return None
 
 
+GIT_SNAPSHOT_TIMEOUT_SECONDS = 600
+
+
+def _git_object_id(payload: str) -> str | None:
+    text = str(payload or '').strip().lower()
+    return text if re.fullmatch(r'[0-9a-f]{40}|[0-9a-f]{64}', text) else None
+
+
+def git_snapshot_tree(root: Path, *, index_file: Path, excludes: list[str] | None = None) -> str | None:
+    """Write the worktree of *root* as a git tree object and return its id.
+
+    Uses a private index (*index_file*) so the repository's own index and
+    HEAD are untouched. Reusing the same index across calls keeps its stat
+    data, so later snapshots only rehash files that changed. Ignored files
+    follow ``.gitignore``; *excludes* adds pathspec exclusions.
+    """
+    env = {'GIT_INDEX_FILE': str(Path(index_file).resolve(strict=False))}
+    pathspecs = ['.', *[f':(exclude){item}' for item in (excludes or [])]]
+    ok, _ = run_git_command(
+        root=root,
+        args=['add', '-A', '--', *pathspecs],
+        env=env,
+        timeout_seconds=GIT_SNAPSHOT_TIMEOUT_SECONDS,
+    )
+    if not ok:
+        return None
+    ok, tree = run_git_command(root=root, args=['write-tree'], env=env, timeout_seconds=GIT_SNAPSHOT_TIMEOUT_SECONDS)
+    return _git_object_id(tree) if ok else None
+
+
+def git_update_ref(root: Path, ref: str, object_id: str) -> bool:
+    ok, _ = run_git_command(root=root, args=['update-ref', ref, object_id])
+    return ok
+
+
+def git_resolve_ref(root: Path, ref: str) -> str | None:
+    ok, payload = run_git_command(root=root, args=['rev-parse', '--verify', '--quiet', ref])
+    return _git_object_id(payload) if ok else None
+
+
+def git_delete_refs(root: Path, prefix: str) -> int:
+    ok, payload = run_git_command(root=root, args=['for-each-ref', '--format=%(refname)', prefix])
+    if not ok:
+        return 0
+    removed = 0
+    for ref in str(payload or '').splitlines():
+        if ref.strip() and run_git_command(root=root, args=['update-ref', '-d', ref.strip()])[0]:
+            removed += 1
+    return removed
+
+
+def git_diff_trees(root: Path, old_tree: str, new_tree: str) -> tuple[dict[str, str], str] | None:
+    """Return ``({path: status letter}, unified patch)`` between two trees."""
+    ok, names = run_git_command(
+        root=root,
+        args=['diff', '--name-status', '--no-renames', '-z', old_tree, new_tree],
+        timeout_seconds=GIT_SNAPSHOT_TIMEOUT_SECONDS,
+    )
+    if not ok:
+        return None
+    parts = [part for part in str(names or '').split('\0') if part]
+    statuses = {parts[idx + 1]: parts[idx][:1] for idx in range(0, len(parts) - 1, 2)}
+    ok, patch = run_git_command(
+        root=root,
+        args=['diff', '--no-color', '--no-ext-diff', '--no-renames', old_tree, new_tree],
+        timeout_seconds=GIT_SNAPSHOT_TIMEOUT_SECONDS,
+        # A trailing blank context line is " \n"; stripping it would corrupt the hunk.
+        strip_output=False,
+    )
+    if not ok:
+        return None
+    return statuses, patch
+
+
+def git_materialize_tree(root: Path, tree: str, target: Path, *, index_file: Path) -> bool:
+    """Check *tree* out into directory *target* without touching the worktree."""
+    env = {'GIT_INDEX_FILE': str(Path(index_file).resolve(strict=False))}
+    ok, _ = run_git_command(root=root, args=['read-tree', tree], env=env, timeout_seconds=GIT_SNAPSHOT_TIMEOUT_SECONDS)
+    if not ok:
+        return False
+    prefix = str(Path(target).resolve(strict=False)).replace('\\', '/').rstrip('/') + '/'
+    ok, _ = run_git_command(
+        root=root,
+        args=['checkout-index', '-a', '-f', f'--prefix={prefix}'],
+        env=env,
+        timeout_seconds=GIT_SNAPSHOT_TIMEOUT_SECONDS,
+    )
+    return ok
+
+
 def read_git_state(root: Path | None) -> dict:
     if root is None:
         return {
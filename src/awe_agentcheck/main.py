@@ -1,9 +1,16 @@
 from __future__ import annotations
 
+import atexit
 import logging
 
 from awe_agentcheck.api import create_app
-from awe_agentcheck.adapters import ParticipantRunner
+from awe_agentcheck.adapters import (
+    PROVIDER_CIRCUIT_BREAKER,
+    PROVIDER_SCHEDULER,
+    AsyncParticipantRunner,
+    ParticipantResponseCache,
+    ParticipantRunner,
+)
 from awe_agentcheck.config import load_settings
 from awe_agentcheck.db import Database, SqlTaskRepository
 from awe_agentcheck.observability import configure_observability
@@ -27,12 +34,35 @@ def build_app():
     try:
         db = Database(settings.database_url)
         db.create_schema()
-        repo = SqlTaskRepository(db)
+        repo = SqlTaskRepository(
+            db,
+            event_batch_rows=settings.event_batch_max_rows,
+            event_batch_interval_ms=settings.event_batch_interval_ms,
+        )
+        atexit.register(repo.close)
     except Exception:
         _log.exception('database bootstrap failed; falling back to in-memory repository')
         repo = InMemoryTaskRepository()
 
-    runner = ParticipantRunner(
+    PROVIDER_SCHEDULER.configure(
+        limits=settings.provider_limits,
+        default_concurrency=settings.provider_max_concurrency,
+    )
+    PROVIDER_CIRCUIT_BREAKER.configure(
+        failure_threshold=settings.provider_breaker_failures,
+        cooldown_seconds=settings.provider_breaker_cooldown_seconds,
+        fallbacks=settings.provider_fallbacks,
+    )
+    runner_kwargs = {}
+    if settings.response_cache_mode != 'off':
+        runner_kwargs['response_cache'] = ParticipantResponseCache(
+            settings.response_cache_dir,
+            mode=settings.response_cache_mode,
+            ttl_seconds=settings.response_cache_ttl_seconds,
+            max_bytes=settings.response_cache_max_mb * 1024 * 1024,
+        )
+    runner_cls = AsyncParticipantRunner if settings.participant_runner == 'async' else ParticipantRunner
+    runner = runner_cls(
         command_overrides={
             'claude': settings.claude_command,
             'codex': settings.codex_command,
@@ -41,6 +71,7 @@ def build_app():
         },
         dry_run=settings.dry_run,
         timeout_retries=settings.participant_timeout_retries,
+        **runner_kwargs,
     )
     commands = getattr(runner, 'commands', None)
     if isinstance(commands, dict):
@@ -53,13 +84,28 @@ def build_app():
         participant_timeout_seconds=settings.participant_timeout_seconds,
         command_timeout_seconds=settings.command_timeout_seconds,
         workflow_backend=settings.workflow_backend,
+        stream_window_ms=settings.stream_window_ms,
+        stream_max_bytes=settings.stream_max_bytes,
+        parallel_reviews=settings.parallel_reviews,
+        parallel_debate=settings.parallel_debate,
+        parallel_proposal_reviews=settings.parallel_proposal_reviews,
+        review_max_workers=settings.review_max_workers,
+        review_hedge=settings.review_hedge,
     )
     service = OrchestratorService(
         repository=repo,
         artifact_store=artifacts,
         workflow_engine=workflow,
         max_concurrent_running_tasks=settings.max_concurrent_running_tasks,
+        manifest_hash_workers=settings.manifest_hash_workers,
+        round_snapshot_mode=settings.round_snapshot_mode,
+        sandbox_strategy=settings.sandbox_strategy,
+        sandbox_pool_size=settings.sandbox_pool_size,
+        sandbox_pool_projects=settings.sandbox_pool_projects,
     )
+    service.recover_pending_merges()
+    if service.sandbox_pool is not None:
+        atexit.register(service.sandbox_pool.close)
     return create_app(service=service)
 
 
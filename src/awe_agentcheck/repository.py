@@ -3,11 +3,22 @@ from __future__ import annotations
 from dataclasses import dataclass
 from datetime import datetime, timezone
 import json
-from typing import Protocol
+import logging
+import threading
+from typing import Callable, Protocol
 from uuid import uuid4
 
 from awe_agentcheck.domain.events import EventType, normalize_event_type
 
+_log = logging.getLogger(__name__)
+
+TASK_CHANGE_CREATED = 'task_created'
+TASK_CHANGE_UPDATED = 'task_updated'
+TASK_CHANGE_DELETED = 'tasks_deleted'
+TASK_CHANGE_EVENT = 'event_appended'
+
+TaskChangeListener = Callable[[str, dict], None]
+
 
 def _utc_now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
@@ -49,6 +60,7 @@ class TaskCreateRecord:
     lint_command: str
     memory_mode: str = 'basic'
     phase_timeout_seconds: dict[str, int] | None = None
+    parallel_reviews: bool = False
 
 
 class TaskRepository(Protocol):
@@ -61,6 +73,12 @@ class TaskRepository(Protocol):
     def get_task(self, task_id: str) -> dict | None:
         ...
 
+    def count_tasks_by_status(self, statuses: list[str] | None = None) -> dict[str, int]:
+        ...
+
+    def list_task_ids_by_status(self, status: str, *, limit: int | None = None) -> list[str]:
+        ...
+
     def update_task_status(
         self,
         task_id: str,
@@ -104,17 +122,79 @@ class TaskRepository(Protocol):
     ) -> dict:
         ...
 
-    def list_events(self, task_id: str) -> list[dict]:
+    def list_events(
+        self,
+        task_id: str,
+        *,
+        after_seq: int | None = None,
+        limit: int | None = None,
+        event_types: list[str] | None = None,
+    ) -> list[dict]:
+        """Return events ordered by ``seq``.
+
+        ``after_seq`` acts as an exclusive cursor, ``limit`` caps the page size
+        and ``event_types`` restricts the result to the given normalized types.
+        """
         ...
 
     def delete_tasks(self, task_ids: list[str]) -> int:
         ...
 
 
-class InMemoryTaskRepository:
+class TaskChangeNotifier:
+    """Fan out committed repository writes to in-process listeners.
+
+    Listeners receive ``(kind, payload)`` where *kind* is one of the
+    ``TASK_CHANGE_*`` constants and *payload* is the task row, the event row or
+    ``{'task_ids': [...]}`` for deletions. Listener failures are logged and
+    never propagate into the write path.
+    """
+
+    _change_listeners: list[TaskChangeListener]
+    _change_listeners_lock: threading.Lock
+
+    def _init_change_listeners(self) -> None:
+        self._change_listeners = []
+        self._change_listeners_lock = threading.Lock()
+
+    def add_change_listener(self, listener: TaskChangeListener) -> None:
+        with self._change_listeners_lock:
+            if listener not in self._change_listeners:
+                self._change_listeners.append(listener)
+
+    def remove_change_listener(self, listener: TaskChangeListener) -> None:
+        with self._change_listeners_lock:
+            if listener in self._change_listeners:
+                self._change_listeners.remove(listener)
+
+    def _notify_change(self, kind: str, payload: dict) -> None:
+        with self._change_listeners_lock:
+            listeners = list(self._change_listeners)
+        for listener in listeners:
+            try:
+                listener(kind, dict(payload))
+            except Exception:
+                _log.exception('task_change_listener_failed kind=%s', kind)
+
+
+class InMemoryTaskRepository(TaskChangeNotifier):
     def __init__(self):
         self.items: dict[str, dict] = {}
         self.events: dict[str, list[dict]] = {}
+        self._task_ids_by_status: dict[str, set[str]] = {}
+        self._init_change_listeners()
+
+    def _index_status(self, task_id: str, *, old: str | None, new: str | None) -> None:
+        if old == new:
+            return
+        if old is not None:
+            bucket = self._task_ids_by_status.get(old)
+            if bucket is not None:
+                bucket.discard(task_id)
+                if not bucket:
+                    del self._task_ids_by_status[old]
+        if new is not None:
+            self._task_ids_by_status.setdefault(new, set()).add(task_id)
 
     def create_task_record(self, record: TaskCreateRecord) -> dict:
         task_id = f'task-{uuid4().hex[:12]}'
@@ -145,6 +225,7 @@ class InMemoryTaskRepository:
             'plain_mode': bool(record.plain_mode),
             'stream_mode': bool(record.stream_mode),
             'debate_mode': bool(record.debate_mode),
+            'parallel_reviews': bool(record.parallel_reviews),
             'auto_merge': bool(record.auto_merge),
             'merge_target_path': (str(record.merge_target_path).strip() if record.merge_target_path else None),
             'sandbox_mode': bool(record.sandbox_mode),
@@ -171,6 +252,8 @@ class InMemoryTaskRepository:
         }
         self.items[task_id] = row
         self.events[task_id] = []
+        self._index_status(task_id, old=None, new=row['status'])
+        self._notify_change(TASK_CHANGE_CREATED, row)
         return dict(row)
 
     def list_tasks(self, *, limit: int = 100) -> list[dict]:
@@ -182,6 +265,19 @@ class InMemoryTaskRepository:
         row = self.items.get(task_id)
         return dict(row) if row else None
 
+    def count_tasks_by_status(self, statuses: list[str] | None = None) -> dict[str, int]:
+        wanted = set(statuses) if statuses is not None else None
+        return {
+            status: len(ids)
+            for status, ids in self._task_ids_by_status.items()
+            if ids and (wanted is None or status in wanted)
+        }
+
+    def list_task_ids_by_status(self, status: str, *, limit: int | None = None) -> list[str]:
+        ids = [task_id for task_id in self._task_ids_by_status.get(status, ()) if task_id in self.items]
+        ids.sort(key=lambda task_id: self.items[task_id].get('created_at', ''), reverse=True)
+        return ids[:limit] if limit is not None else ids
+
     def update_task_status(
         self,
         task_id: str,
@@ -192,11 +288,13 @@ class InMemoryTaskRepository:
     ) -> dict:
         if task_id not in self.items:
             raise KeyError(task_id)
+        self._index_status(task_id, old=self.items[task_id]['status'], new=status)
         self.items[task_id]['status'] = status
         self.items[task_id]['last_gate_reason'] = reason
         if rounds_completed is not None:
             self.items[task_id]['rounds_completed'] = int(rounds_completed)
         self.items[task_id]['updated_at'] = _utc_now_iso()
+        self._notify_change(TASK_CHANGE_UPDATED, self.items[task_id])
         return dict(self.items[task_id])
 
     def set_cancel_requested(self, task_id: str, *, requested: bool) -> dict:
@@ -204,6 +302,7 @@ class InMemoryTaskRepository:
             raise KeyError(task_id)
         self.items[task_id]['cancel_requested'] = bool(requested)
         self.items[task_id]['updated_at'] = _utc_now_iso()
+        self._notify_change(TASK_CHANGE_UPDATED, self.items[task_id])
         return dict(self.items[task_id])
 
     def update_task_status_if(
@@ -220,6 +319,7 @@ class InMemoryTaskRepository:
             raise KeyError(task_id)
         if self.items[task_id]['status'] != expected_status:
             return None
+        self._index_status(task_id, old=expected_status, new=status)
         self.items[task_id]['status'] = status
         self.items[task_id]['last_gate_reason'] = reason
         if rounds_completed is not None:
@@ -227,6 +327,7 @@ class InMemoryTaskRepository:
         if set_cancel_requested is not None:
             self.items[task_id]['cancel_requested'] = bool(set_cancel_requested)
         self.items[task_id]['updated_at'] = _utc_now_iso()
+        self._notify_change(TASK_CHANGE_UPDATED, self.items[task_id])
         return dict(self.items[task_id])
 
     def is_cancel_requested(self, task_id: str) -> bool:
@@ -254,12 +355,29 @@ class InMemoryTaskRepository:
             'created_at': _utc_now_iso(),
         }
         self.events[task_id].append(event)
+        self._notify_change(TASK_CHANGE_EVENT, event)
         return dict(event)
 
-    def list_events(self, task_id: str) -> list[dict]:
+    def list_events(
+        self,
+        task_id: str,
+        *,
+        after_seq: int | None = None,
+        limit: int | None = None,
+        event_types: list[str] | None = None,
+    ) -> list[dict]:
         if task_id not in self.items:
             raise KeyError(task_id)
-        return [dict(e) for e in self.events.get(task_id, [])]
+        rows = self.events.get(task_id, [])
+        cursor = max(0, int(after_seq or 0))
+        # seq is assigned as len(rows) + 1, so the cursor maps to a list offset.
+        window = filter_event_window(
+            rows[cursor:],
+            after_seq=cursor,
+            limit=limit,
+            event_types=event_types,
+        )
+        return [dict(e) for e in window]
 
     def delete_tasks(self, task_ids: list[str]) -> int:
         unique_ids: list[str] = []
@@ -270,13 +388,52 @@ class InMemoryTaskRepository:
                 continue
             seen.add(task_id)
             unique_ids.append(task_id)
-        deleted = 0
+        deleted_ids: list[str] = []
         for task_id in unique_ids:
             if task_id in self.items:
+                self._index_status(task_id, old=self.items[task_id]['status'], new=None)
                 del self.items[task_id]
                 self.events.pop(task_id, None)
-                deleted += 1
-        return deleted
+                deleted_ids.append(task_id)
+        if deleted_ids:
+            self._notify_change(TASK_CHANGE_DELETED, {'task_ids': deleted_ids})
+        return len(deleted_ids)
+
+
+def normalize_event_type_filter(event_types: list[str] | None) -> list[str]:
+    out: list[str] = []
+    for raw in event_types or []:
+        for part in str(raw or '').split(','):
+            text = part.strip().lower()
+            if text and text not in out:
+                out.append(text)
+    return out
+
+
+def filter_event_window(
+    events: list[dict],
+    *,
+    after_seq: int | None = None,
+    limit: int | None = None,
+    event_types: list[str] | None = None,
+) -> list[dict]:
+    cursor = max(0, int(after_seq or 0))
+    types = set(normalize_event_type_filter(event_types))
+    cap = max(0, int(limit)) if limit is not None else None
+    out: list[dict] = []
+    for event in events:
+        try:
+            seq = int(event.get('seq') or 0)
+        except (TypeError, ValueError):
+            seq = 0
+        if seq <= cursor:
+            continue
+        if types and str(event.get('type') or '').strip().lower() not in types:
+            continue
+        out.append(event)
+        if cap is not None and len(out) >= cap:
+            break
+    return out
 
 
 def encode_reviewer_meta(
@@ -342,6 +499,7 @@ def encode_task_meta(
     workspace_fingerprint: dict[str, object] | None = None,
     memory_mode: str = 'basic',
     phase_timeout_seconds: dict[str, int] | None = None,
+    parallel_reviews: bool = False,
 ) -> str:
     payload = {
         'participants': [str(v) for v in reviewer_participants],
@@ -366,6 +524,7 @@ def encode_task_meta(
         'plain_mode': bool(plain_mode),
         'stream_mode': bool(stream_mode),
         'debate_mode': bool(debate_mode),
+        'parallel_reviews': bool(parallel_reviews),
         'auto_merge': bool(auto_merge),
         'merge_target_path': (str(merge_target_path).strip() if merge_target_path else None),
         'sandbox_mode': bool(sandbox_mode),
@@ -412,6 +571,7 @@ def decode_task_meta(raw: str) -> dict:
         'plain_mode': True,
         'stream_mode': True,
         'debate_mode': True,
+        'parallel_reviews': False,
         'auto_merge': True,
         'merge_target_path': None,
         'sandbox_mode': False,
@@ -525,6 +685,7 @@ def decode_task_meta(raw: str) -> dict:
         plain_mode = _coerce_meta_bool(parsed.get('plain_mode', True), default=True)
         stream_mode = _coerce_meta_bool(parsed.get('stream_mode', True), default=True)
         debate_mode = _coerce_meta_bool(parsed.get('debate_mode', True), default=True)
+        parallel_reviews = _coerce_meta_bool(parsed.get('parallel_reviews', False), default=False)
         merge_target_path = parsed.get('merge_target_path')
         merge_target_text = (str(merge_target_path).strip() if merge_target_path else None)
         sandbox_mode = bool(parsed.get('sandbox_mode', False))
@@ -568,6 +729,7 @@ def decode_task_meta(raw: str) -> dict:
         out['plain_mode'] = plain_mode
         out['stream_mode'] = stream_mode
         out['debate_mode'] = debate_mode
+        out['parallel_reviews'] = parallel_reviews
         out['auto_merge'] = auto_merge
         out['merge_target_path'] = merge_target_text
         out['sandbox_mode'] = sandbox_mode
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
 import json
-from pathlib import Path
+from pathlib import Path, PurePosixPath
 import re
 from typing import Callable
 
 from awe_agentcheck.policy_templates import DEFAULT_POLICY_TEMPLATE, DEFAULT_RISK_POLICY_CONTRACT
+from awe_agentcheck.workspace_walk import walk_workspace
 
 
 def analyze_workspace_profile(workspace_path: str | None) -> dict:
@@ -59,16 +60,12 @@ def analyze_workspace_profile(workspace_path: str | None) -> dict:
     file_count = 0
     risk_markers = 0
     max_scan = 5000
-    for path in root.rglob('*'):
+    for rel, _ in walk_workspace(root, ignore_names=ignore_dirs):
         if file_count >= max_scan:
             break
-        if not path.is_file():
-            continue
-        rel_parts = path.relative_to(root).parts
-        if any(part in ignore_dirs for part in rel_parts):
-            continue
         file_count += 1
-        rel_text = '/'.join(str(v).lower() for v in rel_parts)
+        rel_text = rel.lower()
+        path = PurePosixPath(rel)
         stem = path.stem.lower()
         ext = path.suffix.lower()
         if any(token in rel_text for token in risk_tokens):
@@ -0,0 +1,252 @@
+from __future__ import annotations
+
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+import difflib
+from functools import lru_cache
+import os
+from pathlib import Path
+import re
+import shutil
+import subprocess
+from typing import Iterator, TextIO
+
+PATCH_MAX_FILE_BYTES = 2 * 1024 * 1024
+# Above this combined size a changed file is diffed by ``git diff --no-index``.
+PATCH_GIT_DIFF_MIN_BYTES = 256 * 1024
+PATCH_CONTEXT_LINES = 3
+_PATCH_PREFETCH_PER_WORKER = 4
+_GIT_DIFF_TIMEOUT_SECONDS = 120
+_HUNK_HEADER_RE = re.compile(r'^(@@ -\S+ \+\S+ @@).*$')
+
+
+def read_text_for_patch(path: Path) -> tuple[str, bool]:
+    """Return ``(text, is_binary)``; files over the size cutoff, with NUL bytes or non-UTF-8 count as binary."""
+    try:
+        info = path.stat()
+    except OSError:
+        return '', False
+    if not path.is_file():
+        return '', False
+    # Check the size before reading so oversized files are never loaded.
+    if info.st_size > PATCH_MAX_FILE_BYTES:
+        return '', True
+    try:
+        data = path.read_bytes()
+    except OSError:
+        return '', True
+    if len(data) > PATCH_MAX_FILE_BYTES or b'\x00' in data:
+        return '', True
+    try:
+        return data.decode('utf-8'), False
+    except UnicodeDecodeError:
+        return '', True
+
+
+def diff_file(rel: str, from_root: Path, to_root: Path) -> str:
+    """Return the unified diff chunk for one path (empty when unchanged), newline-terminated."""
+    old_path = Path(from_root) / rel
+    new_path = Path(to_root) / rel
+    old_text, old_binary = read_text_for_patch(old_path)
+    new_text, new_binary = read_text_for_patch(new_path)
+    if old_binary or new_binary:
+        return f'diff --git a/{rel} b/{rel}\nBinary files differ\n'
+    if old_text == new_text:
+        return ''
+    from_name = f'a/{rel}' if old_path.exists() else '/dev/null'
+    to_name = f'b/{rel}' if new_path.exists() else '/dev/null'
+    hunks = None
+    if len(old_text) + len(new_text) >= PATCH_GIT_DIFF_MIN_BYTES:
+        hunks = _git_diff_hunks(old_path if old_path.exists() else None, new_path if new_path.exists() else None)
+    if hunks is None:
+        hunks = list(unified_hunks(old_text.splitlines(), new_text.splitlines()))
+    if not hunks:
+        return ''
+    return '\n'.join([f'--- {from_name}', f'+++ {to_name}', *hunks]) + '\n'
+
+
+def iter_round_patch(
+    from_root: Path,
+    to_root: Path,
+    changed_paths: list[str],
+    *,
+    workers: int = 1,
+) -> Iterator[str]:
+    """Yield non-empty per-file diff chunks in *changed_paths* order.
+
+    Files are diffed on *workers* threads with a bounded look-ahead, so only
+    a small window of chunks is held in memory at once.
+    """
+    if workers <= 1 or len(changed_paths) <= 1:
+        for rel in changed_paths:
+            chunk = diff_file(rel, from_root, to_root)
+            if chunk:
+                yield chunk
+        return
+    window: deque[Future] = deque()
+    max_pending = workers * _PATCH_PREFETCH_PER_WORKER
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='awe-patch') as executor:
+        try:
+            for rel in changed_paths:
+                window.append(executor.submit(diff_file, rel, from_root, to_root))
+                if len(window) >= max_pending:
+                    chunk = window.popleft().result()
+                    if chunk:
+                        yield chunk
+            while window:
+                chunk = window.popleft().result()
+                if chunk:
+                    yield chunk
+        finally:
+            for pending in window:
+                pending.cancel()
+
+
+def write_round_patch(
+    target: TextIO,
+    from_root: Path,
+    to_root: Path,
+    changed_paths: list[str],
+    *,
+    workers: int = 1,
+) -> int:
+    """Stream the patch into *target*, one blank line between files; returns the number of files written."""
+    written = 0
+    for chunk in iter_round_patch(from_root, to_root, changed_paths, workers=workers):
+        if written:
+            target.write('\n')
+        target.write(chunk)
+        written += 1
+    return written
+
+
+def unified_hunks(old_lines: list[str], new_lines: list[str], *, context: int = PATCH_CONTEXT_LINES) -> Iterator[str]:
+    """Yield ``@@`` hunk lines like :func:`difflib.unified_diff` without the file headers.
+
+    The common prefix and suffix are trimmed before matching, so the
+    quadratic part of :class:`difflib.SequenceMatcher` only sees the edited
+    region of a large file.
+    """
+    for group in _grouped_opcodes(_trimmed_opcodes(old_lines, new_lines), context):
+        first, last = group[0], group[-1]
+        old_range = _format_range(first[1], last[2])
+        new_range = _format_range(first[3], last[4])
+        yield f'@@ -{old_range} +{new_range} @@'
+        for tag, i1, i2, j1, j2 in group:
+            if tag == 'equal':
+                for line in old_lines[i1:i2]:
+                    yield f' {line}'
+                continue
+            if tag in {'replace', 'delete'}:
+                for line in old_lines[i1:i2]:
+                    yield f'-{line}'
+            if tag in {'replace', 'insert'}:
+                for line in new_lines[j1:j2]:
+                    yield f'+{line}'
+
+
+def _trimmed_opcodes(old_lines: list[str], new_lines: list[str]) -> list[tuple[str, int, int, int, int]]:
+    limit = min(len(old_lines), len(new_lines))
+    prefix = 0
+    while prefix < limit and old_lines[prefix] == new_lines[prefix]:
+        prefix += 1
+    suffix = 0
+    while suffix < limit - prefix and old_lines[-1 - suffix] == new_lines[-1 - suffix]:
+        suffix += 1
+    old_end = len(old_lines) - suffix
+    new_end = len(new_lines) - suffix
+    matcher = difflib.SequenceMatcher(None, old_lines[prefix:old_end], new_lines[prefix:new_end])
+    opcodes = [('equal', 0, prefix, 0, prefix)]
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        opcodes.append((tag, i1 + prefix, i2 + prefix, j1 + prefix, j2 + prefix))
+    opcodes.append(('equal', old_end, len(old_lines), new_end, len(new_lines)))
+    merged: list[tuple[str, int, int, int, int]] = []
+    for op in opcodes:
+        if op[1] == op[2] and op[3] == op[4]:
+            continue
+        if merged and op[0] == 'equal' and merged[-1][0] == 'equal':
+            prev = merged.pop()
+            op = ('equal', prev[1], op[2], prev[3], op[4])
+        merged.append(op)
+    return merged
+
+
+def _grouped_opcodes(
+    opcodes: list[tuple[str, int, int, int, int]],
+    context: int,
+) -> Iterator[list[tuple[str, int, int, int, int]]]:
+    # Same grouping as SequenceMatcher.get_grouped_opcodes.
+    codes = list(opcodes)
+    if not any(tag != 'equal' for tag, *_ in codes):
+        return
+    if codes[0][0] == 'equal':
+        tag, i1, i2, j1, j2 = codes[0]
+        codes[0] = (tag, max(i1, i2 - context), i2, max(j1, j2 - context), j2)
+    if codes[-1][0] == 'equal':
+        tag, i1, i2, j1, j2 = codes[-1]
+        codes[-1] = (tag, i1, min(i2, i1 + context), j1, min(j2, j1 + context))
+    span = context + context
+    group: list[tuple[str, int, int, int, int]] = []
+    for tag, i1, i2, j1, j2 in codes:
+        if tag == 'equal' and i2 - i1 > span:
+            group.append((tag, i1, min(i2, i1 + context), j1, min(j2, j1 + context)))
+            yield group
+            group = []
+            i1, j1 = max(i1, i2 - context), max(j1, j2 - context)
+        group.append((tag, i1, i2, j1, j2))
+    if group and not (len(group) == 1 and group[0][0] == 'equal'):
+        yield group
+
+
+def _format_range(start: int, stop: int) -> str:
+    beginning = start + 1
+    length = stop - start
+    if length == 1:
+        return f'{beginning}'
+    if not length:
+        beginning -= 1
+    return f'{beginning},{length}'
+
+
+@lru_cache(maxsize=1)
+def _git_executable() -> str | None:
+    return shutil.which('git')
+
+
+def _git_diff_hunks(old_path: Path | None, new_path: Path | None) -> list[str] | None:
+    """Hunk lines from ``git diff --no-index``; None when git is unavailable or fails."""
+    git = _git_executable()
+    if git is None:
+        return None
+    try:
+        completed = subprocess.run(
+            [
+                git,
+                'diff',
+                '--no-index',
+                '--no-color',
+                '--no-ext-diff',
+                f'-U{PATCH_CONTEXT_LINES}',
+                '--',
+                str(old_path) if old_path is not None else os.devnull,
+                str(new_path) if new_path is not None else os.devnull,
+            ],
+            capture_output=True,
+            timeout=_GIT_DIFF_TIMEOUT_SECONDS,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    # --no-index exits 1 when the files differ.
+    if completed.returncode not in {0, 1}:
+        return None
+    try:
+        text = completed.stdout.decode('utf-8')
+    except UnicodeDecodeError:
+        return None
+    lines = text.splitlines()
+    for idx, line in enumerate(lines):
+        if line.startswith('@@'):
+            # Drop git's file headers, hunk function context and "\ No newline"
+            # markers so the output matches the difflib path.
+            return [_HUNK_HEADER_RE.sub(r'\1', item) for item in lines[idx:] if not item.startswith('\\ ')]
+    return []
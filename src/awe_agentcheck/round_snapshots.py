@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+import shutil
+
+try:  # pragma: no cover - platform dependent
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+SNAPSHOT_MODE_COPY = 'copy'
+SNAPSHOT_MODE_LINK = 'link'
+SNAPSHOT_MODE_STORE = 'store'
+SNAPSHOT_MODE_GIT = 'git'
+SNAPSHOT_MODES = (SNAPSHOT_MODE_COPY, SNAPSHOT_MODE_LINK, SNAPSHOT_MODE_STORE, SNAPSHOT_MODE_GIT)
+DEFAULT_SNAPSHOT_MODE = SNAPSHOT_MODE_COPY
+
+# linux/fs.h FICLONE: share the source extents copy-on-write (btrfs, XFS, ...).
+_FICLONE = 0x40049409
+
+
+def normalize_snapshot_mode(value: object) -> str:
+    text = str(value or '').strip().lower()
+    return text if text in SNAPSHOT_MODES else DEFAULT_SNAPSHOT_MODE
+
+
+def clone_file(src: Path, dst: Path) -> str:
+    """Copy *src* to *dst*, preferring a reflink; returns ``'cloned'`` or ``'copied'``."""
+    if fcntl is not None and _reflink(src, dst):
+        shutil.copystat(src, dst)
+        return 'cloned'
+    shutil.copy2(src, dst)
+    return 'copied'
+
+
+def link_file(src: Path, dst: Path) -> bool:
+    """Hardlink *dst* to *src*; returns False when the filesystem refuses."""
+    try:
+        os.link(src, dst)
+    except OSError:
+        return False
+    return True
+
+
+def _reflink(src: Path, dst: Path) -> bool:
+    try:
+        with open(src, 'rb') as source, open(dst, 'wb') as target:
+            fcntl.ioctl(target.fileno(), _FICLONE, source.fileno())
+    except OSError:
+        try:
+            os.unlink(dst)
+        except OSError:
+            pass
+        return False
+    return True
@@ -0,0 +1,234 @@
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass
+import hashlib
+import os
+from pathlib import Path
+import shutil
+import stat
+import threading
+import time
+from typing import Callable
+
+from awe_agentcheck.observability import get_logger
+from awe_agentcheck.sandbox_strategies import remove_sandbox_worktree
+from awe_agentcheck.workspace_walk import walk_workspace
+
+_log = get_logger('awe_agentcheck.sandbox_pool')
+
+DEFAULT_SANDBOX_POOL_REFRESH_SECONDS = 60.0
+
+
+@dataclass
+class _PooledSandbox:
+    path: Path
+    fingerprint: str
+    created_at: float
+
+
+def remove_sandbox_dir(sandbox_root: Path) -> bool:
+    """Delete a sandbox directory (unregistering worktrees first); returns False on failure."""
+    root = Path(sandbox_root)
+    if not root.exists():
+        return True
+    remove_sandbox_worktree(root)
+
+    def _onerror(func, p, exc_info):
+        try:
+            os.chmod(p, stat.S_IWRITE)
+            func(p)
+        except OSError:
+            _log.debug('sandbox_cleanup_onerror_failed path=%s', str(p))
+
+    try:
+        shutil.rmtree(root, onerror=_onerror)
+    except OSError:
+        _log.debug('sandbox_cleanup_failed path=%s', str(root))
+        return False
+    return not root.exists()
+
+
+class SandboxPool:
+    """Keeps ``size`` provisioned sandboxes ready for every registered project.
+
+    A daemon thread fills each project's queue using *provision* (the same
+    bootstrap ``create_task`` would run) and, every *refresh_seconds*,
+    recycles sandboxes whose project fingerprint no longer matches. The
+    fingerprint hashes the path, size and mtime of every file the sandbox
+    filter (*exclude*) lets through, so it tracks HEAD moves as well as
+    uncommitted edits. :meth:`acquire` pops a matching sandbox under the pool
+    lock, so each one is handed to exactly one task.
+    """
+
+    def __init__(
+        self,
+        *,
+        size: int,
+        provision: Callable[[Path, Path], object],
+        path_factory: Callable[[Path], str],
+        exclude: Callable[[str], bool] | None = None,
+        cleanup: Callable[[Path], object] = remove_sandbox_dir,
+        refresh_seconds: float = DEFAULT_SANDBOX_POOL_REFRESH_SECONDS,
+    ):
+        self.size = max(0, int(size))
+        self.refresh_seconds = max(0.05, float(refresh_seconds))
+        self._provision = provision
+        self._path_factory = path_factory
+        self._exclude = exclude
+        self._cleanup = cleanup
+        self._cond = threading.Condition()
+        self._ready: dict[Path, deque[_PooledSandbox]] = {}
+        self._thread: threading.Thread | None = None
+        self._closed = False
+        self.hits = 0
+        self.misses = 0
+        self.recycled = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.size > 0
+
+    def register(self, project_root: Path) -> None:
+        if not self.enabled:
+            return
+        key = Path(project_root).resolve(strict=False)
+        with self._cond:
+            if self._closed:
+                return
+            self._ready.setdefault(key, deque())
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='awe-sandbox-pool', daemon=True)
+                self._thread.start()
+            self._cond.notify_all()
+
+    def acquire(self, project_root: Path) -> Path | None:
+        """Hand out a ready sandbox that matches the project's current state, or None."""
+        if not self.enabled:
+            return None
+        key = Path(project_root).resolve(strict=False)
+        fingerprint = self.fingerprint(key)
+        stale: list[_PooledSandbox] = []
+        found: _PooledSandbox | None = None
+        with self._cond:
+            queue = self._ready.get(key)
+            while queue:
+                entry = queue.popleft()
+                if entry.fingerprint == fingerprint and entry.path.is_dir():
+                    found = entry
+                    break
+                stale.append(entry)
+            if found is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        for entry in stale:
+            self._recycle(entry)
+        # Registering also wakes the filler to replace what was just taken.
+        self.register(key)
+        return found.path if found is not None else None
+
+    def ready_count(self, project_root: Path) -> int:
+        with self._cond:
+            return len(self._ready.get(Path(project_root).resolve(strict=False), ()))
+
+    def wait_ready(self, project_root: Path, *, count: int | None = None, timeout: float | None = None) -> bool:
+        target = self.size if count is None else int(count)
+        key = Path(project_root).resolve(strict=False)
+        with self._cond:
+            return self._cond.wait_for(lambda: len(self._ready.get(key, ())) >= target, timeout=timeout)
+
+    def fingerprint(self, project_root: Path) -> str:
+        hasher = hashlib.sha256()
+        for rel, info in walk_workspace(project_root, exclude=self._exclude):
+            hasher.update(f'{rel}\0{info.st_size}\0{info.st_mtime_ns}\n'.encode('utf-8', 'surrogateescape'))
+        return hasher.hexdigest()
+
+    def close(self, *, timeout: float | None = 10.0) -> None:
+        """Stop the filler and delete every sandbox that was never handed out."""
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify_all()
+            thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+        with self._cond:
+            leftovers = [entry for queue in self._ready.values() for entry in queue]
+            self._ready.clear()
+        for entry in leftovers:
+            self._cleanup(entry.path)
+
+    def _run(self) -> None:
+        last_refresh = time.monotonic()
+        while True:
+            with self._cond:
+                self._cond.wait_for(
+                    lambda: self._closed or self._next_short_project() is not None,
+                    timeout=self.refresh_seconds,
+                )
+                if self._closed:
+                    return
+                project = self._next_short_project()
+            if time.monotonic() - last_refresh >= self.refresh_seconds:
+                self._refresh()
+                last_refresh = time.monotonic()
+            if project is not None:
+                self._fill_one(project)
+
+    def _next_short_project(self) -> Path | None:
+        for key, queue in self._ready.items():
+            if len(queue) < self.size:
+                return key
+        return None
+
+    def _fill_one(self, project: Path) -> None:
+        try:
+            fingerprint = self.fingerprint(project)
+            sandbox = Path(self._path_factory(project))
+            sandbox.mkdir(parents=True, exist_ok=True)
+        except OSError:
+            _log.exception('sandbox_pool_prepare_failed project=%s', str(project))
+            self._backoff()
+            return
+        try:
+            self._provision(project, sandbox)
+        except Exception:
+            _log.exception('sandbox_pool_provision_failed project=%s path=%s', str(project), str(sandbox))
+            self._cleanup(sandbox)
+            self._backoff()
+            return
+        entry = _PooledSandbox(path=sandbox, fingerprint=fingerprint, created_at=time.time())
+        with self._cond:
+            if not self._closed:
+                self._ready.setdefault(project, deque()).append(entry)
+                self._cond.notify_all()
+                _log.info('sandbox_pool_ready project=%s path=%s', str(project), str(sandbox))
+                return
+        self._cleanup(sandbox)
+
+    def _refresh(self) -> None:
+        with self._cond:
+            projects = list(self._ready)
+        for project in projects:
+            fingerprint = self.fingerprint(project)
+            with self._cond:
+                queue = self._ready.get(project)
+                if not queue:
+                    continue
+                stale = [entry for entry in queue if entry.fingerprint != fingerprint]
+                for entry in stale:
+                    queue.remove(entry)
+            for entry in stale:
+                self._recycle(entry)
+
+    def _recycle(self, entry: _PooledSandbox) -> None:
+        self._cleanup(entry.path)
+        with self._cond:
+            self.recycled += 1
+        _log.info('sandbox_pool_recycled path=%s', str(entry.path))
+
+    def _backoff(self) -> None:
+        with self._cond:
+            self._cond.wait_for(lambda: self._closed, timeout=self.refresh_seconds)
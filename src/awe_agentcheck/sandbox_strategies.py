@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+import shutil
+from typing import Callable
+
+from awe_agentcheck.git_operations import GIT_SNAPSHOT_TIMEOUT_SECONDS, run_git_command
+from awe_agentcheck.observability import get_logger
+from awe_agentcheck.round_snapshots import clone_file
+from awe_agentcheck.workspace_walk import walk_workspace
+
+_log = get_logger('awe_agentcheck.sandbox_strategies')
+
+SANDBOX_STRATEGY_AUTO = 'auto'
+SANDBOX_STRATEGY_COPY = 'copy'
+SANDBOX_STRATEGY_REFLINK = 'reflink'
+SANDBOX_STRATEGY_WORKTREE = 'worktree'
+SANDBOX_STRATEGIES = (
+    SANDBOX_STRATEGY_AUTO,
+    SANDBOX_STRATEGY_COPY,
+    SANDBOX_STRATEGY_REFLINK,
+    SANDBOX_STRATEGY_WORKTREE,
+)
+DEFAULT_SANDBOX_STRATEGY = SANDBOX_STRATEGY_AUTO
+
+
+def normalize_sandbox_strategy(value: object) -> str:
+    text = str(value or '').strip().lower()
+    return text if text in SANDBOX_STRATEGIES else DEFAULT_SANDBOX_STRATEGY
+
+
+def place_file(src: Path, dst: Path, strategy: str) -> str:
+    """Put *src* at *dst* using a file-level strategy; returns ``'cloned'`` or ``'copied'``.
+
+    Sandbox files never share an inode with the project: an agent writing a
+    file in place must not reach the user's tree, so only copy-on-write
+    clones and plain copies are used.
+    """
+    if strategy == SANDBOX_STRATEGY_REFLINK:
+        return clone_file(src, dst)
+    shutil.copy2(src, dst)
+    return 'copied'
+
+
+def reflink_supported(sample: Path, target_dir: Path) -> bool:
+    """Probe whether *sample* can be reflinked into *target_dir* (same CoW filesystem)."""
+    probe = Path(target_dir) / f'.awe-reflink-probe-{os.getpid()}'
+    try:
+        return clone_file(sample, probe) == 'cloned'
+    except OSError:
+        return False
+    finally:
+        probe.unlink(missing_ok=True)
+
+
+def worktree_available(project_root: Path, sandbox_root: Path) -> bool:
+    """True when *project_root* is the top of a git repo with a commit and *sandbox_root* lies outside it."""
+    project = Path(project_root).resolve(strict=False)
+    sandbox = Path(sandbox_root).resolve(strict=False)
+    if sandbox == project or project in sandbox.parents:
+        return False
+    ok, toplevel = run_git_command(root=project, args=['rev-parse', '--show-toplevel'])
+    if not ok or Path(toplevel).resolve(strict=False) != project:
+        return False
+    ok, _ = run_git_command(root=project, args=['rev-parse', '--verify', '--quiet', 'HEAD'])
+    return ok
+
+
+def add_sandbox_worktree(project_root: Path, sandbox_root: Path, *, excluded: Callable[[str], bool]) -> bool:
+    """Check HEAD out as a detached worktree at *sandbox_root*, then overlay uncommitted changes.
+
+    Tracked files that *excluded* rejects (secrets, caches) are removed again
+    and modified, untracked and ignored files are copied over, so the result
+    matches a filtered copy of the working tree. Returns False, leaving
+    *sandbox_root* empty, when git refuses.
+    """
+    project = Path(project_root).resolve(strict=False)
+    sandbox = Path(sandbox_root).resolve(strict=False)
+    ok, detail = run_git_command(
+        root=project,
+        args=['worktree', 'add', '--detach', str(sandbox), 'HEAD'],
+        timeout_seconds=GIT_SNAPSHOT_TIMEOUT_SECONDS,
+    )
+    if not ok:
+        _log.warning('sandbox_worktree_add_failed path=%s detail=%s', str(sandbox), detail[:200])
+        remove_sandbox_worktree(sandbox)
+        return False
+    ok, tracked = run_git_command(
+        root=sandbox,
+        args=['ls-files', '-z'],
+        timeout_seconds=GIT_SNAPSHOT_TIMEOUT_SECONDS,
+        strip_output=False,
+    )
+    ok_status, status = run_git_command(
+        root=project,
+        args=['status', '--porcelain=v1', '-z', '--untracked-files=all', '--ignored=traditional'],
+        timeout_seconds=GIT_SNAPSHOT_TIMEOUT_SECONDS,
+        strip_output=False,
+    )
+    if not ok or not ok_status:
+        remove_sandbox_worktree(sandbox)
+        return False
+    for rel in tracked.split('\0'):
+        if rel and excluded(rel):
+            (sandbox / rel).unlink(missing_ok=True)
+    for rel in _status_paths(status):
+        rel = rel.rstrip('/')
+        if not rel or excluded(rel):
+            continue
+        for item in _expand_status_path(project, rel, excluded):
+            src = project / item
+            dst = sandbox / item
+            if src.is_file():
+                dst.parent.mkdir(parents=True, exist_ok=True)
+                dst.unlink(missing_ok=True)
+                shutil.copy2(src, dst)
+            elif not src.exists():
+                dst.unlink(missing_ok=True)
+    return True
+
+
+def remove_sandbox_worktree(sandbox_root: Path) -> bool:
+    """Unregister a worktree sandbox from its repository; False when it is not one."""
+    sandbox = Path(sandbox_root)
+    marker = sandbox / '.git'
+    if not marker.is_file():
+        return False
+    ok, common_dir = run_git_command(root=sandbox, args=['rev-parse', '--git-common-dir'])
+    if not ok:
+        return False
+    repo = (sandbox / common_dir).resolve(strict=False)
+    ok, _ = run_git_command(
+        root=repo,
+        args=['worktree', 'remove', '--force', '--force', str(sandbox.resolve(strict=False))],
+        timeout_seconds=GIT_SNAPSHOT_TIMEOUT_SECONDS,
+    )
+    if not ok:
+        run_git_command(root=repo, args=['worktree', 'prune'])
+    return ok
+
+
+def _status_paths(payload: str) -> list[str]:
+    parts = payload.split('\0')
+    paths: list[str] = []
+    idx = 0
+    while idx < len(parts):
+        entry = parts[idx]
+        idx += 1
+        if len(entry) < 4:
+            continue
+        paths.append(entry[3:])
+        if entry[0] in {'R', 'C'}:
+            # Renames and copies carry the original path as the next field.
+            if idx < len(parts) and parts[idx]:
+                paths.append(parts[idx])
+            idx += 1
+    return paths
+
+
+def _expand_status_path(project: Path, rel: str, excluded: Callable[[str], bool]) -> list[str]:
+    path = project / rel
+    if not path.is_dir() or path.is_symlink():
+        return [rel]
+    # Untracked or ignored directories are reported once; walk them with the same filter.
+    return [f'{rel}/{item}' for item, _ in walk_workspace(path, exclude=lambda item: excluded(f'{rel}/{item}'))]
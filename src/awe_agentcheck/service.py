@@ -2,15 +2,21 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime, timezone
-import difflib
+import json
 import os
 from pathlib import Path
 import re
 import shutil
 import stat
 import threading
+from typing import AsyncIterator
 
-from awe_agentcheck.adapters import ParticipantRunner
+from awe_agentcheck.adapters import (
+    ParticipantResponseCache,
+    ParticipantRunner,
+    ProviderCircuitBreaker,
+    ProviderScheduler,
+)
 from awe_agentcheck.domain.events import EventType
 from awe_agentcheck.domain.gate import evaluate_medium_gate
 from awe_agentcheck.domain.models import ReviewVerdict, TaskStatus
@@ -32,14 +38,21 @@ from awe_agentcheck.event_analysis import (
     validate_artifact_task_id as event_validate_artifact_task_id,
 )
 from awe_agentcheck.fusion import AutoFusionManager
+from awe_agentcheck.fusion_merge import recover_merges
 from awe_agentcheck.git_operations import (
     evaluate_promotion_guard,
+    git_delete_refs,
+    git_diff_trees,
+    git_materialize_tree,
+    git_resolve_ref,
+    git_snapshot_tree,
+    git_update_ref,
     promotion_guard_config,
     read_git_head_sha,
     read_git_state,
     run_git_command,
 )
-from awe_agentcheck.observability import get_logger, set_task_context
+from awe_agentcheck.observability import get_logger, get_round_no, set_task_context
 from awe_agentcheck.participants import parse_participant_id
 from awe_agentcheck.policy_templates import (
     POLICY_TEMPLATE_CATALOG,
@@ -78,7 +91,24 @@ from awe_agentcheck.risk_assessment import (
     resolve_risk_tier_from_profile,
     run_preflight_risk_gate,
 )
-from awe_agentcheck.repository import TaskRepository
+from awe_agentcheck.round_patches import iter_round_patch, read_text_for_patch, write_round_patch
+from awe_agentcheck.round_snapshots import (
+    DEFAULT_SNAPSHOT_MODE,
+    SNAPSHOT_MODE_COPY,
+    SNAPSHOT_MODE_GIT,
+    SNAPSHOT_MODE_LINK,
+    SNAPSHOT_MODE_STORE,
+    clone_file,
+    link_file,
+    normalize_snapshot_mode,
+)
+from awe_agentcheck.repository import TaskRepository, filter_event_window
+from awe_agentcheck.sandbox_pool import SandboxPool
+from awe_agentcheck.sandbox_strategies import (
+    DEFAULT_SANDBOX_STRATEGY,
+    SANDBOX_STRATEGY_COPY,
+    remove_sandbox_worktree,
+)
 from awe_agentcheck.service_layers import (
     AnalyticsService,
     EvidenceDeps,
@@ -87,11 +117,16 @@ from awe_agentcheck.service_layers import (
     HistoryService,
     MemoryDeps,
     MemoryService,
+    SANDBOX_IGNORED_HEADS,
+    StreamMessage,
+    TaskEventBroker,
     TaskManagementService,
+    TaskUpdateStream,
     normalize_memory_mode,
     normalize_phase_timeout_seconds,
 )
 from awe_agentcheck.storage.artifacts import ArtifactStore
+from awe_agentcheck.storage.content_store import ContentStore
 from awe_agentcheck.task_options import (
     extract_model_from_command,
     normalize_bool_flag,
@@ -106,8 +141,11 @@ from awe_agentcheck.task_options import (
     supported_providers,
 )
 from awe_agentcheck.workflow import RunConfig, ShellCommandExecutor, WorkflowEngine
+from awe_agentcheck.workflow_fanout import DEFAULT_FANOUT_MAX_WORKERS, fan_out
 from awe_agentcheck.workflow_architecture import build_environment_context
+from awe_agentcheck.workflow_stream import DEFAULT_STREAM_MAX_BYTES, DEFAULT_STREAM_WINDOW_MS, run_participant
 from awe_agentcheck.workflow_text import clip_text
+from awe_agentcheck.workspace_walk import walk_workspace
 
 _log = get_logger('awe_agentcheck.service')
 
@@ -143,6 +181,7 @@ class CreateTaskInput:
     plain_mode: bool = True
     stream_mode: bool = True
     debate_mode: bool = True
+    parallel_reviews: bool = False
     sandbox_mode: bool = True
     sandbox_workspace_path: str | None = None
     sandbox_cleanup_on_pass: bool = True
@@ -186,6 +225,7 @@ class TaskView:
     plain_mode: bool
     stream_mode: bool
     debate_mode: bool
+    parallel_reviews: bool
     sandbox_mode: bool
     sandbox_workspace_path: str | None
     sandbox_generated: bool
@@ -224,6 +264,8 @@ class StatsView:
 
 
 _PROVIDER_RE = re.compile(r'provider=([a-zA-Z0-9_-]+)')
+# Recent tasks whose merge targets are scanned for leftover merge journals at start-up.
+_MERGE_RECOVERY_SCAN_TASKS = 2000
 _TERMINAL_STATUSES = {
     TaskStatus.PASSED.value,
     TaskStatus.FAILED_GATE.value,
@@ -385,11 +427,29 @@ class OrchestratorService:
         artifact_store: ArtifactStore,
         workflow_engine: WorkflowEngine | None = None,
         max_concurrent_running_tasks: int = 1,
+        manifest_hash_workers: int = 0,
+        round_snapshot_mode: str = DEFAULT_SNAPSHOT_MODE,
+        sandbox_strategy: str = DEFAULT_SANDBOX_STRATEGY,
+        sandbox_pool_size: int = 0,
+        sandbox_pool_projects: list[str] | tuple[str, ...] = (),
+        provider_scheduler: ProviderScheduler | None = None,
+        circuit_breaker: ProviderCircuitBreaker | None = None,
     ):
         self.repository = repository
         self.artifact_store = artifact_store
         self.max_concurrent_running_tasks = max(0, int(max_concurrent_running_tasks))
-        self.fusion_manager = AutoFusionManager(snapshot_root=self.artifact_store.root / 'snapshots')
+        self.round_snapshot_mode = normalize_snapshot_mode(round_snapshot_mode)
+        self.content_store = (
+            ContentStore(self.artifact_store.root / 'content-store')
+            if self.round_snapshot_mode == SNAPSHOT_MODE_STORE
+            else None
+        )
+        self.fusion_manager = AutoFusionManager(
+            snapshot_root=self.artifact_store.root / 'snapshots',
+            hash_cache_root=self.artifact_store.root / 'manifest-cache',
+            hash_workers=manifest_hash_workers,
+            content_store=self.content_store,
+        )
         self.workflow_engine = workflow_engine or WorkflowEngine(
             runner=ParticipantRunner(),
             command_executor=ShellCommandExecutor(),
@@ -435,10 +495,52 @@ class OrchestratorService:
                 read_artifact_json=self._read_task_artifact_json,
             ),
         )
+        self.sandbox_pool = (
+            SandboxPool(
+                size=sandbox_pool_size,
+                provision=lambda project, sandbox: TaskManagementService._bootstrap_sandbox_workspace(
+                    project,
+                    sandbox,
+                    strategy=sandbox_strategy,
+                ),
+                path_factory=TaskManagementService._default_sandbox_path,
+                exclude=TaskManagementService._is_sandbox_ignored,
+            )
+            if int(sandbox_pool_size) > 0
+            else None
+        )
+        if self.sandbox_pool is not None:
+            for project in sandbox_pool_projects:
+                if str(project or '').strip() and Path(project).is_dir():
+                    self.sandbox_pool.register(Path(project))
         self.task_management_service = TaskManagementService(
             repository=self.repository,
             artifact_store=self.artifact_store,
             validation_error_cls=InputValidationError,
+            sandbox_strategy=sandbox_strategy,
+            sandbox_pool=self.sandbox_pool,
+        )
+        engine_runner = getattr(self.workflow_engine, 'runner', None)
+        runner_scheduler = getattr(engine_runner, 'scheduler', None)
+        self.provider_scheduler = provider_scheduler or (
+            runner_scheduler if isinstance(runner_scheduler, ProviderScheduler) else None
+        )
+        if self.provider_scheduler is not None:
+            self.provider_scheduler.add_listener(self._record_provider_event)
+        runner_breaker = getattr(engine_runner, 'circuit_breaker', None)
+        self.circuit_breaker = circuit_breaker or (
+            runner_breaker if isinstance(runner_breaker, ProviderCircuitBreaker) else None
+        )
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.add_listener(self._record_provider_event)
+        runner_cache = getattr(engine_runner, 'response_cache', None)
+        self.response_cache = runner_cache if isinstance(runner_cache, ParticipantResponseCache) else None
+        self.event_broker = TaskEventBroker()
+        self.event_broker.attach(self.repository)
+        self.event_stream = TaskUpdateStream(
+            broker=self.event_broker,
+            get_task=self.repository.get_task,
+            list_events=self.list_events,
         )
 
     def _try_claim_start_slot(self, task_id: str) -> bool:
@@ -465,13 +567,14 @@ class OrchestratorService:
         with self._running_state_guard:
             if key in self._active_run_slots:
                 return True, 0
-            running_ids = self._running_task_ids(exclude_task_id=key)
             inflight_ids = {item for item in self._active_run_slots if item != key}
-            occupied = running_ids | inflight_ids
-            if self.max_concurrent_running_tasks > 0 and len(occupied) >= self.max_concurrent_running_tasks:
-                return False, len(occupied)
+            # Claimed slots whose task is already marked running are in the count.
+            claimed_only = sum(1 for item in inflight_ids if not self._is_task_running(item))
+            occupied = self._count_running_tasks(exclude_task_id=key) + claimed_only
+            if self.max_concurrent_running_tasks > 0 and occupied >= self.max_concurrent_running_tasks:
+                return False, occupied
             self._active_run_slots.add(key)
-            return True, len(occupied)
+            return True, occupied
 
     def _release_running_capacity(self, task_id: str) -> None:
         key = str(task_id or '').strip()
@@ -549,7 +652,9 @@ class OrchestratorService:
             return None
         return self._to_view(row)
 
-    def get_stats(self) -> StatsView:
+    def get_stats(self, *, refresh: bool = False) -> StatsView:
+        if refresh:
+            self.analytics_service.rebuild_stats()
         return self.analytics_service.get_stats()
 
     def get_provider_models_catalog(self) -> dict[str, list[str]]:
@@ -614,7 +719,67 @@ class OrchestratorService:
         }
 
     def get_analytics(self, *, limit: int = 300) -> dict:
-        return self.analytics_service.get_analytics(limit=limit)
+        analytics = self.analytics_service.get_analytics(limit=limit)
+        if self.provider_scheduler is not None:
+            analytics['provider_admission'] = self.provider_scheduler.snapshot()
+        if self.circuit_breaker is not None:
+            analytics['provider_circuits'] = self.circuit_breaker.snapshot()
+        if self.response_cache is not None:
+            analytics['response_cache'] = self.response_cache.snapshot()
+        if self.fusion_manager.hash_cache is not None:
+            analytics['manifest_cache'] = self.fusion_manager.hash_cache.snapshot()
+        return analytics
+
+    def recover_pending_merges(self, *, limit: int = _MERGE_RECOVERY_SCAN_TASKS) -> list[dict]:
+        """Finish merge transactions a crashed process left in any known merge target.
+
+        Called once at start-up so a half-applied merge is rolled forward
+        before anyone reads the target, not only when the next merge into it
+        happens to run.
+        """
+        targets: dict[str, Path] = {}
+        for row in self.repository.list_tasks(limit=max(1, int(limit))):
+            for text in (
+                normalize_merge_target_path(row.get('merge_target_path')),
+                str(row.get('project_path') or '').strip(),
+            ):
+                if not text:
+                    continue
+                target = Path(text).resolve(strict=False)
+                targets.setdefault(str(target), target)
+        recovered: list[dict] = []
+        for key, target in sorted(targets.items()):
+            if not target.is_dir():
+                continue
+            try:
+                results = recover_merges(target)
+            except Exception:
+                _log.exception('merge_recovery_failed target=%s', key)
+                continue
+            recovered.extend({'target_path': key, **item} for item in results)
+        if recovered:
+            _log.warning('merge_recovery_completed targets=%d transactions=%d', len(targets), len(recovered))
+        return recovered
+
+    def _record_provider_event(self, payload: dict) -> None:
+        """Store runner-level provider events (admission waits, breaker changes) on the task that triggered them."""
+        task_id = str(payload.get('task_id') or '').strip()
+        if not task_id:
+            return
+        event = dict(payload)
+        round_no = get_round_no()
+        if round_no is not None:
+            event['round'] = round_no
+        try:
+            self.repository.append_event(
+                task_id,
+                event_type=str(event.get('type') or 'event'),
+                payload=event,
+                round_number=round_no,
+            )
+        except KeyError:
+            return
+        self.artifact_store.append_event(task_id, event)
 
     def list_memory(
         self,
@@ -734,8 +899,11 @@ class OrchestratorService:
 
         delete_order = sorted(candidate_ids)
         deleted_tasks = self.repository.delete_tasks(delete_order)
+        # Snapshot refs are located via the task's rounds dir, so release them first.
+        self._release_round_snapshot_refs(delete_order)
         deleted_artifacts = 0
         for task_id in delete_order:
+            self._forget_round_snapshot_manifests(task_id)
             try:
                 if self.artifact_store.remove_task_workspace(task_id):
                     deleted_artifacts += 1
@@ -749,23 +917,56 @@ class OrchestratorService:
             'skipped_non_terminal': int(skipped_non_terminal),
         }
 
-    def list_events(self, task_id: str) -> list[dict]:
+    def list_events(
+        self,
+        task_id: str,
+        *,
+        after_seq: int | None = None,
+        limit: int | None = None,
+        event_types: list[str] | None = None,
+    ) -> list[dict]:
+        window = {
+            'after_seq': after_seq,
+            'limit': limit,
+            'event_types': event_types,
+        }
         try:
-            events = self.repository.list_events(task_id)
+            events = self.repository.list_events(task_id, **window)
         except KeyError as exc:
             fallback = self._load_events_from_artifacts(task_id)
             if fallback is not None:
-                return fallback
+                return filter_event_window(fallback, **window)
             raise exc
 
         if events:
             return events
+        if int(after_seq or 0) > 0:
+            # An empty tail is the steady state for cursor polls; only the
+            # initial page is allowed to fall back to artifact history.
+            return events
 
         fallback = self._load_events_from_artifacts(task_id)
         if fallback:
-            return fallback
+            return filter_event_window(fallback, **window)
         return events
 
+    def astream_task_updates(
+        self,
+        *,
+        task_id: str | None = None,
+        after_seq: int = 0,
+        heartbeat_seconds: float = 15.0,
+        max_seconds: float | None = None,
+    ) -> AsyncIterator[StreamMessage]:
+        if task_id:
+            self._validate_artifact_task_id(task_id)
+        return self.event_stream.aiter_messages(
+            task_id=task_id,
+            after_seq=after_seq,
+            heartbeat_seconds=heartbeat_seconds,
+            max_seconds=max_seconds,
+        )
+
     def _load_events_from_artifacts(self, task_id: str) -> list[dict] | None:
         key = self._validate_artifact_task_id(task_id)
         threads_root = (self.artifact_store.root / 'threads').resolve(strict=False)
@@ -1707,6 +1908,9 @@ class OrchestratorService:
                 if int(row.get('self_loop_mode', 0)) == 1 and evolution_level <= 2
                 else 'all'
             )
+            review_hedge_delays = None
+            if getattr(self.workflow_engine, 'review_hedge', False):
+                review_hedge_delays = self.analytics_service.review_hedge_delays() or None
 
             result = self.workflow_engine.run(
                 RunConfig(
@@ -1736,12 +1940,14 @@ class OrchestratorService:
                     plain_mode=normalize_plain_mode(row.get('plain_mode')),
                     stream_mode=normalize_bool_flag(row.get('stream_mode', True), default=True),
                     debate_mode=normalize_bool_flag(row.get('debate_mode', True), default=True),
+                    parallel_reviews=normalize_bool_flag(row.get('parallel_reviews', False), default=False),
                     cwd=Path(str(row.get('workspace_path') or Path.cwd())),
                     max_rounds=int(row['max_rounds']),
                     test_command=row['test_command'],
                     lint_command=row['lint_command'],
                     proposal_issue_contract=proposal_issue_contract,
                     architecture_audit_scope=architecture_audit_scope,
+                    review_hedge_delays=review_hedge_delays,
                 ),
                 on_event=on_event,
                 should_cancel=should_cancel,
@@ -2070,6 +2276,8 @@ class OrchestratorService:
 
                 cleanup_payload = self._cleanup_sandbox_after_merge(row=row, workspace_root=workspace_root)
                 if cleanup_payload is not None:
+                    if cleanup_payload.get('removed'):
+                        self.fusion_manager.forget_manifest(workspace_root)
                     event_type = 'sandbox_cleanup_completed' if cleanup_payload.get('ok') else 'sandbox_cleanup_failed'
                     self.repository.append_event(
                         task_id,
@@ -2290,54 +2498,63 @@ class OrchestratorService:
 
         round_no = max(1, int(round_number))
         rounds_root = self._round_artifacts_root(task_id)
-        source_snapshot = self._round_snapshot_dir(rounds_root, round_no)
-        if not source_snapshot.exists() or not source_snapshot.is_dir():
-            raise InputValidationError(
-                f'round snapshot not found for round {round_no}',
-                field='round',
-            )
-        baseline_snapshot = self._round_snapshot_dir(rounds_root, 0)
-        if not baseline_snapshot.exists() or not baseline_snapshot.is_dir():
-            raise InputValidationError(
-                'round baseline snapshot missing',
-                field='round',
-            )
+        # Trees rebuilt from a ref or git tree only for this promotion are removed afterwards.
+        transient = [
+            path for path in (self._round_snapshot_dir(rounds_root, n) for n in (round_no, 0)) if not path.is_dir()
+        ]
+        try:
+            source_snapshot = self._restore_round_snapshot(task_id, rounds_root, round_no)
+            if not source_snapshot.exists() or not source_snapshot.is_dir():
+                raise InputValidationError(
+                    f'round snapshot not found for round {round_no}',
+                    field='round',
+                )
+            baseline_snapshot = self._restore_round_snapshot(task_id, rounds_root, 0)
+            if not baseline_snapshot.exists() or not baseline_snapshot.is_dir():
+                raise InputValidationError(
+                    'round baseline snapshot missing',
+                    field='round',
+                )
 
-        target_text = (
-            normalize_merge_target_path(merge_target_path)
-            or normalize_merge_target_path(row.get('merge_target_path'))
-            or str(row.get('project_path') or row.get('workspace_path') or '').strip()
-        )
-        target_root = Path(str(target_text)).resolve()
-        if not target_root.exists() or not target_root.is_dir():
-            raise InputValidationError(
-                'merge_target_path must be an existing directory',
-                field='merge_target_path',
+            target_text = (
+                normalize_merge_target_path(merge_target_path)
+                or normalize_merge_target_path(row.get('merge_target_path'))
+                or str(row.get('project_path') or row.get('workspace_path') or '').strip()
             )
+            target_root = Path(str(target_text)).resolve()
+            if not target_root.exists() or not target_root.is_dir():
+                raise InputValidationError(
+                    'merge_target_path must be an existing directory',
+                    field='merge_target_path',
+                )
 
-        guard = self._evaluate_promotion_guard(target_root=target_root)
-        self.repository.append_event(
-            task_id,
-            event_type='promotion_guard_checked',
-            payload=guard,
-            round_number=round_no,
-        )
-        self.artifact_store.append_event(task_id, {'type': EventType.PROMOTION_GUARD_CHECKED.value, **guard})
-        self.artifact_store.update_state(task_id, {'promotion_guard_last': guard})
-        if not bool(guard.get('guard_allowed', True)):
-            raise InputValidationError(
-                f'promotion guard blocked: {guard.get("guard_reason") or "blocked"}',
-                field='merge_target_path',
-                code='promotion_guard_blocked',
+            guard = self._evaluate_promotion_guard(target_root=target_root)
+            self.repository.append_event(
+                task_id,
+                event_type='promotion_guard_checked',
+                payload=guard,
+                round_number=round_no,
             )
+            self.artifact_store.append_event(task_id, {'type': EventType.PROMOTION_GUARD_CHECKED.value, **guard})
+            self.artifact_store.update_state(task_id, {'promotion_guard_last': guard})
+            if not bool(guard.get('guard_allowed', True)):
+                raise InputValidationError(
+                    f'promotion guard blocked: {guard.get("guard_reason") or "blocked"}',
+                    field='merge_target_path',
+                    code='promotion_guard_blocked',
+                )
 
-        before_manifest = self.fusion_manager.build_manifest(baseline_snapshot)
-        fusion = self.fusion_manager.run(
-            task_id=f'{task_id}-round-{round_no}',
-            source_root=source_snapshot,
-            target_root=target_root,
-            before_manifest=before_manifest,
-        )
+            before_manifest = self.fusion_manager.build_manifest(baseline_snapshot)
+            fusion = self.fusion_manager.run(
+                task_id=f'{task_id}-round-{round_no}',
+                source_root=source_snapshot,
+                target_root=target_root,
+                before_manifest=before_manifest,
+            )
+        finally:
+            for path in transient:
+                self.fusion_manager.forget_manifest(path)
+                shutil.rmtree(path, ignore_errors=True)
         payload = {
             'task_id': task_id,
             'round': round_no,
@@ -2431,6 +2648,7 @@ class OrchestratorService:
                 plain_mode=normalize_plain_mode(row.get('plain_mode')),
                 stream_mode=normalize_bool_flag(row.get('stream_mode', True), default=True),
                 debate_mode=normalize_bool_flag(row.get('debate_mode', True), default=True),
+                parallel_reviews=normalize_bool_flag(row.get('parallel_reviews', False), default=False),
                 cwd=Path(str(row.get('workspace_path') or Path.cwd())),
                 max_rounds=int(row.get('max_rounds', 3)),
                 test_command=str(row.get('test_command', 'python -m pytest -q')),
@@ -2465,155 +2683,219 @@ class OrchestratorService:
                 feedback_block = f'{feedback_prefix}\n- {author_feedback_note}'
                 discussion_text = f'{discussion_text}\n\n{feedback_block}'.strip() if discussion_text else feedback_block
             if runner is not None:
+                stream_window_ms = int(getattr(self.workflow_engine, 'stream_window_ms', DEFAULT_STREAM_WINDOW_MS))
+                stream_max_bytes = int(getattr(self.workflow_engine, 'stream_max_bytes', DEFAULT_STREAM_MAX_BYTES))
+
+                proposal_parallel = len(reviewers) > 1 and bool(
+                    getattr(self.workflow_engine, 'parallel_proposal_reviews', False)
+                )
+                proposal_event_lock = threading.Lock()
+
+                def append_proposal_event(event_type: str, payload: dict, round_number: int | None) -> None:
+                    # Parallel reviewers stream from worker threads; keep seq and artifact writes serialized.
+                    with proposal_event_lock:
+                        self.repository.append_event(
+                            task_id,
+                            event_type=event_type,
+                            payload=payload,
+                            round_number=round_number,
+                        )
+                        self.artifact_store.append_event(task_id, payload)
+
                 def emit_runtime_event(event: dict) -> None:
-                    self.repository.append_event(
-                        task_id,
-                        event_type=str(event.get('type', 'participant_stream')),
-                        payload=event,
-                        round_number=event.get('round'),
-                    )
-                    self.artifact_store.append_event(task_id, event)
+                    append_proposal_event(str(event.get('type', 'participant_stream')), event, event.get('round'))
 
-                def run_proposal_reviewer_pass(
-                    source_text: str,
-                    *,
-                    round_no: int,
-                    stage: str,
-                ) -> tuple[list[dict], str]:
-                    payloads: list[dict] = []
-                    merged_context = str(source_text or '').strip()
-                    for reviewer in reviewers:
-                        started_type = f'{stage}_started'
-                        error_type = f'{stage}_error'
-                        review_started = {
-                            'type': started_type,
+                def announce_proposal_reviewer(reviewer, *, round_no: int, stage: str) -> None:
+                    append_proposal_event(
+                        f'{stage}_started',
+                        {
+                            'type': f'{stage}_started',
                             'round': round_no,
                             'participant': reviewer.participant_id,
                             'provider': reviewer.provider,
                             'timeout_seconds': review_timeout,
-                        }
-                        self.repository.append_event(
-                            task_id,
-                            event_type=started_type,
-                            payload=review_started,
-                            round_number=round_no,
-                        )
-                        self.artifact_store.append_event(task_id, review_started)
-                        try:
-                            review = runner.run(
-                                participant=reviewer,
-                                prompt=self._proposal_review_prompt(
-                                    config,
-                                    merged_context,
+                        },
+                        round_no,
+                    )
+
+                def invoke_proposal_reviewer(
+                    reviewer,
+                    context: str,
+                    *,
+                    round_no: int,
+                    stage: str,
+                ) -> tuple[ReviewVerdict, str, str | None]:
+                    try:
+                        review = run_participant(
+                            runner,
+                            participant=reviewer,
+                            stage=stage,
+                            prompt=self._proposal_review_prompt(
+                                config,
+                                context,
+                                stage=stage,
+                                environment_context=proposal_environment_context,
+                                memory_context=(config.memory_context or {}).get('proposal'),
+                            ),
+                            cwd=config.cwd,
+                            timeout_seconds=review_timeout,
+                            model=resolve_model_for_participant(
+                                participant_id=reviewer.participant_id,
+                                provider=reviewer.provider,
+                                provider_models=config.provider_models,
+                                participant_models=config.participant_models,
+                            ),
+                            model_params=resolve_model_params_for_participant(
+                                participant_id=reviewer.participant_id,
+                                provider=reviewer.provider,
+                                provider_model_params=config.provider_model_params,
+                                participant_model_params=config.participant_model_params,
+                            ),
+                            claude_team_agents=resolve_agent_toggle_for_participant(
+                                participant_id=reviewer.participant_id,
+                                global_enabled=bool(config.claude_team_agents),
+                                overrides=claude_team_agents_overrides,
+                            ),
+                            codex_multi_agents=resolve_agent_toggle_for_participant(
+                                participant_id=reviewer.participant_id,
+                                global_enabled=bool(config.codex_multi_agents),
+                                overrides=codex_multi_agents_overrides,
+                            ),
+                            on_stream=(
+                                WorkflowEngine._stream_emitter(
+                                    emit=emit_runtime_event,
+                                    round_no=round_no,
                                     stage=stage,
-                                    environment_context=proposal_environment_context,
-                                    memory_context=(config.memory_context or {}).get('proposal'),
-                                ),
-                                cwd=config.cwd,
-                                timeout_seconds=review_timeout,
-                                model=resolve_model_for_participant(
-                                    participant_id=reviewer.participant_id,
+                                    participant=reviewer.participant_id,
                                     provider=reviewer.provider,
-                                    provider_models=config.provider_models,
-                                    participant_models=config.participant_models,
-                                ),
-                                model_params=resolve_model_params_for_participant(
-                                    participant_id=reviewer.participant_id,
-                                    provider=reviewer.provider,
-                                    provider_model_params=config.provider_model_params,
-                                    participant_model_params=config.participant_model_params,
-                                ),
-                                claude_team_agents=resolve_agent_toggle_for_participant(
-                                    participant_id=reviewer.participant_id,
-                                    global_enabled=bool(config.claude_team_agents),
-                                    overrides=claude_team_agents_overrides,
-                                ),
-                                codex_multi_agents=resolve_agent_toggle_for_participant(
-                                    participant_id=reviewer.participant_id,
-                                    global_enabled=bool(config.codex_multi_agents),
-                                    overrides=codex_multi_agents_overrides,
-                                ),
-                                on_stream=(
-                                    WorkflowEngine._stream_emitter(
-                                        emit=emit_runtime_event,
-                                        round_no=round_no,
-                                        stage=stage,
-                                        participant=reviewer.participant_id,
-                                        provider=reviewer.provider,
-                                    )
-                                    if bool(config.stream_mode)
-                                    else None
-                                ),
-                            )
-                            verdict = WorkflowEngine._normalize_verdict(str(getattr(review, 'verdict', '') or ''))
-                            review_text = str(getattr(review, 'output', '') or '').strip()
-                            verdict, review_text = self._normalize_proposal_reviewer_result(
-                                config=config,
-                                stage=stage,
-                                verdict=verdict,
-                                review_text=review_text,
-                            )
-                        except Exception as exc:
-                            _log.exception(
-                                'proposal_reviewer_stage_failed task_id=%s round=%s participant=%s',
-                                task_id,
-                                round_no,
-                                reviewer.participant_id,
-                            )
-                            reason = str(exc or 'review_failed').strip() or 'review_failed'
-                            error_payload = {
+                                    window_ms=stream_window_ms,
+                                    max_bytes=stream_max_bytes,
+                                )
+                                if bool(config.stream_mode)
+                                else None
+                            ),
+                        )
+                        verdict = WorkflowEngine._normalize_verdict(str(getattr(review, 'verdict', '') or ''))
+                        review_text = str(getattr(review, 'output', '') or '').strip()
+                        verdict, review_text = self._normalize_proposal_reviewer_result(
+                            config=config,
+                            stage=stage,
+                            verdict=verdict,
+                            review_text=review_text,
+                        )
+                        return verdict, review_text, None
+                    except Exception as exc:
+                        _log.exception(
+                            'proposal_reviewer_stage_failed task_id=%s round=%s participant=%s',
+                            task_id,
+                            round_no,
+                            reviewer.participant_id,
+                        )
+                        reason = str(exc or 'review_failed').strip() or 'review_failed'
+                        return ReviewVerdict.UNKNOWN, '', reason
+
+                def record_proposal_reviewer(
+                    reviewer,
+                    result: tuple[ReviewVerdict, str, str | None],
+                    merged_context: str,
+                    payloads: list[dict],
+                    *,
+                    round_no: int,
+                    stage: str,
+                ) -> str:
+                    verdict, review_text, error_reason = result
+                    if error_reason is not None:
+                        error_type = f'{stage}_error'
+                        append_proposal_event(
+                            error_type,
+                            {
                                 'type': error_type,
                                 'round': round_no,
                                 'participant': reviewer.participant_id,
                                 'provider': reviewer.provider,
-                                'reason': reason,
-                            }
-                            self.repository.append_event(
-                                task_id,
-                                event_type=error_type,
-                                payload=error_payload,
-                                round_number=round_no,
-                            )
-                            self.artifact_store.append_event(task_id, error_payload)
-                            verdict = ReviewVerdict.UNKNOWN
-                            review_text = f'[{error_type}] {reason}'
-                        parsed_issues = parse_reviewer_issues(
-                            output=review_text,
-                            verdict=verdict.value,
-                        )
-                        contract_ok = not (
-                            verdict in {ReviewVerdict.BLOCKER, ReviewVerdict.UNKNOWN}
-                            and len(parsed_issues) == 0
+                                'reason': error_reason,
+                            },
+                            round_no,
                         )
-                        payload = {
-                            'type': stage,
-                            'round': round_no,
-                            'participant': reviewer.participant_id,
-                            'provider': reviewer.provider,
-                            'verdict': verdict.value,
-                            'output': review_text,
-                            'issues': parsed_issues,
-                            'issue_contract_ok': contract_ok,
-                        }
-                        payloads.append(payload)
-                        self.repository.append_event(
+                        verdict = ReviewVerdict.UNKNOWN
+                        review_text = f'[{error_type}] {error_reason}'
+                    parsed_issues = parse_reviewer_issues(
+                        output=review_text,
+                        verdict=verdict.value,
+                    )
+                    contract_ok = not (
+                        verdict in {ReviewVerdict.BLOCKER, ReviewVerdict.UNKNOWN}
+                        and len(parsed_issues) == 0
+                    )
+                    payload = {
+                        'type': stage,
+                        'round': round_no,
+                        'participant': reviewer.participant_id,
+                        'provider': reviewer.provider,
+                        'verdict': verdict.value,
+                        'output': review_text,
+                        'issues': parsed_issues,
+                        'issue_contract_ok': contract_ok,
+                    }
+                    payloads.append(payload)
+                    append_proposal_event('proposal_review', payload, round_no)
+                    if review_text:
+                        self.artifact_store.append_discussion(
                             task_id,
-                            event_type='proposal_review',
-                            payload=payload,
+                            role=f'{stage}:{reviewer.participant_id}',
                             round_number=round_no,
+                            content=review_text,
                         )
-                        self.artifact_store.append_event(task_id, payload)
-                        if review_text:
-                            self.artifact_store.append_discussion(
-                                task_id,
-                                role=f'{stage}:{reviewer.participant_id}',
-                                round_number=round_no,
-                                content=review_text,
+                    return self._append_proposal_feedback_context(
+                        merged_context,
+                        reviewer_id=reviewer.participant_id,
+                        review_text=review_text,
+                    )
+
+                def run_proposal_reviewer_pass(
+                    source_text: str,
+                    *,
+                    round_no: int,
+                    stage: str,
+                ) -> tuple[list[dict], str]:
+                    payloads: list[dict] = []
+                    merged_context = str(source_text or '').strip()
+                    if not proposal_parallel:
+                        for reviewer in reviewers:
+                            announce_proposal_reviewer(reviewer, round_no=round_no, stage=stage)
+                            result = invoke_proposal_reviewer(reviewer, merged_context, round_no=round_no, stage=stage)
+                            merged_context = record_proposal_reviewer(
+                                reviewer, result, merged_context, payloads, round_no=round_no, stage=stage
                             )
-                        merged_context = self._append_proposal_feedback_context(
-                            merged_context,
-                            reviewer_id=reviewer.participant_id,
-                            review_text=review_text,
+                        return payloads, merged_context
+
+                    # Parallel pass: every reviewer sees the same source context and the
+                    # results are merged back in reviewer order, so validation downstream
+                    # is unchanged. Per-provider limits come from the runner's ProviderScheduler.
+                    seed_context = merged_context
+                    for reviewer in reviewers:
+                        announce_proposal_reviewer(reviewer, round_no=round_no, stage=stage)
+                    outcomes = fan_out(
+                        reviewers,
+                        lambda reviewer: invoke_proposal_reviewer(
+                            reviewer, seed_context, round_no=round_no, stage=stage
+                        ),
+                        max_workers=int(getattr(self.workflow_engine, 'review_max_workers', DEFAULT_FANOUT_MAX_WORKERS)),
+                        should_cancel=lambda: self.repository.is_cancel_requested(task_id),
+                        timeout_seconds=review_timeout + 30,
+                        thread_name_prefix='awe-proposal-review',
+                    )
+                    for reviewer, outcome in zip(reviewers, outcomes):
+                        if outcome.ok:
+                            result = outcome.value
+                        elif outcome.canceled:
+                            result = (ReviewVerdict.UNKNOWN, '', 'canceled')
+                        elif outcome.timed_out:
+                            result = (ReviewVerdict.UNKNOWN, '', f'timeout_seconds={review_timeout}')
+                        else:
+                            result = (ReviewVerdict.UNKNOWN, '', str(outcome.error or 'review_failed'))
+                        merged_context = record_proposal_reviewer(
+                            reviewer, result, merged_context, payloads, round_no=round_no, stage=stage
                         )
                     return payloads, merged_context
 
@@ -2894,8 +3176,10 @@ class OrchestratorService:
                             )
                         )
                         try:
-                            discussion = runner.run(
+                            discussion = run_participant(
+                                runner,
                                 participant=author,
+                                stage='proposal_discussion',
                                 prompt=discussion_prompt,
                                 cwd=config.cwd,
                                 timeout_seconds=proposal_timeout,
@@ -2928,6 +3212,8 @@ class OrchestratorService:
                                         stage='proposal_discussion',
                                         participant=author.participant_id,
                                         provider=author.provider,
+                                        window_ms=stream_window_ms,
+                                        max_bytes=stream_max_bytes,
                                     )
                                     if bool(config.stream_mode)
                                     else None
@@ -3421,18 +3707,29 @@ class OrchestratorService:
         return TaskStatus.FAILED_GATE
 
     def _count_running_tasks(self, *, exclude_task_id: str | None = None) -> int:
-        return len(self._running_task_ids(exclude_task_id=exclude_task_id))
+        count_by_status = getattr(self.repository, 'count_tasks_by_status', None)
+        if not callable(count_by_status):
+            return len(self._running_task_ids(exclude_task_id=exclude_task_id))
+        running = int(count_by_status([TaskStatus.RUNNING.value]).get(TaskStatus.RUNNING.value, 0))
+        if exclude_task_id and self._is_task_running(exclude_task_id):
+            running -= 1
+        return max(0, running)
+
+    def _is_task_running(self, task_id: str) -> bool:
+        row = self.repository.get_task(task_id)
+        return row is not None and str(row.get('status', '')) == TaskStatus.RUNNING.value
 
     def _running_task_ids(self, *, exclude_task_id: str | None = None) -> set[str]:
-        rows = self.repository.list_tasks(limit=10_000)
-        running_ids: set[str] = set()
-        for row in rows:
-            task_id = str(row.get('task_id', ''))
-            if exclude_task_id and task_id == exclude_task_id:
-                continue
-            if str(row.get('status', '')) == TaskStatus.RUNNING.value:
-                running_ids.add(task_id)
-        return running_ids
+        list_ids = getattr(self.repository, 'list_task_ids_by_status', None)
+        if callable(list_ids):
+            task_ids = [str(v) for v in list_ids(TaskStatus.RUNNING.value)]
+        else:
+            task_ids = [
+                str(row.get('task_id', ''))
+                for row in self.repository.list_tasks(limit=10_000)
+                if str(row.get('status', '')) == TaskStatus.RUNNING.value
+            ]
+        return {task_id for task_id in task_ids if not (exclude_task_id and task_id == exclude_task_id)}
 
     @staticmethod
     def _parse_iso_datetime(value) -> datetime | None:
@@ -3594,6 +3891,8 @@ class OrchestratorService:
         }
         try:
             if sandbox_root.exists():
+                remove_sandbox_worktree(sandbox_root)
+
                 def _onerror(func, p, exc_info):
                     try:
                         os.chmod(p, stat.S_IWRITE)
@@ -3617,11 +3916,125 @@ class OrchestratorService:
     def _round_snapshot_dir(rounds_root: Path, round_no: int) -> Path:
         return rounds_root / f'round-{int(round_no):03d}-snapshot'
 
+    def _round_snapshot_ref(self, task_id: str, round_no: int) -> str:
+        return f'tasks/{self._validate_artifact_task_id(task_id)}/round-{int(round_no):03d}'
+
+    def _restore_round_snapshot(self, task_id: str, rounds_root: Path, round_no: int) -> Path:
+        """Return the round snapshot dir, rebuilding it from the content store or git if absent."""
+        snapshot = self._round_snapshot_dir(rounds_root, round_no)
+        if snapshot.is_dir():
+            return snapshot
+        if self.content_store is not None:
+            files = self.content_store.read_ref(self._round_snapshot_ref(task_id, round_no))
+            if files is not None:
+                snapshot.mkdir(parents=True, exist_ok=True)
+                self.content_store.materialize(files, snapshot)
+                return snapshot
+        repo, tree = self._git_round_tree(task_id, rounds_root, round_no)
+        if repo is not None and tree is not None:
+            snapshot.mkdir(parents=True, exist_ok=True)
+            if not git_materialize_tree(repo, tree, snapshot, index_file=rounds_root / 'git-export-index'):
+                self.fusion_manager.forget_manifest(snapshot)
+                shutil.rmtree(snapshot, ignore_errors=True)
+        return snapshot
+
+    def _git_snapshot_ref(self, task_id: str, round_no: int) -> str:
+        return f'refs/awe/{self._validate_artifact_task_id(task_id)}/round-{int(round_no)}'
+
+    @staticmethod
+    def _git_snapshot_repo(rounds_root: Path) -> Path | None:
+        try:
+            payload = json.loads((rounds_root / 'git-snapshots.json').read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return None
+        repo = str(payload.get('repo') or '').strip() if isinstance(payload, dict) else ''
+        return Path(repo) if repo else None
+
+    def _git_round_tree(self, task_id: str, rounds_root: Path, round_no: int) -> tuple[Path | None, str | None]:
+        repo = self._git_snapshot_repo(rounds_root)
+        if repo is None:
+            return None, None
+        return repo, git_resolve_ref(repo, self._git_snapshot_ref(task_id, round_no))
+
+    def _capture_git_snapshot(self, *, task_id: str, round_no: int, workspace_root: Path, rounds_root: Path) -> str | None:
+        """Record the workspace as a git tree under refs/awe/<task>/round-N; None means fall back to a copy."""
+        if self.round_snapshot_mode != SNAPSHOT_MODE_GIT:
+            return None
+        workspace = Path(workspace_root).resolve(strict=False)
+        ok, toplevel = run_git_command(root=workspace, args=['rev-parse', '--show-toplevel'])
+        if not ok or Path(toplevel).resolve(strict=False) != workspace:
+            return None
+        excludes = sorted(SANDBOX_IGNORED_HEADS - {'.git'})
+        try:
+            artifact_rel = self.artifact_store.root.resolve(strict=False).relative_to(workspace).as_posix()
+            excludes.append(artifact_rel)
+        except ValueError:
+            pass
+        tree = git_snapshot_tree(workspace, index_file=rounds_root / 'git-index', excludes=excludes)
+        if tree is None or not git_update_ref(workspace, self._git_snapshot_ref(task_id, round_no), tree):
+            _log.warning('git_round_snapshot_failed task_id=%s round=%s', task_id, round_no)
+            return None
+        (rounds_root / 'git-snapshots.json').write_text(
+            json.dumps({'repo': str(workspace)}, ensure_ascii=True),
+            encoding='utf-8',
+        )
+        return tree
+
+    def _release_round_snapshot_refs(self, task_ids: list[str]) -> None:
+        for task_id in task_ids:
+            try:
+                key = self._validate_artifact_task_id(task_id)
+            except InputValidationError:
+                continue
+            rounds_root = self.artifact_store.root / 'threads' / key / 'artifacts' / 'rounds'
+            repo = self._git_snapshot_repo(rounds_root)
+            if repo is not None:
+                git_delete_refs(repo, f'refs/awe/{key}/')
+        if self.content_store is None:
+            return
+        released = 0
+        for task_id in task_ids:
+            try:
+                released += self.content_store.delete_refs(f'tasks/{self._validate_artifact_task_id(task_id)}')
+            except (InputValidationError, ValueError, OSError):
+                continue
+        if not released:
+            return
+        try:
+            result = self.content_store.gc()
+        except OSError:
+            _log.warning('content_store_gc_failed root=%s', str(self.content_store.root))
+            return
+        _log.info(
+            'content_store_gc refs_released=%d blobs_removed=%s bytes_freed=%s',
+            released,
+            result.get('blobs_removed'),
+            result.get('bytes_freed'),
+        )
+
+    def _forget_round_snapshot_manifests(self, task_id: str) -> None:
+        try:
+            key = self._validate_artifact_task_id(task_id)
+        except InputValidationError:
+            return
+        rounds_root = self.artifact_store.root / 'threads' / key / 'artifacts' / 'rounds'
+        for snapshot in rounds_root.glob('round-*-snapshot'):
+            self.fusion_manager.forget_manifest(snapshot)
+
     def _initialize_round_artifact_baseline(self, *, task_id: str, workspace_root: Path) -> Path:
         rounds_root = self._round_artifacts_root(task_id)
         baseline = self._round_snapshot_dir(rounds_root, 0)
         if baseline.exists():
+            self.fusion_manager.forget_manifest(baseline)
             shutil.rmtree(baseline, ignore_errors=True)
+        (rounds_root / 'git-snapshots.json').unlink(missing_ok=True)
+        if self._capture_git_snapshot(task_id=task_id, round_no=0, workspace_root=workspace_root, rounds_root=rounds_root):
+            # Git mode keeps the tree in the repository; the dir is only rebuilt on demand.
+            return baseline
+        if self.content_store is not None:
+            # Store mode keeps only the ref; the dir is only rebuilt on demand.
+            self._store_workspace_snapshot(source=workspace_root, ref=self._round_snapshot_ref(task_id, 0))
+            return baseline
         baseline.mkdir(parents=True, exist_ok=True)
         self._copy_workspace_snapshot(source_root=workspace_root, target_root=baseline)
         return baseline
@@ -3639,35 +4052,87 @@ class OrchestratorService:
         rounds_root = self._round_artifacts_root(task_id)
         next_snapshot = self._round_snapshot_dir(rounds_root, round_no)
         if next_snapshot.exists():
+            self.fusion_manager.forget_manifest(next_snapshot)
             shutil.rmtree(next_snapshot, ignore_errors=True)
-        next_snapshot.mkdir(parents=True, exist_ok=True)
-        self._copy_workspace_snapshot(source_root=workspace_root, target_root=next_snapshot)
-
-        before_manifest = self.fusion_manager.build_manifest(previous_snapshot)
-        after_manifest = self.fusion_manager.build_manifest(next_snapshot)
-        changed_paths = sorted(
-            [rel for rel in set(before_manifest) | set(after_manifest) if before_manifest.get(rel) != after_manifest.get(rel)]
-        )
-        added_files = sorted([rel for rel in after_manifest if rel not in before_manifest])
-        deleted_files = sorted([rel for rel in before_manifest if rel not in after_manifest])
-        modified_files = sorted(
-            [
-                rel
-                for rel in changed_paths
-                if rel in before_manifest and rel in after_manifest and before_manifest.get(rel) != after_manifest.get(rel)
-            ]
+        git_capture = self._capture_git_round_artifacts(
+            task_id=task_id,
+            round_no=round_no,
+            previous_snapshot=previous_snapshot,
+            workspace_root=workspace_root,
+            rounds_root=rounds_root,
         )
+        patch_from, patch_to = previous_snapshot, next_snapshot
+        patch_scratch: Path | None = None
+        if git_capture is not None:
+            snapshot_mode = SNAPSHOT_MODE_GIT
+            changed_paths, added_files, modified_files, deleted_files, patch_text, snapshot_stats = git_capture
+        elif self.content_store is not None:
+            snapshot_mode = SNAPSHOT_MODE_STORE
+            patch_scratch = rounds_root / f'.round-{int(round_no)}-patch'
+            (
+                changed_paths,
+                added_files,
+                modified_files,
+                deleted_files,
+                snapshot_stats,
+                patch_from,
+                patch_to,
+            ) = self._capture_store_round_artifacts(
+                task_id=task_id,
+                round_no=round_no,
+                previous_snapshot=previous_snapshot,
+                workspace_root=workspace_root,
+                scratch=patch_scratch,
+            )
+            patch_text = None
+        else:
+            snapshot_mode = self.round_snapshot_mode if self.round_snapshot_mode != SNAPSHOT_MODE_GIT else SNAPSHOT_MODE_COPY
+            previous_round = self._round_number_from_snapshot(previous_snapshot)
+            if previous_round is not None and not previous_snapshot.is_dir():
+                previous_snapshot = self._restore_round_snapshot(task_id, rounds_root, previous_round)
+            next_snapshot.mkdir(parents=True, exist_ok=True)
+            before_manifest = self.fusion_manager.build_manifest(previous_snapshot)
+            snapshot_stats = self._copy_workspace_snapshot(
+                source_root=workspace_root,
+                target_root=next_snapshot,
+                previous_root=previous_snapshot,
+                previous_manifest=before_manifest,
+            )
+            after_manifest = self.fusion_manager.build_manifest(next_snapshot, seed_root=previous_snapshot)
+            changed_paths = sorted(
+                [rel for rel in set(before_manifest) | set(after_manifest) if before_manifest.get(rel) != after_manifest.get(rel)]
+            )
+            added_files = sorted([rel for rel in after_manifest if rel not in before_manifest])
+            deleted_files = sorted([rel for rel in before_manifest if rel not in after_manifest])
+            modified_files = sorted(
+                [
+                    rel
+                    for rel in changed_paths
+                    if rel in before_manifest and rel in after_manifest and before_manifest.get(rel) != after_manifest.get(rel)
+                ]
+            )
 
-        patch_text = self._build_patch_text(
-            from_root=previous_snapshot,
-            to_root=next_snapshot,
-            changed_paths=changed_paths,
-        )
+            patch_text = None
         patch_path = rounds_root / f'round-{int(round_no)}.patch'
-        if patch_text.strip():
-            patch_path.write_text(patch_text, encoding='utf-8')
-        else:
-            patch_path.write_text('# no file-level changes detected for this round\n', encoding='utf-8')
+        try:
+            with patch_path.open('w', encoding='utf-8', newline='') as handle:
+                if patch_text is None:
+                    has_patch = write_round_patch(
+                        handle,
+                        patch_from,
+                        patch_to,
+                        changed_paths,
+                        workers=self.fusion_manager.hash_workers,
+                    ) > 0
+                else:
+                    has_patch = bool(patch_text.strip())
+                    if has_patch:
+                        handle.write(patch_text)
+                if not has_patch:
+                    handle.write('# no file-level changes detected for this round\n')
+        finally:
+            if patch_scratch is not None:
+                shutil.rmtree(patch_scratch, ignore_errors=True)
 
         summary_path = rounds_root / f'round-{int(round_no)}.md'
         lines = [
@@ -3704,6 +4169,8 @@ class OrchestratorService:
             'patch_path': str(patch_path),
             'summary_path': str(summary_path),
             'snapshot_path': str(next_snapshot),
+            'snapshot_mode': snapshot_mode,
+            'snapshot_files': snapshot_stats,
             'created_at': datetime.now().isoformat(),
         }
         self.artifact_store.write_artifact_json(
@@ -3713,72 +4180,145 @@ class OrchestratorService:
         )
         return meta_payload, next_snapshot
 
-    def _copy_workspace_snapshot(self, *, source_root: Path, target_root: Path) -> None:
+    @staticmethod
+    def _round_number_from_snapshot(snapshot: Path) -> int | None:
+        match = re.fullmatch(r'round-(\d+)-snapshot', Path(snapshot).name)
+        return int(match.group(1)) if match else None
+
+    def _capture_store_round_artifacts(
+        self,
+        *,
+        task_id: str,
+        round_no: int,
+        previous_snapshot: Path,
+        workspace_root: Path,
+        scratch: Path,
+    ) -> tuple[list[str], list[str], list[str], list[str], dict, Path, Path]:
+        """Record the round as a content-store ref and diff it against the previous round's ref.
+
+        No snapshot tree is written: only the changed files of both sides are
+        materialized under *scratch*, which the caller removes once the patch
+        is written.
+        """
+        store = self.content_store
+        previous_round = self._round_number_from_snapshot(previous_snapshot)
+        before = store.read_ref(self._round_snapshot_ref(task_id, previous_round)) if previous_round is not None else None
+        after, stats = self._store_workspace_snapshot(
+            source=workspace_root,
+            ref=self._round_snapshot_ref(task_id, round_no),
+        )
+        shutil.rmtree(scratch, ignore_errors=True)
+        if before is None:
+            # The previous round was not stored (e.g. a git tree that fell back); diff its dir.
+            before = self.fusion_manager.build_manifest(previous_snapshot) if previous_snapshot.is_dir() else {}
+            from_root = previous_snapshot
+        else:
+            from_root = scratch / 'a'
+        changed_paths = sorted(rel for rel in set(before) | set(after) if before.get(rel) != after.get(rel))
+        added_files = [rel for rel in changed_paths if rel not in before]
+        deleted_files = [rel for rel in changed_paths if rel not in after]
+        modified_files = [rel for rel in changed_paths if rel in before and rel in after]
+        if from_root != previous_snapshot:
+            store.materialize({rel: before[rel] for rel in changed_paths if rel in before}, from_root)
+        to_root = scratch / 'b'
+        store.materialize({rel: after[rel] for rel in changed_paths if rel in after}, to_root)
+        return changed_paths, added_files, modified_files, deleted_files, stats, from_root, to_root
+
+    def _capture_git_round_artifacts(
+        self,
+        *,
+        task_id: str,
+        round_no: int,
+        previous_snapshot: Path,
+        workspace_root: Path,
+        rounds_root: Path,
+    ) -> tuple[list[str], list[str], list[str], list[str], str, dict] | None:
+        previous_round = self._round_number_from_snapshot(previous_snapshot)
+        if previous_round is None:
+            return None
+        repo, previous_tree = self._git_round_tree(task_id, rounds_root, previous_round)
+        if repo is None or previous_tree is None:
+            return None
+        tree = self._capture_git_snapshot(
+            task_id=task_id,
+            round_no=round_no,
+            workspace_root=workspace_root,
+            rounds_root=rounds_root,
+        )
+        if tree is None:
+            return None
+        diff = git_diff_trees(repo, previous_tree, tree)
+        if diff is None:
+            return None
+        statuses, patch_text = diff
+        changed_paths = sorted(statuses)
+        added_files = sorted(rel for rel, status in statuses.items() if status == 'A')
+        deleted_files = sorted(rel for rel, status in statuses.items() if status == 'D')
+        modified_files = sorted(rel for rel, status in statuses.items() if status not in {'A', 'D'})
+        stats = {'git_tree': tree, 'git_ref': self._git_snapshot_ref(task_id, round_no)}
+        return changed_paths, added_files, modified_files, deleted_files, patch_text, stats
+
+    def _copy_workspace_snapshot(
+        self,
+        *,
+        source_root: Path,
+        target_root: Path,
+        previous_root: Path | None = None,
+        previous_manifest: dict[str, str] | None = None,
+    ) -> dict[str, int]:
+        """Materialize *source_root* into *target_root*.
+
+        In link mode, files whose manifest hash matches *previous_manifest* are hardlinked
+        from *previous_root* and the rest are reflinked where the filesystem
+        supports it. Snapshots are never written after capture, which keeps
+        the shared inodes safe. Copy mode copies every file.
+        """
         source = Path(source_root)
         target = Path(target_root)
+        link_mode = self.round_snapshot_mode == SNAPSHOT_MODE_LINK
+        unchanged: set[str] = set()
+        if link_mode and previous_root is not None and previous_manifest:
+            source_manifest = self.fusion_manager.build_manifest(source)
+            unchanged = {rel for rel, digest in source_manifest.items() if previous_manifest.get(rel) == digest}
+        stats = {'linked': 0, 'cloned': 0, 'copied': 0}
         for src in self._iter_workspace_files(source):
             rel = src.relative_to(source)
             dst = target / rel
             dst.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(src, dst)
+            if rel.as_posix() in unchanged and link_file(Path(previous_root) / rel, dst):
+                stats['linked'] += 1
+            elif link_mode:
+                stats[clone_file(src, dst)] += 1
+            else:
+                shutil.copy2(src, dst)
+                stats['copied'] += 1
+        return stats
+
+    def _store_workspace_snapshot(self, *, source: Path, ref: str) -> tuple[dict[str, str], dict[str, int]]:
+        """Put every file of *source* into the content store and record them under *ref*; no tree is written."""
+        store = self.content_store
+        source = Path(source)
+        known = self.fusion_manager.build_manifest(source)
+        files: dict[str, str] = {}
+        with store.writing():
+            for src in self._iter_workspace_files(source):
+                rel = src.relative_to(source).as_posix()
+                files[rel] = store.put_file(src, digest=known.get(rel))
+            store.write_ref(ref, files, meta={'source_root': str(source)})
+        return files, {'linked': 0, 'cloned': 0, 'copied': 0, 'stored': len(files)}
 
     def _iter_workspace_files(self, root: Path):
         base = Path(root)
-        for path in base.rglob('*'):
-            if not path.is_file():
-                continue
-            rel = path.relative_to(base).as_posix()
-            if self._is_sandbox_ignored(rel):
-                continue
-            yield path
+        for rel, _ in walk_workspace(base, exclude=self._is_sandbox_ignored):
+            yield base / rel
 
     def _build_patch_text(self, *, from_root: Path, to_root: Path, changed_paths: list[str]) -> str:
-        output: list[str] = []
-        for rel in changed_paths:
-            old_path = from_root / rel
-            new_path = to_root / rel
-            old_text, old_binary = self._read_text_for_patch(old_path)
-            new_text, new_binary = self._read_text_for_patch(new_path)
-            if old_binary or new_binary:
-                output.append(f'diff --git a/{rel} b/{rel}')
-                output.append('Binary files differ')
-                output.append('')
-                continue
-            old_lines = old_text.splitlines()
-            new_lines = new_text.splitlines()
-            from_name = '/dev/null' if not old_path.exists() else f'a/{rel}'
-            to_name = '/dev/null' if not new_path.exists() else f'b/{rel}'
-            diff_lines = list(
-                difflib.unified_diff(
-                    old_lines,
-                    new_lines,
-                    fromfile=from_name,
-                    tofile=to_name,
-                    lineterm='',
-                )
-            )
-            if not diff_lines:
-                continue
-            output.extend(diff_lines)
-            output.append('')
-        return '\n'.join(output).rstrip() + '\n' if output else ''
+        chunks = iter_round_patch(from_root, to_root, changed_paths, workers=self.fusion_manager.hash_workers)
+        return '\n'.join(chunks)
 
     @staticmethod
     def _read_text_for_patch(path: Path) -> tuple[str, bool]:
-        if not path.exists() or not path.is_file():
-            return '', False
-        try:
-            data = path.read_bytes()
-        except OSError:
-            return '', True
-        if len(data) > 2 * 1024 * 1024:
-            return '', True
-        if b'\x00' in data:
-            return '', True
-        try:
-            return data.decode('utf-8'), False
-        except UnicodeDecodeError:
-            return '', True
+        return read_text_for_patch(path)
 
     @staticmethod
     def _is_sandbox_ignored(rel_path: str) -> bool:
@@ -3789,8 +4329,13 @@ class OrchestratorService:
         return TaskManagementService._is_windows_reserved_device_name(filename)
 
     @staticmethod
-    def _bootstrap_sandbox_workspace(project_root: Path, sandbox_root: Path) -> None:
-        TaskManagementService._bootstrap_sandbox_workspace(project_root, sandbox_root)
+    def _bootstrap_sandbox_workspace(
+        project_root: Path,
+        sandbox_root: Path,
+        *,
+        strategy: str = SANDBOX_STRATEGY_COPY,
+    ) -> str | None:
+        return TaskManagementService._bootstrap_sandbox_workspace(project_root, sandbox_root, strategy=strategy)
 
     @staticmethod
     def _proposal_review_prompt(
@@ -3936,6 +4481,7 @@ class OrchestratorService:
             plain_mode=normalize_plain_mode(row.get('plain_mode', True)),
             stream_mode=normalize_bool_flag(row.get('stream_mode', True), default=True),
             debate_mode=normalize_bool_flag(row.get('debate_mode', True), default=True),
+            parallel_reviews=normalize_bool_flag(row.get('parallel_reviews', False), default=False),
             sandbox_mode=bool(row.get('sandbox_mode', False)),
             sandbox_workspace_path=(str(row.get('sandbox_workspace_path')).strip() if row.get('sandbox_workspace_path') else None),
             sandbox_generated=bool(row.get('sandbox_generated', False)),
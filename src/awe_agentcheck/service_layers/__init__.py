@@ -1,10 +1,12 @@
-from .analytics import AnalyticsService
+from .analytics import AnalyticsService, StatsAggregator
+from .event_stream import StreamMessage, TaskEventBroker, TaskUpdateStream, format_sse
 from .evidence import EvidenceDeps, EvidenceService
 from .history import HistoryDeps, HistoryService
 from .memory import MemoryDeps, MemoryService, normalize_memory_mode, normalize_phase_timeout_seconds
-from .task_management import TaskManagementService
+from .task_management import SANDBOX_IGNORED_HEADS, TaskManagementService
 
 __all__ = [
+    'SANDBOX_IGNORED_HEADS',
     'AnalyticsService',
     'EvidenceDeps',
     'EvidenceService',
@@ -12,7 +14,12 @@ __all__ = [
     'HistoryService',
     'MemoryDeps',
     'MemoryService',
+    'StatsAggregator',
+    'StreamMessage',
+    'TaskEventBroker',
     'TaskManagementService',
+    'TaskUpdateStream',
+    'format_sse',
     'normalize_memory_mode',
     'normalize_phase_timeout_seconds',
 ]
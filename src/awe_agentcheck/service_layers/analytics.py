@@ -1,12 +1,21 @@
 from __future__ import annotations
 
+from dataclasses import dataclass, field
 from datetime import datetime
+import heapq
 import re
+import threading
 from typing import Callable
 
 from awe_agentcheck.domain.events import EventType, REVIEW_EVENT_TYPES
 from awe_agentcheck.domain.models import TaskStatus
 from awe_agentcheck.observability import get_logger
+from awe_agentcheck.repository import (
+    TASK_CHANGE_CREATED,
+    TASK_CHANGE_DELETED,
+    TASK_CHANGE_EVENT,
+    TASK_CHANGE_UPDATED,
+)
 
 
 _TERMINAL_STATUSES = {
@@ -16,6 +25,286 @@ _TERMINAL_STATUSES = {
     TaskStatus.CANCELED.value,
 }
 _log = get_logger('awe_agentcheck.service_layers.analytics')
+_RECENT_WINDOW = 50
+_HEDGE_WINDOW_TASKS = 50
+_HEDGE_MIN_SAMPLES = 5
+_PROMPT_CACHE_EVENT_TYPES = [
+    EventType.PROMPT_CACHE_PROBE.value,
+    EventType.PROMPT_CACHE_BREAK.value,
+]
+
+
+def _to_bool(value) -> bool:
+    if isinstance(value, bool):
+        return value
+    text = str(value or '').strip().lower()
+    return text in {'1', 'true', 'yes', 'on'}
+
+
+@dataclass
+class _PromptCacheCounters:
+    prefix_reuse_eligible: int = 0
+    prefix_reuse_hits: int = 0
+    break_count: int = 0
+    break_model: int = 0
+    break_toolset: int = 0
+    break_prefix: int = 0
+    last_seq: int = 0
+
+    def apply(self, event: dict, payload: dict) -> None:
+        etype = str(event.get('type') or '').strip().lower()
+        if etype == EventType.PROMPT_CACHE_PROBE.value:
+            if _to_bool(payload.get('prefix_reuse_eligible')):
+                self.prefix_reuse_eligible += 1
+                if _to_bool(payload.get('prefix_reused')):
+                    self.prefix_reuse_hits += 1
+        elif etype == EventType.PROMPT_CACHE_BREAK.value:
+            self.break_count += 1
+            reason = str(payload.get('reason') or '').strip().lower()
+            if reason == 'model_changed':
+                self.break_model += 1
+            elif reason == 'toolset_changed':
+                self.break_toolset += 1
+            elif reason == 'prefix_changed':
+                self.break_prefix += 1
+
+
+@dataclass
+class _TrackedTask:
+    task_id: str
+    status: str
+    reason: str | None
+    created_at: str
+    updated_at: str
+    bucket: str | None = None
+    provider: str | None = None
+    prompt_cache: _PromptCacheCounters | None = field(default=None)
+
+
+class StatsAggregator:
+    """Keep ``/api/stats`` inputs up to date from repository change notifications.
+
+    A full rebuild (task rows plus prompt-cache events of the recent window)
+    only happens on first use or when :meth:`rebuild` is called; afterwards
+    status updates and ``append_event`` calls are applied incrementally so a
+    snapshot costs O(recent window) instead of a scan of every task.
+
+    Repository reads never run under ``_lock``: the change listener is called
+    from the repository's write path and only ever touches in-memory state.
+    Changes that arrive while a rebuild or a prompt-cache load is reading are
+    buffered and replayed once the read result is installed.
+    """
+
+    def __init__(
+        self,
+        *,
+        repository,
+        reason_bucket_fn: Callable[[str | None], str | None],
+        provider_pattern: re.Pattern,
+        merged_event_payload_fn: Callable[[dict], dict],
+        rebuild_limit: int = 10_000,
+    ):
+        self.repository = repository
+        self._reason_bucket = reason_bucket_fn
+        self._provider_pattern = provider_pattern
+        self._merged_event_payload = merged_event_payload_fn
+        self._rebuild_limit = max(1, int(rebuild_limit))
+        self._lock = threading.RLock()
+        self._rebuild_lock = threading.Lock()
+        self._ready = False
+        self._tasks: dict[str, _TrackedTask] = {}
+        self._status_counts: dict[str, int] = {}
+        self._reason_bucket_counts: dict[str, int] = {}
+        self._provider_error_counts: dict[str, int] = {}
+        self._recent: list[_TrackedTask] = []
+        # Changes seen while a rebuild is listing tasks; None when not rebuilding.
+        self._pending_changes: list[tuple[str, dict]] | None = None
+        # task_id -> prompt-cache events seen while its counters are being loaded.
+        self._loading: dict[str, list[dict]] = {}
+        self.attached = False
+
+    def attach(self) -> bool:
+        add_listener = getattr(self.repository, 'add_change_listener', None)
+        if not callable(add_listener):
+            return False
+        add_listener(self.on_change)
+        self.attached = True
+        return True
+
+    @property
+    def ready(self) -> bool:
+        with self._lock:
+            return self._ready
+
+    def rebuild(self) -> None:
+        with self._rebuild_lock:
+            with self._lock:
+                self._pending_changes = []
+            try:
+                rows = self.repository.list_tasks(limit=self._rebuild_limit)
+            except Exception:
+                with self._lock:
+                    self._pending_changes = None
+                raise
+            with self._lock:
+                self._tasks = {}
+                self._status_counts = {}
+                self._reason_bucket_counts = {}
+                self._provider_error_counts = {}
+                for row in rows:
+                    self._upsert_task(row)
+                self._refresh_recent()
+                pending, self._pending_changes = self._pending_changes or [], None
+                self._ready = True
+                for kind, payload in pending:
+                    self._apply_change(kind, payload)
+                missing = [t.task_id for t in self._recent if t.prompt_cache is None]
+            self._load_prompt_caches(missing)
+
+    def on_change(self, kind: str, payload: dict) -> None:
+        with self._lock:
+            if self._pending_changes is not None:
+                self._pending_changes.append((kind, dict(payload)))
+                return
+            if not self._ready:
+                return
+            self._apply_change(kind, payload)
+
+    def snapshot(self) -> dict:
+        if not self.ready:
+            self.rebuild()
+        with self._lock:
+            missing = [t.task_id for t in self._recent if t.prompt_cache is None]
+        self._load_prompt_caches(missing)
+        with self._lock:
+            recent = list(self._recent)
+            return {
+                'total_tasks': len(self._tasks),
+                'status_counts': {k: v for k, v in self._status_counts.items() if v > 0},
+                'reason_bucket_counts': {k: v for k, v in self._reason_bucket_counts.items() if v > 0},
+                'provider_error_counts': {k: v for k, v in self._provider_error_counts.items() if v > 0},
+                'recent_rows': [
+                    {
+                        'task_id': t.task_id,
+                        'status': t.status,
+                        'created_at': t.created_at,
+                        'updated_at': t.updated_at,
+                    }
+                    for t in recent
+                ],
+                'prompt_cache': [t.prompt_cache or _PromptCacheCounters() for t in recent],
+            }
+
+    def _apply_change(self, kind: str, payload: dict) -> None:
+        if kind in {TASK_CHANGE_CREATED, TASK_CHANGE_UPDATED}:
+            is_new = str(payload.get('task_id') or '') not in self._tasks
+            tracked = self._upsert_task(payload)
+            if tracked is None:
+                return
+            if is_new:
+                if kind == TASK_CHANGE_CREATED:
+                    tracked.prompt_cache = _PromptCacheCounters()
+                self._refresh_recent()
+        elif kind == TASK_CHANGE_DELETED:
+            removed = False
+            for raw in payload.get('task_ids', []):
+                tracked = self._tasks.pop(str(raw), None)
+                if tracked is not None:
+                    self._apply_contribution(tracked, -1)
+                    removed = True
+            if removed:
+                self._refresh_recent()
+        elif kind == TASK_CHANGE_EVENT:
+            etype = str(payload.get('type') or '').strip().lower()
+            if etype not in _PROMPT_CACHE_EVENT_TYPES:
+                return
+            task_id = str(payload.get('task_id') or '')
+            tracked = self._tasks.get(task_id)
+            if tracked is None:
+                return
+            if tracked.prompt_cache is None:
+                # Counters are loaded lazily once the task enters the recent window.
+                if task_id in self._loading:
+                    self._loading[task_id].append(dict(payload))
+                return
+            self._apply_prompt_cache_event(tracked.prompt_cache, payload)
+
+    def _apply_prompt_cache_event(self, counters: _PromptCacheCounters, event: dict) -> None:
+        seq = int(event.get('seq') or 0)
+        if seq and seq <= counters.last_seq:
+            return
+        counters.apply(event, self._merged_event_payload(event))
+        counters.last_seq = max(counters.last_seq, seq)
+
+    def _upsert_task(self, row: dict) -> _TrackedTask | None:
+        task_id = str(row.get('task_id') or '').strip()
+        if not task_id:
+            return None
+        previous = self._tasks.get(task_id)
+        if previous is not None:
+            self._apply_contribution(previous, -1)
+        reason = row.get('last_gate_reason')
+        provider_match = self._provider_pattern.search(str(reason or ''))
+        tracked = _TrackedTask(
+            task_id=task_id,
+            status=str(row.get('status', 'unknown')),
+            reason=reason,
+            created_at=str(row.get('created_at') or (previous.created_at if previous else '')),
+            updated_at=str(row.get('updated_at') or ''),
+            bucket=self._reason_bucket(reason),
+            provider=(provider_match.group(1).strip().lower() if provider_match else None),
+            prompt_cache=(previous.prompt_cache if previous is not None else None),
+        )
+        self._tasks[task_id] = tracked
+        self._apply_contribution(tracked, 1)
+        if previous is not None:
+            self._recent = [tracked if t.task_id == task_id else t for t in self._recent]
+        return tracked
+
+    def _apply_contribution(self, tracked: _TrackedTask, delta: int) -> None:
+        self._status_counts[tracked.status] = self._status_counts.get(tracked.status, 0) + delta
+        if tracked.bucket:
+            self._reason_bucket_counts[tracked.bucket] = self._reason_bucket_counts.get(tracked.bucket, 0) + delta
+        if tracked.provider:
+            self._provider_error_counts[tracked.provider] = self._provider_error_counts.get(tracked.provider, 0) + delta
+
+    def _refresh_recent(self) -> None:
+        self._recent = heapq.nlargest(_RECENT_WINDOW, self._tasks.values(), key=lambda t: t.created_at)
+
+    def _load_prompt_caches(self, task_ids: list[str]) -> None:
+        with self._lock:
+            claimed = [
+                task_id
+                for task_id in task_ids
+                if task_id not in self._loading
+                and task_id in self._tasks
+                and self._tasks[task_id].prompt_cache is None
+            ]
+            for task_id in claimed:
+                self._loading[task_id] = []
+        for task_id in claimed:
+            counters = self._read_prompt_cache(task_id)
+            with self._lock:
+                pending = self._loading.pop(task_id, [])
+                tracked = self._tasks.get(task_id)
+                if tracked is None or tracked.prompt_cache is not None:
+                    continue
+                for event in pending:
+                    self._apply_prompt_cache_event(counters, event)
+                tracked.prompt_cache = counters
+
+    def _read_prompt_cache(self, task_id: str) -> _PromptCacheCounters:
+        counters = _PromptCacheCounters()
+        try:
+            events = self.repository.list_events(task_id, event_types=_PROMPT_CACHE_EVENT_TYPES)
+        except KeyError:
+            events = []
+        except Exception:
+            _log.exception('list_events failed while building stats task_id=%s', task_id)
+            events = []
+        for event in events:
+            self._apply_prompt_cache_event(counters, event)
+        return counters
 
 
 class AnalyticsService:
@@ -37,15 +326,47 @@ class AnalyticsService:
         self._parse_iso_datetime = parse_iso_datetime_fn
         self._format_task_day = format_task_day_fn
         self._merged_event_payload = merged_event_payload_fn
+        self.stats_aggregator = StatsAggregator(
+            repository=repository,
+            reason_bucket_fn=reason_bucket_fn,
+            provider_pattern=provider_pattern,
+            merged_event_payload_fn=merged_event_payload_fn,
+        )
+        self.stats_aggregator.attach()
 
     def get_stats(self):
+        if self.stats_aggregator.attached:
+            snapshot = self.stats_aggregator.snapshot()
+            return self._build_stats(
+                total_tasks=snapshot['total_tasks'],
+                counts=snapshot['status_counts'],
+                reason_bucket_counts=snapshot['reason_bucket_counts'],
+                provider_error_counts=snapshot['provider_error_counts'],
+                recent_rows=snapshot['recent_rows'],
+                prompt_cache=snapshot['prompt_cache'],
+            )
+        return self._scan_stats()
+
+    def rebuild_stats(self) -> None:
+        if self.stats_aggregator.attached:
+            self.stats_aggregator.rebuild()
+
+    def _scan_stats(self):
         rows = self.repository.list_tasks(limit=10_000)
-        counts: dict[str, int] = {}
+        # Status totals come from the repository's status index when it has one;
+        # the capped row scan below then only feeds the breakdowns.
+        count_by_status = getattr(self.repository, 'count_tasks_by_status', None)
+        counts: dict[str, int] = (
+            {str(status): int(count) for status, count in count_by_status().items() if count}
+            if callable(count_by_status)
+            else {}
+        )
         reason_bucket_counts: dict[str, int] = {}
         provider_error_counts: dict[str, int] = {}
         for row in rows:
-            status = str(row.get('status', 'unknown'))
-            counts[status] = counts.get(status, 0) + 1
+            if not callable(count_by_status):
+                status = str(row.get('status', 'unknown'))
+                counts[status] = counts.get(status, 0) + 1
 
             reason = row.get('last_gate_reason')
             bucket = self._reason_bucket(reason)
@@ -57,8 +378,46 @@ class AnalyticsService:
                 provider = provider_match.group(1).strip().lower()
                 provider_error_counts[provider] = provider_error_counts.get(provider, 0) + 1
 
+        recent_rows = rows[:_RECENT_WINDOW]
+        prompt_cache: list[_PromptCacheCounters] = []
+        for row in recent_rows:
+            task_id = str(row.get('task_id') or '').strip()
+            if not task_id:
+                continue
+            try:
+                events = self.repository.list_events(task_id)
+            except KeyError:
+                events = []
+            except Exception:
+                _log.exception('list_events failed while building stats task_id=%s', task_id)
+                events = []
+            counters = _PromptCacheCounters()
+            for event in events:
+                etype = str(event.get('type') or '').strip().lower()
+                if etype in _PROMPT_CACHE_EVENT_TYPES:
+                    counters.apply(event, self._merged_event_payload(event))
+            prompt_cache.append(counters)
+
+        return self._build_stats(
+            total_tasks=sum(counts.values()) if callable(count_by_status) else len(rows),
+            counts=counts,
+            reason_bucket_counts=reason_bucket_counts,
+            provider_error_counts=provider_error_counts,
+            recent_rows=recent_rows,
+            prompt_cache=prompt_cache,
+        )
+
+    def _build_stats(
+        self,
+        *,
+        total_tasks: int,
+        counts: dict[str, int],
+        reason_bucket_counts: dict[str, int],
+        provider_error_counts: dict[str, int],
+        recent_rows: list[dict],
+        prompt_cache: list[_PromptCacheCounters],
+    ):
         active = counts.get(TaskStatus.RUNNING.value, 0) + counts.get(TaskStatus.QUEUED.value, 0)
-        recent_rows = rows[:50]
         recent_terminal = [r for r in recent_rows if str(r.get('status', '')) in _TERMINAL_STATUSES]
         recent_terminal_total = len(recent_terminal)
         if recent_terminal_total > 0:
@@ -81,47 +440,8 @@ class AnalyticsService:
                 durations.append(delta)
         mean_task_duration_seconds_50 = (sum(durations) / len(durations)) if durations else 0.0
 
-        def _to_bool(value) -> bool:
-            if isinstance(value, bool):
-                return value
-            text = str(value or '').strip().lower()
-            return text in {'1', 'true', 'yes', 'on'}
-
-        prefix_reuse_eligible = 0
-        prefix_reuse_hits = 0
-        prompt_cache_break_count_50 = 0
-        prompt_cache_break_model_50 = 0
-        prompt_cache_break_toolset_50 = 0
-        prompt_cache_break_prefix_50 = 0
-        for row in recent_rows:
-            task_id = str(row.get('task_id') or '').strip()
-            if not task_id:
-                continue
-            try:
-                events = self.repository.list_events(task_id)
-            except KeyError:
-                events = []
-            except Exception:
-                _log.exception('list_events failed while building stats task_id=%s', task_id)
-                events = []
-            for event in events:
-                etype = str(event.get('type') or '').strip().lower()
-                if etype == EventType.PROMPT_CACHE_PROBE.value:
-                    payload = self._merged_event_payload(event)
-                    if _to_bool(payload.get('prefix_reuse_eligible')):
-                        prefix_reuse_eligible += 1
-                        if _to_bool(payload.get('prefix_reused')):
-                            prefix_reuse_hits += 1
-                elif etype == EventType.PROMPT_CACHE_BREAK.value:
-                    prompt_cache_break_count_50 += 1
-                    payload = self._merged_event_payload(event)
-                    reason = str(payload.get('reason') or '').strip().lower()
-                    if reason == 'model_changed':
-                        prompt_cache_break_model_50 += 1
-                    elif reason == 'toolset_changed':
-                        prompt_cache_break_toolset_50 += 1
-                    elif reason == 'prefix_changed':
-                        prompt_cache_break_prefix_50 += 1
+        prefix_reuse_eligible = sum(c.prefix_reuse_eligible for c in prompt_cache)
+        prefix_reuse_hits = sum(c.prefix_reuse_hits for c in prompt_cache)
         prompt_prefix_reuse_rate_50 = (
             prefix_reuse_hits / prefix_reuse_eligible
             if prefix_reuse_eligible > 0
@@ -129,7 +449,7 @@ class AnalyticsService:
         )
 
         return self._stats_factory(
-            total_tasks=len(rows),
+            total_tasks=total_tasks,
             status_counts=counts,
             active_tasks=active,
             reason_bucket_counts=reason_bucket_counts,
@@ -140,12 +460,62 @@ class AnalyticsService:
             failed_system_rate_50=failed_system_rate_50,
             mean_task_duration_seconds_50=mean_task_duration_seconds_50,
             prompt_prefix_reuse_rate_50=prompt_prefix_reuse_rate_50,
-            prompt_cache_break_count_50=prompt_cache_break_count_50,
-            prompt_cache_break_model_50=prompt_cache_break_model_50,
-            prompt_cache_break_toolset_50=prompt_cache_break_toolset_50,
-            prompt_cache_break_prefix_50=prompt_cache_break_prefix_50,
+            prompt_cache_break_count_50=sum(c.break_count for c in prompt_cache),
+            prompt_cache_break_model_50=sum(c.break_model for c in prompt_cache),
+            prompt_cache_break_toolset_50=sum(c.break_toolset for c in prompt_cache),
+            prompt_cache_break_prefix_50=sum(c.break_prefix for c in prompt_cache),
         )
 
+    def review_hedge_delays(
+        self,
+        *,
+        quantile: float = 0.9,
+        min_samples: int = _HEDGE_MIN_SAMPLES,
+        limit: int = _HEDGE_WINDOW_TASKS,
+    ) -> dict[str, float]:
+        """Per-provider review latency at *quantile* over recent tasks, used as the hedge delay.
+
+        Only successful reviews count (review errors would skew the tail
+        toward the participant timeout); providers with fewer than
+        *min_samples* reviews are left out so they are never hedged on noise.
+        """
+        samples: dict[str, list[float]] = {}
+        for row in self.repository.list_tasks(limit=max(1, int(limit))):
+            task_id = str(row.get('task_id') or '').strip()
+            if not task_id:
+                continue
+            try:
+                events = self.repository.list_events(task_id, event_types=[EventType.REVIEW.value])
+            except KeyError:
+                continue
+            except Exception:
+                _log.exception('list_events failed while building hedge delays task_id=%s', task_id)
+                continue
+            for event in events:
+                payload = self._merged_event_payload(event)
+                if str(payload.get('output') or '').startswith('[review_error]'):
+                    continue
+                provider = str(payload.get('provider') or '').strip().lower()
+                if not provider:
+                    provider = str(payload.get('participant') or '').partition('#')[0].strip().lower()
+                try:
+                    duration = float(payload.get('duration_seconds') or 0.0)
+                except (TypeError, ValueError):
+                    continue
+                if provider and duration > 0:
+                    samples.setdefault(provider, []).append(duration)
+
+        fraction = min(1.0, max(0.0, float(quantile)))
+        delays: dict[str, float] = {}
+        for provider, values in sorted(samples.items()):
+            if len(values) < max(1, int(min_samples)):
+                continue
+            values.sort()
+            # Nearest-rank quantile: the smallest sample covering *fraction* of the reviews.
+            rank = max(1, -(-len(values) * fraction // 1))
+            delays[provider] = round(values[int(rank) - 1], 3)
+        return delays
+
     def get_analytics(self, *, limit: int = 300) -> dict:
         rows = self.repository.list_tasks(limit=max(1, min(2000, int(limit))))
         failures = [row for row in rows if str(row.get('status') or '') == TaskStatus.FAILED_GATE.value]
@@ -0,0 +1,253 @@
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from dataclasses import dataclass, field
+import json
+import threading
+import time
+from typing import AsyncIterator, Callable
+
+from awe_agentcheck.repository import (
+    TASK_CHANGE_CREATED,
+    TASK_CHANGE_DELETED,
+    TASK_CHANGE_EVENT,
+    TASK_CHANGE_UPDATED,
+)
+
+_TASK_STREAM_FIELDS = (
+    'task_id',
+    'title',
+    'status',
+    'last_gate_reason',
+    'rounds_completed',
+    'max_rounds',
+    'cancel_requested',
+    'project_path',
+    'updated_at',
+)
+
+
+@dataclass(frozen=True)
+class TaskChange:
+    version: int
+    kind: str
+    task_id: str
+    payload: dict = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class StreamMessage:
+    event: str
+    data: dict
+    id: str | None = None
+
+
+class TaskEventBroker:
+    """Versioned in-process change log fed by repository change listeners.
+
+    Subscribers remember the last version they saw and await
+    :meth:`await_changes` on an event loop until something newer is
+    published. Only the most recent *backlog*
+    changes are retained; a subscriber that falls further behind is told
+    about the gap and must resync from the repository.
+    """
+
+    def __init__(self, *, backlog: int = 2048):
+        self._lock = threading.Lock()
+        self._version = 0
+        self._changes: deque[TaskChange] = deque(maxlen=max(16, int(backlog)))
+        self._async_waiters: set[tuple[asyncio.AbstractEventLoop, asyncio.Future]] = set()
+
+    @property
+    def current_version(self) -> int:
+        with self._lock:
+            return self._version
+
+    def attach(self, repository) -> bool:
+        add_listener = getattr(repository, 'add_change_listener', None)
+        if not callable(add_listener):
+            return False
+        add_listener(self.publish)
+        return True
+
+    def publish(self, kind: str, payload: dict) -> None:
+        task_id = str(payload.get('task_id') or '').strip()
+        with self._lock:
+            self._version += 1
+            self._changes.append(
+                TaskChange(version=self._version, kind=str(kind), task_id=task_id, payload=dict(payload))
+            )
+            waiters = list(self._async_waiters)
+            self._async_waiters.clear()
+        for loop, waiter in waiters:
+            try:
+                loop.call_soon_threadsafe(_wake, waiter)
+            except RuntimeError:
+                # The subscriber's loop has already closed.
+                continue
+
+    async def await_changes(self, since_version: int, *, timeout: float) -> tuple[int, list[TaskChange], bool]:
+        """Return ``(latest_version, changes, gap)`` for changes after *since_version*.
+
+        Suspends the calling coroutine until something newer is published or
+        *timeout* passes.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + max(0.0, float(timeout))
+        while True:
+            with self._lock:
+                if self._version > since_version:
+                    return self._collect_locked(since_version)
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    return self._version, [], False
+                entry = (loop, loop.create_future())
+                self._async_waiters.add(entry)
+            try:
+                await asyncio.wait({entry[1]}, timeout=remaining)
+            finally:
+                with self._lock:
+                    self._async_waiters.discard(entry)
+                entry[1].cancel()
+
+    def _collect_locked(self, since_version: int) -> tuple[int, list[TaskChange], bool]:
+        changes = [change for change in self._changes if change.version > since_version]
+        oldest = changes[0].version if changes else self._version + 1
+        gap = oldest > since_version + 1
+        return self._version, changes, gap
+
+
+def _wake(waiter: asyncio.Future) -> None:
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+class TaskUpdateStream:
+    """Turn broker notifications into an ordered stream of :class:`StreamMessage`.
+
+    Task rows are pushed for every status/cancel transition. When *task_id* is
+    given, that task's events are read through the repository cursor
+    (``after_seq``) whenever the broker reports new rows, so a resumed stream
+    never skips or duplicates a ``seq``. The stream awaits the broker and runs
+    repository reads on worker threads, so an idle subscriber holds no thread.
+    """
+
+    def __init__(
+        self,
+        *,
+        broker: TaskEventBroker,
+        get_task: Callable[[str], dict | None],
+        list_events: Callable[..., list[dict]],
+        page_size: int = 500,
+    ):
+        self._broker = broker
+        self._get_task = get_task
+        self._list_events = list_events
+        self._page_size = max(1, int(page_size))
+
+    async def aiter_messages(
+        self,
+        *,
+        task_id: str | None = None,
+        after_seq: int = 0,
+        heartbeat_seconds: float = 15.0,
+        max_seconds: float | None = None,
+    ) -> AsyncIterator[StreamMessage]:
+        key = str(task_id or '').strip() or None
+        cursor = max(0, int(after_seq or 0))
+        deadline = (time.monotonic() + max(0.0, float(max_seconds))) if max_seconds is not None else None
+        # Capture the version before the initial read so nothing published in
+        # between is lost; at worst the tail read below is repeated.
+        version = self._broker.current_version
+        yield StreamMessage(event='ready', data={'task_id': key, 'after_seq': cursor, 'version': version})
+
+        if key is not None:
+            row = await asyncio.to_thread(self._get_task, key)
+            if row is not None:
+                yield self._task_message(row)
+            async for message in self._adrain_events(key, cursor):
+                cursor = int(message.data['seq'])
+                yield message
+
+        while True:
+            wait_seconds = max(0.05, float(heartbeat_seconds))
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return
+                wait_seconds = min(wait_seconds, remaining)
+            version, changes, gap = await self._broker.await_changes(version, timeout=wait_seconds)
+            messages, events_pending = self._change_messages(key, version, changes, gap)
+            for message in messages:
+                yield message
+            if events_pending:
+                async for message in self._adrain_events(key, cursor):
+                    cursor = int(message.data['seq'])
+                    yield message
+
+    def _change_messages(
+        self,
+        key: str | None,
+        version: int,
+        changes: list[TaskChange],
+        gap: bool,
+    ) -> tuple[list[StreamMessage], bool]:
+        """Messages for one broker wake-up, and whether *key*'s events must be re-read."""
+        if not changes and not gap:
+            return [StreamMessage(event='heartbeat', data={'version': version})], False
+        messages: list[StreamMessage] = []
+        if gap:
+            messages.append(StreamMessage(event='resync', data={'version': version}))
+        events_pending = gap and key is not None
+        for change in changes:
+            if change.kind in {TASK_CHANGE_CREATED, TASK_CHANGE_UPDATED}:
+                if key is None or change.task_id == key:
+                    messages.append(self._task_message(change.payload))
+            elif change.kind == TASK_CHANGE_DELETED:
+                task_ids = [str(v) for v in change.payload.get('task_ids', [])]
+                messages.append(StreamMessage(event='tasks_deleted', data={'task_ids': task_ids}))
+            elif change.kind == TASK_CHANGE_EVENT and key is not None and change.task_id == key:
+                events_pending = True
+        return messages, events_pending
+
+    async def _adrain_events(self, task_id: str, after_seq: int) -> AsyncIterator[StreamMessage]:
+        cursor = after_seq
+        while True:
+            messages, more = await asyncio.to_thread(self._event_page, task_id, cursor)
+            for message in messages:
+                cursor = int(message.data['seq'])
+                yield message
+            if not more:
+                return
+
+    def _event_page(self, task_id: str, after_seq: int) -> tuple[list[StreamMessage], bool]:
+        try:
+            rows = self._list_events(task_id, after_seq=after_seq, limit=self._page_size)
+        except KeyError:
+            return [], False
+        cursor = after_seq
+        messages: list[StreamMessage] = []
+        for row in rows:
+            seq = int(row.get('seq') or 0)
+            if seq <= cursor:
+                continue
+            cursor = seq
+            messages.append(StreamMessage(event='task_event', data=dict(row), id=str(seq)))
+        return messages, len(rows) >= self._page_size
+
+    @staticmethod
+    def _task_message(row: dict) -> StreamMessage:
+        data = {name: row.get(name) for name in _TASK_STREAM_FIELDS if name in row}
+        return StreamMessage(event='task', data=data)
+
+
+def format_sse(message: StreamMessage) -> str:
+    if message.event == 'heartbeat':
+        return ': heartbeat\n\n'
+    lines: list[str] = []
+    if message.id is not None:
+        lines.append(f'id: {message.id}')
+    lines.append(f'event: {message.event}')
+    lines.append(f'data: {json.dumps(message.data, ensure_ascii=True)}')
+    return '\n'.join(lines) + '\n\n'
@@ -12,6 +12,19 @@ from uuid import uuid4
 from awe_agentcheck.observability import get_logger
 from awe_agentcheck.participants import parse_participant_id
 from awe_agentcheck.repository import TaskCreateRecord
+from awe_agentcheck.sandbox_strategies import (
+    DEFAULT_SANDBOX_STRATEGY,
+    SANDBOX_STRATEGY_AUTO,
+    SANDBOX_STRATEGY_COPY,
+    SANDBOX_STRATEGY_REFLINK,
+    SANDBOX_STRATEGY_WORKTREE,
+    add_sandbox_worktree,
+    normalize_sandbox_strategy,
+    place_file,
+    reflink_supported,
+    remove_sandbox_worktree,
+    worktree_available,
+)
 from awe_agentcheck.task_options import (
     coerce_bool_override_value,
     normalize_bool_flag,
@@ -28,9 +41,26 @@ from awe_agentcheck.task_options import (
     normalize_provider_models,
     normalize_repair_mode,
 )
+from awe_agentcheck.workspace_walk import walk_workspace
 
 _log = get_logger('awe_agentcheck.service_layers.task_management')
 
+SANDBOX_IGNORED_HEADS = frozenset(
+    {
+        '.git',
+        '.agents',
+        '.claude',
+        '.venv',
+        '__pycache__',
+        '.pytest_cache',
+        '.ruff_cache',
+        'node_modules',
+        '.mypy_cache',
+        '.idea',
+        '.vscode',
+    }
+)
+
 class TaskManagementService:
     def __init__(
         self,
@@ -38,10 +68,14 @@ class TaskManagementService:
         repository,
         artifact_store,
         validation_error_cls,
+        sandbox_strategy: str = DEFAULT_SANDBOX_STRATEGY,
+        sandbox_pool=None,
     ):
         self.repository = repository
         self.artifact_store = artifact_store
         self._validation_error_cls = validation_error_cls
+        self.sandbox_strategy = normalize_sandbox_strategy(sandbox_strategy)
+        self.sandbox_pool = sandbox_pool
 
     def create_task(self, payload) -> dict:
         try:
@@ -106,6 +140,7 @@ class TaskManagementService:
         plain_mode = self._normalize_plain_mode(payload.plain_mode)
         stream_mode = self._normalize_bool_flag(payload.stream_mode, default=True)
         debate_mode = self._normalize_bool_flag(payload.debate_mode, default=True)
+        parallel_reviews = self._normalize_bool_flag(getattr(payload, 'parallel_reviews', False), default=False)
         sandbox_mode = bool(payload.sandbox_mode)
         self_loop_mode = max(0, min(1, int(payload.self_loop_mode)))
         sandbox_cleanup_on_pass = bool(payload.sandbox_cleanup_on_pass)
@@ -134,7 +169,9 @@ class TaskManagementService:
         try:
             if sandbox_mode:
                 if not sandbox_workspace_path:
-                    sandbox_workspace_path = self._default_sandbox_path(project_root)
+                    pooled = self.sandbox_pool.acquire(project_root) if self.sandbox_pool is not None else None
+                    # A pooled sandbox is already populated, so the bootstrap below is a no-op.
+                    sandbox_workspace_path = str(pooled) if pooled is not None else self._default_sandbox_path(project_root)
                     sandbox_generated = True
                 sandbox_root = Path(sandbox_workspace_path)
                 if sandbox_root.exists() and not sandbox_root.is_dir():
@@ -150,7 +187,7 @@ class TaskManagementService:
                         field='sandbox_workspace_path',
                     )
                 sandbox_root.mkdir(parents=True, exist_ok=True)
-                self._bootstrap_sandbox_workspace(project_root, sandbox_root)
+                self._bootstrap_sandbox_workspace(project_root, sandbox_root, strategy=self.sandbox_strategy)
                 workspace_root = sandbox_root
             else:
                 sandbox_workspace_path = None
@@ -186,6 +223,7 @@ class TaskManagementService:
                 plain_mode=plain_mode,
                 stream_mode=stream_mode,
                 debate_mode=debate_mode,
+                parallel_reviews=parallel_reviews,
                 auto_merge=auto_merge,
                 merge_target_path=merge_target_path,
                 sandbox_mode=sandbox_mode,
@@ -223,6 +261,7 @@ class TaskManagementService:
                     'plain_mode': bool(row.get('plain_mode', True)),
                     'stream_mode': bool(row.get('stream_mode', True)),
                     'debate_mode': bool(row.get('debate_mode', True)),
+                    'parallel_reviews': bool(row.get('parallel_reviews', False)),
                     'sandbox_mode': bool(row.get('sandbox_mode', False)),
                     'sandbox_workspace_path': row.get('sandbox_workspace_path'),
                     'sandbox_generated': bool(row.get('sandbox_generated', False)),
@@ -496,6 +535,8 @@ class TaskManagementService:
             return
         try:
             if sandbox_resolved.exists():
+                remove_sandbox_worktree(sandbox_resolved)
+
                 def _onerror(func, p, exc_info):
                     try:
                         os.chmod(p, stat.S_IWRITE)
@@ -516,20 +557,7 @@ class TaskManagementService:
         if not normalized:
             return False
         head = normalized.split('/', 1)[0]
-        ignored_heads = {
-            '.git',
-            '.agents',
-            '.claude',
-            '.venv',
-            '__pycache__',
-            '.pytest_cache',
-            '.ruff_cache',
-            'node_modules',
-            '.mypy_cache',
-            '.idea',
-            '.vscode',
-        }
-        if head in ignored_heads:
+        if head in SANDBOX_IGNORED_HEADS:
             return True
         if normalized.endswith('.pyc') or normalized.endswith('.pyo'):
             return True
@@ -557,13 +585,26 @@ class TaskManagementService:
         return bool(re.fullmatch(r'(com|lpt)[1-9]', stem))
 
     @staticmethod
-    def _bootstrap_sandbox_workspace(project_root: Path, sandbox_root: Path) -> None:
+    def _bootstrap_sandbox_workspace(
+        project_root: Path,
+        sandbox_root: Path,
+        *,
+        strategy: str = SANDBOX_STRATEGY_COPY,
+    ) -> str | None:
+        """Populate an empty sandbox; returns the strategy used, or None when it was already populated.
+
+        ``worktree`` checks the project out with ``git worktree add`` (the
+        sandbox then carries a ``.git`` file, so it is opt-in); the others walk
+        the filtered project and reflink or copy each file. ``auto``
+        reflinks when the filesystem supports it. Unsupported strategies fall
+        back to plain copies.
+        """
         try:
             entries = list(sandbox_root.iterdir())
         except OSError:
             entries = []
         if entries:
-            return
+            return None
 
         sandbox_subtree_prefix = ''
         project_root_resolved = project_root.resolve(strict=False)
@@ -578,36 +619,48 @@ class TaskManagementService:
         except ValueError:
             sandbox_subtree_prefix = ''
 
-        for root, dirs, files in os.walk(project_root):
-            root_path = Path(root)
-            rel_root = root_path.relative_to(project_root)
-            rel_root_text = '' if str(rel_root) == '.' else rel_root.as_posix()
-            if sandbox_subtree_prefix and (
-                rel_root_text == sandbox_subtree_prefix
-                or rel_root_text.startswith(f'{sandbox_subtree_prefix}/')
-            ):
-                dirs[:] = []
-                continue
-            if rel_root_text and TaskManagementService._is_sandbox_ignored(rel_root_text):
-                dirs[:] = []
-                continue
+        def excluded(rel: str) -> bool:
+            if sandbox_subtree_prefix and (rel == sandbox_subtree_prefix or rel.startswith(f'{sandbox_subtree_prefix}/')):
+                return True
+            return TaskManagementService._is_sandbox_ignored(rel)
+
+        strategy = normalize_sandbox_strategy(strategy)
+        if strategy == SANDBOX_STRATEGY_WORKTREE and worktree_available(project_root, sandbox_root):
+            if add_sandbox_worktree(project_root, sandbox_root, excluded=excluded):
+                _log.info('sandbox_bootstrapped strategy=worktree path=%s', str(sandbox_root))
+                return SANDBOX_STRATEGY_WORKTREE
+            TaskManagementService._empty_directory(sandbox_root)
+        file_strategy = SANDBOX_STRATEGY_COPY if strategy == SANDBOX_STRATEGY_WORKTREE else strategy
+        stats = {'cloned': 0, 'copied': 0}
+        for rel, _ in walk_workspace(project_root, exclude=excluded):
+            dst = sandbox_root / rel
+            dst.parent.mkdir(parents=True, exist_ok=True)
+            if file_strategy == SANDBOX_STRATEGY_AUTO:
+                # Probe copy-on-write support once, on the first file.
+                file_strategy = (
+                    SANDBOX_STRATEGY_REFLINK
+                    if reflink_supported(project_root / rel, dst.parent)
+                    else SANDBOX_STRATEGY_COPY
+                )
+            stats[place_file(project_root / rel, dst, file_strategy)] += 1
+        used = SANDBOX_STRATEGY_COPY if file_strategy == SANDBOX_STRATEGY_AUTO else file_strategy
+        _log.info(
+            'sandbox_bootstrapped strategy=%s path=%s cloned=%d copied=%d',
+            used,
+            str(sandbox_root),
+            stats['cloned'],
+            stats['copied'],
+        )
+        return used
 
-            keep_dirs: list[str] = []
-            for name in dirs:
-                rel = f'{rel_root_text}/{name}' if rel_root_text else name
-                if sandbox_subtree_prefix and (rel == sandbox_subtree_prefix or rel.startswith(f'{sandbox_subtree_prefix}/')):
-                    continue
-                if not TaskManagementService._is_sandbox_ignored(rel):
-                    keep_dirs.append(name)
-            dirs[:] = keep_dirs
-
-            for filename in files:
-                rel = f'{rel_root_text}/{filename}' if rel_root_text else filename
-                if sandbox_subtree_prefix and (rel == sandbox_subtree_prefix or rel.startswith(f'{sandbox_subtree_prefix}/')):
-                    continue
-                if TaskManagementService._is_sandbox_ignored(rel):
-                    continue
-                src = root_path / filename
-                dst = sandbox_root / rel
-                dst.parent.mkdir(parents=True, exist_ok=True)
-                shutil.copy2(src, dst)
+    @staticmethod
+    def _empty_directory(root: Path) -> None:
+        try:
+            entries = list(root.iterdir())
+        except OSError:
+            return
+        for entry in entries:
+            if entry.is_dir() and not entry.is_symlink():
+                shutil.rmtree(entry, ignore_errors=True)
+            else:
+                entry.unlink(missing_ok=True)
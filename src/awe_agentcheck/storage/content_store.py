@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from datetime import datetime, timezone
+import hashlib
+import json
+import os
+from pathlib import Path
+import re
+import threading
+import time
+from typing import Iterator
+
+from awe_agentcheck.round_snapshots import clone_file
+
+_REF_RE = re.compile(r'^[A-Za-z0-9._-]+(?:/[A-Za-z0-9._-]+)*$')
+_DIGEST_RE = re.compile(r'^[0-9a-f]{64}$')
+
+
+class ContentStore:
+    """Content-addressed blob store with named manifests and refcount GC.
+
+    Blobs live under ``objects/<aa>/<sha256>``; a ref (``refs/<name>.json``)
+    maps relative paths to blob digests and describes one snapshot tree.
+    Identical files are stored once across rounds, tasks and fusion
+    snapshots. Trees are materialized by reflinking blobs where the
+    filesystem supports it and copying them otherwise, never by hardlinks.
+    :meth:`gc` deletes blobs that no ref points to.
+    """
+
+    VERSION = 1
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+        self.objects_root = self.root / 'objects'
+        self.refs_root = self.root / 'refs'
+        self._lock = threading.Lock()
+        self._writers = 0
+
+    def blob_path(self, digest: str) -> Path:
+        key = str(digest or '').strip().lower()
+        if not _DIGEST_RE.fullmatch(key):
+            raise ValueError(f'invalid blob digest: {digest!r}')
+        return self.objects_root / key[:2] / key
+
+    def has_blob(self, digest: str) -> bool:
+        return self.blob_path(digest).is_file()
+
+    @contextmanager
+    def writing(self) -> Iterator[ContentStore]:
+        """Hold off :meth:`gc` while blobs are stored before their ref exists."""
+        with self._lock:
+            self._writers += 1
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._writers -= 1
+
+    def put_file(self, path: Path, *, digest: str | None = None) -> str:
+        """Store *path* and return its digest; a known *digest* already stored is reused."""
+        if digest and _DIGEST_RE.fullmatch(str(digest)) and self.has_blob(digest):
+            return str(digest)
+        hasher = hashlib.sha256()
+        self.objects_root.mkdir(parents=True, exist_ok=True)
+        tmp = self.objects_root / f'.incoming-{os.getpid()}-{threading.get_ident()}'
+        try:
+            with Path(path).open('rb') as source, tmp.open('wb') as target:
+                while True:
+                    chunk = source.read(1024 * 1024)
+                    if not chunk:
+                        break
+                    hasher.update(chunk)
+                    target.write(chunk)
+            actual = hasher.hexdigest()
+            blob = self.blob_path(actual)
+            if blob.exists():
+                return actual
+            blob.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(tmp, blob)
+            return actual
+        finally:
+            tmp.unlink(missing_ok=True)
+
+    def materialize_blob(self, digest: str, target: Path) -> str:
+        """Place blob *digest* at *target*; returns ``'cloned'`` or ``'copied'``.
+
+        Blobs are shared by every ref, so trees never hardlink them: a write
+        to one materialized file would otherwise change it everywhere.
+        Reflinks still share extents copy-on-write where supported.
+        """
+        return clone_file(self.blob_path(digest), target)
+
+    def materialize(self, files: dict[str, str], target_root: Path) -> dict[str, int]:
+        stats = {'linked': 0, 'cloned': 0, 'copied': 0}
+        root = Path(target_root)
+        for rel, digest in sorted(files.items()):
+            target = root / rel
+            target.parent.mkdir(parents=True, exist_ok=True)
+            stats[self.materialize_blob(digest, target)] += 1
+        return stats
+
+    def write_ref(self, name: str, files: dict[str, str], *, meta: dict | None = None) -> Path:
+        path = self._ref_path(name)
+        payload = {
+            'version': self.VERSION,
+            'ref': name,
+            'created_at': datetime.now(timezone.utc).isoformat(),
+            'meta': dict(meta or {}),
+            'files': dict(sorted(files.items())),
+        }
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f'{path.name}.{threading.get_ident()}.tmp')
+        tmp.write_text(json.dumps(payload, ensure_ascii=True, separators=(',', ':')), encoding='utf-8')
+        os.replace(tmp, path)
+        return path
+
+    def read_ref(self, name: str) -> dict[str, str] | None:
+        try:
+            payload = json.loads(self._ref_path(name).read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return None
+        files = payload.get('files') if isinstance(payload, dict) else None
+        return {str(k): str(v) for k, v in files.items()} if isinstance(files, dict) else None
+
+    def delete_refs(self, prefix: str) -> int:
+        """Delete the ref *prefix* and every ref below it; returns how many were removed."""
+        removed = 0
+        single = self._ref_path(prefix)
+        if single.is_file():
+            single.unlink(missing_ok=True)
+            removed += 1
+        folder = self.refs_root / prefix
+        if folder.is_dir():
+            for path in sorted(folder.rglob('*.json')):
+                path.unlink(missing_ok=True)
+                removed += 1
+        return removed
+
+    def refcounts(self) -> dict[str, int]:
+        counts: dict[str, int] = {}
+        if not self.refs_root.is_dir():
+            return counts
+        for path in self.refs_root.rglob('*.json'):
+            try:
+                payload = json.loads(path.read_text(encoding='utf-8'))
+            except (OSError, ValueError):
+                continue
+            files = payload.get('files') if isinstance(payload, dict) else None
+            if not isinstance(files, dict):
+                continue
+            for digest in files.values():
+                counts[str(digest)] = counts.get(str(digest), 0) + 1
+        return counts
+
+    def gc(self, *, min_age_seconds: float = 3600.0) -> dict[str, int | bool]:
+        """Delete unreferenced blobs older than *min_age_seconds*.
+
+        Skipped while a :meth:`writing` block is open in this process.
+        """
+        result: dict[str, int | bool] = {
+            'skipped': False,
+            'blobs_kept': 0,
+            'blobs_removed': 0,
+            'bytes_freed': 0,
+        }
+        with self._lock:
+            if self._writers:
+                result['skipped'] = True
+                return result
+            counts = self.refcounts()
+            cutoff = time.time() - max(0.0, float(min_age_seconds))
+            if not self.objects_root.is_dir():
+                return result
+            for blob in self.objects_root.glob('*/*'):
+                if counts.get(blob.name, 0) > 0:
+                    result['blobs_kept'] += 1
+                    continue
+                try:
+                    info = blob.stat()
+                    if info.st_mtime > cutoff:
+                        result['blobs_kept'] += 1
+                        continue
+                    blob.unlink()
+                except OSError:
+                    continue
+                result['blobs_removed'] += 1
+                result['bytes_freed'] += int(info.st_size)
+        return result
+
+    def _ref_path(self, name: str) -> Path:
+        text = str(name or '').strip()
+        if not _REF_RE.fullmatch(text) or any(part in {'.', '..'} for part in text.split('/')):
+            raise ValueError(f'invalid ref name: {name!r}')
+        return self.refs_root / f'{text}.json'
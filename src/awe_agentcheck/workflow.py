@@ -1,4 +1,5 @@
 from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, replace
 from datetime import datetime, timezone
 from pathlib import Path
@@ -7,8 +8,9 @@ import re
 import shlex
 from string import Template
 import subprocess
+import threading
 import time
-from typing import Callable
+from typing import Callable, Sequence
 from contextlib import nullcontext
 from awe_agentcheck.adapters import ParticipantRunner
 from awe_agentcheck.domain.events import EventType
@@ -35,6 +37,17 @@ from awe_agentcheck.workflow_runtime import (
     resolve_model_for_participant as runtime_resolve_model_for_participant,
     resolve_model_params_for_participant as runtime_resolve_model_params_for_participant,
 )
+from awe_agentcheck.workflow_fanout import (
+    DEFAULT_FANOUT_MAX_WORKERS,
+    fan_out,
+    serialized,
+)
+from awe_agentcheck.workflow_stream import (
+    DEFAULT_STREAM_MAX_BYTES,
+    DEFAULT_STREAM_WINDOW_MS,
+    ParticipantStreamCoalescer,
+    run_participant,
+)
 from awe_agentcheck.task_options import (
     normalize_memory_mode as normalize_memory_mode_task,
     normalize_phase_timeout_seconds as normalize_phase_timeout_seconds_task,
@@ -150,6 +163,34 @@ class ShellCommandExecutor:
             stderr=completed.stderr or '',
         )
 
+    def run_many(
+        self,
+        commands: Sequence[str | list[str]],
+        cwd: Path,
+        timeout_seconds: int | Sequence[int],
+    ) -> list[CommandResult]:
+        """Run commands concurrently; results follow *commands* order.
+
+        Each command gets its own subprocess, output capture and timeout
+        (*timeout_seconds* may be one value for all or one per command), so
+        the wall time is that of the slowest command rather than the sum.
+        """
+        items = list(commands)
+        if isinstance(timeout_seconds, (int, float)):
+            timeouts = [int(timeout_seconds)] * len(items)
+        else:
+            timeouts = [int(value) for value in timeout_seconds]
+            if len(timeouts) != len(items):
+                raise ValueError('timeout_seconds must match the number of commands')
+        if len(items) <= 1:
+            return [self.run(command, cwd=cwd, timeout_seconds=timeout) for command, timeout in zip(items, timeouts)]
+        with ThreadPoolExecutor(max_workers=len(items), thread_name_prefix='awe-command') as pool:
+            futures = [
+                pool.submit(self.run, command, cwd, timeout)
+                for command, timeout in zip(items, timeouts)
+            ]
+            return [future.result() for future in futures]
+
     @staticmethod
     def _build_subprocess_env(cwd: Path) -> dict[str, str]:
         env = dict(os.environ)
@@ -214,8 +255,10 @@ class RunConfig:
     plain_mode: bool = True
     stream_mode: bool = False
     debate_mode: bool = False
+    parallel_reviews: bool = False
     proposal_issue_contract: dict[str, object] | None = None
     architecture_audit_scope: str = 'all'
+    review_hedge_delays: dict[str, float] | None = None
 
 @dataclass(frozen=True)
 class RunResult:
@@ -238,12 +281,28 @@ class WorkflowEngine:
         participant_timeout_seconds: int = 3600,
         command_timeout_seconds: int = 300,
         workflow_backend: str = 'langgraph',
+        stream_window_ms: int = DEFAULT_STREAM_WINDOW_MS,
+        stream_max_bytes: int = DEFAULT_STREAM_MAX_BYTES,
+        parallel_reviews: bool = False,
+        parallel_debate: bool = False,
+        parallel_proposal_reviews: bool = False,
+        review_max_workers: int = DEFAULT_FANOUT_MAX_WORKERS,
+        review_hedge: bool = False,
     ):
         self.runner = runner
         self.command_executor = command_executor
         self.participant_timeout_seconds = max(1, int(participant_timeout_seconds))
         self.command_timeout_seconds = max(1, int(command_timeout_seconds))
         self.workflow_backend = self._normalize_workflow_backend(workflow_backend)
+        self.stream_window_ms = max(0, int(stream_window_ms))
+        self.stream_max_bytes = max(1, int(stream_max_bytes))
+        self.parallel_reviews = bool(parallel_reviews)
+        # The parallel debate drops the reviewer-sees-previous-reviewer chain, so it is a separate opt-in.
+        self.parallel_debate = bool(parallel_debate)
+        # Read by the service's proposal/precheck review passes.
+        self.parallel_proposal_reviews = bool(parallel_proposal_reviews)
+        self.review_max_workers = max(1, int(review_max_workers))
+        self.review_hedge = bool(review_hedge)
         self._langgraph_compiled = None
     def run(
         self,
@@ -327,6 +386,8 @@ class WorkflowEngine:
             strategy_hint = str(self._initial_architecture_strategy_hint(config) or '').strip() or None
         stream_mode = bool(config.stream_mode)
         debate_mode = bool(config.debate_mode) and bool(config.reviewers)
+        parallel_reviews = (self.parallel_reviews or bool(config.parallel_reviews)) and len(config.reviewers) > 1
+        parallel_debate = self.parallel_debate and len(config.reviewers) > 1
         memory_mode = normalize_memory_mode_task(config.memory_mode, strict=False)
         phase_timeouts = self._resolve_phase_timeout_seconds(config.phase_timeout_seconds)
         discussion_timeout_seconds = int(phase_timeouts.get('discussion', self.participant_timeout_seconds))
@@ -395,19 +456,28 @@ class WorkflowEngine:
             if debate_mode:
                 debate_review_total = 0
                 debate_review_usable = 0
-                emit(
+                # Independent reviewers still stream from worker threads.
+                debate_emit = serialized(emit) if parallel_debate else emit
+                debate_emit(
                     {
                         'type': EventType.DEBATE_STARTED.value,
                         'round': round_no,
                         'mode': 'reviewer_first',
+                        'parallel': parallel_debate,
                         'reviewer_count': len(config.reviewers),
                     }
                 )
-                for reviewer in config.reviewers:
-                    if check_cancel():
-                        emit({'type': EventType.CANCELED.value, 'round': round_no})
-                        return RunResult(status='canceled', rounds=round_no - 1, gate_reason='canceled')
-                    emit(
+
+                # Closures below bind this round's state as defaults, not by late lookup.
+                def prepare_debate_review(
+                    reviewer: Participant,
+                    context: str,
+                    *,
+                    round_no: int = round_no,
+                    debate_emit: Callable[[dict], None] = debate_emit,
+                    strategy_hint: str | None = strategy_hint,
+                ) -> tuple[str, dict]:
+                    debate_emit(
                         {
                             'type': EventType.DEBATE_REVIEW_STARTED.value,
                             'round': round_no,
@@ -416,95 +486,117 @@ class WorkflowEngine:
                             'timeout_seconds': review_timeout_seconds,
                         }
                     )
-                    try:
-                        debate_review_prompt = self._debate_review_prompt(
-                            config,
-                            round_no,
-                            implementation_context,
-                            reviewer.participant_id,
-                            environment_context=environment_context,
-                            strategy_hint=strategy_hint,
-                            memory_context=proposal_memory_context,
-                        )
-                        runtime_profile = self._participant_runtime_profile(
-                            participant=reviewer,
-                            config=config,
-                            provider_models=provider_models,
-                            provider_model_params=provider_model_params,
-                            participant_models=participant_models,
-                            participant_model_params=participant_model_params,
-                            claude_team_agents_overrides=claude_team_agents_overrides,
-                            codex_multi_agents_overrides=codex_multi_agents_overrides,
-                        )
-                        probe_event, break_events = self._record_prompt_cache_probe(
-                            cache_state=prompt_cache_state,
-                            round_no=round_no,
-                            stage='debate_review',
-                            participant=reviewer,
-                            model=runtime_profile['model'],
-                            model_params=runtime_profile['model_params'],
-                            claude_team_agents=bool(runtime_profile['claude_team_agents']),
-                            codex_multi_agents=bool(runtime_profile['codex_multi_agents']),
-                            prompt=debate_review_prompt,
-                        )
-                        emit(probe_event)
-                        for cache_break in break_events:
-                            emit(cache_break)
-                        debate_review = self.runner.run(
-                            participant=reviewer,
-                            prompt=debate_review_prompt,
-                            cwd=config.cwd,
-                            timeout_seconds=review_timeout_seconds,
-                            model=runtime_profile['model'],
-                            model_params=runtime_profile['model_params'],
-                            claude_team_agents=bool(runtime_profile['claude_team_agents']),
-                            codex_multi_agents=bool(runtime_profile['codex_multi_agents']),
-                            on_stream=(
-                                self._stream_emitter(
-                                    emit=emit,
-                                    round_no=round_no,
-                                    stage='debate_review',
-                                    participant=reviewer.participant_id,
-                                    provider=reviewer.provider,
-                                )
-                                if stream_mode
-                                else None
-                            ),
-                        )
-                        review_text = str(debate_review.output or '').strip()
-                        runtime_reason = self._runtime_error_reason_from_result(debate_review)
-                        if runtime_reason:
-                            review_text = f'[debate_review_error] {runtime_reason}'
-                            usable = False
-                            emit(
-                                {
-                                    'type': EventType.DEBATE_REVIEW_ERROR.value,
-                                    'round': round_no,
-                                    'participant': reviewer.participant_id,
-                                    'provider': reviewer.provider,
-                                    'output': review_text,
-                                }
+                    debate_review_prompt = self._debate_review_prompt(
+                        config,
+                        round_no,
+                        context,
+                        reviewer.participant_id,
+                        environment_context=environment_context,
+                        strategy_hint=strategy_hint,
+                        memory_context=proposal_memory_context,
+                    )
+                    runtime_profile = self._participant_runtime_profile(
+                        participant=reviewer,
+                        config=config,
+                        provider_models=provider_models,
+                        provider_model_params=provider_model_params,
+                        participant_models=participant_models,
+                        participant_model_params=participant_model_params,
+                        claude_team_agents_overrides=claude_team_agents_overrides,
+                        codex_multi_agents_overrides=codex_multi_agents_overrides,
+                    )
+                    probe_event, break_events = self._record_prompt_cache_probe(
+                        cache_state=prompt_cache_state,
+                        round_no=round_no,
+                        stage='debate_review',
+                        participant=reviewer,
+                        model=runtime_profile['model'],
+                        model_params=runtime_profile['model_params'],
+                        claude_team_agents=bool(runtime_profile['claude_team_agents']),
+                        codex_multi_agents=bool(runtime_profile['codex_multi_agents']),
+                        prompt=debate_review_prompt,
+                    )
+                    debate_emit(probe_event)
+                    for cache_break in break_events:
+                        debate_emit(cache_break)
+                    return debate_review_prompt, runtime_profile
+
+                def invoke_debate_review(
+                    reviewer: Participant,
+                    debate_review_prompt: str,
+                    runtime_profile: dict,
+                    *,
+                    should_stop: Callable[[], bool] | None = None,
+                    round_no: int = round_no,
+                    debate_emit: Callable[[dict], None] = debate_emit,
+                ):
+                    stop_kwargs = {'should_stop': should_stop} if should_stop is not None else {}
+                    return run_participant(
+                        self.runner,
+                        participant=reviewer,
+                        stage='debate_review',
+                        prompt=debate_review_prompt,
+                        cwd=config.cwd,
+                        timeout_seconds=review_timeout_seconds,
+                        model=runtime_profile['model'],
+                        model_params=runtime_profile['model_params'],
+                        claude_team_agents=bool(runtime_profile['claude_team_agents']),
+                        codex_multi_agents=bool(runtime_profile['codex_multi_agents']),
+                        on_stream=(
+                            self._stream_emitter(
+                                emit=debate_emit,
+                                round_no=round_no,
+                                stage='debate_review',
+                                participant=reviewer.participant_id,
+                                provider=reviewer.provider,
+                                window_ms=self.stream_window_ms,
+                                max_bytes=self.stream_max_bytes,
                             )
-                        else:
-                            usable = self._is_actionable_debate_review_text(review_text)
-                    except Exception as exc:
-                        _log.exception('debate_review_exception round=%s participant=%s', round_no, reviewer.participant_id)
-                        review_text = f'[debate_review_error] {str(exc or "review_failed").strip() or "review_failed"}'
-                        usable = False
-                        emit(
-                            {
-                                'type': EventType.DEBATE_REVIEW_ERROR.value,
-                                'round': round_no,
-                                'participant': reviewer.participant_id,
-                                'provider': reviewer.provider,
-                                'output': review_text,
-                            }
-                        )
+                            if stream_mode
+                            else None
+                        ),
+                        **stop_kwargs,
+                    )
+
+                def debate_review_error(
+                    reviewer: Participant,
+                    reason: str,
+                    *,
+                    round_no: int = round_no,
+                    debate_emit: Callable[[dict], None] = debate_emit,
+                ) -> tuple[str, bool]:
+                    review_text = f'[debate_review_error] {reason}'
+                    debate_emit(
+                        {
+                            'type': EventType.DEBATE_REVIEW_ERROR.value,
+                            'round': round_no,
+                            'participant': reviewer.participant_id,
+                            'provider': reviewer.provider,
+                            'output': review_text,
+                        }
+                    )
+                    return review_text, False
+
+                def debate_review_result(reviewer: Participant, debate_review) -> tuple[str, bool]:
+                    review_text = str(debate_review.output or '').strip()
+                    runtime_reason = self._runtime_error_reason_from_result(debate_review)
+                    if runtime_reason:
+                        return debate_review_error(reviewer, runtime_reason)
+                    return review_text, self._is_actionable_debate_review_text(review_text)
+
+                def record_debate_review(
+                    reviewer: Participant,
+                    review_text: str,
+                    usable: bool,
+                    *,
+                    round_no: int = round_no,
+                    debate_emit: Callable[[dict], None] = debate_emit,
+                ) -> None:
+                    nonlocal debate_review_total, debate_review_usable, implementation_context
                     debate_review_total += 1
                     if usable:
                         debate_review_usable += 1
-
-                    emit(
+                    debate_emit(
                         {
                             'type': EventType.DEBATE_REVIEW.value,
                             'round': round_no,
@@ -521,6 +613,84 @@ class WorkflowEngine:
                             text=review_text,
                         )
 
+                if not parallel_debate:
+                    for reviewer in config.reviewers:
+                        if check_cancel():
+                            emit({'type': EventType.CANCELED.value, 'round': round_no})
+                            return RunResult(status='canceled', rounds=round_no - 1, gate_reason='canceled')
+                        try:
+                            debate_review = invoke_debate_review(
+                                reviewer,
+                                *prepare_debate_review(reviewer, implementation_context),
+                            )
+                            review_text, usable = debate_review_result(reviewer, debate_review)
+                        except Exception as exc:
+                            _log.exception('debate_review_exception round=%s participant=%s', round_no, reviewer.participant_id)
+                            review_text, usable = debate_review_error(
+                                reviewer,
+                                str(exc or 'review_failed').strip() or 'review_failed',
+                            )
+                        record_debate_review(reviewer, review_text, usable)
+                else:
+                    # Parallel independent variant: every reviewer sees the same
+                    # seed context and usable outputs are merged in reviewer order.
+                    if check_cancel():
+                        emit({'type': EventType.CANCELED.value, 'round': round_no})
+                        return RunResult(status='canceled', rounds=round_no - 1, gate_reason='canceled')
+                    seed_context = implementation_context
+                    prepared_debates: list[tuple[Participant, tuple[str, dict] | None, str | None]] = []
+                    for reviewer in config.reviewers:
+                        try:
+                            prepared_debates.append((reviewer, prepare_debate_review(reviewer, seed_context), None))
+                        except Exception as exc:
+                            _log.exception('debate_review_exception round=%s participant=%s', round_no, reviewer.participant_id)
+                            prepared_debates.append((reviewer, None, str(exc or 'review_failed').strip() or 'review_failed'))
+                    runnable_debates = [(reviewer, prepared) for reviewer, prepared, _ in prepared_debates if prepared is not None]
+                    # Set by fan_out on cancel or timeout; running debate reviewers are killed.
+                    debate_stop = threading.Event()
+                    with self._span(tracer, 'workflow.debate_fanout', {'task.id': config.task_id, 'round': round_no, 'reviewers': len(runnable_debates)}):
+                        debate_outcomes = fan_out(
+                            runnable_debates,
+                            lambda item, debate_stop=debate_stop: invoke_debate_review(
+                                item[0],
+                                *item[1],
+                                should_stop=debate_stop.is_set,
+                            ),
+                            max_workers=self.review_max_workers,
+                            should_cancel=check_cancel,
+                            timeout_seconds=review_timeout_seconds + 30,
+                            thread_name_prefix='awe-debate',
+                            stop=debate_stop,
+                        )
+                    if any(outcome.canceled for outcome in debate_outcomes):
+                        debate_emit({'type': EventType.CANCELED.value, 'round': round_no})
+                        return RunResult(status='canceled', rounds=round_no - 1, gate_reason='canceled')
+                    debate_outcome_iter = iter(debate_outcomes)
+                    for reviewer, prepared, prepare_error in prepared_debates:
+                        if prepared is None:
+                            review_text, usable = debate_review_error(reviewer, str(prepare_error))
+                        else:
+                            outcome = next(debate_outcome_iter)
+                            if outcome.timed_out:
+                                review_text, usable = debate_review_error(
+                                    reviewer,
+                                    f'debate_review_timeout timeout_seconds={review_timeout_seconds}',
+                                )
+                            elif outcome.error is not None:
+                                _log.error(
+                                    'debate_review_exception round=%s participant=%s',
+                                    round_no,
+                                    reviewer.participant_id,
+                                    exc_info=outcome.error,
+                                )
+                                review_text, usable = debate_review_error(
+                                    reviewer,
+                                    str(outcome.error or 'review_failed').strip() or 'review_failed',
+                                )
+                            else:
+                                review_text, usable = debate_review_result(reviewer, outcome.value)
+                        record_debate_review(reviewer, review_text, usable)
+
                 emit(
                     {
                         'type': EventType.DEBATE_COMPLETED.value,
@@ -598,8 +768,10 @@ class WorkflowEngine:
                 emit(discussion_probe_event)
                 for cache_break in discussion_break_events:
                     emit(cache_break)
-                discussion = self.runner.run(
+                discussion = run_participant(
+                    self.runner,
                     participant=config.author,
+                    stage='discussion',
                     prompt=discussion_prompt,
                     cwd=config.cwd,
                     timeout_seconds=discussion_timeout_seconds,
@@ -614,6 +786,8 @@ class WorkflowEngine:
                             stage='discussion',
                             participant=config.author.participant_id,
                             provider=config.author.provider,
+                            window_ms=self.stream_window_ms,
+                            max_bytes=self.stream_max_bytes,
                         )
                         if stream_mode
                         else None
@@ -690,8 +864,10 @@ class WorkflowEngine:
                 emit(implementation_probe_event)
                 for cache_break in implementation_break_events:
                     emit(cache_break)
-                implementation = self.runner.run(
+                implementation = run_participant(
+                    self.runner,
                     participant=config.author,
+                    stage='implementation',
                     prompt=implementation_prompt,
                     cwd=config.cwd,
                     timeout_seconds=implementation_timeout_seconds,
@@ -706,6 +882,8 @@ class WorkflowEngine:
                             stage='implementation',
                             participant=config.author.participant_id,
                             provider=config.author.provider,
+                            window_ms=self.stream_window_ms,
+                            max_bytes=self.stream_max_bytes,
                         )
                         if stream_mode
                         else None
@@ -740,133 +918,156 @@ class WorkflowEngine:
             verdicts: list[ReviewVerdict] = []
             review_outputs: list[str] = []
             review_output_entries: list[dict[str, str]] = []
-            for reviewer in config.reviewers:
-                with self._span(tracer, 'workflow.review', {'task.id': config.task_id, 'round': round_no, 'participant': reviewer.participant_id}):
-                    emit(
-                        {
-                            'type': EventType.REVIEW_STARTED.value,
-                            'round': round_no,
-                            'participant': reviewer.participant_id,
-                            'timeout_seconds': review_timeout_seconds,
-                        }
-                    )
-                    try:
-                        review_prompt = self._review_prompt(
-                            config,
-                            round_no,
-                            implementation.output,
-                            environment_context=environment_context,
-                            strategy_hint=strategy_hint,
-                            memory_context=review_memory_context,
-                        )
-                        review_profile = self._participant_runtime_profile(
-                            participant=reviewer,
-                            config=config,
-                            provider_models=provider_models,
-                            provider_model_params=provider_model_params,
-                            participant_models=participant_models,
-                            participant_model_params=participant_model_params,
-                            claude_team_agents_overrides=claude_team_agents_overrides,
-                            codex_multi_agents_overrides=codex_multi_agents_overrides,
-                        )
-                        review_probe_event, review_break_events = self._record_prompt_cache_probe(
-                            cache_state=prompt_cache_state,
+            # Reviewer streams arrive from worker threads in parallel mode.
+            review_emit = serialized(emit) if parallel_reviews else emit
+
+            # Closures below bind this round's state as defaults, not by late lookup.
+            def prepare_review(
+                reviewer: Participant,
+                *,
+                round_no: int = round_no,
+                review_emit: Callable[[dict], None] = review_emit,
+                implementation=implementation,
+                strategy_hint: str | None = strategy_hint,
+            ) -> tuple[str, dict]:
+                review_emit(
+                    {
+                        'type': EventType.REVIEW_STARTED.value,
+                        'round': round_no,
+                        'participant': reviewer.participant_id,
+                        'timeout_seconds': review_timeout_seconds,
+                    }
+                )
+                review_prompt = self._review_prompt(
+                    config,
+                    round_no,
+                    implementation.output,
+                    environment_context=environment_context,
+                    strategy_hint=strategy_hint,
+                    memory_context=review_memory_context,
+                )
+                review_profile = self._participant_runtime_profile(
+                    participant=reviewer,
+                    config=config,
+                    provider_models=provider_models,
+                    provider_model_params=provider_model_params,
+                    participant_models=participant_models,
+                    participant_model_params=participant_model_params,
+                    claude_team_agents_overrides=claude_team_agents_overrides,
+                    codex_multi_agents_overrides=codex_multi_agents_overrides,
+                )
+                review_probe_event, review_break_events = self._record_prompt_cache_probe(
+                    cache_state=prompt_cache_state,
+                    round_no=round_no,
+                    stage='review',
+                    participant=reviewer,
+                    model=review_profile['model'],
+                    model_params=review_profile['model_params'],
+                    claude_team_agents=bool(review_profile['claude_team_agents']),
+                    codex_multi_agents=bool(review_profile['codex_multi_agents']),
+                    prompt=review_prompt,
+                )
+                review_emit(review_probe_event)
+                for cache_break in review_break_events:
+                    review_emit(cache_break)
+                return review_prompt, review_profile
+
+            def invoke_review(
+                reviewer: Participant,
+                review_prompt: str,
+                review_profile: dict,
+                *,
+                should_stop: Callable[[], bool] | None = None,
+                round_no: int = round_no,
+                review_emit: Callable[[dict], None] = review_emit,
+            ):
+                hedge_kwargs = {}
+                hedge_delay = (config.review_hedge_delays or {}).get(reviewer.provider)
+                if self.review_hedge and hedge_delay is not None:
+                    hedge_kwargs['hedge_delay_seconds'] = hedge_delay
+                if should_stop is not None:
+                    hedge_kwargs['should_stop'] = should_stop
+                return run_participant(
+                    self.runner,
+                    participant=reviewer,
+                    stage='review',
+                    prompt=review_prompt,
+                    cwd=config.cwd,
+                    timeout_seconds=review_timeout_seconds,
+                    model=review_profile['model'],
+                    model_params=review_profile['model_params'],
+                    claude_team_agents=bool(review_profile['claude_team_agents']),
+                    codex_multi_agents=bool(review_profile['codex_multi_agents']),
+                    on_stream=(
+                        self._stream_emitter(
+                            emit=review_emit,
                             round_no=round_no,
                             stage='review',
-                            participant=reviewer,
-                            model=review_profile['model'],
-                            model_params=review_profile['model_params'],
-                            claude_team_agents=bool(review_profile['claude_team_agents']),
-                            codex_multi_agents=bool(review_profile['codex_multi_agents']),
-                            prompt=review_prompt,
-                        )
-                        emit(review_probe_event)
-                        for cache_break in review_break_events:
-                            emit(cache_break)
-                        review = self.runner.run(
-                            participant=reviewer,
-                            prompt=review_prompt,
-                            cwd=config.cwd,
-                            timeout_seconds=review_timeout_seconds,
-                            model=review_profile['model'],
-                            model_params=review_profile['model_params'],
-                            claude_team_agents=bool(review_profile['claude_team_agents']),
-                            codex_multi_agents=bool(review_profile['codex_multi_agents']),
-                            on_stream=(
-                                self._stream_emitter(
-                                    emit=emit,
-                                    round_no=round_no,
-                                    stage='review',
-                                    participant=reviewer.participant_id,
-                                    provider=reviewer.provider,
-                                )
-                                if stream_mode
-                                else None
-                            ),
-                        )
-                        runtime_reason = self._runtime_error_reason_from_result(review)
-                        if runtime_reason:
-                            emit(
-                                {
-                                    'type': EventType.REVIEW_ERROR.value,
-                                    'round': round_no,
-                                    'participant': reviewer.participant_id,
-                                    'reason': runtime_reason,
-                                }
-                            )
-                            verdict = ReviewVerdict.UNKNOWN
-                            verdicts.append(verdict)
-                            error_output = f'[review_error] {runtime_reason}'
-                            review_outputs.append(error_output)
-                            review_output_entries.append(
-                                {
-                                    'participant': reviewer.participant_id,
-                                    'output': error_output,
-                                }
-                            )
-                            emit(
-                                {
-                                    'type': EventType.REVIEW.value,
-                                    'round': round_no,
-                                    'participant': reviewer.participant_id,
-                                    'verdict': verdict.value,
-                                    'output': error_output,
-                                    'duration_seconds': review.duration_seconds,
-                                }
-                            )
-                            continue
-                    except Exception as exc:
-                        _log.exception('review_exception round=%s participant=%s', round_no, reviewer.participant_id)
-                        reason = str(exc or 'review_failed').strip() or 'review_failed'
-                        emit(
-                            {
-                                'type': EventType.REVIEW_ERROR.value,
-                                'round': round_no,
-                                'participant': reviewer.participant_id,
-                                'reason': reason,
-                            }
+                            participant=reviewer.participant_id,
+                            provider=reviewer.provider,
+                            window_ms=self.stream_window_ms,
+                            max_bytes=self.stream_max_bytes,
                         )
-                        verdict = ReviewVerdict.UNKNOWN
-                        verdicts.append(verdict)
-                        error_output = f'[review_error] {reason}'
-                        review_outputs.append(error_output)
-                        review_output_entries.append(
-                            {
-                                'participant': reviewer.participant_id,
-                                'output': error_output,
-                            }
-                        )
-                        emit(
-                            {
-                                'type': EventType.REVIEW.value,
-                                'round': round_no,
-                                'participant': reviewer.participant_id,
-                                'verdict': verdict.value,
-                                'output': error_output,
-                                'duration_seconds': 0.0,
-                            }
-                        )
-                        continue
+                        if stream_mode
+                        else None
+                    ),
+                    **hedge_kwargs,
+                )
+
+            def record_review_error(
+                reviewer: Participant,
+                reason: str,
+                duration_seconds: float,
+                *,
+                round_no: int = round_no,
+                review_emit: Callable[[dict], None] = review_emit,
+                verdicts: list[ReviewVerdict] = verdicts,
+                review_outputs: list[str] = review_outputs,
+                review_output_entries: list[dict[str, str]] = review_output_entries,
+            ) -> None:
+                review_emit(
+                    {
+                        'type': EventType.REVIEW_ERROR.value,
+                        'round': round_no,
+                        'participant': reviewer.participant_id,
+                        'reason': reason,
+                    }
+                )
+                verdict = ReviewVerdict.UNKNOWN
+                verdicts.append(verdict)
+                error_output = f'[review_error] {reason}'
+                review_outputs.append(error_output)
+                review_output_entries.append(
+                    {
+                        'participant': reviewer.participant_id,
+                        'output': error_output,
+                    }
+                )
+                review_emit(
+                    {
+                        'type': EventType.REVIEW.value,
+                        'round': round_no,
+                        'participant': reviewer.participant_id,
+                        'verdict': verdict.value,
+                        'output': error_output,
+                        'duration_seconds': duration_seconds,
+                    }
+                )
+
+            def record_review(
+                reviewer: Participant,
+                review,
+                *,
+                round_no: int = round_no,
+                review_emit: Callable[[dict], None] = review_emit,
+                verdicts: list[ReviewVerdict] = verdicts,
+                review_outputs: list[str] = review_outputs,
+                review_output_entries: list[dict[str, str]] = review_output_entries,
+            ) -> None:
+                runtime_reason = self._runtime_error_reason_from_result(review)
+                if runtime_reason:
+                    record_review_error(reviewer, runtime_reason, review.duration_seconds)
+                    return
                 verdict = self._normalize_verdict(review.verdict)
                 verdicts.append(verdict)
                 review_output = str(review.output or '')
@@ -877,18 +1078,93 @@ class WorkflowEngine:
                         'output': review_output,
                     }
                 )
-                emit(
+                review_emit(
                     {
                         'type': EventType.REVIEW.value,
                         'round': round_no,
                         'participant': reviewer.participant_id,
-                        'provider': reviewer.provider,
+                        # The hedge leg or a breaker fallback may have served the call; its latency is that provider's.
+                        'provider': getattr(review, 'provider', None) or reviewer.provider,
                         'verdict': verdict.value,
                         'output': review.output,
                         'duration_seconds': review.duration_seconds,
                     }
                 )
 
+            if not parallel_reviews:
+                for reviewer in config.reviewers:
+                    with self._span(tracer, 'workflow.review', {'task.id': config.task_id, 'round': round_no, 'participant': reviewer.participant_id}):
+                        try:
+                            review = invoke_review(reviewer, *prepare_review(reviewer))
+                        except Exception as exc:
+                            _log.exception('review_exception round=%s participant=%s', round_no, reviewer.participant_id)
+                            record_review_error(reviewer, str(exc or 'review_failed').strip() or 'review_failed', 0.0)
+                            continue
+                    record_review(reviewer, review)
+            else:
+                # Prompts and cache probes are prepared in reviewer order; only the
+                # participant calls overlap. Results are recorded in reviewer order
+                # afterwards so REVIEW events and verdicts stay deterministic.
+                prepared_reviews: list[tuple[Participant, tuple[str, dict] | None, str | None]] = []
+                for reviewer in config.reviewers:
+                    try:
+                        prepared_reviews.append((reviewer, prepare_review(reviewer), None))
+                    except Exception as exc:
+                        _log.exception('review_exception round=%s participant=%s', round_no, reviewer.participant_id)
+                        prepared_reviews.append((reviewer, None, str(exc or 'review_failed').strip() or 'review_failed'))
+                runnable = [(reviewer, prepared) for reviewer, prepared, _ in prepared_reviews if prepared is not None]
+                # Set by fan_out on cancel or timeout; running reviewers are killed.
+                review_stop = threading.Event()
+
+                def run_prepared_review(
+                    item: tuple[Participant, tuple[str, dict]],
+                    *,
+                    round_no: int = round_no,
+                    review_stop: threading.Event = review_stop,
+                ):
+                    reviewer, (review_prompt, review_profile) = item
+                    with self._span(tracer, 'workflow.review', {'task.id': config.task_id, 'round': round_no, 'participant': reviewer.participant_id}):
+                        return invoke_review(reviewer, review_prompt, review_profile, should_stop=review_stop.is_set)
+
+                with self._span(tracer, 'workflow.review_fanout', {'task.id': config.task_id, 'round': round_no, 'reviewers': len(runnable)}):
+                    outcomes = fan_out(
+                        runnable,
+                        run_prepared_review,
+                        max_workers=self.review_max_workers,
+                        should_cancel=check_cancel,
+                        # Runners enforce review_timeout_seconds per call; this only
+                        # guards against a call that never returns.
+                        timeout_seconds=review_timeout_seconds + 30,
+                        thread_name_prefix='awe-review',
+                        stop=review_stop,
+                    )
+                if any(outcome.canceled for outcome in outcomes):
+                    review_emit({'type': EventType.CANCELED.value, 'round': round_no})
+                    return RunResult(status='canceled', rounds=round_no - 1, gate_reason='canceled')
+                outcome_iter = iter(outcomes)
+                for reviewer, prepared, prepare_error in prepared_reviews:
+                    if prepared is None:
+                        record_review_error(reviewer, str(prepare_error), 0.0)
+                        continue
+                    outcome = next(outcome_iter)
+                    if outcome.timed_out:
+                        record_review_error(
+                            reviewer,
+                            f'review_timeout timeout_seconds={review_timeout_seconds}',
+                            float(review_timeout_seconds),
+                        )
+                    elif outcome.error is not None:
+                        _log.error(
+                            'review_exception round=%s participant=%s',
+                            round_no,
+                            reviewer.participant_id,
+                            exc_info=outcome.error,
+                        )
+                        reason = str(outcome.error or 'review_failed').strip() or 'review_failed'
+                        record_review_error(reviewer, reason, 0.0)
+                    else:
+                        record_review(reviewer, outcome.value)
+
             required_issue_ids = self._proposal_contract_issue_ids(config.proposal_issue_contract)
             if required_issue_ids:
                 coverage: set[str] = set()
@@ -977,14 +1253,8 @@ class WorkflowEngine:
                         'timeout_seconds': command_timeout_seconds,
                     }
                 )
-                test_result = self.command_executor.run(
-                    config.test_command,
-                    cwd=config.cwd,
-                    timeout_seconds=command_timeout_seconds,
-                )
-                lint_result = self.command_executor.run(
-                    config.lint_command,
-                    cwd=config.cwd,
+                test_result, lint_result = self._run_verification_commands(
+                    config,
                     timeout_seconds=command_timeout_seconds,
                 )
             emit(
@@ -1944,6 +2214,33 @@ class WorkflowEngine:
             'terminal_reason': terminal_reason,
         }
 
+    def _run_verification_commands(
+        self,
+        config: RunConfig,
+        *,
+        timeout_seconds: int,
+    ) -> tuple[CommandResult, CommandResult]:
+        run_many = getattr(self.command_executor, 'run_many', None)
+        if callable(run_many):
+            test_result, lint_result = run_many(
+                [config.test_command, config.lint_command],
+                cwd=config.cwd,
+                timeout_seconds=timeout_seconds,
+            )
+            return test_result, lint_result
+        # Executors without run_many (custom or test doubles) keep the sequential order.
+        test_result = self.command_executor.run(
+            config.test_command,
+            cwd=config.cwd,
+            timeout_seconds=timeout_seconds,
+        )
+        lint_result = self.command_executor.run(
+            config.lint_command,
+            cwd=config.cwd,
+            timeout_seconds=timeout_seconds,
+        )
+        return test_result, lint_result
+
     def _run_pre_completion_checklist(
         self,
         *,
@@ -2060,24 +2357,18 @@ class WorkflowEngine:
         stage: str,
         participant: str,
         provider: str,
-    ) -> Callable[[str, str], None]:
-        def _callback(stream_name: str, chunk: str) -> None:
-            text = str(chunk or '')
-            if not text:
-                return
-            emit(
-                {
-                    'type': EventType.PARTICIPANT_STREAM.value,
-                    'round': round_no,
-                    'stage': stage,
-                    'stream': str(stream_name or 'stdout'),
-                    'participant': participant,
-                    'provider': provider,
-                    'chunk': text,
-                }
-            )
-
-        return _callback
+        window_ms: int = DEFAULT_STREAM_WINDOW_MS,
+        max_bytes: int = DEFAULT_STREAM_MAX_BYTES,
+    ) -> ParticipantStreamCoalescer:
+        return ParticipantStreamCoalescer(
+            emit=emit,
+            round_no=round_no,
+            stage=stage,
+            participant=participant,
+            provider=provider,
+            window_ms=window_ms,
+            max_bytes=max_bytes,
+        )
 
     @staticmethod
     def _append_debate_line(base: str, *, speaker: str, text: str) -> str:
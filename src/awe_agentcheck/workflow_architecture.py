@@ -5,6 +5,8 @@ from pathlib import Path
 import os
 import re
 
+from awe_agentcheck.workspace_walk import walk_workspace
+
 
 @dataclass(frozen=True)
 class ArchitectureAuditResult:
@@ -204,113 +206,106 @@ def run_architecture_audit(*, cwd: Path, evolution_level: int) -> ArchitectureAu
             scanned_files=0,
         )
 
-    for dirpath, dirs, files in os.walk(root):
-        base = Path(dirpath)
-        dirs[:] = [d for d in dirs if d not in ignore_dirs]
-        for name in files:
-            path = base / name
-            ext = path.suffix.lower()
-            if ext not in {'.py', *frontend_ext}:
-                continue
-            scanned_files += 1
-            try:
-                file_text = path.read_text(encoding='utf-8', errors='ignore')
-            except OSError:
-                continue
-            line_count = int(file_text.count('\n') + 1) if file_text else 0
-            try:
-                rel = path.relative_to(root).as_posix()
-            except ValueError:
-                rel = path.as_posix()
-            if ext == '.py' and line_count > int(thresholds['python_file_lines_max']):
-                violations.append(
-                    {
-                        'kind': 'python_file_too_large',
-                        'path': rel,
-                        'lines': int(line_count),
-                        'limit': int(thresholds['python_file_lines_max']),
-                        'suggestion': 'Split responsibilities into smaller modules.',
-                    }
-                )
-            if ext == '.py' and line_count > max(300, int(thresholds['python_file_lines_max']) // 2):
-                lowered = file_text.lower()
-                responsibility_hits = sum(1 for k in responsibility_keywords if k in lowered)
-                responsibility_limit = int(thresholds['python_responsibility_keywords_max'])
-                if responsibility_hits > responsibility_limit:
-                    violations.append(
-                        {
-                            'kind': 'python_mixed_responsibilities',
-                            'path': rel,
-                            'lines': int(line_count),
-                            'responsibility_hits': int(responsibility_hits),
-                            'limit': int(responsibility_limit),
-                            'suggestion': 'Extract domain concerns into focused modules.',
-                        }
-                    )
-            if rel == 'src/awe_agentcheck/service.py' and line_count > int(thresholds['service_file_lines_max']):
-                violations.append(
-                    {
-                        'kind': 'service_monolith_too_large',
-                        'path': rel,
-                        'lines': int(line_count),
-                        'limit': int(thresholds['service_file_lines_max']),
-                        'suggestion': 'Split service lifecycle/orchestration concerns into focused modules.',
-                    }
-                )
-            if rel == 'src/awe_agentcheck/workflow.py' and line_count > int(thresholds['workflow_file_lines_max']):
+    for rel, _ in walk_workspace(root, ignore_names=ignore_dirs):
+        path = root / rel
+        ext = path.suffix.lower()
+        if ext not in {'.py', *frontend_ext}:
+            continue
+        scanned_files += 1
+        try:
+            file_text = path.read_text(encoding='utf-8', errors='ignore')
+        except OSError:
+            continue
+        line_count = int(file_text.count('\n') + 1) if file_text else 0
+        if ext == '.py' and line_count > int(thresholds['python_file_lines_max']):
+            violations.append(
+                {
+                    'kind': 'python_file_too_large',
+                    'path': rel,
+                    'lines': int(line_count),
+                    'limit': int(thresholds['python_file_lines_max']),
+                    'suggestion': 'Split responsibilities into smaller modules.',
+                }
+            )
+        if ext == '.py' and line_count > max(300, int(thresholds['python_file_lines_max']) // 2):
+            lowered = file_text.lower()
+            responsibility_hits = sum(1 for k in responsibility_keywords if k in lowered)
+            responsibility_limit = int(thresholds['python_responsibility_keywords_max'])
+            if responsibility_hits > responsibility_limit:
                 violations.append(
                     {
-                        'kind': 'workflow_monolith_too_large',
+                        'kind': 'python_mixed_responsibilities',
                         'path': rel,
                         'lines': int(line_count),
-                        'limit': int(thresholds['workflow_file_lines_max']),
-                        'suggestion': 'Extract prompt/phase controllers into smaller workflow modules.',
+                        'responsibility_hits': int(responsibility_hits),
+                        'limit': int(responsibility_limit),
+                        'suggestion': 'Extract domain concerns into focused modules.',
                     }
                 )
-            if rel in {'src/awe_agentcheck/workflow.py', 'src/awe_agentcheck/service.py'} and ext == '.py':
-                prompt_builder_hits = int(file_text.count('_prompt('))
-                if prompt_builder_hits > int(thresholds['prompt_builder_count_max']):
-                    violations.append(
-                        {
-                            'kind': 'prompt_assembly_hotspot',
-                            'path': rel,
-                            'prompt_builder_hits': prompt_builder_hits,
-                            'limit': int(thresholds['prompt_builder_count_max']),
-                            'suggestion': 'Move prompt templates into dedicated files and compose with data-only bindings.',
-                        }
-                    )
-            if rel in {'src/awe_agentcheck/adapters.py', 'src/awe_agentcheck/adapters/runner.py'}:
-                runtime_raise_hits = len(re.findall(r'raise\s+RuntimeError\s*\(', file_text))
-                if runtime_raise_hits > int(thresholds['adapter_runtime_raise_max']):
-                    violations.append(
-                        {
-                            'kind': 'adapter_runtime_raise_detected',
-                            'path': rel,
-                            'runtime_raise_hits': int(runtime_raise_hits),
-                            'limit': int(thresholds['adapter_runtime_raise_max']),
-                            'suggestion': 'Return structured adapter errors and let workflow decide retry/fallback/gate.',
-                        }
-                    )
-            if ext in frontend_ext and line_count > int(thresholds['frontend_file_lines_max']):
+        if rel == 'src/awe_agentcheck/service.py' and line_count > int(thresholds['service_file_lines_max']):
+            violations.append(
+                {
+                    'kind': 'service_monolith_too_large',
+                    'path': rel,
+                    'lines': int(line_count),
+                    'limit': int(thresholds['service_file_lines_max']),
+                    'suggestion': 'Split service lifecycle/orchestration concerns into focused modules.',
+                }
+            )
+        if rel == 'src/awe_agentcheck/workflow.py' and line_count > int(thresholds['workflow_file_lines_max']):
+            violations.append(
+                {
+                    'kind': 'workflow_monolith_too_large',
+                    'path': rel,
+                    'lines': int(line_count),
+                    'limit': int(thresholds['workflow_file_lines_max']),
+                    'suggestion': 'Extract prompt/phase controllers into smaller workflow modules.',
+                }
+            )
+        if rel in {'src/awe_agentcheck/workflow.py', 'src/awe_agentcheck/service.py'} and ext == '.py':
+            prompt_builder_hits = int(file_text.count('_prompt('))
+            if prompt_builder_hits > int(thresholds['prompt_builder_count_max']):
                 violations.append(
                     {
-                        'kind': 'frontend_file_too_large',
+                        'kind': 'prompt_assembly_hotspot',
                         'path': rel,
-                        'lines': int(line_count),
-                        'limit': int(thresholds['frontend_file_lines_max']),
-                        'suggestion': 'Split UI into smaller files/components.',
+                        'prompt_builder_hits': prompt_builder_hits,
+                        'limit': int(thresholds['prompt_builder_count_max']),
+                        'suggestion': 'Move prompt templates into dedicated files and compose with data-only bindings.',
                     }
                 )
-            if rel == 'web/assets/dashboard.js' and line_count > int(thresholds['dashboard_js_lines_max']):
+        if rel in {'src/awe_agentcheck/adapters.py', 'src/awe_agentcheck/adapters/runner.py'}:
+            runtime_raise_hits = len(re.findall(r'raise\s+RuntimeError\s*\(', file_text))
+            if runtime_raise_hits > int(thresholds['adapter_runtime_raise_max']):
                 violations.append(
                     {
-                        'kind': 'dashboard_monolith_too_large',
+                        'kind': 'adapter_runtime_raise_detected',
                         'path': rel,
-                        'lines': int(line_count),
-                        'limit': int(thresholds['dashboard_js_lines_max']),
-                        'suggestion': 'Split dashboard runtime by panel/feature modules.',
+                        'runtime_raise_hits': int(runtime_raise_hits),
+                        'limit': int(thresholds['adapter_runtime_raise_max']),
+                        'suggestion': 'Return structured adapter errors and let workflow decide retry/fallback/gate.',
                     }
                 )
+        if ext in frontend_ext and line_count > int(thresholds['frontend_file_lines_max']):
+            violations.append(
+                {
+                    'kind': 'frontend_file_too_large',
+                    'path': rel,
+                    'lines': int(line_count),
+                    'limit': int(thresholds['frontend_file_lines_max']),
+                    'suggestion': 'Split UI into smaller files/components.',
+                }
+            )
+        if rel == 'web/assets/dashboard.js' and line_count > int(thresholds['dashboard_js_lines_max']):
+            violations.append(
+                {
+                    'kind': 'dashboard_monolith_too_large',
+                    'path': rel,
+                    'lines': int(line_count),
+                    'limit': int(thresholds['dashboard_js_lines_max']),
+                    'suggestion': 'Split dashboard runtime by panel/feature modules.',
+                }
+            )
 
     scripts_dir = root / 'scripts'
     if scripts_dir.exists() and scripts_dir.is_dir():
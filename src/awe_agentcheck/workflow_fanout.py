@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+import contextvars
+from dataclasses import dataclass
+import threading
+import time
+from typing import Any, Callable, Sequence
+
+DEFAULT_FANOUT_MAX_WORKERS = 4
+# How long fan_out waits for stopped items to return before giving up on them.
+DEFAULT_FANOUT_STOP_GRACE_SECONDS = 10.0
+
+
+@dataclass(frozen=True)
+class FanOutOutcome:
+    value: Any = None
+    error: BaseException | None = None
+    canceled: bool = False
+    timed_out: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and not self.canceled and not self.timed_out
+
+
+def fan_out(
+    items: Sequence[Any],
+    fn: Callable[[Any], Any],
+    *,
+    max_workers: int = DEFAULT_FANOUT_MAX_WORKERS,
+    should_cancel: Callable[[], bool] | None = None,
+    timeout_seconds: float | None = None,
+    poll_seconds: float = 0.25,
+    thread_name_prefix: str = 'awe-fanout',
+    stop: threading.Event | None = None,
+    stop_grace_seconds: float = DEFAULT_FANOUT_STOP_GRACE_SECONDS,
+) -> list[FanOutOutcome]:
+    """Run ``fn(item)`` for every item on a bounded pool; outcomes keep input order.
+
+    *should_cancel* is polled while waiting: once it returns true, items that
+    have not started are dropped and every unfinished item is reported as
+    canceled. Items still running after *timeout_seconds* are reported as timed
+    out. In either case *stop* is set and running items get up to
+    *stop_grace_seconds* to return; items hand ``stop.is_set`` to the
+    participant runner as ``should_stop``, which kills their processes.
+    Without *stop*, running calls are left to their own per-call timeouts.
+
+    Per-provider limits are not applied here; participant runners get them
+    from ``ProviderScheduler`` admission.
+    """
+    if not items:
+        return []
+    workers = max(1, min(int(max_workers), len(items)))
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix=thread_name_prefix)
+    # Each item runs in a copy of the caller's context so task/round log correlation follows it.
+    futures: list[Future] = [executor.submit(contextvars.copy_context().run, fn, item) for item in items]
+    deadline = (time.monotonic() + max(0.0, float(timeout_seconds))) if timeout_seconds is not None else None
+    pending = set(futures)
+    unfinished_state: dict[str, bool] = {}
+    try:
+        while pending:
+            wait_seconds = max(0.01, float(poll_seconds))
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    unfinished_state = {'timed_out': True}
+                    break
+                wait_seconds = min(wait_seconds, remaining)
+            _, pending = wait(pending, timeout=wait_seconds, return_when=FIRST_COMPLETED)
+            if pending and should_cancel is not None and should_cancel():
+                unfinished_state = {'canceled': True}
+                break
+    finally:
+        abandoned = set(pending)
+        if pending and stop is not None:
+            stop.set()
+            for future in pending:
+                future.cancel()
+            wait(pending, timeout=max(0.0, float(stop_grace_seconds)))
+        executor.shutdown(wait=not pending, cancel_futures=True)
+
+    outcomes: list[FanOutOutcome] = []
+    for future in futures:
+        if future in abandoned or not future.done() or future.cancelled():
+            outcomes.append(FanOutOutcome(**unfinished_state))
+            continue
+        error = future.exception()
+        if error is not None:
+            outcomes.append(FanOutOutcome(error=error))
+        else:
+            outcomes.append(FanOutOutcome(value=future.result()))
+    return outcomes
+
+
+def serialized(callback: Callable[[dict], None]) -> Callable[[dict], None]:
+    """Wrap an event callback so concurrent workers never interleave calls."""
+    lock = threading.Lock()
+
+    def _emit(event: dict) -> None:
+        with lock:
+            callback(event)
+
+    return _emit
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Callable
+
+from awe_agentcheck.domain.events import EventType
+
+DEFAULT_STREAM_WINDOW_MS = 250
+DEFAULT_STREAM_MAX_BYTES = 4096
+
+
+class ParticipantStreamCoalescer:
+    """``on_stream`` callback that merges participant output into windowed events.
+
+    Chunks are buffered per stream name (``stdout``/``stderr``) and emitted as a
+    single ``participant_stream`` event once the buffer is *window_ms* old or
+    holds *max_bytes* of text. :meth:`poll` emits windows that expired while no
+    new output arrived and :meth:`flush` emits whatever is left; runners call
+    both, and :func:`run_participant` flushes once the participant returns.
+    """
+
+    def __init__(
+        self,
+        *,
+        emit: Callable[[dict], None],
+        round_no: int,
+        stage: str,
+        participant: str,
+        provider: str,
+        window_ms: int = DEFAULT_STREAM_WINDOW_MS,
+        max_bytes: int = DEFAULT_STREAM_MAX_BYTES,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._emit = emit
+        self._round_no = round_no
+        self._stage = stage
+        self._participant = participant
+        self._provider = provider
+        self._window = max(0, int(window_ms)) / 1000.0
+        self._max_bytes = max(1, int(max_bytes))
+        self._clock = clock
+        self._lock = threading.Lock()
+        # stream name -> (window start, chunks, buffered bytes)
+        self._buffers: dict[str, tuple[float, list[str], int]] = {}
+
+    @property
+    def window_seconds(self) -> float:
+        return self._window
+
+    def __call__(self, stream_name: str, chunk: str) -> None:
+        text = str(chunk or '')
+        if not text:
+            return
+        stream = str(stream_name or 'stdout')
+        now = self._clock()
+        ready: list[tuple[str, list[str]]] = []
+        with self._lock:
+            started, chunks, size = self._buffers.get(stream, (now, [], 0))
+            chunks.append(text)
+            size += len(text.encode('utf-8', errors='replace'))
+            if size >= self._max_bytes or (now - started) >= self._window:
+                self._buffers.pop(stream, None)
+                ready.append((stream, chunks))
+            else:
+                self._buffers[stream] = (started, chunks, size)
+        self._emit_ready(ready)
+
+    def poll(self) -> None:
+        now = self._clock()
+        with self._lock:
+            expired = [name for name, (started, _, _) in self._buffers.items() if (now - started) >= self._window]
+            ready = [(name, self._buffers.pop(name)[1]) for name in expired]
+        self._emit_ready(ready)
+
+    def flush(self) -> None:
+        with self._lock:
+            ready = [(name, chunks) for name, (_, chunks, _) in self._buffers.items()]
+            self._buffers.clear()
+        self._emit_ready(ready)
+
+    def _emit_ready(self, ready: list[tuple[str, list[str]]]) -> None:
+        for stream, chunks in ready:
+            self._emit(
+                {
+                    'type': EventType.PARTICIPANT_STREAM.value,
+                    'round': self._round_no,
+                    'stage': self._stage,
+                    'stream': stream,
+                    'participant': self._participant,
+                    'provider': self._provider,
+                    'chunk': ''.join(chunks),
+                    'chunk_count': len(chunks),
+                }
+            )
+
+
+def run_participant(runner: Any, **kwargs: Any):
+    """Call ``runner.run`` and flush a coalescing ``on_stream`` callback afterwards."""
+    on_stream = kwargs.get('on_stream')
+    try:
+        return runner.run(**kwargs)
+    finally:
+        flush = getattr(on_stream, 'flush', None)
+        if callable(flush):
+            flush()
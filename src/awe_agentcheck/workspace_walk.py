@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Callable, Iterable, Iterator
+
+
+def walk_workspace(
+    root: Path | str,
+    *,
+    ignore_names: Iterable[str] = (),
+    exclude: Callable[[str], bool] | None = None,
+) -> Iterator[tuple[str, os.stat_result]]:
+    """Yield ``(rel_path, stat)`` for every regular file under *root*.
+
+    Directories whose name is in *ignore_names*, or whose relative path
+    matches *exclude*, are pruned before descending, so ignored trees such as
+    ``node_modules`` or ``.git`` are never listed. Files are filtered the same
+    way. Paths are POSIX-style and relative to *root*; the stat result comes
+    from the ``DirEntry`` and follows symlinks. Symlinked directories are not
+    descended into, matching ``Path.rglob`` and ``os.walk`` defaults.
+    Unreadable directories are skipped.
+    """
+    ignored = frozenset(ignore_names)
+    pending: list[tuple[str, str]] = [(os.fspath(root), '')]
+    while pending:
+        directory, prefix = pending.pop()
+        try:
+            with os.scandir(directory) as iterator:
+                entries = sorted(iterator, key=lambda entry: entry.name)
+        except OSError:
+            continue
+        subdirs: list[tuple[str, str]] = []
+        for entry in entries:
+            if entry.name in ignored:
+                continue
+            rel = f'{prefix}{entry.name}'
+            if exclude is not None and exclude(rel):
+                continue
+            try:
+                if entry.is_dir():
+                    if not entry.is_symlink():
+                        subdirs.append((entry.path, f'{rel}/'))
+                    continue
+                if not entry.is_file():
+                    continue
+                info = entry.stat()
+            except OSError:
+                continue
+            yield rel, info
+        # Depth-first in name order: push reversed so the first subdir is walked next.
+        pending.extend(reversed(subdirs))
@@ -92,6 +92,7 @@ def test_api_create_start_and_get_task_roundtrip(tmp_path: Path):
     assert body['plain_mode'] is True
     assert body['stream_mode'] is True
     assert body['debate_mode'] is True
+    assert body['parallel_reviews'] is False
     assert body['repair_mode'] == 'balanced'
     assert body['memory_mode'] == 'basic'
     assert body['phase_timeout_seconds'] == {}
@@ -196,6 +197,80 @@ def test_api_events_and_cancel(tmp_path: Path):
     assert isinstance(body['prompt_cache_break_count_50'], int)
 
 
+def test_api_events_supports_after_seq_limit_and_types(tmp_path: Path):
+    client = build_client(tmp_path)
+    created = client.post(
+        '/api/tasks',
+        json={
+            'title': 'Task Cursor',
+            'description': 'Cursor paging',
+            'author_participant': 'claude#author-A',
+            'reviewer_participants': ['codex#review-B'],
+            'sandbox_mode': False,
+            'self_loop_mode': 1,
+            'auto_start': False,
+        },
+    )
+    task_id = created.json()['task_id']
+    assert client.post(f"/api/tasks/{task_id}/start", json={'background': False}).status_code == 200
+
+    full = client.get(f"/api/tasks/{task_id}/events").json()
+    assert len(full) >= 3
+    pivot = int(full[1]['seq'])
+
+    tail = client.get(f"/api/tasks/{task_id}/events", params={'after_seq': pivot})
+    assert tail.status_code == 200
+    assert [row['seq'] for row in tail.json()] == [row['seq'] for row in full if row['seq'] > pivot]
+
+    page = client.get(f"/api/tasks/{task_id}/events", params={'limit': 2}).json()
+    assert [row['seq'] for row in page] == [row['seq'] for row in full[:2]]
+
+    reviews = client.get(f"/api/tasks/{task_id}/events", params={'types': 'review'}).json()
+    assert reviews and all(row['type'] == 'review' for row in reviews)
+
+    empty = client.get(f"/api/tasks/{task_id}/events", params={'after_seq': int(full[-1]['seq'])})
+    assert empty.status_code == 200
+    assert empty.json() == []
+
+    invalid = client.get(f"/api/tasks/{task_id}/events", params={'after_seq': -1})
+    assert invalid.status_code == 400
+
+
+def test_api_event_stream_replays_task_events_after_last_event_id(tmp_path: Path):
+    client = build_client(tmp_path)
+    created = client.post(
+        '/api/tasks',
+        json={
+            'title': 'Task Stream',
+            'description': 'SSE replay',
+            'author_participant': 'claude#author-A',
+            'reviewer_participants': ['codex#review-B'],
+            'sandbox_mode': False,
+            'self_loop_mode': 1,
+            'auto_start': False,
+        },
+    )
+    task_id = created.json()['task_id']
+    assert client.post(f"/api/tasks/{task_id}/start", json={'background': False}).status_code == 200
+    full = client.get(f"/api/tasks/{task_id}/events").json()
+
+    resp = client.get(
+        '/api/events/stream',
+        params={'task_id': task_id, 'max_seconds': 0.2},
+        headers={'last-event-id': str(full[0]['seq'])},
+    )
+    assert resp.status_code == 200
+    assert resp.headers['content-type'].startswith('text/event-stream')
+    body = resp.text
+    assert body.startswith('event: ready\n')
+    assert 'event: task\n' in body
+    ids = [int(line[4:]) for line in body.splitlines() if line.startswith('id: ')]
+    assert ids == [int(row['seq']) for row in full[1:]]
+
+    missing = client.get('/api/events/stream', params={'task_id': 'task-missing', 'max_seconds': 0.1})
+    assert missing.status_code == 404
+
+
 def test_api_policy_templates_endpoint_returns_profile_and_templates(tmp_path: Path):
     client = build_client(tmp_path)
     project = tmp_path / 'policy-api-repo'
@@ -244,6 +319,7 @@ def test_api_analytics_endpoint_returns_failure_and_drift_views(tmp_path: Path):
     assert isinstance(body['failure_taxonomy_trend'], list)
     assert isinstance(body['reviewer_drift'], list)
     assert 'adverse_rate' in body['reviewer_global']
+    assert isinstance(body['provider_admission'], dict)
 
 
 def test_api_github_summary_endpoint_returns_markdown_payload(tmp_path: Path):
@@ -0,0 +1,273 @@
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import os
+from pathlib import Path
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+
+from awe_agentcheck.adapters import AsyncParticipantRunner, ParticipantRunner, ProviderScheduler
+from awe_agentcheck.adapters.runner import ParticipantCancelled
+from awe_agentcheck.participants import Participant, set_extra_providers
+
+
+class _Coalescer:
+    window_seconds = 0.05
+
+    def __init__(self):
+        self.chunks: list[tuple[str, str]] = []
+        self.polls = 0
+        self.flushed = False
+
+    def __call__(self, stream: str, chunk: str) -> None:
+        self.chunks.append((stream, chunk))
+
+    def poll(self) -> None:
+        self.polls += 1
+
+    def flush(self) -> None:
+        self.flushed = True
+
+
+def test_arun_process_streams_both_pipes_and_polls_while_silent(tmp_path: Path):
+    script = tmp_path / 'stream.py'
+    script.write_text(
+        'import sys, time\n'
+        'data = sys.stdin.read().strip()\n'
+        'print(f"OUT:{data}", flush=True)\n'
+        'time.sleep(0.3)\n'
+        'print("ERR:warn", file=sys.stderr, flush=True)\n',
+        encoding='utf-8',
+    )
+    sink = _Coalescer()
+    result = asyncio.run(
+        AsyncParticipantRunner._arun_process(
+            argv=[sys.executable, str(script)],
+            runtime_input='payload',
+            cwd=tmp_path,
+            timeout_seconds=5.0,
+            on_stream=sink,
+        )
+    )
+    assert result.returncode == 0
+    assert 'OUT:payload' in result.stdout
+    assert 'ERR:warn' in result.stderr
+    assert {name for name, _ in sink.chunks} == {'stdout', 'stderr'}
+    assert sink.polls >= 1
+    assert sink.flushed is True
+
+
+def test_arun_process_kills_child_on_deadline(tmp_path: Path):
+    script = tmp_path / 'sleep.py'
+    script.write_text('import time\ntime.sleep(30)\n', encoding='utf-8')
+    sink = _Coalescer()
+    started = time.monotonic()
+    with pytest.raises(subprocess.TimeoutExpired):
+        asyncio.run(
+            AsyncParticipantRunner._arun_process(
+                argv=[sys.executable, str(script)],
+                runtime_input='',
+                cwd=tmp_path,
+                timeout_seconds=0.2,
+                on_stream=sink,
+            )
+        )
+    assert time.monotonic() - started < 10
+    assert sink.flushed is True
+
+
+def test_arun_process_runs_stream_callbacks_off_the_event_loop(tmp_path: Path):
+    script = tmp_path / 'lines.py'
+    script.write_text(
+        'import time\n'
+        'for i in range(5):\n'
+        '    print(f"line-{i}", flush=True)\n'
+        '    time.sleep(0.02)\n',
+        encoding='utf-8',
+    )
+    loop_threads: list[int] = []
+    slow_threads: list[int] = []
+    slow_chunks: list[str] = []
+    fast_chunks: list[str] = []
+    release = threading.Event()
+
+    def slow_sink(_stream: str, chunk: str) -> None:
+        slow_threads.append(threading.get_ident())
+        release.wait(5)
+        slow_chunks.append(chunk)
+
+    async def main() -> float:
+        loop_threads.append(threading.get_ident())
+        slow = asyncio.ensure_future(
+            AsyncParticipantRunner._arun_process(
+                argv=[sys.executable, str(script)],
+                runtime_input='',
+                cwd=tmp_path,
+                timeout_seconds=10.0,
+                on_stream=slow_sink,
+            )
+        )
+        started = time.monotonic()
+        # A stalled callback on one call must not hold up the other call on the same loop.
+        await AsyncParticipantRunner._arun_process(
+            argv=[sys.executable, str(script)],
+            runtime_input='',
+            cwd=tmp_path,
+            timeout_seconds=10.0,
+            on_stream=lambda _stream, chunk: fast_chunks.append(chunk),
+        )
+        elapsed = time.monotonic() - started
+        release.set()
+        await slow
+        return elapsed
+
+    elapsed = asyncio.run(main())
+    assert elapsed < 4
+    assert ''.join(fast_chunks).split() == [f'line-{i}' for i in range(5)]
+    assert ''.join(slow_chunks).split() == [f'line-{i}' for i in range(5)]
+    assert loop_threads[0] not in slow_threads
+
+
+def test_async_runner_sync_facade_runs_participant(tmp_path: Path):
+    script = tmp_path / 'agent.py'
+    script.write_text(
+        'import sys\n'
+        'prompt = sys.stdin.read().strip()\n'
+        'print(f"echo {prompt}")\n'
+        'print(\'{"verdict": "no_blocker", "next_action": "stop"}\')\n',
+        encoding='utf-8',
+    )
+    set_extra_providers({'qwen'})
+    try:
+        runner = AsyncParticipantRunner(
+            command_overrides={'qwen': f'{sys.executable} {script}'},
+            dry_run=False,
+        )
+        streamed: list[str] = []
+        result = runner.run(
+            participant=Participant(participant_id='qwen#review-A', provider='qwen', alias='review-A'),
+            prompt='hello',
+            cwd=tmp_path,
+            timeout_seconds=10,
+            on_stream=lambda _stream, chunk: streamed.append(chunk),
+        )
+    finally:
+        set_extra_providers(set())
+    assert result.returncode == 0
+    assert 'echo hello' in result.output
+    assert result.verdict == 'no_blocker'
+    assert 'echo hello' in ''.join(streamed)
+
+
+def test_async_runner_reports_timeout_after_retries(tmp_path: Path):
+    script = tmp_path / 'hang.py'
+    script.write_text('import time\ntime.sleep(30)\n', encoding='utf-8')
+    set_extra_providers({'qwen'})
+    try:
+        runner = AsyncParticipantRunner(
+            command_overrides={'qwen': f'{sys.executable} {script}'},
+            dry_run=False,
+            timeout_retries=1,
+        )
+        started = time.monotonic()
+        result = runner.run(
+            participant=Participant(participant_id='qwen#review-A', provider='qwen', alias='review-A'),
+            prompt='hello',
+            cwd=tmp_path,
+            timeout_seconds=1,
+        )
+    finally:
+        set_extra_providers(set())
+    assert time.monotonic() - started < 10
+    assert result.returncode == 2
+    assert 'command_timeout provider=qwen' in result.output
+    assert 'attempts_made=2' in result.output
+
+
+def test_queued_calls_do_not_starve_the_admitted_call_of_executor_threads(tmp_path: Path):
+    script = tmp_path / 'agent.py'
+    script.write_text(
+        'import time\n'
+        'print("working", flush=True)\n'
+        'time.sleep(0.3)\n'
+        'print(\'{"verdict": "no_blocker", "next_action": "stop"}\')\n',
+        encoding='utf-8',
+    )
+    set_extra_providers({'qwen'})
+    try:
+        runner = AsyncParticipantRunner(
+            command_overrides={'qwen': f'{sys.executable} {script}'},
+            dry_run=False,
+            scheduler=ProviderScheduler(default_concurrency=1),
+        )
+
+        async def main() -> list:
+            # Fewer default-executor threads than queued calls.
+            asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=4))
+            return await asyncio.gather(
+                *(
+                    runner.arun(
+                        participant=Participant(participant_id=f'qwen#review-{i}', provider='qwen', alias=f'review-{i}'),
+                        prompt='hello',
+                        cwd=tmp_path,
+                        timeout_seconds=20,
+                        on_stream=_Coalescer(),
+                    )
+                    for i in range(6)
+                )
+            )
+
+        started = time.monotonic()
+        results = asyncio.run(main())
+    finally:
+        set_extra_providers(set())
+    assert time.monotonic() - started < 15
+    assert [result.returncode for result in results] == [0] * 6
+    assert all(result.verdict == 'no_blocker' for result in results)
+
+
+@pytest.mark.parametrize('runner_cls', [ParticipantRunner, AsyncParticipantRunner])
+def test_should_stop_kills_a_running_participant(tmp_path: Path, runner_cls):
+    pid_file = tmp_path / 'pid'
+    script = tmp_path / 'hang.py'
+    script.write_text(
+        'import os, pathlib, sys, time\n'
+        'pathlib.Path(sys.argv[1]).write_text(str(os.getpid()))\n'
+        'time.sleep(30)\n',
+        encoding='utf-8',
+    )
+    stop = threading.Event()
+
+    def stop_once_started() -> None:
+        deadline = time.monotonic() + 10
+        while not pid_file.exists() and time.monotonic() < deadline:
+            time.sleep(0.02)
+        stop.set()
+
+    set_extra_providers({'qwen'})
+    try:
+        runner = runner_cls(
+            command_overrides={'qwen': f'{sys.executable} {script} {pid_file}'},
+            dry_run=False,
+        )
+        threading.Thread(target=stop_once_started, daemon=True).start()
+        started = time.monotonic()
+        with pytest.raises(ParticipantCancelled):
+            runner.run(
+                participant=Participant(participant_id='qwen#review-A', provider='qwen', alias='review-A'),
+                prompt='hello',
+                cwd=tmp_path,
+                timeout_seconds=30,
+                should_stop=stop.is_set,
+            )
+    finally:
+        set_extra_providers(set())
+    assert time.monotonic() - started < 10
+    pid = int(pid_file.read_text())
+    with pytest.raises(OSError):
+        os.kill(pid, 0)
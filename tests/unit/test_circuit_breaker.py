@@ -0,0 +1,222 @@
+from __future__ import annotations
+
+from pathlib import Path
+import subprocess
+import sys
+import time
+
+from awe_agentcheck.adapters import ParticipantRunner, ProviderCircuitBreaker, ProviderScheduler, parse_provider_fallbacks
+from awe_agentcheck.participants import Participant, parse_participant_id, set_extra_providers
+
+
+def _breaker(now: list[float], **kwargs) -> ProviderCircuitBreaker:
+    return ProviderCircuitBreaker(failure_threshold=2, cooldown_seconds=60, clock=lambda: now[0], **kwargs)
+
+
+def test_parse_provider_fallbacks_normalizes_chains():
+    assert parse_provider_fallbacks(
+        {'Claude': 'codex', 'gemini': ['Codex', 'claude', 'codex', 'gemini'], 'qwen': '', '': 'codex'}
+    ) == {'claude': ('codex',), 'gemini': ('codex', 'claude')}
+
+
+def test_breaker_opens_after_consecutive_provider_failures_and_probes_after_cooldown():
+    now = [0.0]
+    breaker = _breaker(now)
+    events: list[dict] = []
+    breaker.add_listener(events.append)
+
+    breaker.record('claude', returncode=2, output='command_failed provider=claude returncode=1')
+    breaker.record('claude', returncode=2, output='provider_limit provider=claude command=claude')
+    assert breaker.state('claude') == 'closed'
+    breaker.record('claude', returncode=2, output='command_timeout provider=claude timeout_seconds=5', task_id='t1')
+    assert breaker.state('claude') == 'open'
+
+    blocked = breaker.route('claude', available={'claude'})
+    assert blocked.blocked.startswith('provider_circuit_open provider=claude key=claude retry_in_seconds=60')
+
+    now[0] = 61.0
+    probe = breaker.route('claude', available={'claude'})
+    assert probe.blocked == '' and probe.provider == 'claude'
+    assert breaker.state('claude') == 'half_open'
+    assert breaker.route('claude', available={'claude'}).blocked
+    breaker.record('claude', returncode=0, output='ok')
+    assert breaker.state('claude') == 'closed'
+
+    assert [(event['type'], event['previous_state'], event['state']) for event in events] == [
+        ('provider_circuit_state', 'closed', 'open'),
+        ('provider_circuit_state', 'open', 'half_open'),
+        ('provider_circuit_state', 'half_open', 'closed'),
+    ]
+    assert events[0]['task_id'] == 't1'
+    assert events[0]['last_reason'] == 'command_timeout'
+
+
+def test_breaker_reopens_when_half_open_probe_fails():
+    now = [0.0]
+    breaker = _breaker(now)
+    for _ in range(2):
+        breaker.record('codex', model='gpt-5', returncode=2, output='provider_limit provider=codex')
+    assert breaker.state('codex', 'gpt-5') == 'open'
+    assert breaker.state('codex') == 'closed'
+    now[0] = 100.0
+    assert not breaker.route('codex', model='gpt-5').blocked
+    breaker.record('codex', model='gpt-5', returncode=2, output='provider_limit provider=codex')
+    assert breaker.state('codex', 'gpt-5') == 'open'
+    assert breaker.snapshot()['codex:gpt-5']['trips'] == 2
+    assert breaker.snapshot()['codex:gpt-5']['retry_in_seconds'] == 60.0
+
+
+def test_breaker_routes_to_first_available_fallback():
+    now = [0.0]
+    breaker = _breaker(now, fallbacks={'claude': ('gemini', 'codex')})
+    events: list[dict] = []
+    breaker.add_listener(events.append)
+    for _ in range(2):
+        breaker.record('claude', model='opus', returncode=2, output='provider_limit provider=claude')
+
+    route = breaker.route(
+        'claude',
+        model='opus',
+        model_params='--effort high',
+        available={'claude', 'codex'},
+        participant_id='claude#review-A',
+        task_id='t1',
+    )
+    assert (route.provider, route.model, route.model_params, route.fallback_from) == ('codex', None, None, 'claude')
+    assert events[-1] == {
+        'type': 'provider_fallback_routed',
+        'participant': 'claude#review-A',
+        'provider': 'claude',
+        'model': 'opus',
+        'fallback_provider': 'codex',
+        'task_id': 't1',
+    }
+    assert breaker.snapshot()['claude:opus']['fallbacks'] == 1
+
+
+def test_disabled_breaker_never_blocks():
+    breaker = ProviderCircuitBreaker()
+    for _ in range(5):
+        breaker.record('claude', returncode=2, output='provider_limit provider=claude')
+    assert breaker.route('claude').blocked == ''
+    assert breaker.snapshot() == {}
+
+
+def test_runner_reroutes_participant_while_circuit_is_open(tmp_path: Path, monkeypatch):
+    launched: list[str] = []
+
+    def fake_run(argv, *args, **kwargs):
+        launched.append(Path(argv[0]).name)
+        stdout = 'usage limit reached' if 'claude' in argv[0] else '{"verdict":"NO_BLOCKER","next_action":"pass"}'
+        return subprocess.CompletedProcess(args=argv, returncode=0, stdout=stdout, stderr='')
+
+    monkeypatch.setattr('awe_agentcheck.adapters.runner.subprocess.run', fake_run)
+    breaker = ProviderCircuitBreaker(failure_threshold=1, fallbacks={'claude': ('codex',)})
+    runner = ParticipantRunner(
+        command_overrides={'claude': 'claude -p', 'codex': 'codex exec'},
+        dry_run=False,
+        scheduler=ProviderScheduler(),
+        circuit_breaker=breaker,
+    )
+    participant = parse_participant_id('claude#review-A')
+
+    first = runner.run(participant=participant, prompt='hello', cwd=tmp_path, timeout_seconds=5, model='claude-x')
+    assert 'provider_limit provider=claude' in first.output
+    assert breaker.state('claude', 'claude-x') == 'open'
+
+    second = runner.run(participant=participant, prompt='hello', cwd=tmp_path, timeout_seconds=5, model='claude-x')
+    assert second.returncode == 0
+    assert second.verdict == 'no_blocker'
+    assert second.provider == 'codex'
+    assert launched == ['claude', 'codex']
+
+
+def test_half_open_probe_that_times_out_in_admission_queue_frees_the_probe_slot(tmp_path: Path):
+    now = [0.0]
+    breaker = ProviderCircuitBreaker(failure_threshold=1, cooldown_seconds=60, clock=lambda: now[0])
+    scheduler = ProviderScheduler(default_concurrency=1)
+    runner = ParticipantRunner(
+        command_overrides={'claude': 'claude -p'},
+        dry_run=False,
+        scheduler=scheduler,
+        circuit_breaker=breaker,
+    )
+    breaker.record('claude', returncode=2, output='provider_limit provider=claude')
+    now[0] = 61.0
+    held = scheduler.acquire('claude', task_id='other-task')
+
+    queued = runner.run(participant=parse_participant_id('claude#review-A'), prompt='hi', cwd=tmp_path, timeout_seconds=0)
+    assert queued.output.startswith('provider_queue_timeout provider=claude')
+    assert breaker.state('claude') == 'half_open'
+    # Without releasing the probe this would stay blocked for another full cooldown.
+    assert breaker.route('claude', available={'claude'}).blocked == ''
+    scheduler.release(held)
+
+
+def _agent_script(tmp_path: Path, name: str, body: str) -> str:
+    script = tmp_path / f'{name}.py'
+    script.write_text(
+        'import pathlib, sys, time\n'
+        f'pathlib.Path({str(tmp_path / (name + ".started"))!r}).touch()\n'
+        'sys.stdin.read()\n' + body,
+        encoding='utf-8',
+    )
+    return f'{sys.executable} {script}'
+
+
+_VERDICT = 'print(\'{"verdict": "no_blocker", "next_action": "stop"}\', flush=True)\n'
+
+
+def _hedging_runner(tmp_path: Path, primary_body: str, hedge_body: str) -> tuple[ParticipantRunner, ProviderScheduler]:
+    scheduler = ProviderScheduler()
+    runner = ParticipantRunner(
+        command_overrides={
+            'qwen': _agent_script(tmp_path, 'primary', primary_body),
+            'kimi': _agent_script(tmp_path, 'hedge', hedge_body),
+        },
+        dry_run=False,
+        timeout_retries=0,
+        scheduler=scheduler,
+        circuit_breaker=ProviderCircuitBreaker(fallbacks={'qwen': ('kimi',)}),
+    )
+    return runner, scheduler
+
+
+def test_hedged_run_takes_secondary_result_when_primary_stays_silent(tmp_path: Path):
+    set_extra_providers({'qwen', 'kimi'})
+    try:
+        runner, scheduler = _hedging_runner(tmp_path, 'time.sleep(30)\n' + _VERDICT, _VERDICT)
+        started = time.monotonic()
+        result = runner.run(
+            participant=Participant(participant_id='qwen#review-A', provider='qwen', alias='review-A'),
+            prompt='review this',
+            cwd=tmp_path,
+            timeout_seconds=60,
+            hedge_delay_seconds=0.3,
+        )
+    finally:
+        set_extra_providers(set())
+    assert result.returncode == 0
+    assert result.verdict == 'no_blocker'
+    assert time.monotonic() - started < 15
+    assert (tmp_path / 'hedge.started').exists()
+    assert result.provider == 'kimi'
+    assert {key: stats['active'] for key, stats in scheduler.snapshot().items()} == {'kimi': 0, 'qwen': 0}
+
+
+def test_hedged_run_does_not_hedge_once_primary_streams_output(tmp_path: Path):
+    set_extra_providers({'qwen', 'kimi'})
+    try:
+        runner, _ = _hedging_runner(tmp_path, 'print("thinking", flush=True)\ntime.sleep(0.6)\n' + _VERDICT, _VERDICT)
+        result = runner.run(
+            participant=Participant(participant_id='qwen#review-A', provider='qwen', alias='review-A'),
+            prompt='review this',
+            cwd=tmp_path,
+            timeout_seconds=60,
+            hedge_delay_seconds=0.3,
+        )
+    finally:
+        set_extra_providers(set())
+    assert result.verdict == 'no_blocker'
+    assert 'thinking' in result.output
+    assert not (tmp_path / 'hedge.started').exists()
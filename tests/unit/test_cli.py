@@ -418,6 +418,18 @@ def test_cli_main_routes_http_commands(monkeypatch, capsys):
         assert '"ok": true' in capsys.readouterr().out.lower()
 
 
+def test_cli_main_events_passes_cursor_params(monkeypatch):
+    fake = _FakeClient(response=_FakeResponse(status_code=200, payload=[]))
+    monkeypatch.setattr(cli_module.httpx, 'Client', lambda timeout=60: fake)
+
+    code = cli_module.main(['events', 'task-1', '--after-seq', '12', '--limit', '50', '--type', 'review', '--type', 'gate_passed'])
+    assert code == 0
+    method, url, params, _payload = fake.calls[-1]
+    assert method == 'GET'
+    assert url.endswith('/api/tasks/task-1/events')
+    assert params == {'after_seq': 12, 'limit': 50, 'types': ['review', 'gate_passed']}
+
+
 def test_cli_main_run_posts_task_payload(monkeypatch):
     fake = _FakeClient(response=_FakeResponse(status_code=200, payload={'task_id': 'task-1'}))
     monkeypatch.setattr(cli_module.httpx, 'Client', lambda timeout=60: fake)
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import os
+
 from awe_agentcheck.config import load_settings
 
 
@@ -61,3 +63,152 @@ def test_load_settings_parses_extra_provider_commands(monkeypatch):
         'qwen': 'qwen-cli --yolo',
         'deepseek': 'deepseek-cli run',
     }
+
+
+def test_load_settings_event_batch_defaults_and_disable(monkeypatch):
+    monkeypatch.delenv('AWE_EVENT_BATCH_MAX_ROWS', raising=False)
+    monkeypatch.delenv('AWE_EVENT_BATCH_INTERVAL_MS', raising=False)
+    settings = load_settings()
+    assert settings.event_batch_max_rows == 200
+    assert settings.event_batch_interval_ms == 50
+
+    monkeypatch.setenv('AWE_EVENT_BATCH_MAX_ROWS', '0')
+    assert load_settings().event_batch_max_rows == 0
+
+
+def test_load_settings_stream_coalesce_overrides(monkeypatch):
+    monkeypatch.setenv('AWE_STREAM_COALESCE_MS', '0')
+    monkeypatch.setenv('AWE_STREAM_COALESCE_BYTES', '1024')
+    settings = load_settings()
+    assert settings.stream_window_ms == 0
+    assert settings.stream_max_bytes == 1024
+
+
+def test_load_settings_review_fanout_overrides(monkeypatch):
+    monkeypatch.delenv('AWE_PARALLEL_DEBATE', raising=False)
+    monkeypatch.setenv('AWE_PARALLEL_REVIEWS', 'yes')
+    monkeypatch.setenv('AWE_REVIEW_MAX_WORKERS', '3')
+    settings = load_settings()
+    assert settings.parallel_reviews is True
+    assert settings.parallel_debate is False
+    monkeypatch.setenv('AWE_PARALLEL_DEBATE', 'on')
+    assert load_settings().parallel_debate is True
+    monkeypatch.delenv('AWE_PARALLEL_PROPOSAL_REVIEWS', raising=False)
+    assert load_settings().parallel_proposal_reviews is False
+    monkeypatch.setenv('AWE_PARALLEL_PROPOSAL_REVIEWS', '1')
+    assert load_settings().parallel_proposal_reviews is True
+    assert settings.review_max_workers == 3
+
+
+def test_load_settings_manifest_hash_workers(monkeypatch):
+    monkeypatch.delenv('AWE_MANIFEST_HASH_WORKERS', raising=False)
+    assert load_settings().manifest_hash_workers == 0
+    monkeypatch.setenv('AWE_MANIFEST_HASH_WORKERS', '6')
+    assert load_settings().manifest_hash_workers == 6
+
+
+def test_load_settings_participant_runner(monkeypatch):
+    monkeypatch.delenv('AWE_PARTICIPANT_RUNNER', raising=False)
+    assert load_settings().participant_runner == 'thread'
+    monkeypatch.setenv('AWE_PARTICIPANT_RUNNER', 'Async')
+    assert load_settings().participant_runner == 'async'
+    monkeypatch.setenv('AWE_PARTICIPANT_RUNNER', 'fibers')
+    assert load_settings().participant_runner == 'thread'
+
+
+def test_load_settings_provider_admission_limits(monkeypatch):
+    monkeypatch.delenv('AWE_PROVIDER_MAX_CONCURRENCY', raising=False)
+    monkeypatch.delenv('AWE_PROVIDER_LIMITS_JSON', raising=False)
+    settings = load_settings()
+    assert settings.provider_max_concurrency == 4
+    assert settings.provider_limits == {}
+    monkeypatch.setenv('AWE_PROVIDER_MAX_CONCURRENCY', '0')
+    monkeypatch.setenv('AWE_PROVIDER_LIMITS_JSON', '{"codex":{"concurrency":2,"rate_per_minute":12}}')
+    settings = load_settings()
+    assert settings.provider_max_concurrency == 0
+    assert settings.provider_limits['codex'].concurrency == 2
+    assert settings.provider_limits['codex'].rate_per_minute == 12.0
+    monkeypatch.setenv('AWE_PROVIDER_LIMITS_JSON', '[1, 2]')
+    assert load_settings().provider_limits == {}
+
+
+def test_load_settings_provider_breaker(monkeypatch):
+    monkeypatch.delenv('AWE_PROVIDER_BREAKER_FAILURES', raising=False)
+    monkeypatch.delenv('AWE_PROVIDER_BREAKER_COOLDOWN_SECONDS', raising=False)
+    monkeypatch.delenv('AWE_PROVIDER_FALLBACKS_JSON', raising=False)
+    settings = load_settings()
+    assert settings.provider_breaker_failures == 0
+    assert settings.provider_breaker_cooldown_seconds == 300
+    assert settings.provider_fallbacks == {}
+    monkeypatch.setenv('AWE_PROVIDER_BREAKER_FAILURES', '4')
+    monkeypatch.setenv('AWE_PROVIDER_BREAKER_COOLDOWN_SECONDS', '30')
+    monkeypatch.setenv('AWE_PROVIDER_FALLBACKS_JSON', '{"claude":"codex","gemini":["codex","claude"]}')
+    settings = load_settings()
+    assert settings.provider_breaker_failures == 4
+    assert settings.provider_breaker_cooldown_seconds == 30
+    assert settings.provider_fallbacks == {'claude': ('codex',), 'gemini': ('codex', 'claude')}
+
+
+def test_load_settings_sandbox_strategy(monkeypatch):
+    monkeypatch.delenv('AWE_SANDBOX_STRATEGY', raising=False)
+    assert load_settings().sandbox_strategy == 'auto'
+    monkeypatch.setenv('AWE_SANDBOX_STRATEGY', 'Worktree')
+    assert load_settings().sandbox_strategy == 'worktree'
+    monkeypatch.setenv('AWE_SANDBOX_STRATEGY', 'nope')
+    assert load_settings().sandbox_strategy == 'auto'
+
+
+def test_load_settings_sandbox_pool(monkeypatch):
+    monkeypatch.delenv('AWE_SANDBOX_POOL_SIZE', raising=False)
+    monkeypatch.delenv('AWE_SANDBOX_POOL_PROJECTS', raising=False)
+    settings = load_settings()
+    assert settings.sandbox_pool_size == 0
+    assert settings.sandbox_pool_projects == []
+    monkeypatch.setenv('AWE_SANDBOX_POOL_SIZE', '3')
+    monkeypatch.setenv('AWE_SANDBOX_POOL_PROJECTS', os.pathsep.join(['/work/a', ' ', '/work/b']))
+    settings = load_settings()
+    assert settings.sandbox_pool_size == 3
+    assert settings.sandbox_pool_projects == ['/work/a', '/work/b']
+
+
+def test_load_settings_round_snapshot_mode(monkeypatch):
+    monkeypatch.delenv('AWE_ROUND_SNAPSHOT_MODE', raising=False)
+    assert load_settings().round_snapshot_mode == 'copy'
+    monkeypatch.setenv('AWE_ROUND_SNAPSHOT_MODE', 'COPY')
+    assert load_settings().round_snapshot_mode == 'copy'
+    monkeypatch.setenv('AWE_ROUND_SNAPSHOT_MODE', 'Link')
+    assert load_settings().round_snapshot_mode == 'link'
+    monkeypatch.setenv('AWE_ROUND_SNAPSHOT_MODE', ' git ')
+    assert load_settings().round_snapshot_mode == 'git'
+    monkeypatch.setenv('AWE_ROUND_SNAPSHOT_MODE', 'Store')
+    assert load_settings().round_snapshot_mode == 'store'
+    monkeypatch.setenv('AWE_ROUND_SNAPSHOT_MODE', 'bogus')
+    assert load_settings().round_snapshot_mode == 'copy'
+
+
+def test_load_settings_review_hedge(monkeypatch):
+    monkeypatch.delenv('AWE_REVIEW_HEDGE', raising=False)
+    assert load_settings().review_hedge is False
+    monkeypatch.setenv('AWE_REVIEW_HEDGE', 'on')
+    assert load_settings().review_hedge is True
+
+
+def test_load_settings_response_cache(monkeypatch, tmp_path):
+    monkeypatch.delenv('AWE_RESPONSE_CACHE_MODE', raising=False)
+    monkeypatch.delenv('AWE_RESPONSE_CACHE_DIR', raising=False)
+    monkeypatch.setenv('AWE_ARTIFACT_ROOT', str(tmp_path))
+    settings = load_settings()
+    assert settings.response_cache_mode == 'off'
+    assert settings.response_cache_dir == (tmp_path / 'response-cache').resolve()
+    assert settings.response_cache_ttl_seconds == 7 * 24 * 3600
+
+    monkeypatch.setenv('AWE_RESPONSE_CACHE_MODE', 'Replay')
+    monkeypatch.setenv('AWE_RESPONSE_CACHE_TTL_SECONDS', '0')
+    monkeypatch.setenv('AWE_RESPONSE_CACHE_MAX_MB', '16')
+    settings = load_settings()
+    assert settings.response_cache_mode == 'replay'
+    assert settings.response_cache_ttl_seconds == 0
+    assert settings.response_cache_max_mb == 16
+
+    monkeypatch.setenv('AWE_RESPONSE_CACHE_MODE', 'sometimes')
+    assert load_settings().response_cache_mode == 'off'
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+import time
+
+import pytest
+
+from awe_agentcheck.storage.content_store import ContentStore
+
+
+def _old(path: Path) -> None:
+    stamp = time.time() - 7200
+    os.utime(path, (stamp, stamp))
+
+
+def test_content_store_dedups_blobs_and_materializes_refs(tmp_path: Path):
+    store = ContentStore(tmp_path / 'store')
+    src = tmp_path / 'src'
+    src.mkdir()
+    (src / 'a.txt').write_text('same\n', encoding='utf-8')
+    (src / 'b.txt').write_text('same\n', encoding='utf-8')
+
+    first = store.put_file(src / 'a.txt')
+    assert store.put_file(src / 'b.txt') == first
+    assert store.put_file(src / 'b.txt', digest=first) == first
+    assert len(list(store.objects_root.glob('*/*'))) == 1
+
+    store.write_ref('tasks/t1/round-000', {'a.txt': first, 'nested/b.txt': first})
+    files = store.read_ref('tasks/t1/round-000')
+    stats = store.materialize(files, tmp_path / 'tree')
+    assert (tmp_path / 'tree' / 'nested' / 'b.txt').read_text(encoding='utf-8') == 'same\n'
+    assert sum(stats.values()) == 2
+    with pytest.raises(ValueError):
+        store.write_ref('../escape', {})
+    with pytest.raises(ValueError):
+        store.blob_path('not-a-digest')
+
+
+def test_content_store_gc_removes_only_unreferenced_old_blobs(tmp_path: Path):
+    store = ContentStore(tmp_path / 'store')
+    for name in ('keep', 'drop', 'fresh'):
+        (tmp_path / name).write_text(f'{name}\n', encoding='utf-8')
+    keep = store.put_file(tmp_path / 'keep')
+    drop = store.put_file(tmp_path / 'drop')
+    fresh = store.put_file(tmp_path / 'fresh')
+    store.write_ref('tasks/t1/round-000', {'keep': keep, 'drop': drop})
+    store.write_ref('tasks/t2/round-000', {'keep': keep})
+    for digest in (keep, drop):
+        _old(store.blob_path(digest))
+
+    assert store.refcounts() == {keep: 2, drop: 1}
+    assert store.delete_refs('tasks/t1') == 1
+    with store.writing():
+        assert store.gc()['skipped'] is True
+
+    result = store.gc()
+    assert result['blobs_removed'] == 1
+    assert result['bytes_freed'] == len('drop\n')
+    assert store.has_blob(keep) and store.has_blob(fresh)
+    assert not store.has_blob(drop)
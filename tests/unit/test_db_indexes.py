@@ -23,3 +23,19 @@ def test_database_schema_creates_expected_composite_indexes(tmp_path: Path):
     assert 'ix_task_events_task_id_created_at' in names
     assert 'ix_task_events_task_id_event_type_created_at' in names
 
+
+def test_running_task_id_lookup_uses_status_created_at_index(tmp_path: Path):
+    db_path = tmp_path / 'awe-indexes-plan.db'
+    db = Database(f'sqlite:///{db_path.as_posix()}')
+    db.create_schema()
+
+    with db.engine.connect() as conn:
+        plan = conn.execute(
+            text(
+                "EXPLAIN QUERY PLAN SELECT task_id FROM tasks "
+                "WHERE status = 'running' ORDER BY created_at DESC"
+            )
+        ).fetchall()
+
+    detail = ' '.join(str(row[-1]) for row in plan)
+    assert 'ix_tasks_status_created_at' in detail
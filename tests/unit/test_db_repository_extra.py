@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 from pathlib import Path
+import threading
+import time
 from types import SimpleNamespace
 
 import pytest
-from sqlalchemy.exc import OperationalError
+from sqlalchemy.exc import IntegrityError, OperationalError
 
 from awe_agentcheck.db import Database, SqlTaskRepository
 from awe_agentcheck.repository import TaskCreateRecord
@@ -89,6 +91,41 @@ def test_sql_repository_missing_task_raises_key_error(tmp_path: Path):
         repo.list_events('task-missing')
 
 
+def test_sql_repository_list_events_cursor_limit_and_type_filter(tmp_path: Path):
+    db_file = tmp_path / 'awe-extra-cursor.sqlite3'
+    db = Database(f"sqlite+pysqlite:///{db_file.as_posix()}")
+    db.create_schema()
+    repo = SqlTaskRepository(db)
+    task_id = _create_task(repo, tmp_path)['task_id']
+    for idx in range(4):
+        repo.append_event(task_id, event_type='participant_stream', payload={'i': idx}, round_number=1)
+    repo.append_event(task_id, event_type='review', payload={'verdict': 'no_blocker'}, round_number=1)
+
+    assert [e['seq'] for e in repo.list_events(task_id)] == [1, 2, 3, 4, 5]
+    assert [e['seq'] for e in repo.list_events(task_id, after_seq=3)] == [4, 5]
+    assert [e['seq'] for e in repo.list_events(task_id, after_seq=1, limit=2)] == [2, 3]
+    assert [e['seq'] for e in repo.list_events(task_id, event_types=['review,discussion'])] == [5]
+    assert repo.list_events(task_id, after_seq=5) == []
+
+
+def test_sql_repository_status_index_queries(tmp_path: Path):
+    db_file = tmp_path / 'awe-extra-status.sqlite3'
+    db = Database(f"sqlite+pysqlite:///{db_file.as_posix()}")
+    db.create_schema()
+    repo = SqlTaskRepository(db)
+    first = _create_task(repo, tmp_path)['task_id']
+    second = _create_task(repo, tmp_path)['task_id']
+    _create_task(repo, tmp_path)
+    repo.update_task_status(first, status='running', reason=None)
+    repo.update_task_status(second, status='running', reason=None)
+
+    assert repo.count_tasks_by_status() == {'queued': 1, 'running': 2}
+    assert repo.count_tasks_by_status(['running', 'passed']) == {'running': 2}
+    assert repo.list_task_ids_by_status('running') == [second, first]
+    assert repo.list_task_ids_by_status('running', limit=1) == [second]
+    assert repo.list_task_ids_by_status('passed') == []
+
+
 def test_sql_repository_delete_tasks_deduplicates_and_ignores_empty_ids(tmp_path: Path):
     db_file = tmp_path / 'awe-extra-delete.sqlite3'
     db = Database(f"sqlite+pysqlite:///{db_file.as_posix()}")
@@ -191,3 +228,116 @@ def test_update_task_status_retries_operational_error_on_lock(tmp_path: Path, mo
     row = repo.update_task_status(task_id, status='running', reason='ok', rounds_completed=1)
     assert row['status'] == 'running'
     assert state['n'] >= 2
+
+
+def test_sql_repository_batched_events_keep_seq_order_and_flush_before_status(tmp_path: Path):
+    db_file = tmp_path / 'awe-extra-batch.sqlite3'
+    db = Database(f"sqlite+pysqlite:///{db_file.as_posix()}")
+    db.create_schema()
+    repo = SqlTaskRepository(db, event_batch_rows=50, event_batch_interval_ms=5_000)
+    seen: list[tuple[str, int]] = []
+    repo.add_change_listener(lambda kind, payload: seen.append((kind, int(payload.get('seq') or 0))))
+    try:
+        first = _create_task(repo, tmp_path)['task_id']
+        second = _create_task(repo, tmp_path)['task_id']
+        returned = [
+            repo.append_event(task_id, event_type='participant_stream', payload={'n': n})
+            for n in range(3)
+            for task_id in (first, second)
+        ]
+        assert [row['seq'] for row in returned] == [1, 1, 2, 2, 3, 3]
+        assert returned[0]['id'] is None
+
+        repo.update_task_status(first, status='running', reason=None)
+        assert [kind for kind, _ in seen].count('event_appended') == 6
+        assert seen[-1][0] == 'task_updated'
+
+        rows = repo.list_events(first)
+        assert [row['seq'] for row in rows] == [1, 2, 3]
+        assert [row['payload']['n'] for row in rows] == [0, 1, 2]
+        assert all(row['id'] is not None for row in rows)
+
+        # The unbatched path continues from the counter the writer advanced.
+        assert repo._append_event_now(second, event_type='note', payload={})['seq'] == 4
+        with pytest.raises(KeyError):
+            repo.append_event('task-missing', event_type='note', payload={})
+    finally:
+        repo.close()
+
+
+def test_sql_repository_batched_events_resume_after_delete(tmp_path: Path):
+    db_file = tmp_path / 'awe-extra-batch-delete.sqlite3'
+    db = Database(f"sqlite+pysqlite:///{db_file.as_posix()}")
+    db.create_schema()
+    repo = SqlTaskRepository(db, event_batch_rows=1, event_batch_interval_ms=1)
+    try:
+        task_id = _create_task(repo, tmp_path)['task_id']
+        repo.append_event(task_id, event_type='note', payload={})
+        assert repo.flush_events(timeout=5) is True
+        assert repo.delete_tasks([task_id]) == 1
+        with pytest.raises(KeyError):
+            repo.append_event(task_id, event_type='note', payload={})
+    finally:
+        repo.close()
+
+
+def test_batched_event_writer_full_queue_and_seq_collision_do_not_deadlock(tmp_path: Path, monkeypatch):
+    db_file = tmp_path / 'awe-extra-batch-full.sqlite3'
+    db = Database(f"sqlite+pysqlite:///{db_file.as_posix()}")
+    db.create_schema()
+    repo = SqlTaskRepository(db, event_batch_rows=1, event_batch_interval_ms=1, event_queue_size=1)
+    writer = repo._event_writer
+    gate = threading.Event()
+    original_insert = repo._insert_event_batch
+    calls = {'n': 0}
+
+    def blocking_insert(batch):
+        calls['n'] += 1
+        if calls['n'] == 1:
+            gate.wait(5)
+            raise IntegrityError('insert', {}, Exception('seq collision'))
+        return original_insert(batch)
+
+    monkeypatch.setattr(repo, '_insert_event_batch', blocking_insert)
+    try:
+        task_id = _create_task(repo, tmp_path)['task_id']
+        repo.append_event(task_id, event_type='note', payload={'n': 0})
+        submitter = threading.Thread(
+            target=lambda: [repo.append_event(task_id, event_type='note', payload={'n': n}) for n in (1, 2)]
+        )
+        submitter.start()
+        time.sleep(0.1)
+        # The blocked submitter waits for room without holding the seq lock.
+        assert writer._submit_lock.acquire(timeout=1)
+        writer._submit_lock.release()
+        gate.set()
+        submitter.join(5)
+        assert not submitter.is_alive()
+        assert repo.flush_events(timeout=5) is True
+        rows = repo.list_events(task_id)
+        assert sorted(row['payload']['n'] for row in rows) == [0, 1, 2]
+        assert len({row['seq'] for row in rows}) == 3
+        assert writer.failed_events == 0
+    finally:
+        gate.set()
+        repo.close()
+
+
+def test_batched_event_writer_rewrites_failed_events_with_a_reserved_seq(tmp_path: Path, monkeypatch):
+    db_file = tmp_path / 'awe-extra-batch-error.sqlite3'
+    db = Database(f"sqlite+pysqlite:///{db_file.as_posix()}")
+    db.create_schema()
+    repo = SqlTaskRepository(db, event_batch_rows=1, event_batch_interval_ms=1)
+
+    def failing_insert(batch):
+        raise RuntimeError('disk hiccup')
+
+    monkeypatch.setattr(repo, '_insert_event_batch', failing_insert)
+    try:
+        task_id = _create_task(repo, tmp_path)['task_id']
+        repo.append_event(task_id, event_type='note', payload={'n': 1})
+        assert repo.flush_events(timeout=5) is True
+        assert [row['payload'] for row in repo.list_events(task_id)] == [{'n': 1}]
+        assert repo._event_writer.failed_events == 0
+    finally:
+        repo.close()
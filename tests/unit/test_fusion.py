@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import json
+import os
 from pathlib import Path
+import threading
 import zipfile
 
-from awe_agentcheck.fusion import AutoFusionManager
+from awe_agentcheck.fusion import AutoFusionManager, ManifestHashCache
 
 
 def test_build_manifest_ignores_cache_and_git_dirs(tmp_path: Path):
@@ -108,3 +110,124 @@ def test_hash_file_changes_when_content_changes(tmp_path: Path):
     digest_2 = AutoFusionManager._hash_file(file_path)
 
     assert digest_1 != digest_2
+
+
+def test_build_manifest_hash_cache_reuses_unchanged_stat(tmp_path: Path, monkeypatch):
+    root = tmp_path / "repo"
+    root.mkdir()
+    stable = root / "stable.txt"
+    edited = root / "edited.txt"
+    stable.write_text("same\n", encoding="utf-8")
+    edited.write_text("v1\n", encoding="utf-8")
+    old_ns = 1_600_000_000 * 1_000_000_000
+    for path in (stable, edited):
+        os.utime(path, ns=(old_ns, old_ns))
+
+    mgr = AutoFusionManager(snapshot_root=tmp_path / "snapshots", hash_cache_root=tmp_path / "cache")
+    first = mgr.build_manifest(root)
+    assert (mgr.hash_cache.hits, mgr.hash_cache.misses) == (0, 2)
+    assert mgr.hash_cache.path_for(root).exists()
+
+    edited.write_text("v2\n", encoding="utf-8")
+    os.utime(edited, ns=(old_ns + 1, old_ns + 1))
+    hashed: list[str] = []
+    original_hash = AutoFusionManager._hash_file
+
+    def tracking_hash(path: Path) -> str:
+        hashed.append(path.name)
+        return original_hash(path)
+
+    monkeypatch.setattr(AutoFusionManager, "_hash_file", staticmethod(tracking_hash))
+
+    # A fresh manager picks the cache up from disk.
+    mgr2 = AutoFusionManager(snapshot_root=tmp_path / "snapshots", hash_cache_root=tmp_path / "cache")
+    second = mgr2.build_manifest(root)
+    assert hashed == ["edited.txt"]
+    assert second["stable.txt"] == first["stable.txt"]
+    assert second["edited.txt"] != first["edited.txt"]
+    assert (mgr2.hash_cache.hits, mgr2.hash_cache.misses) == (1, 1)
+
+    hashed.clear()
+    assert mgr2.build_manifest(root, full_rehash=True) == second
+    assert sorted(hashed) == ["edited.txt", "stable.txt"]
+
+
+def test_build_manifest_does_not_cache_recently_modified_files(tmp_path: Path):
+    root = tmp_path / "repo"
+    root.mkdir()
+    (root / "fresh.txt").write_text("now\n", encoding="utf-8")
+
+    mgr = AutoFusionManager(snapshot_root=tmp_path / "snapshots", hash_cache_root=tmp_path / "cache")
+    mgr.build_manifest(root)
+    mgr.build_manifest(root)
+
+    assert mgr.hash_cache.hits == 0
+    assert mgr.hash_cache.misses == 2
+
+
+def test_manifest_hash_cache_forgets_removed_workspaces_and_caps_directory(tmp_path: Path):
+    cache = ManifestHashCache(tmp_path / "cache", max_workspaces=2)
+    workspaces = [tmp_path / f"ws-{index}" for index in range(3)]
+    for index, workspace in enumerate(workspaces):
+        cache.save(workspace, {"a.txt": [1, 1, 1, "x"]})
+        os.utime(cache.path_for(workspace), (1_000 + index, 1_000 + index))
+
+    # The third save pushed the directory past the cap; the oldest file went.
+    assert not cache.path_for(workspaces[0]).exists()
+    assert cache.snapshot()["workspaces"] == 2
+    assert cache.snapshot()["pruned"] == 1
+
+    mgr = AutoFusionManager(snapshot_root=tmp_path / "snapshots", hash_cache_root=tmp_path / "cache")
+    mgr.hash_cache = cache
+    mgr.forget_manifest(workspaces[1])
+    assert not cache.path_for(workspaces[1]).exists()
+    assert cache.snapshot()["workspaces"] == 1
+
+
+def test_parallel_manifest_matches_sequential_and_streams_in_walk_order(tmp_path: Path, monkeypatch):
+    root = tmp_path / "repo"
+    (root / "pkg").mkdir(parents=True)
+    for idx in range(30):
+        (root / "pkg" / f"m{idx:02d}.py").write_text(f"value = {idx}\n", encoding="utf-8")
+    (root / "README.md").write_text("readme\n", encoding="utf-8")
+
+    sequential = AutoFusionManager(snapshot_root=tmp_path / "snapshots", hash_workers=1)
+    expected = sequential.build_manifest(root)
+
+    threads: set[str] = set()
+    original_hash = AutoFusionManager._hash_file
+
+    def tracking_hash(path: Path) -> str:
+        threads.add(threading.current_thread().name)
+        return original_hash(path)
+
+    monkeypatch.setattr(AutoFusionManager, "_hash_file", staticmethod(tracking_hash))
+    parallel = AutoFusionManager(snapshot_root=tmp_path / "snapshots", hash_workers=4)
+    streamed = list(parallel.iter_manifest(root))
+
+    assert dict(streamed) == expected
+    assert [rel for rel, _ in streamed] == ["README.md", *[f"pkg/m{idx:02d}.py" for idx in range(30)]]
+    assert threads and all(name.startswith("awe-hash") for name in threads)
+    assert AutoFusionManager(snapshot_root=tmp_path / "snapshots").hash_workers >= 1
+
+
+def test_run_with_content_store_keeps_digests_instead_of_bodies(tmp_path: Path):
+    from awe_agentcheck.storage.content_store import ContentStore
+
+    source = tmp_path / "source"
+    target = tmp_path / "target"
+    source.mkdir()
+    target.mkdir()
+    store = ContentStore(tmp_path / "store")
+    mgr = AutoFusionManager(snapshot_root=tmp_path / "snapshots", content_store=store)
+    before = mgr.build_manifest(source)
+    (source / "a.txt").write_text("alpha\n", encoding="utf-8")
+
+    result = mgr.run(task_id="task 1", source_root=source, target_root=target, before_manifest=before)
+
+    with zipfile.ZipFile(result.snapshot_path, "r") as zf:
+        meta = json.loads(zf.read("meta.json").decode("utf-8"))
+        assert not any(name.startswith("files/") for name in zf.namelist())
+    blobs = meta["content_store"]["files"]
+    assert store.blob_path(blobs["a.txt"]).read_text(encoding="utf-8") == "alpha\n"
+    assert store.read_ref(meta["content_store"]["ref"]) == blobs
@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+import threading
+
+import pytest
+
+from awe_agentcheck import fusion_merge
+from awe_agentcheck.fusion import AutoFusionManager
+from awe_agentcheck.fusion_merge import MERGE_TXN_DIRNAME, MergeTransaction, recover_merges
+from awe_agentcheck.repository import InMemoryTaskRepository
+from awe_agentcheck.service import CreateTaskInput, OrchestratorService
+from awe_agentcheck.storage.artifacts import ArtifactStore
+
+
+def _trees(tmp_path: Path) -> tuple[Path, Path]:
+    source = tmp_path / "source"
+    target = tmp_path / "target"
+    (source / "pkg").mkdir(parents=True)
+    target.mkdir()
+    (source / "a.txt").write_text("new a\n", encoding="utf-8")
+    (source / "pkg" / "b.txt").write_text("new b\n", encoding="utf-8")
+    (target / "a.txt").write_text("old a\n", encoding="utf-8")
+    (target / "gone.txt").write_text("old gone\n", encoding="utf-8")
+    return source, target
+
+
+def _interrupted(source: Path, target: Path, *, applied: int) -> MergeTransaction:
+    txn = MergeTransaction(target, "txn-1")
+    txn.begin(copies=["a.txt", "pkg/b.txt"], deletes=["gone.txt"])
+    txn.stage(source)
+    txn._set_state(fusion_merge.STATE_APPLYING)
+    for rel in txn.copies[:applied]:
+        txn._apply_copy(rel)
+    # The owning process dies, which drops its merge lock.
+    txn.lock.release()
+    return txn
+
+
+def test_interrupted_merge_rolls_forward_on_recovery(tmp_path: Path):
+    source, target = _trees(tmp_path)
+    _interrupted(source, target, applied=1)
+    assert (target / "a.txt").read_text(encoding="utf-8") == "new a\n"
+    assert not (target / "pkg" / "b.txt").exists()
+
+    assert recover_merges(target) == [{"txn_id": "txn-1", "state": "applying", "action": "rolled_forward"}]
+
+    assert (target / "a.txt").read_text(encoding="utf-8") == "new a\n"
+    assert (target / "pkg" / "b.txt").read_text(encoding="utf-8") == "new b\n"
+    assert not (target / "gone.txt").exists()
+    assert not (target / MERGE_TXN_DIRNAME / "txn-1").exists()
+    assert recover_merges(target) == []
+
+
+def test_service_start_up_recovers_merges_in_known_targets(tmp_path: Path):
+    source, target = _trees(tmp_path)
+    repository = InMemoryTaskRepository()
+    OrchestratorService(repository=repository, artifact_store=ArtifactStore(tmp_path / ".agents")).create_task(
+        CreateTaskInput(
+            sandbox_mode=False,
+            title="Merge target",
+            description="left a half-applied merge behind",
+            author_participant="codex#author-A",
+            reviewer_participants=["claude#review-B"],
+            workspace_path=str(target),
+        )
+    )
+    _interrupted(source, target, applied=1)
+
+    # A fresh process finishes the merge before any new merge runs.
+    restarted = OrchestratorService(repository=repository, artifact_store=ArtifactStore(tmp_path / ".agents"))
+    recovered = restarted.recover_pending_merges()
+
+    assert [(item["target_path"], item["action"]) for item in recovered] == [(str(target.resolve()), "rolled_forward")]
+    assert (target / "pkg" / "b.txt").read_text(encoding="utf-8") == "new b\n"
+    assert restarted.recover_pending_merges() == []
+
+
+def test_interrupted_merge_rolls_back_on_request(tmp_path: Path):
+    source, target = _trees(tmp_path)
+    txn = _interrupted(source, target, applied=2)
+    txn._apply_delete("gone.txt")
+
+    assert recover_merges(target, roll_back=True)[0]["action"] == "rolled_back"
+
+    assert (target / "a.txt").read_text(encoding="utf-8") == "old a\n"
+    assert (target / "gone.txt").read_text(encoding="utf-8") == "old gone\n"
+    assert not (target / "pkg" / "b.txt").exists()
+
+
+def test_staging_only_merge_is_discarded_without_touching_target(tmp_path: Path):
+    source, target = _trees(tmp_path)
+    txn = MergeTransaction(target, "txn-2")
+    txn.begin(copies=["a.txt"], deletes=[])
+    txn.stage(source)
+    journal = json.loads(txn.journal_path.read_text(encoding="utf-8"))
+    assert journal["state"] == "staging"
+    txn.lock.release()
+
+    assert recover_merges(target)[0]["action"] == "discarded"
+    assert (target / "a.txt").read_text(encoding="utf-8") == "old a\n"
+
+
+def test_recovery_leaves_a_live_merge_alone(tmp_path: Path):
+    source, target = _trees(tmp_path)
+    live = MergeTransaction(target, "txn-live")
+    live.begin(copies=["a.txt", "pkg/b.txt"], deletes=["gone.txt"])
+    live.stage(source)
+
+    assert recover_merges(target) == []
+    assert (live.staged_root / "pkg" / "b.txt").exists()
+
+    live.apply()
+    live.commit()
+    assert (target / "pkg" / "b.txt").read_text(encoding="utf-8") == "new b\n"
+    assert not (target / "gone.txt").exists()
+
+
+def test_merges_into_one_target_are_serialized(tmp_path: Path):
+    source, target = _trees(tmp_path)
+    first = MergeTransaction(target, "txn-a")
+    first.begin(copies=["a.txt"], deletes=[])
+    second_began = threading.Event()
+
+    def second_merge():
+        second = MergeTransaction(target, "txn-b")
+        second.begin(copies=["pkg/b.txt"], deletes=[])
+        second_began.set()
+        second.stage(source)
+        second.apply()
+        second.commit()
+
+    worker = threading.Thread(target=second_merge)
+    worker.start()
+    assert not second_began.wait(0.2)
+    first.stage(source)
+    first.apply()
+    first.commit()
+    worker.join(timeout=5)
+
+    assert second_began.is_set()
+    assert (target / "a.txt").read_text(encoding="utf-8") == "new a\n"
+    assert (target / "pkg" / "b.txt").read_text(encoding="utf-8") == "new b\n"
+
+
+def test_live_apply_raises_when_a_staged_file_is_missing(tmp_path: Path):
+    source, target = _trees(tmp_path)
+    txn = MergeTransaction(target)
+    txn.begin(copies=["a.txt", "pkg/b.txt"], deletes=[])
+    txn.stage(source)
+    (txn.staged_root / "pkg" / "b.txt").unlink()
+
+    with pytest.raises(FileNotFoundError):
+        txn.apply()
+    txn.roll_back()
+
+    assert (target / "a.txt").read_text(encoding="utf-8") == "old a\n"
+    assert recover_merges(target) == []
+
+
+def test_failed_apply_rolls_back_and_reraises(tmp_path: Path, monkeypatch):
+    source, target = _trees(tmp_path)
+    original = MergeTransaction._apply_copy
+
+    def failing(self, rel, **kwargs):
+        if rel == "pkg/b.txt":
+            raise OSError("disk full")
+        original(self, rel, **kwargs)
+
+    monkeypatch.setattr(MergeTransaction, "_apply_copy", failing)
+    with pytest.raises(OSError):
+        MergeTransaction(target).run(source, copies=["a.txt", "pkg/b.txt"], deletes=["gone.txt"])
+
+    assert (target / "a.txt").read_text(encoding="utf-8") == "old a\n"
+    assert (target / "gone.txt").exists()
+    assert not any((target / MERGE_TXN_DIRNAME).iterdir())
+
+
+def test_fusion_run_stages_copies_on_worker_threads(tmp_path: Path, monkeypatch):
+    source, target = _trees(tmp_path)
+    mgr = AutoFusionManager(snapshot_root=tmp_path / "snapshots", hash_workers=4)
+    before = {"a.txt": "0" * 64, "gone.txt": "1" * 64}
+    threads: set[str] = set()
+    original = fusion_merge._fsync_path
+
+    def tracking(path, *, directory=False):
+        if not directory:
+            threads.add(threading.current_thread().name)
+        return original(path, directory=directory)
+
+    monkeypatch.setattr(fusion_merge, "_fsync_path", tracking)
+    result = mgr.run(task_id="task-merge", source_root=source, target_root=target, before_manifest=before)
+
+    assert sorted(result.copied_files) == ["a.txt", "pkg/b.txt"]
+    assert result.deleted_files == ["gone.txt"]
+    assert (target / "pkg" / "b.txt").read_text(encoding="utf-8") == "new b\n"
+    assert not (target / "gone.txt").exists()
+    assert threads and all(name.startswith("awe-merge") for name in threads)
+    assert not any((target / MERGE_TXN_DIRNAME).iterdir())
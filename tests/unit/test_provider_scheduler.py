@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+from pathlib import Path
+import threading
+import time
+
+from awe_agentcheck.adapters import ParticipantRunner, ProviderLimit, ProviderScheduler, parse_provider_limits
+from awe_agentcheck.participants import Participant, set_extra_providers
+
+
+def _wait_until(predicate, timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, 'condition not reached'
+        time.sleep(0.01)
+
+
+def test_parse_provider_limits_normalizes_and_drops_bad_entries():
+    limits = parse_provider_limits(
+        {
+            'Codex': {'concurrency': 2, 'rate_per_minute': 30, 'burst': 4},
+            'claude:opus': 1,
+            'gemini': 'fast',
+            '': {'concurrency': 3},
+            'qwen': {'concurrency': 'x'},
+        }
+    )
+    assert limits == {
+        'codex': ProviderLimit(concurrency=2, rate_per_minute=30.0, burst=4),
+        'claude:opus': ProviderLimit(concurrency=1),
+    }
+
+
+def test_scheduler_caps_concurrency_and_reports_wait():
+    scheduler = ProviderScheduler(default_concurrency=1)
+    events: list[dict] = []
+    scheduler.add_listener(events.append)
+
+    first = scheduler.acquire('codex', task_id='task-a')
+    assert first is not None and first.wait_seconds == 0.0
+    assert scheduler.acquire('codex', task_id='task-b', timeout=0.05) is None
+    assert scheduler.acquire('claude', task_id='task-b', timeout=0.05) is not None
+
+    admitted: list[object] = []
+    worker = threading.Thread(target=lambda: admitted.append(scheduler.acquire('codex', task_id='task-b')))
+    worker.start()
+    _wait_until(lambda: scheduler.snapshot()['codex']['queued'] == 1)
+    time.sleep(0.05)
+    scheduler.release(first)
+    worker.join(5)
+
+    ticket = admitted[0]
+    assert ticket is not None and ticket.limited_by == 'concurrency'
+    assert ticket.wait_seconds > 0
+    assert events == [
+        {
+            'type': 'provider_admission_wait',
+            'provider': 'codex',
+            'model': '',
+            'task_id': 'task-b',
+            'wait_seconds': round(ticket.wait_seconds, 3),
+            'limited_by': 'concurrency',
+        }
+    ]
+    stats = scheduler.snapshot()['codex']
+    assert stats['active'] == 1
+    assert stats['admitted'] == 2
+    assert stats['waited'] == 1
+    assert stats['timeouts'] == 1
+
+
+def test_scheduler_stops_waiting_when_should_stop_turns_true():
+    scheduler = ProviderScheduler(default_concurrency=1)
+    held = scheduler.acquire('codex', task_id='task-a')
+    stop = threading.Event()
+    threading.Timer(0.1, stop.set).start()
+
+    started = time.monotonic()
+    assert scheduler.acquire('codex', task_id='task-b', timeout=30, should_stop=stop.is_set) is None
+    assert time.monotonic() - started < 5
+    stats = scheduler.snapshot()['codex']
+    assert stats['queued'] == 0
+    assert stats['timeouts'] == 0
+    scheduler.release(held)
+
+
+def test_scheduler_token_bucket_refills_over_time():
+    now = [100.0]
+    scheduler = ProviderScheduler(
+        limits={'codex': ProviderLimit(rate_per_minute=60.0, burst=2)},
+        clock=lambda: now[0],
+    )
+    for _ in range(2):
+        scheduler.release(scheduler.acquire('codex', timeout=0))
+    assert scheduler.acquire('codex', timeout=0) is None
+    now[0] += 1.0
+    ticket = scheduler.acquire('codex', timeout=0)
+    assert ticket is not None
+    scheduler.release(ticket)
+    assert scheduler.acquire('codex', timeout=0) is None
+
+
+def test_scheduler_model_limit_applies_only_to_that_model():
+    scheduler = ProviderScheduler(limits={'codex:gpt-5': ProviderLimit(concurrency=1)})
+    held = scheduler.acquire('codex', model='GPT-5')
+    assert held is not None and held.keys == ('codex', 'codex:gpt-5')
+    assert scheduler.acquire('codex', model='gpt-5', timeout=0.05) is None
+    assert scheduler.acquire('codex', model='o3', timeout=0.05) is not None
+    scheduler.release(held)
+    assert scheduler.acquire('codex', model='gpt-5', timeout=0.05) is not None
+
+
+def test_scheduler_admits_least_recently_served_task_first():
+    scheduler = ProviderScheduler(default_concurrency=1)
+    held = scheduler.acquire('codex', task_id='busy')
+    order: list[str] = []
+    lock = threading.Lock()
+
+    def launch(task_id: str) -> None:
+        ticket = scheduler.acquire('codex', task_id=task_id)
+        with lock:
+            order.append(task_id)
+        time.sleep(0.02)
+        scheduler.release(ticket)
+
+    workers = []
+    for task_id in ('busy', 'busy', 'quiet'):
+        worker = threading.Thread(target=launch, args=(task_id,))
+        worker.start()
+        workers.append(worker)
+        _wait_until(lambda n=len(workers): scheduler.snapshot()['codex']['queued'] == n)
+    scheduler.release(held)
+    for worker in workers:
+        worker.join(5)
+
+    assert order == ['quiet', 'busy', 'busy']
+
+
+def test_runner_reports_queue_timeout_when_provider_is_saturated(tmp_path: Path):
+    scheduler = ProviderScheduler(default_concurrency=1)
+    held = scheduler.acquire('qwen')
+    set_extra_providers({'qwen'})
+    try:
+        runner = ParticipantRunner(command_overrides={'qwen': 'qwen-cli'}, dry_run=False, scheduler=scheduler)
+        result = runner.run(
+            participant=Participant(participant_id='qwen#review-A', provider='qwen', alias='review-A'),
+            prompt='hello',
+            cwd=tmp_path,
+            timeout_seconds=0.1,
+        )
+    finally:
+        set_extra_providers(set())
+        scheduler.release(held)
+    assert result.returncode == 2
+    assert result.output.startswith('provider_queue_timeout provider=qwen')
+    assert scheduler.snapshot()['qwen']['timeouts'] == 1
@@ -108,6 +108,41 @@ def test_inmemory_repository_crud_and_event_paths():
     assert repo.delete_tasks([task_id]) == 0
 
 
+def test_inmemory_repository_list_events_cursor_limit_and_type_filter():
+    repo = InMemoryTaskRepository()
+    task_id = repo.create_task_record(_record())['task_id']
+    for idx in range(5):
+        repo.append_event(task_id, event_type='participant_stream', payload={'i': idx}, round_number=1)
+    repo.append_event(task_id, event_type=EventType.REVIEW, payload={'verdict': 'no_blocker'}, round_number=1)
+
+    tail = repo.list_events(task_id, after_seq=3)
+    assert [e['seq'] for e in tail] == [4, 5, 6]
+    page = repo.list_events(task_id, after_seq=1, limit=2)
+    assert [e['seq'] for e in page] == [2, 3]
+    reviews = repo.list_events(task_id, event_types=['REVIEW'])
+    assert [e['seq'] for e in reviews] == [6]
+    assert repo.list_events(task_id, after_seq=6) == []
+
+
+def test_inmemory_repository_status_index_tracks_transitions_and_deletes():
+    repo = InMemoryTaskRepository()
+    t1 = repo.create_task_record(_record())['task_id']
+    t2 = repo.create_task_record(_record())['task_id']
+    assert repo.count_tasks_by_status() == {'queued': 2}
+
+    repo.update_task_status(t1, status='running', reason=None)
+    assert repo.update_task_status_if(t2, expected_status='queued', status='running', reason=None) is not None
+    assert repo.count_tasks_by_status(['running']) == {'running': 2}
+    assert set(repo.list_task_ids_by_status('running')) == {t1, t2}
+    assert repo.update_task_status_if(t2, expected_status='queued', status='passed', reason=None) is None
+
+    repo.update_task_status(t1, status='passed', reason='passed')
+    repo.delete_tasks([t2])
+    assert repo.count_tasks_by_status() == {'passed': 1}
+    assert repo.list_task_ids_by_status('running') == []
+    assert repo.list_task_ids_by_status('passed') == [t1]
+
+
 def test_inmemory_repository_keyerror_paths():
     repo = InMemoryTaskRepository()
     with pytest.raises(KeyError):
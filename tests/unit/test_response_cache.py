@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+from pathlib import Path
+import subprocess
+
+from awe_agentcheck.adapters import AdapterResult, ParticipantResponseCache, ParticipantRunner, ProviderScheduler
+from awe_agentcheck.adapters.response_cache import WorkspaceFingerprint
+from awe_agentcheck.participants import parse_participant_id
+
+
+def _result(output: str = 'ok') -> AdapterResult:
+    return AdapterResult(output=output, verdict='no_blocker', next_action='pass', returncode=0, duration_seconds=1.5)
+
+
+def _key(cache: ParticipantResponseCache, cwd: Path, **overrides) -> str:
+    request = {
+        'provider': 'codex',
+        'model': 'gpt-5',
+        'model_params': None,
+        'claude_team_agents': False,
+        'codex_multi_agents': False,
+        'prompt': 'review this',
+        'cwd': cwd,
+    }
+    request.update(overrides)
+    return cache.key_for(**request)
+
+
+def test_cache_key_tracks_request_and_workspace_contents(tmp_path: Path):
+    workspace = tmp_path / 'ws'
+    workspace.mkdir()
+    (workspace / 'app.py').write_text('x = 1\n', encoding='utf-8')
+    (workspace / '.agents').mkdir()
+    cache = ParticipantResponseCache(tmp_path / 'cache')
+
+    base = _key(cache, workspace)
+    assert _key(cache, workspace) == base
+    assert _key(cache, workspace, prompt='review that') != base
+    assert _key(cache, workspace, codex_multi_agents=True) != base
+    assert _key(cache, workspace, model='o3') != base
+
+    (workspace / '.agents' / 'log.txt').write_text('ignored', encoding='utf-8')
+    assert _key(cache, workspace) == base
+    (workspace / 'app.py').write_text('x = 2\n', encoding='utf-8')
+    assert _key(cache, workspace) != base
+
+
+def test_workspace_fingerprint_reuses_hashes_for_unchanged_files(tmp_path: Path, monkeypatch):
+    (tmp_path / 'a.txt').write_text('a', encoding='utf-8')
+    fingerprint = WorkspaceFingerprint()
+    first = fingerprint(tmp_path)
+    hashed: list[str] = []
+    original = WorkspaceFingerprint._hash_file
+    monkeypatch.setattr(WorkspaceFingerprint, '_hash_file', staticmethod(lambda path: hashed.append(path) or original(path)))
+    assert fingerprint(tmp_path) == first
+    assert hashed == []
+
+
+def test_workspace_fingerprint_memo_is_bounded(tmp_path: Path):
+    for index in range(5):
+        (tmp_path / f'{index}.txt').write_text(str(index), encoding='utf-8')
+    fingerprint = WorkspaceFingerprint(max_files=3)
+    first = fingerprint(tmp_path)
+    assert len(fingerprint._files) == 3
+    assert fingerprint(tmp_path) == first
+
+
+def test_cache_expires_entries_after_ttl(tmp_path: Path):
+    now = [1000.0]
+    cache = ParticipantResponseCache(tmp_path, ttl_seconds=60, clock=lambda: now[0])
+    cache.put('ab' * 32, _result(), provider='codex', model=None)
+    assert cache.get('ab' * 32) == _result()
+    now[0] += 61
+    assert cache.get('ab' * 32) is None
+    assert not cache.path_for('ab' * 32).exists()
+    assert cache.snapshot()['hits'] == 1
+
+
+def test_cache_evicts_least_recently_used_entries_over_size_cap(tmp_path: Path):
+    now = [0.0]
+    probe = ParticipantResponseCache(tmp_path / 'probe')
+    probe.put('00' * 32, _result('x' * 200), provider='codex', model=None)
+    entry_bytes = probe.snapshot()['bytes']
+
+    cache = ParticipantResponseCache(tmp_path / 'cache', max_bytes=entry_bytes * 2, clock=lambda: now[0])
+    keys = [f'{index:02d}' * 32 for index in range(3)]
+    for key in keys[:2]:
+        now[0] += 1
+        cache.put(key, _result('x' * 200), provider='codex', model=None)
+    now[0] += 1
+    assert cache.get(keys[0]) is not None
+    now[0] += 1
+    cache.put(keys[2], _result('x' * 200), provider='codex', model=None)
+
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]) is not None and cache.get(keys[2]) is not None
+    snapshot = cache.snapshot()
+    assert snapshot['entries'] == 2
+    assert snapshot['evictions'] == 1
+
+    reopened = ParticipantResponseCache(tmp_path / 'cache', max_bytes=entry_bytes * 2)
+    assert reopened.snapshot()['entries'] == 2
+
+
+def test_runner_records_then_replays_without_launching(tmp_path: Path, monkeypatch):
+    launched: list[list[str]] = []
+
+    def fake_run(argv, *args, **kwargs):
+        launched.append(list(argv))
+        return subprocess.CompletedProcess(
+            args=argv,
+            returncode=0,
+            stdout='{"verdict":"BLOCKER","next_action":"retry"}',
+            stderr='',
+        )
+
+    monkeypatch.setattr('awe_agentcheck.adapters.runner.subprocess.run', fake_run)
+    workspace = tmp_path / 'ws'
+    workspace.mkdir()
+    participant = parse_participant_id('codex#review-B')
+
+    def runner_for(mode: str) -> ParticipantRunner:
+        return ParticipantRunner(
+            command_overrides={'codex': 'codex exec'},
+            scheduler=ProviderScheduler(),
+            response_cache=ParticipantResponseCache(tmp_path / 'cache', mode=mode),
+        )
+
+    recorder = runner_for('record')
+    recorded = recorder.run(participant=participant, prompt='review', cwd=workspace, timeout_seconds=5, stage='review')
+    assert recorded.verdict == 'blocker'
+    assert len(launched) == 1
+    # Implementation calls edit the workspace, so they are never cached.
+    for _ in range(2):
+        recorder.run(participant=participant, prompt='fix it', cwd=workspace, timeout_seconds=5, stage='implementation')
+    assert len(launched) == 3
+    assert recorder.response_cache.snapshot()['stores'] == 1
+
+    streamed: list[tuple[str, str]] = []
+    replayer = runner_for('replay')
+    replayed = replayer.run(
+        participant=participant,
+        prompt='review',
+        cwd=workspace,
+        timeout_seconds=5,
+        on_stream=lambda name, chunk: streamed.append((name, chunk)),
+        stage='review',
+    )
+    assert replayed == recorded
+    assert streamed == [('stdout', recorded.output)]
+
+    missed = replayer.run(participant=participant, prompt='other prompt', cwd=workspace, timeout_seconds=5, stage='review')
+    assert missed.returncode == 2
+    assert missed.output.startswith('response_cache_miss provider=codex')
+    assert len(launched) == 3
+
+
+def test_dry_run_replays_cached_answers_and_simulates_misses(tmp_path: Path):
+    workspace = tmp_path / 'ws'
+    workspace.mkdir()
+    cache = ParticipantResponseCache(tmp_path / 'cache', mode='replay')
+    participant = parse_participant_id('claude#review-A')
+    key = cache.key_for(
+        provider='claude',
+        model=None,
+        model_params=None,
+        claude_team_agents=False,
+        codex_multi_agents=False,
+        prompt='review',
+        cwd=workspace,
+    )
+    cache.put(key, _result('recorded answer'), provider='claude', model=None)
+    runner = ParticipantRunner(dry_run=True, response_cache=cache)
+
+    assert runner.run(participant=participant, prompt='review', cwd=workspace, stage='review').output == 'recorded answer'
+    assert runner.run(participant=participant, prompt='new', cwd=workspace, stage='review').output.startswith(
+        '[dry-run participant='
+    )
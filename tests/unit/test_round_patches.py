@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import difflib
+import io
+from pathlib import Path
+import random
+import threading
+
+import pytest
+
+from awe_agentcheck import round_patches
+from awe_agentcheck.round_patches import (
+    PATCH_MAX_FILE_BYTES,
+    diff_file,
+    iter_round_patch,
+    read_text_for_patch,
+    unified_hunks,
+    write_round_patch,
+)
+
+
+def test_unified_hunks_match_difflib_for_local_edits():
+    rng = random.Random(7)
+    for _ in range(50):
+        old = [f'line {idx}' for idx in range(rng.randint(0, 60))]
+        new = list(old)
+        for _edit in range(rng.randint(1, 3)):
+            pos = rng.randint(0, len(new))
+            if new and rng.random() < 0.5:
+                del new[min(pos, len(new) - 1)]
+            else:
+                new.insert(pos, f'added {rng.random():.6f}')
+        expected = list(difflib.unified_diff(old, new, lineterm=''))[2:]
+        assert list(unified_hunks(old, new)) == expected
+
+
+def test_read_text_for_patch_treats_large_nul_and_non_utf8_as_binary(tmp_path: Path):
+    (tmp_path / 'big.txt').write_bytes(b'a' * (PATCH_MAX_FILE_BYTES + 1))
+    (tmp_path / 'nul.bin').write_bytes(b'a\x00b')
+    (tmp_path / 'latin.txt').write_bytes('caf\xe9'.encode('latin-1'))
+    (tmp_path / 'ok.txt').write_text('ok\n', encoding='utf-8')
+
+    assert read_text_for_patch(tmp_path / 'big.txt') == ('', True)
+    assert read_text_for_patch(tmp_path / 'nul.bin') == ('', True)
+    assert read_text_for_patch(tmp_path / 'latin.txt') == ('', True)
+    assert read_text_for_patch(tmp_path / 'ok.txt') == ('ok\n', False)
+    assert read_text_for_patch(tmp_path / 'missing.txt') == ('', False)
+
+
+def test_diff_file_headers_for_added_deleted_and_binary(tmp_path: Path):
+    old = tmp_path / 'old'
+    new = tmp_path / 'new'
+    old.mkdir()
+    new.mkdir()
+    (new / 'added.txt').write_text('hello\n', encoding='utf-8')
+    (old / 'removed.txt').write_text('bye\n', encoding='utf-8')
+    (new / 'data.bin').write_bytes(b'\x00\x01')
+
+    assert diff_file('added.txt', old, new).splitlines()[:3] == ['--- /dev/null', '+++ b/added.txt', '@@ -0,0 +1 @@']
+    assert diff_file('removed.txt', old, new).splitlines()[:2] == ['--- a/removed.txt', '+++ /dev/null']
+    assert diff_file('data.bin', old, new) == 'diff --git a/data.bin b/data.bin\nBinary files differ\n'
+    assert diff_file('absent.txt', old, new) == ''
+
+
+def test_large_files_are_diffed_with_git_no_index(tmp_path: Path, monkeypatch):
+    if round_patches._git_executable() is None:
+        pytest.skip('git not available')
+    old = tmp_path / 'old'
+    new = tmp_path / 'new'
+    old.mkdir()
+    new.mkdir()
+    lines = [f'generated row {idx}' for idx in range(20000)]
+    (old / 'gen.txt').write_text('\n'.join(lines) + '\n', encoding='utf-8')
+    lines[10000] = 'generated row changed'
+    (new / 'gen.txt').write_text('\n'.join(lines) + '\n', encoding='utf-8')
+    calls: list[object] = []
+    original = round_patches._git_diff_hunks
+
+    def tracking(old_path, new_path):
+        result = original(old_path, new_path)
+        calls.append(result)
+        return result
+
+    monkeypatch.setattr(round_patches, '_git_diff_hunks', tracking)
+
+    chunk = diff_file('gen.txt', old, new)
+
+    assert calls and calls[0] is not None
+    assert chunk.splitlines()[:3] == ['--- a/gen.txt', '+++ b/gen.txt', '@@ -9998,7 +9998,7 @@']
+    assert '-generated row 10000' in chunk
+    assert '+generated row changed' in chunk
+
+
+def test_write_round_patch_streams_chunks_in_order_from_worker_threads(tmp_path: Path, monkeypatch):
+    old = tmp_path / 'old'
+    new = tmp_path / 'new'
+    old.mkdir()
+    new.mkdir()
+    changed = []
+    for idx in range(40):
+        rel = f'f{idx:02d}.txt'
+        (old / rel).write_text(f'v1 {idx}\n', encoding='utf-8')
+        (new / rel).write_text(f'v2 {idx}\n', encoding='utf-8')
+        changed.append(rel)
+    (old / 'same.txt').write_text('same\n', encoding='utf-8')
+    (new / 'same.txt').write_text('same\n', encoding='utf-8')
+    changed.insert(5, 'same.txt')
+    threads: set[str] = set()
+    original = round_patches.diff_file
+
+    def tracking(rel, from_root, to_root):
+        threads.add(threading.current_thread().name)
+        return original(rel, from_root, to_root)
+
+    monkeypatch.setattr(round_patches, 'diff_file', tracking)
+
+    sequential = list(iter_round_patch(old, new, changed, workers=1))
+    threads.clear()
+    buffer = io.StringIO()
+    written = write_round_patch(buffer, old, new, changed, workers=4)
+
+    assert written == 40
+    assert buffer.getvalue() == '\n'.join(sequential)
+    assert [line for line in buffer.getvalue().splitlines() if line.startswith('+++')] == [
+        f'+++ b/f{idx:02d}.txt' for idx in range(40)
+    ]
+    assert threads and all(name.startswith('awe-patch') for name in threads)
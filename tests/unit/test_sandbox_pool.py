@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+import shutil
+
+from awe_agentcheck.sandbox_pool import SandboxPool, remove_sandbox_dir
+from awe_agentcheck.repository import InMemoryTaskRepository
+from awe_agentcheck.service import CreateTaskInput, OrchestratorService
+from awe_agentcheck.storage.artifacts import ArtifactStore
+
+
+def _copy_provision(project: Path, sandbox: Path) -> None:
+    for item in project.iterdir():
+        if item.is_file():
+            shutil.copy2(item, sandbox / item.name)
+
+
+def _path_factory(base: Path):
+    counter = iter(range(1000))
+
+    def make(project: Path) -> str:
+        return str(base / f'{project.name}-{next(counter):03d}')
+
+    return make
+
+
+def test_pool_fills_hands_out_and_recycles_stale_sandboxes(tmp_path: Path):
+    project = tmp_path / 'proj'
+    project.mkdir()
+    (project / 'a.txt').write_text('v1\n', encoding='utf-8')
+    pool = SandboxPool(
+        size=2,
+        provision=_copy_provision,
+        path_factory=_path_factory(tmp_path / 'pool'),
+        refresh_seconds=30,
+    )
+    try:
+        assert pool.acquire(project) is None
+        assert pool.wait_ready(project, timeout=10)
+
+        first = pool.acquire(project)
+        assert first is not None
+        assert (first / 'a.txt').read_text(encoding='utf-8') == 'v1\n'
+        assert pool.wait_ready(project, timeout=10)
+
+        (project / 'a.txt').write_text('v2 longer\n', encoding='utf-8')
+        ready_before = sorted((tmp_path / 'pool').iterdir())
+        # Every pooled copy is stale now, so the caller provisions inline.
+        assert pool.acquire(project) is None
+        assert pool.recycled == 2
+        assert pool.wait_ready(project, timeout=10)
+        fresh = pool.acquire(project)
+        assert fresh is not None and fresh not in ready_before
+        assert (fresh / 'a.txt').read_text(encoding='utf-8') == 'v2 longer\n'
+        assert (pool.hits, pool.misses) == (2, 2)
+    finally:
+        pool.close()
+    leftovers = sorted(path.name for path in (tmp_path / 'pool').iterdir())
+    assert leftovers == sorted(path.name for path in (first, fresh))
+
+
+def test_pool_disabled_when_size_is_zero(tmp_path: Path):
+    pool = SandboxPool(size=0, provision=_copy_provision, path_factory=_path_factory(tmp_path / 'pool'))
+    pool.register(tmp_path)
+    assert pool.acquire(tmp_path) is None
+    assert not (tmp_path / 'pool').exists()
+
+
+def test_remove_sandbox_dir_handles_read_only_files(tmp_path: Path):
+    sandbox = tmp_path / 'sb'
+    sandbox.mkdir()
+    locked = sandbox / 'locked.txt'
+    locked.write_text('x\n', encoding='utf-8')
+    os.chmod(locked, 0o444)
+    assert remove_sandbox_dir(sandbox)
+    assert not sandbox.exists()
+    assert remove_sandbox_dir(sandbox)
+
+
+def test_service_create_task_takes_pooled_sandbox(tmp_path: Path, monkeypatch):
+    monkeypatch.setenv('AWE_SANDBOX_BASE', str(tmp_path / 'sandboxes'))
+    project = tmp_path / 'repo-pooled'
+    project.mkdir()
+    (project / 'README.md').write_text('hello\n', encoding='utf-8')
+    svc = OrchestratorService(
+        repository=InMemoryTaskRepository(),
+        artifact_store=ArtifactStore(tmp_path / '.agents'),
+        sandbox_pool_size=1,
+        sandbox_pool_projects=[str(project)],
+    )
+    try:
+        assert svc.sandbox_pool.wait_ready(project, timeout=10)
+        (pooled_path,) = [entry.path for entry in svc.sandbox_pool._ready[project.resolve()]]
+
+        task = svc.create_task(
+            CreateTaskInput(
+                title='Pooled',
+                description='use a pre-warmed sandbox',
+                author_participant='codex#author-A',
+                reviewer_participants=['claude#review-B'],
+                workspace_path=str(project),
+                sandbox_mode=True,
+                self_loop_mode=1,
+            )
+        )
+
+        assert Path(task.workspace_path) == pooled_path
+        assert task.sandbox_generated is True
+        assert (pooled_path / 'README.md').read_text(encoding='utf-8') == 'hello\n'
+        assert svc.sandbox_pool.hits == 1
+    finally:
+        svc.sandbox_pool.close()
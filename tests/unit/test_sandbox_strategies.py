@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+from pathlib import Path
+import subprocess
+
+from awe_agentcheck.sandbox_strategies import (
+    normalize_sandbox_strategy,
+    place_file,
+    remove_sandbox_worktree,
+    worktree_available,
+)
+from awe_agentcheck.service_layers import TaskManagementService
+
+
+def _git(root: Path, *args: str) -> str:
+    completed = subprocess.run(['git', *args], cwd=str(root), check=True, capture_output=True, text=True)
+    return completed.stdout
+
+
+def _init_repo(root: Path) -> None:
+    _git(root, 'init')
+    _git(root, 'config', 'user.name', 'test-user')
+    _git(root, 'config', 'user.email', 'test@example.com')
+    _git(root, 'add', '.')
+    _git(root, 'commit', '-m', 'init')
+
+
+def test_normalize_sandbox_strategy_defaults_to_auto():
+    assert normalize_sandbox_strategy(' Worktree ') == 'worktree'
+    assert normalize_sandbox_strategy('hardlink') == 'auto'
+    assert normalize_sandbox_strategy(None) == 'auto'
+    assert normalize_sandbox_strategy('bogus') == 'auto'
+
+
+def test_place_file_never_shares_inodes_with_the_project(tmp_path: Path):
+    large = tmp_path / 'large.bin'
+    large.write_bytes(b'x' * (2 * 1024 * 1024))
+    out = tmp_path / 'out'
+    out.mkdir()
+
+    assert place_file(large, out / 'large.bin', 'reflink') in {'cloned', 'copied'}
+    assert place_file(large, out / 'copy.bin', 'copy') == 'copied'
+    for name in ('large.bin', 'copy.bin'):
+        assert (out / name).stat().st_ino != large.stat().st_ino
+    (out / 'large.bin').write_bytes(b'changed')
+    assert large.read_bytes() == b'x' * (2 * 1024 * 1024)
+
+
+def test_worktree_bootstrap_overlays_uncommitted_changes_and_filters(tmp_path: Path):
+    project = tmp_path / 'project'
+    (project / 'src').mkdir(parents=True)
+    (project / 'src' / 'app.py').write_text('v1\n', encoding='utf-8')
+    (project / 'src' / 'gone.py').write_text('old\n', encoding='utf-8')
+    (project / '.env').write_text('SECRET=1\n', encoding='utf-8')
+    (project / '.gitignore').write_text('build/\n', encoding='utf-8')
+    _init_repo(project)
+    (project / 'src' / 'app.py').write_text('v2 dirty\n', encoding='utf-8')
+    (project / 'src' / 'gone.py').unlink()
+    (project / 'src' / 'new.py').write_text('untracked\n', encoding='utf-8')
+    (project / 'build').mkdir()
+    (project / 'build' / 'out.txt').write_text('ignored\n', encoding='utf-8')
+    (project / 'node_modules').mkdir()
+    (project / 'node_modules' / 'dep.js').write_text('x\n', encoding='utf-8')
+    sandbox = tmp_path / 'sandbox'
+    sandbox.mkdir()
+    assert worktree_available(project, sandbox)
+    assert not worktree_available(project, project / 'nested')
+
+    used = TaskManagementService._bootstrap_sandbox_workspace(project, sandbox, strategy='worktree')
+
+    assert used == 'worktree'
+    assert (sandbox / '.git').is_file()
+    assert (sandbox / 'src' / 'app.py').read_text(encoding='utf-8') == 'v2 dirty\n'
+    assert (sandbox / 'src' / 'new.py').read_text(encoding='utf-8') == 'untracked\n'
+    assert (sandbox / 'build' / 'out.txt').read_text(encoding='utf-8') == 'ignored\n'
+    assert not (sandbox / 'src' / 'gone.py').exists()
+    assert not (sandbox / '.env').exists()
+    assert not (sandbox / 'node_modules').exists()
+    # The project's own checkout is untouched.
+    assert (project / '.env').exists()
+    assert 'src/app.py' in _git(project, 'status', '--porcelain')
+
+    assert remove_sandbox_worktree(sandbox)
+    assert not sandbox.exists()
+    assert str(sandbox) not in _git(project, 'worktree', 'list')
+
+
+def test_worktree_strategy_falls_back_to_copy_outside_git(tmp_path: Path):
+    project = tmp_path / 'plain'
+    project.mkdir()
+    (project / 'a.txt').write_text('a\n', encoding='utf-8')
+    sandbox = tmp_path / 'sandbox-plain'
+    sandbox.mkdir()
+
+    used = TaskManagementService._bootstrap_sandbox_workspace(project, sandbox, strategy='worktree')
+
+    assert used == 'copy'
+    assert not (sandbox / '.git').exists()
+    assert (sandbox / 'a.txt').read_text(encoding='utf-8') == 'a\n'
+    assert TaskManagementService._bootstrap_sandbox_workspace(project, sandbox, strategy='worktree') is None
+
+
+def test_auto_strategy_reflinks_or_copies(tmp_path: Path):
+    project = tmp_path / 'proj'
+    project.mkdir()
+    (project / 'a.txt').write_text('a\n', encoding='utf-8')
+    sandbox = tmp_path / 'sandbox-auto'
+    sandbox.mkdir()
+
+    used = TaskManagementService._bootstrap_sandbox_workspace(project, sandbox, strategy='auto')
+
+    assert used in {'reflink', 'copy'}
+    assert sorted(path.name for path in sandbox.iterdir()) == ['a.txt']
+    assert (sandbox / 'a.txt').stat().st_ino != (project / 'a.txt').stat().st_ino
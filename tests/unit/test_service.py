@@ -3,17 +3,24 @@ from __future__ import annotations
 import json
 import os
 from pathlib import Path
+import shutil
 import subprocess
 import threading
 
 import pytest
 
-from awe_agentcheck.adapters import AdapterResult
+from awe_agentcheck.adapters import (
+    AdapterResult,
+    ParticipantResponseCache,
+    ParticipantRunner,
+    ProviderCircuitBreaker,
+    ProviderScheduler,
+)
 from awe_agentcheck.participants import parse_participant_id, set_extra_providers
 from awe_agentcheck.repository import InMemoryTaskRepository
 from awe_agentcheck.service import CreateTaskInput, InputValidationError, OrchestratorService
 from awe_agentcheck.storage.artifacts import ArtifactStore
-from awe_agentcheck.workflow import RunConfig, RunResult, WorkflowEngine
+from awe_agentcheck.workflow import RunConfig, RunResult, ShellCommandExecutor, WorkflowEngine
 
 
 class FakeWorkflowEngine:
@@ -278,6 +285,40 @@ class ProposalOrderWorkflowEngine:
         self.participant_timeout_seconds = 20
 
 
+class ProposalRunnerConcurrentReviewers:
+    def __init__(self, reviewers: int):
+        self.barrier = threading.Barrier(reviewers, timeout=5)
+        self.prompts: dict[str, list[str]] = {}
+
+    def run(self, *, participant, prompt, cwd, timeout_seconds=900, **kwargs):
+        pid = str(participant.participant_id)
+        if pid.startswith('codex#author'):
+            return AdapterResult(
+                output='Author proposal',
+                verdict='unknown',
+                next_action=None,
+                returncode=0,
+                duration_seconds=0.1,
+            )
+        self.prompts.setdefault(pid, []).append(str(prompt))
+        # Every reviewer of a pass must be in flight at once to get past the barrier.
+        self.barrier.wait()
+        return AdapterResult(
+            output=f'VERDICT: NO_BLOCKER\nnotes from {pid}',
+            verdict='no_blocker',
+            next_action=None,
+            returncode=0,
+            duration_seconds=0.1,
+        )
+
+
+class ProposalConcurrentWorkflowEngine:
+    def __init__(self):
+        self.runner = ProposalRunnerConcurrentReviewers(reviewers=2)
+        self.participant_timeout_seconds = 20
+        self.parallel_proposal_reviews = True
+
+
 class AutoConsensusWorkflowEngine(FakeWorkflowEngine):
     def __init__(self):
         super().__init__()
@@ -1015,6 +1056,23 @@ def test_service_create_task_accepts_stream_and_debate_modes_disabled(tmp_path:
     assert task.debate_mode is False
 
 
+def test_service_create_task_persists_parallel_reviews_opt_in(tmp_path: Path):
+    svc = build_service(tmp_path)
+    task = svc.create_task(
+        CreateTaskInput(
+            sandbox_mode=False,
+            self_loop_mode=1,
+            title='Parallel reviews',
+            description='fan reviewers out',
+            author_participant='codex#author-A',
+            reviewer_participants=['claude#review-B', 'gemini#review-C'],
+            parallel_reviews=True,
+        )
+    )
+    assert task.parallel_reviews is True
+    assert svc.get_task(task.task_id).parallel_reviews is True
+
+
 def test_service_create_task_rejects_invalid_conversation_language(tmp_path: Path):
     svc = build_service(tmp_path)
     with pytest.raises(ValueError, match='invalid conversation_language'):
@@ -1391,13 +1449,15 @@ def test_service_sandbox_bootstrap_skips_windows_reserved_filenames(tmp_path: Pa
 
     copied: list[tuple[Path, Path]] = []
 
-    def fake_walk(_root):
-        yield str(project), [], ['README.md', 'nul', 'COM1.txt', 'notes.txt']
+    def fake_walk(_root, *, exclude=None, **_kwargs):
+        for rel in ['README.md', 'nul', 'COM1.txt', 'notes.txt']:
+            if exclude is None or not exclude(rel):
+                yield rel, None
 
     def fake_copy2(src, dst):
         copied.append((Path(src), Path(dst)))
 
-    monkeypatch.setattr('awe_agentcheck.service.os.walk', fake_walk)
+    monkeypatch.setattr('awe_agentcheck.service_layers.task_management.walk_workspace', fake_walk)
     monkeypatch.setattr('awe_agentcheck.service.shutil.copy2', fake_copy2)
 
     OrchestratorService._bootstrap_sandbox_workspace(project, sandbox)
@@ -1699,6 +1759,278 @@ def test_service_multi_round_no_auto_merge_writes_round_artifacts_and_supports_p
     assert (project / 'src' / 'round.txt').read_text(encoding='utf-8') == 'round-2\n'
 
 
+def test_service_store_mode_promotes_rounds_without_keeping_snapshot_trees(tmp_path: Path):
+    project = tmp_path / 'project-store-rounds'
+    project.mkdir()
+    (project / 'README.md').write_text('base\n', encoding='utf-8')
+    svc = OrchestratorService(
+        repository=InMemoryTaskRepository(),
+        artifact_store=ArtifactStore(tmp_path / '.agents'),
+        workflow_engine=FakeWorkflowEngineTwoRoundsWithChanges(),
+        round_snapshot_mode='store',
+    )
+    created = svc.create_task(
+        CreateTaskInput(
+            title='Store rounds',
+            description='promote from content-store refs',
+            author_participant='codex#author-A',
+            reviewer_participants=['claude#review-B'],
+            workspace_path=str(project),
+            sandbox_mode=False,
+            auto_merge=False,
+            max_rounds=2,
+            self_loop_mode=1,
+        )
+    )
+    assert svc.start_task(created.task_id).status.value == 'passed'
+    rounds_root = tmp_path / '.agents' / 'threads' / created.task_id / 'artifacts' / 'rounds'
+    assert 'round-1' in (rounds_root / 'round-1.patch').read_text(encoding='utf-8')
+    assert not list(rounds_root.glob('round-*-snapshot'))
+
+    promoted = svc.promote_selected_round(created.task_id, round_number=1, merge_target_path=str(project))
+
+    assert promoted['round'] == 1
+    assert (project / 'src' / 'round.txt').read_text(encoding='utf-8') == 'round-1\n'
+    assert not list(rounds_root.glob('round-*-snapshot'))
+
+
+def test_service_round_snapshots_hardlink_unchanged_files(tmp_path: Path):
+    workspace = tmp_path / 'ws-link'
+    (workspace / 'src').mkdir(parents=True)
+    (workspace / 'src' / 'same.txt').write_text('same\n', encoding='utf-8')
+    (workspace / 'src' / 'edit.txt').write_text('v1\n', encoding='utf-8')
+    svc = OrchestratorService(
+        repository=InMemoryTaskRepository(),
+        artifact_store=ArtifactStore(tmp_path / '.agents'),
+        workflow_engine=FakeWorkflowEngine(),
+        round_snapshot_mode='link',
+    )
+    assert svc.content_store is None
+
+    baseline = svc._initialize_round_artifact_baseline(task_id='task-link', workspace_root=workspace)
+    (workspace / 'src' / 'edit.txt').write_text('v2 changed\n', encoding='utf-8')
+    (workspace / 'src' / 'new.txt').write_text('new\n', encoding='utf-8')
+    meta, snapshot = svc._capture_round_artifacts(
+        task_id='task-link',
+        round_no=1,
+        previous_snapshot=baseline,
+        workspace_root=workspace,
+        gate_reason='passed',
+        gate_status='passed',
+    )
+
+    assert (snapshot / 'src' / 'same.txt').stat().st_ino == (baseline / 'src' / 'same.txt').stat().st_ino
+    assert (snapshot / 'src' / 'edit.txt').stat().st_ino != (baseline / 'src' / 'edit.txt').stat().st_ino
+    assert (snapshot / 'src' / 'edit.txt').read_text(encoding='utf-8') == 'v2 changed\n'
+    assert (baseline / 'src' / 'edit.txt').read_text(encoding='utf-8') == 'v1\n'
+    assert meta['snapshot_mode'] == 'link'
+    assert meta['snapshot_files']['linked'] == 1
+    assert meta['snapshot_files']['cloned'] + meta['snapshot_files']['copied'] == 2
+    assert meta['modified_files'] == ['src/edit.txt']
+    assert meta['added_files'] == ['src/new.txt']
+
+    copy_svc = OrchestratorService(
+        repository=InMemoryTaskRepository(),
+        artifact_store=ArtifactStore(tmp_path / '.agents-copy'),
+        workflow_engine=FakeWorkflowEngine(),
+        round_snapshot_mode='copy',
+    )
+    copy_baseline = copy_svc._initialize_round_artifact_baseline(task_id='task-copy', workspace_root=workspace)
+    copy_meta, copy_snapshot = copy_svc._capture_round_artifacts(
+        task_id='task-copy',
+        round_no=1,
+        previous_snapshot=copy_baseline,
+        workspace_root=workspace,
+        gate_reason='passed',
+        gate_status='passed',
+    )
+    assert copy_meta['snapshot_files'] == {'linked': 0, 'cloned': 0, 'copied': 3}
+    assert (copy_snapshot / 'src' / 'same.txt').stat().st_ino != (copy_baseline / 'src' / 'same.txt').stat().st_ino
+
+
+def test_service_round_snapshots_share_content_store_blobs_and_restore(tmp_path: Path):
+    workspace = tmp_path / 'ws-store'
+    workspace.mkdir()
+    (workspace / 'same.txt').write_text('same\n', encoding='utf-8')
+    (workspace / 'edit.txt').write_text('v1\n', encoding='utf-8')
+    svc = OrchestratorService(
+        repository=InMemoryTaskRepository(),
+        artifact_store=ArtifactStore(tmp_path / '.agents'),
+        workflow_engine=FakeWorkflowEngine(),
+        round_snapshot_mode='store',
+    )
+    assert build_service(tmp_path / 'default').round_snapshot_mode == 'copy'
+
+    baseline = svc._initialize_round_artifact_baseline(task_id='task-store', workspace_root=workspace)
+    (workspace / 'edit.txt').write_text('v2\n', encoding='utf-8')
+    (workspace / 'new.txt').write_text('new\n', encoding='utf-8')
+    meta, snapshot = svc._capture_round_artifacts(
+        task_id='task-store',
+        round_no=1,
+        previous_snapshot=baseline,
+        workspace_root=workspace,
+        gate_reason='passed',
+        gate_status='passed',
+    )
+    svc._initialize_round_artifact_baseline(task_id='task-other', workspace_root=workspace)
+
+    # Store mode keeps refs only: no snapshot trees and no patch scratch are left behind.
+    rounds_root = svc._round_artifacts_root('task-store')
+    assert not baseline.exists() and not snapshot.exists()
+    assert sorted(path.name for path in rounds_root.iterdir() if path.is_dir()) == []
+    store = svc.content_store
+    assert meta['snapshot_mode'] == 'store'
+    assert meta['snapshot_files'] == {'linked': 0, 'cloned': 0, 'copied': 0, 'stored': 3}
+    assert meta['modified_files'] == ['edit.txt']
+    assert meta['added_files'] == ['new.txt']
+    patch = Path(meta['patch_path']).read_text(encoding='utf-8')
+    assert '-v1' in patch and '+v2' in patch and '+++ b/new.txt' in patch
+    assert 'same.txt' not in patch
+    same_digest = store.read_ref('tasks/task-store/round-000')['same.txt']
+    assert store.read_ref('tasks/task-store/round-001')['same.txt'] == same_digest
+    assert store.read_ref('tasks/task-other/round-000')['same.txt'] == same_digest
+
+    # A tree is rebuilt from its ref on demand and does not share the blob's inode.
+    restored = svc._restore_round_snapshot('task-store', rounds_root, 1)
+    assert (restored / 'edit.txt').read_text(encoding='utf-8') == 'v2\n'
+    assert (restored / 'same.txt').stat().st_ino != store.blob_path(same_digest).stat().st_ino
+    (restored / 'same.txt').write_text('tampered\n', encoding='utf-8')
+    assert store.blob_path(same_digest).read_text(encoding='utf-8') == 'same\n'
+
+    svc._release_round_snapshot_refs(['task-store'])
+    assert store.read_ref('tasks/task-store/round-001') is None
+    assert store.read_ref('tasks/task-other/round-000') is not None
+
+
+def test_service_round_snapshots_use_git_trees_for_repo_workspaces(tmp_path: Path):
+    workspace = tmp_path / 'ws-git'
+    workspace.mkdir()
+    (workspace / 'edit.txt').write_text('v1\n', encoding='utf-8')
+    (workspace / 'gone.txt').write_text('bye\n', encoding='utf-8')
+    init_git_repo(workspace)
+    head_before = subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=str(workspace), capture_output=True, text=True).stdout
+    svc = OrchestratorService(
+        repository=InMemoryTaskRepository(),
+        artifact_store=ArtifactStore(tmp_path / '.agents'),
+        workflow_engine=FakeWorkflowEngine(),
+        round_snapshot_mode='git',
+    )
+
+    baseline = svc._initialize_round_artifact_baseline(task_id='task-git', workspace_root=workspace)
+    assert not baseline.exists()
+    (workspace / 'edit.txt').write_text('v2\n', encoding='utf-8')
+    (workspace / 'gone.txt').unlink()
+    (workspace / 'new.txt').write_text('new\n', encoding='utf-8')
+    meta, snapshot = svc._capture_round_artifacts(
+        task_id='task-git',
+        round_no=1,
+        previous_snapshot=baseline,
+        workspace_root=workspace,
+        gate_reason='passed',
+        gate_status='passed',
+    )
+
+    assert meta['snapshot_mode'] == 'git'
+    assert meta['added_files'] == ['new.txt']
+    assert meta['deleted_files'] == ['gone.txt']
+    assert meta['modified_files'] == ['edit.txt']
+    patch = Path(meta['patch_path']).read_text(encoding='utf-8')
+    assert 'diff --git a/edit.txt b/edit.txt' in patch
+    assert '+v2' in patch
+    refs = subprocess.run(
+        ['git', 'for-each-ref', '--format=%(refname)', 'refs/awe/'],
+        cwd=str(workspace),
+        capture_output=True,
+        text=True,
+    ).stdout.split()
+    assert refs == ['refs/awe/task-git/round-0', 'refs/awe/task-git/round-1']
+    # The repository's own index and HEAD are untouched.
+    assert subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=str(workspace), capture_output=True, text=True).stdout == head_before
+    staged = subprocess.run(['git', 'diff', '--cached', '--name-only'], cwd=str(workspace), capture_output=True, text=True)
+    assert staged.stdout.strip() == ''
+
+    rounds_root = svc._round_artifacts_root('task-git')
+    restored = svc._restore_round_snapshot('task-git', rounds_root, 1)
+    assert restored == snapshot
+    assert (restored / 'edit.txt').read_text(encoding='utf-8') == 'v2\n'
+    assert not (restored / 'gone.txt').exists()
+    restored_baseline = svc._restore_round_snapshot('task-git', rounds_root, 0)
+    assert (restored_baseline / 'gone.txt').read_text(encoding='utf-8') == 'bye\n'
+
+    svc._release_round_snapshot_refs(['task-git'])
+    refs = subprocess.run(
+        ['git', 'for-each-ref', '--format=%(refname)', 'refs/awe/'],
+        cwd=str(workspace),
+        capture_output=True,
+        text=True,
+    ).stdout.split()
+    assert refs == []
+
+
+def test_service_git_snapshot_patch_keeps_trailing_blank_context_line(tmp_path: Path):
+    workspace = tmp_path / 'ws-git'
+    workspace.mkdir()
+    (workspace / 'code.txt').write_text('one\ntwo\nthree\n\n', encoding='utf-8')
+    init_git_repo(workspace)
+    svc = OrchestratorService(
+        repository=InMemoryTaskRepository(),
+        artifact_store=ArtifactStore(tmp_path / '.agents'),
+        workflow_engine=FakeWorkflowEngine(),
+        round_snapshot_mode='git',
+    )
+
+    baseline = svc._initialize_round_artifact_baseline(task_id='task-git', workspace_root=workspace)
+    (workspace / 'code.txt').write_text('one\ntwo\nTHREE\n\n', encoding='utf-8')
+    meta, _ = svc._capture_round_artifacts(
+        task_id='task-git',
+        round_no=1,
+        previous_snapshot=baseline,
+        workspace_root=workspace,
+        gate_reason='passed',
+        gate_status='passed',
+    )
+
+    patch = Path(meta['patch_path']).read_text(encoding='utf-8')
+    # The hunk ends with the blank line as context: " \n".
+    assert patch.endswith('+THREE\n \n')
+    subprocess.run(['git', 'stash'], cwd=str(workspace), check=True, capture_output=True)
+    applied = subprocess.run(
+        ['git', 'apply', '--check', meta['patch_path']],
+        cwd=str(workspace),
+        capture_output=True,
+        text=True,
+    )
+    assert applied.returncode == 0, applied.stderr
+
+
+def test_service_git_snapshot_mode_falls_back_to_copy_outside_repo(tmp_path: Path):
+    workspace = tmp_path / 'ws-plain'
+    workspace.mkdir()
+    (workspace / 'a.txt').write_text('v1\n', encoding='utf-8')
+    svc = OrchestratorService(
+        repository=InMemoryTaskRepository(),
+        artifact_store=ArtifactStore(tmp_path / '.agents'),
+        workflow_engine=FakeWorkflowEngine(),
+        round_snapshot_mode='git',
+    )
+
+    baseline = svc._initialize_round_artifact_baseline(task_id='task-plain', workspace_root=workspace)
+    (workspace / 'a.txt').write_text('v2\n', encoding='utf-8')
+    meta, snapshot = svc._capture_round_artifacts(
+        task_id='task-plain',
+        round_no=1,
+        previous_snapshot=baseline,
+        workspace_root=workspace,
+        gate_reason='passed',
+        gate_status='passed',
+    )
+
+    assert (baseline / 'a.txt').read_text(encoding='utf-8') == 'v1\n'
+    assert (snapshot / 'a.txt').read_text(encoding='utf-8') == 'v2\n'
+    assert meta['snapshot_mode'] == 'copy'
+    assert meta['modified_files'] == ['a.txt']
+
+
 def test_service_start_task_runs_workflow_and_records_events(tmp_path: Path):
     svc = build_service(tmp_path)
     created = svc.create_task(
@@ -2163,6 +2495,44 @@ def test_service_stats_bucket_watchdog_timeout(tmp_path: Path):
     assert stats.reason_bucket_counts.get('watchdog_timeout') == 1
 
 
+class _NoRunningScanRepository(InMemoryTaskRepository):
+    def list_task_ids_by_status(self, status: str, *, limit: int | None = None) -> list[str]:
+        raise AssertionError('the running limit is checked with count_tasks_by_status')
+
+
+def test_service_running_limit_counts_running_tasks_without_listing_them(tmp_path: Path):
+    svc = OrchestratorService(
+        repository=_NoRunningScanRepository(),
+        artifact_store=ArtifactStore(tmp_path / '.agents'),
+        workflow_engine=FakeWorkflowEngine(),
+        max_concurrent_running_tasks=1,
+    )
+    tasks = [
+        svc.create_task(
+            CreateTaskInput(
+                sandbox_mode=False,
+                self_loop_mode=1,
+                title=f'T{idx}',
+                description='d',
+                author_participant='claude#author-A',
+                reviewer_participants=['codex#review-B'],
+            )
+        )
+        for idx in range(3)
+    ]
+    svc.repository.update_task_status(tasks[0].task_id, status='running', reason=None, rounds_completed=0)
+
+    assert svc._count_running_tasks() == 1
+    assert svc._count_running_tasks(exclude_task_id=tasks[0].task_id) == 0
+    assert svc._try_claim_running_capacity(tasks[1].task_id) == (False, 1)
+    svc.repository.update_task_status(tasks[0].task_id, status='passed', reason='passed')
+    assert svc._try_claim_running_capacity(tasks[1].task_id) == (True, 0)
+    # A claimed slot counts until its task is marked running, and is not counted twice after.
+    assert svc._try_claim_running_capacity(tasks[2].task_id) == (False, 1)
+    svc.repository.update_task_status(tasks[1].task_id, status='running', reason=None, rounds_completed=0)
+    assert svc._try_claim_running_capacity(tasks[2].task_id) == (False, 1)
+
+
 def test_service_start_task_is_deferred_when_running_limit_reached(tmp_path: Path):
     svc = build_service(tmp_path, max_concurrent_running_tasks=1)
     t1 = svc.create_task(
@@ -2245,7 +2615,8 @@ def test_service_stats_include_recent_rates_and_duration(tmp_path: Path):
     svc.repository.items[t3.task_id]['created_at'] = '2026-02-12T00:00:00+00:00'
     svc.repository.items[t3.task_id]['updated_at'] = '2026-02-12T00:02:00+00:00'
 
-    stats = svc.get_stats()
+    # Rows were edited behind the repository's back, so ask for a rebuild.
+    stats = svc.get_stats(refresh=True)
     assert stats.recent_terminal_total == 3
     assert stats.pass_rate_50 == 1 / 3
     assert stats.failed_gate_rate_50 == 1 / 3
@@ -2374,6 +2745,60 @@ def test_service_manual_mode_uses_reviewer_first_before_author_proposal(tmp_path
     assert calls.index('codex#author-A') < len(calls) - 1
 
 
+def test_service_parallel_proposal_reviews_share_context_and_record_in_order(tmp_path: Path):
+    engine = ProposalConcurrentWorkflowEngine()
+    svc = OrchestratorService(
+        repository=InMemoryTaskRepository(),
+        artifact_store=ArtifactStore(tmp_path / '.agents'),
+        workflow_engine=engine,
+    )
+    created = svc.create_task(
+        CreateTaskInput(
+            sandbox_mode=False,
+            self_loop_mode=0,
+            title='Parallel proposal review',
+            description='reviewers run side by side',
+            author_participant='codex#author-A',
+            reviewer_participants=['claude#review-B', 'gemini#review-C'],
+        )
+    )
+
+    started = svc.start_task(created.task_id)
+    assert started.status.value == 'waiting_manual'
+
+    events = svc.list_events(created.task_id)
+    assert not any(str(e['type']).endswith('_review_error') for e in events)
+    reviews = [e['payload'] for e in events if e['type'] == 'proposal_review']
+    assert reviews
+    for offset in range(0, len(reviews), 2):
+        assert [r['participant'] for r in reviews[offset:offset + 2]] == ['claude#review-B', 'gemini#review-C']
+    # The second reviewer does not see the first reviewer's feedback in the same pass.
+    assert not any('notes from claude#review-B' in prompt for prompt in engine.runner.prompts['gemini#review-C'][:1])
+
+
+def test_service_parallel_proposal_reviews_leave_per_provider_limits_to_the_scheduler(tmp_path: Path):
+    engine = ProposalConcurrentWorkflowEngine()
+    svc = OrchestratorService(
+        repository=InMemoryTaskRepository(),
+        artifact_store=ArtifactStore(tmp_path / '.agents'),
+        workflow_engine=engine,
+    )
+    created = svc.create_task(
+        CreateTaskInput(
+            sandbox_mode=False,
+            self_loop_mode=0,
+            title='Same-provider proposal review',
+            description='two claude reviewers run side by side',
+            author_participant='codex#author-A',
+            reviewer_participants=['claude#review-B', 'claude#review-C'],
+        )
+    )
+
+    assert svc.start_task(created.task_id).status.value == 'waiting_manual'
+    events = svc.list_events(created.task_id)
+    assert not any(str(e['type']).endswith('_review_error') for e in events)
+
+
 def test_service_self_loop_auto_mode_still_uses_reviewer_consensus_first(tmp_path: Path):
     engine = AutoConsensusWorkflowEngine()
     svc = OrchestratorService(
@@ -3061,6 +3486,39 @@ def test_service_clear_project_history_include_non_terminal_removes_all_scoped_t
     assert not (thread_root / t3.task_id).exists()
 
 
+def test_service_clear_project_history_forgets_round_snapshot_manifest_caches(tmp_path: Path):
+    project = tmp_path / 'project-manifest-cache'
+    project.mkdir()
+    (project / 'README.md').write_text('base\n', encoding='utf-8')
+    svc = build_service(tmp_path, workflow_engine=FakeWorkflowEngineTwoRoundsWithChanges())
+    created = svc.create_task(
+        CreateTaskInput(
+            title='Manifest cache cleanup',
+            description='round snapshots leave manifest caches behind',
+            author_participant='codex#author-A',
+            reviewer_participants=['claude#review-B'],
+            workspace_path=str(project),
+            sandbox_mode=False,
+            auto_merge=False,
+            max_rounds=2,
+            self_loop_mode=1,
+        )
+    )
+    assert svc.start_task(created.task_id).status.value == 'passed'
+
+    cache = svc.fusion_manager.hash_cache
+    rounds_root = tmp_path / '.agents' / 'threads' / created.task_id / 'artifacts' / 'rounds'
+    snapshot_cache = cache.path_for(rounds_root / 'round-001-snapshot')
+    assert snapshot_cache.exists()
+    stats = svc.get_analytics()['manifest_cache']
+    assert stats['workspaces'] >= 3
+    assert stats['misses'] > 0
+
+    svc.clear_project_history(project_path=str(project), include_non_terminal=True)
+    assert not snapshot_cache.exists()
+    assert not cache.path_for(rounds_root / 'round-000-snapshot').exists()
+
+
 def test_service_clear_project_history_removes_history_only_artifact_records(tmp_path: Path):
     svc = build_service(tmp_path)
     project_root = tmp_path / 'repo-history-only'
@@ -3234,6 +3692,94 @@ def test_service_policy_templates_return_recommended_profile(tmp_path: Path):
     assert deep_defaults['self_loop_mode'] == 1
 
 
+def test_service_records_provider_admission_waits(tmp_path: Path):
+    scheduler = ProviderScheduler(default_concurrency=1)
+    svc = OrchestratorService(
+        repository=InMemoryTaskRepository(),
+        artifact_store=ArtifactStore(tmp_path / '.agents'),
+        workflow_engine=FakeWorkflowEngine(),
+        provider_scheduler=scheduler,
+    )
+    project = tmp_path / 'admission-repo'
+    project.mkdir()
+    task = svc.create_task(
+        CreateTaskInput(
+            sandbox_mode=False,
+            self_loop_mode=1,
+            auto_merge=False,
+            title='Admission task',
+            description='queue behind a busy provider',
+            author_participant='codex#author-A',
+            reviewer_participants=['claude#review-B'],
+            workspace_path=str(project),
+            max_rounds=1,
+        )
+    )
+    held = scheduler.acquire('codex', task_id='other-task')
+    worker = threading.Thread(target=lambda: scheduler.release(scheduler.acquire('codex', task_id=task.task_id)))
+    worker.start()
+    threading.Timer(0.05, scheduler.release, args=(held,)).start()
+    worker.join(5)
+
+    waits = [event for event in svc.list_events(task.task_id) if event['type'] == 'provider_admission_wait']
+    assert len(waits) == 1
+    assert waits[0]['payload']['provider'] == 'codex'
+    assert waits[0]['payload']['limited_by'] == 'concurrency'
+    admission = svc.get_analytics()['provider_admission']
+    assert admission['codex']['waited'] == 1
+    assert admission['codex']['active'] == 0
+
+
+def test_service_records_provider_circuit_events(tmp_path: Path):
+    breaker = ProviderCircuitBreaker(failure_threshold=1, fallbacks={'claude': ('codex',)})
+    svc = OrchestratorService(
+        repository=InMemoryTaskRepository(),
+        artifact_store=ArtifactStore(tmp_path / '.agents'),
+        workflow_engine=FakeWorkflowEngine(),
+        circuit_breaker=breaker,
+    )
+    project = tmp_path / 'circuit-repo'
+    project.mkdir()
+    task = svc.create_task(
+        CreateTaskInput(
+            sandbox_mode=False,
+            self_loop_mode=1,
+            auto_merge=False,
+            title='Circuit task',
+            description='claude is rate limited',
+            author_participant='codex#author-A',
+            reviewer_participants=['claude#review-B'],
+            workspace_path=str(project),
+            max_rounds=1,
+        )
+    )
+    breaker.record('claude', returncode=2, output='provider_limit provider=claude', task_id=task.task_id)
+    breaker.route('claude', available={'codex'}, participant_id='claude#review-B', task_id=task.task_id)
+
+    types = [event['type'] for event in svc.list_events(task.task_id)]
+    assert 'provider_circuit_state' in types
+    assert 'provider_fallback_routed' in types
+    assert svc.get_analytics()['provider_circuits']['claude']['state'] == 'open'
+
+
+def test_service_analytics_reports_response_cache_stats(tmp_path: Path):
+    cache = ParticipantResponseCache(tmp_path / 'response-cache', mode='replay')
+    svc = OrchestratorService(
+        repository=InMemoryTaskRepository(),
+        artifact_store=ArtifactStore(tmp_path / '.agents'),
+        workflow_engine=WorkflowEngine(
+            runner=ParticipantRunner(dry_run=True, response_cache=cache),
+            command_executor=ShellCommandExecutor(),
+        ),
+    )
+    assert cache.get('ab' * 32) is None
+
+    stats = svc.get_analytics()['response_cache']
+    assert stats['mode'] == 'replay'
+    assert stats['misses'] == 1
+    assert stats['entries'] == 0
+
+
 def test_service_analytics_reports_failure_taxonomy_and_reviewer_drift(tmp_path: Path):
     svc = build_service(tmp_path)
     project = tmp_path / 'analytics-repo'
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime, timedelta
 import json
 from pathlib import Path
 import re
+import threading
 
 import pytest
 
@@ -16,7 +18,11 @@ from awe_agentcheck.service_layers import (
     HistoryService,
     MemoryDeps,
     MemoryService,
+    TaskEventBroker,
+    TaskUpdateStream,
+    format_sse,
 )
+from awe_agentcheck.repository import InMemoryTaskRepository, TaskCreateRecord
 from awe_agentcheck.storage.artifacts import ArtifactStore
 
 
@@ -430,3 +436,291 @@ def test_memory_service_persists_queries_and_clears(tmp_path: Path):
     assert clear_res['remaining'] >= 1
     clear_all = service.clear_entries(project_path=row['project_path'], include_pinned=True)
     assert clear_all['remaining'] == 0
+
+
+def _stream_record() -> TaskCreateRecord:
+    return TaskCreateRecord(
+        title='stream',
+        description='stream',
+        author_participant='codex#author-A',
+        reviewer_participants=['claude#review-B'],
+        evolution_level=0,
+        evolve_until=None,
+        conversation_language='en',
+        provider_models={},
+        provider_model_params={},
+        participant_models={},
+        participant_model_params={},
+        claude_team_agents=False,
+        codex_multi_agents=False,
+        claude_team_agents_overrides={},
+        codex_multi_agents_overrides={},
+        repair_mode='balanced',
+        plain_mode=True,
+        stream_mode=True,
+        debate_mode=True,
+        auto_merge=False,
+        merge_target_path=None,
+        sandbox_mode=False,
+        sandbox_workspace_path=None,
+        sandbox_generated=False,
+        sandbox_cleanup_on_pass=False,
+        project_path='.',
+        self_loop_mode=1,
+        workspace_path='.',
+        workspace_fingerprint={},
+        max_rounds=1,
+        test_command='py -m pytest -q',
+        lint_command='py -m ruff check .',
+    )
+
+
+def test_task_update_stream_resumes_from_cursor_and_pushes_new_rows():
+    repo = InMemoryTaskRepository()
+    broker = TaskEventBroker()
+    assert broker.attach(repo) is True
+    task_id = repo.create_task_record(_stream_record())['task_id']
+    for idx in range(3):
+        repo.append_event(task_id, event_type='discussion', payload={'i': idx}, round_number=1)
+
+    stream = TaskUpdateStream(broker=broker, get_task=repo.get_task, list_events=repo.list_events, page_size=10)
+
+    async def consume() -> None:
+        messages = stream.aiter_messages(task_id=task_id, after_seq=1, heartbeat_seconds=0.05)
+        assert (await anext(messages)).event == 'ready'
+        task_message = await anext(messages)
+        assert task_message.event == 'task'
+        assert task_message.data['status'] == 'queued'
+        assert [(await anext(messages)).id for _ in range(2)] == ['2', '3']
+
+        repo.update_task_status(task_id, status='running', reason=None)
+        repo.append_event(task_id, event_type='review', payload={'verdict': 'no_blocker'}, round_number=1)
+        pushed = await anext(messages)
+        assert pushed.event == 'task'
+        assert pushed.data['status'] == 'running'
+        event_message = await anext(messages)
+        assert event_message.event == 'task_event'
+        assert event_message.id == '4'
+        assert event_message.data['type'] == 'review'
+        assert (await anext(messages)).event == 'heartbeat'
+        await messages.aclose()
+
+    asyncio.run(consume())
+
+
+def test_async_task_update_stream_awaits_broker_and_reads_rows_off_the_loop():
+    repo = InMemoryTaskRepository()
+    broker = TaskEventBroker()
+    broker.attach(repo)
+    task_id = repo.create_task_record(_stream_record())['task_id']
+    repo.append_event(task_id, event_type='discussion', payload={'i': 0}, round_number=1)
+    reader_threads: set[int] = set()
+
+    def list_events(*args, **kwargs):
+        reader_threads.add(threading.get_ident())
+        return repo.list_events(*args, **kwargs)
+
+    stream = TaskUpdateStream(broker=broker, get_task=repo.get_task, list_events=list_events, page_size=10)
+
+    async def consume() -> tuple[list, int]:
+        messages = stream.aiter_messages(task_id=task_id, heartbeat_seconds=5)
+        received = [await anext(messages) for _ in range(3)]
+        # Published from another thread while the generator is parked on the broker.
+        threading.Timer(
+            0.05,
+            repo.append_event,
+            args=(task_id,),
+            kwargs={'event_type': 'review', 'payload': {'verdict': 'no_blocker'}, 'round_number': 1},
+        ).start()
+        received.append(await asyncio.wait_for(anext(messages), timeout=2))
+        await messages.aclose()
+        return received, threading.get_ident()
+
+    received, loop_thread = asyncio.run(consume())
+    assert [m.event for m in received] == ['ready', 'task', 'task_event', 'task_event']
+    assert [m.id for m in received[2:]] == ['1', '2']
+    assert loop_thread not in reader_threads
+    assert not broker._async_waiters
+
+
+def test_async_task_event_broker_times_out_without_changes():
+    broker = TaskEventBroker()
+    broker.publish('task_updated', {'task_id': 't1'})
+
+    async def wait() -> tuple:
+        return await broker.await_changes(1, timeout=0.05), await broker.await_changes(0, timeout=0)
+
+    (idle, ready) = asyncio.run(wait())
+    assert idle == (1, [], False)
+    assert [c.task_id for c in ready[1]] == ['t1']
+
+
+def test_task_event_broker_reports_gap_when_backlog_overflows():
+    broker = TaskEventBroker(backlog=16)
+    for idx in range(40):
+        broker.publish('task_updated', {'task_id': f'task-{idx}'})
+    version, changes, gap = asyncio.run(broker.await_changes(0, timeout=0))
+    assert version == 40
+    assert len(changes) == 16
+    assert gap is True
+    _version, changes, gap = asyncio.run(broker.await_changes(39, timeout=0))
+    assert [c.task_id for c in changes] == ['task-39']
+    assert gap is False
+
+
+def test_format_sse_renders_id_event_and_heartbeat_comment():
+    stream_broker = TaskEventBroker()
+    stream = TaskUpdateStream(broker=stream_broker, get_task=lambda _task_id: None, list_events=lambda *_a, **_k: [])
+    ready = asyncio.run(anext(stream.aiter_messages()))
+    assert format_sse(ready).startswith('event: ready\ndata: ')
+    rendered = format_sse(type(ready)(event='task_event', data={'seq': 7}, id='7'))
+    assert rendered == 'id: 7\nevent: task_event\ndata: {"seq": 7}\n\n'
+    assert format_sse(type(ready)(event='heartbeat', data={})) == ': heartbeat\n\n'
+
+
+class _CountingRepo(InMemoryTaskRepository):
+    def __init__(self):
+        super().__init__()
+        self.list_tasks_calls = 0
+        self.list_events_calls = 0
+
+    def list_tasks(self, *, limit: int = 100):
+        self.list_tasks_calls += 1
+        return super().list_tasks(limit=limit)
+
+    def list_events(self, task_id: str, **kwargs):
+        self.list_events_calls += 1
+        return super().list_events(task_id, **kwargs)
+
+
+def _analytics_for(repo) -> AnalyticsService:
+    return AnalyticsService(
+        repository=repo,
+        stats_factory=_stats_factory,
+        reason_bucket_fn=_reason_bucket,
+        provider_pattern=re.compile(r'provider=([a-z0-9_-]+)', re.IGNORECASE),
+        parse_iso_datetime_fn=_parse_iso,
+        format_task_day_fn=_format_task_day,
+        merged_event_payload_fn=_merge_payload,
+    )
+
+
+def test_stats_aggregator_applies_changes_incrementally_and_matches_full_scan():
+    repo = _CountingRepo()
+    service = _analytics_for(repo)
+    assert service.stats_aggregator.attached is True
+    t1 = repo.create_task_record(_stream_record())['task_id']
+    t2 = repo.create_task_record(_stream_record())['task_id']
+
+    first = service.get_stats()
+    assert first['total_tasks'] == 2
+    assert repo.list_tasks_calls == 1
+
+    repo.update_task_status(t1, status='failed_system', reason='command_timeout: provider=codex')
+    repo.update_task_status(t2, status='passed', reason='passed')
+    repo.append_event(t2, event_type='prompt_cache_probe', payload={'prefix_reuse_eligible': True, 'prefix_reused': True})
+    repo.append_event(t2, event_type='prompt_cache_break', payload={'reason': 'toolset_changed'})
+    repo.append_event(t2, event_type='discussion', payload={'output': 'ignored'})
+    events_calls = repo.list_events_calls
+
+    stats = service.get_stats()
+    assert repo.list_tasks_calls == 1
+    assert repo.list_events_calls == events_calls
+    assert stats['status_counts'] == {'failed_system': 1, 'passed': 1}
+    assert stats['reason_bucket_counts'] == {'command_timeout': 1, 'passed': 1}
+    assert stats['provider_error_counts'] == {'codex': 1}
+    assert stats['prompt_prefix_reuse_rate_50'] == 1.0
+    assert stats['prompt_cache_break_toolset_50'] == 1
+    assert stats == service._scan_stats()
+
+    repo.delete_tasks([t1])
+    after_delete = service.get_stats()
+    assert after_delete['total_tasks'] == 1
+    assert after_delete['provider_error_counts'] == {}
+
+
+def test_full_scan_stats_take_status_totals_from_the_repository_index():
+    class _CappedRepo(_CountingRepo):
+        def list_tasks(self, *, limit: int = 100):
+            # Stands in for a history larger than the scan cap.
+            return super().list_tasks(limit=1)
+
+    repo = _CappedRepo()
+    service = _analytics_for(repo)
+    for _ in range(3):
+        repo.create_task_record(_stream_record())
+
+    stats = service._scan_stats()
+    assert stats['total_tasks'] == 3
+    assert stats['status_counts'] == {'queued': 3}
+    assert stats['active_tasks'] == 3
+
+
+def test_stats_aggregator_reads_events_outside_lock_and_keeps_concurrent_changes():
+    class _WritingDuringReadRepo(InMemoryTaskRepository):
+        def __init__(self):
+            super().__init__()
+            self.writer_finished: list[bool] = []
+
+        def list_events(self, task_id: str, **kwargs):
+            events = super().list_events(task_id, **kwargs)
+            if not self.writer_finished:
+                writer = threading.Thread(
+                    target=self.append_event,
+                    args=(task_id,),
+                    kwargs={'event_type': 'prompt_cache_break', 'payload': {'reason': 'prefix_changed'}},
+                )
+                writer.start()
+                writer.join(timeout=5)
+                self.writer_finished.append(not writer.is_alive())
+            return events
+
+    repo = _WritingDuringReadRepo()
+    task_id = repo.create_task_record(_stream_record())['task_id']
+    repo.append_event(task_id, event_type='prompt_cache_break', payload={'reason': 'model_changed'})
+    service = _analytics_for(repo)
+
+    stats = service.get_stats()
+
+    assert repo.writer_finished == [True]
+    assert stats['prompt_cache_break_model_50'] == 1
+    assert stats['prompt_cache_break_prefix_50'] == 1
+    assert stats == service._scan_stats()
+
+
+def test_stats_aggregator_rebuild_reloads_prompt_cache_counters():
+    repo = _CountingRepo()
+    service = _analytics_for(repo)
+    task_id = repo.create_task_record(_stream_record())['task_id']
+    repo.append_event(task_id, event_type='prompt_cache_break', payload={'reason': 'model_changed'})
+
+    stats = service.get_stats()
+    assert stats['prompt_cache_break_model_50'] == 1
+
+    repo.events[task_id].clear()
+    assert service.get_stats()['prompt_cache_break_model_50'] == 1
+    service.rebuild_stats()
+    assert service.get_stats()['prompt_cache_break_model_50'] == 0
+    assert repo.list_tasks_calls == 2
+
+
+def test_review_hedge_delays_use_p90_of_successful_reviews_per_provider():
+    repo = InMemoryTaskRepository()
+    service = _analytics_for(repo)
+    task_id = repo.create_task_record(_stream_record())['task_id']
+    for seconds in range(1, 11):
+        repo.append_event(
+            task_id,
+            event_type='review',
+            payload={'participant': 'codex#review-B', 'provider': 'codex', 'duration_seconds': float(seconds)},
+        )
+    repo.append_event(
+        task_id,
+        event_type='review',
+        payload={'participant': 'codex#review-B', 'output': '[review_error] command_timeout', 'duration_seconds': 900.0},
+    )
+    for seconds in (4.0, 5.0):
+        repo.append_event(task_id, event_type='review', payload={'participant': 'claude#review-C', 'duration_seconds': seconds})
+
+    assert service.review_hedge_delays() == {'codex': 9.0}
+    assert service.review_hedge_delays(min_samples=2) == {'claude': 5.0, 'codex': 9.0}
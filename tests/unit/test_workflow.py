@@ -1,10 +1,15 @@
 from __future__ import annotations
 
+from dataclasses import replace
 from datetime import datetime, timedelta, timezone
 import json
 import os
 from pathlib import Path
 import subprocess
+import threading
+import time
+
+import pytest
 
 from awe_agentcheck.adapters import AdapterResult
 from awe_agentcheck.participants import parse_participant_id
@@ -1053,6 +1058,38 @@ def test_shell_command_executor_maps_missing_binary_exception_to_result(monkeypa
     assert 'command_not_found provider=shell' in result.stderr
 
 
+def test_shell_command_executor_run_many_overlaps_commands_and_keeps_order(monkeypatch, tmp_path: Path):
+    barrier = threading.Barrier(2, timeout=5)
+    timeouts: dict[str, int] = {}
+
+    def fake_run(argv, **kwargs):
+        tool = argv[2]
+        timeouts[tool] = kwargs['timeout']
+        # Both commands must be in flight at once to get past the barrier.
+        barrier.wait()
+        if tool == 'ruff':
+            raise subprocess.TimeoutExpired(cmd=argv, timeout=kwargs['timeout'])
+        return subprocess.CompletedProcess(argv, 0, stdout=f'{tool} ok', stderr='')
+
+    monkeypatch.setattr('awe_agentcheck.workflow.subprocess.run', fake_run)
+    executor = ShellCommandExecutor()
+
+    test_result, lint_result = executor.run_many(
+        ['python -m pytest -q', 'python -m ruff check .'],
+        cwd=tmp_path,
+        timeout_seconds=[30, 7],
+    )
+
+    assert test_result.ok is True
+    assert test_result.stdout == 'pytest ok'
+    assert lint_result.ok is False
+    assert lint_result.returncode == 124
+    assert 'timeout_seconds=7' in lint_result.stderr
+    assert timeouts == {'pytest': 30, 'ruff': 7}
+    with pytest.raises(ValueError):
+        executor.run_many(['pytest'], cwd=tmp_path, timeout_seconds=[1, 2])
+
+
 def test_shell_command_executor_preserves_windows_drive_path(monkeypatch):
     import awe_agentcheck.workflow as workflow_module
 
@@ -1886,3 +1923,225 @@ def test_workflow_langgraph_backend_executes_classic_flow(tmp_path: Path):
     assert result.status == 'passed'
     assert any(e.get('type') == 'task_started' for e in sink.events)
     assert runner.calls == 3
+
+
+class ConcurrentReviewRunner:
+    """Author calls return immediately; reviewers block until all of them have started."""
+
+    def __init__(self, *, reviewer_count: int, verdicts: dict[str, str]):
+        self.barrier = threading.Barrier(reviewer_count, timeout=5)
+        self.verdicts = verdicts
+
+    def run(self, *, participant, prompt, cwd, timeout_seconds=900, **kwargs):
+        verdict = self.verdicts.get(participant.participant_id)
+        if verdict is None:
+            return _ok_result()
+        self.barrier.wait()
+        if participant.participant_id == 'claude#review-B':
+            time.sleep(0.05)
+        if verdict == 'raise':
+            raise RuntimeError('reviewer_crashed')
+        return _ok_result(verdict)
+
+
+def _parallel_review_config(tmp_path: Path, *, parallel_reviews: bool = True) -> RunConfig:
+    return RunConfig(
+        task_id='t-parallel-review',
+        title='Parallel reviews',
+        description='reviewers fan out',
+        author=parse_participant_id('codex#author-A'),
+        reviewers=[
+            parse_participant_id('claude#review-B'),
+            parse_participant_id('gemini#review-C'),
+            parse_participant_id('codex#review-D'),
+        ],
+        evolution_level=0,
+        evolve_until=None,
+        cwd=tmp_path,
+        max_rounds=1,
+        test_command='py -m pytest -q',
+        lint_command='py -m ruff check .',
+        parallel_reviews=parallel_reviews,
+    )
+
+
+def test_workflow_parallel_reviews_run_concurrently_and_keep_reviewer_order(tmp_path: Path):
+    runner = ConcurrentReviewRunner(
+        reviewer_count=3,
+        verdicts={'claude#review-B': 'no_blocker', 'gemini#review-C': 'raise', 'codex#review-D': 'no_blocker'},
+    )
+    sink = EventSink()
+    engine = WorkflowEngine(runner=runner, command_executor=FakeCommandExecutor(tests_ok=True, lint_ok=True))
+
+    result = engine.run(_parallel_review_config(tmp_path), on_event=sink)
+
+    reviews = [e for e in sink.events if e.get('type') == 'review']
+    assert [e['participant'] for e in reviews] == ['claude#review-B', 'gemini#review-C', 'codex#review-D']
+    assert [e['verdict'] for e in reviews] == ['no_blocker', 'unknown', 'no_blocker']
+    assert reviews[1]['output'] == '[review_error] reviewer_crashed'
+    assert any(e.get('type') == 'review_error' and e.get('participant') == 'gemini#review-C' for e in sink.events)
+    assert result.status == 'failed_gate'
+
+
+def test_workflow_passes_review_hedge_delay_only_for_known_providers(tmp_path: Path):
+    class _HedgeRecordingRunner:
+        def __init__(self):
+            self.hedges: dict[str, float | None] = {}
+
+        def run(self, *, participant, prompt, cwd, timeout_seconds=900, **kwargs):
+            if participant.alias.startswith('review'):
+                self.hedges[participant.participant_id] = kwargs.get('hedge_delay_seconds')
+                return _ok_result('no_blocker')
+            return _ok_result()
+
+    runner = _HedgeRecordingRunner()
+    engine = WorkflowEngine(
+        runner=runner,
+        command_executor=FakeCommandExecutor(tests_ok=True, lint_ok=True),
+        review_hedge=True,
+    )
+    config = replace(_parallel_review_config(tmp_path, parallel_reviews=False), review_hedge_delays={'claude': 12.5})
+
+    engine.run(config, on_event=EventSink())
+
+    assert runner.hedges == {'claude#review-B': 12.5, 'gemini#review-C': None, 'codex#review-D': None}
+
+
+def test_workflow_records_provider_that_served_the_review(tmp_path: Path):
+    class _HedgedRunner:
+        def run(self, *, participant, prompt, cwd, timeout_seconds=900, **kwargs):
+            if participant.participant_id == 'claude#review-B':
+                # The hedge leg on kimi answered first.
+                return replace(_ok_result('no_blocker'), provider='kimi')
+            return _ok_result('no_blocker')
+
+    sink = EventSink()
+    engine = WorkflowEngine(runner=_HedgedRunner(), command_executor=FakeCommandExecutor(tests_ok=True, lint_ok=True))
+    engine.run(_parallel_review_config(tmp_path, parallel_reviews=False), on_event=sink)
+
+    providers = {e['participant']: e['provider'] for e in sink.events if e.get('type') == 'review'}
+    assert providers == {'claude#review-B': 'kimi', 'gemini#review-C': 'gemini', 'codex#review-D': 'codex'}
+
+
+def test_workflow_parallel_reviews_stop_waiting_when_canceled(tmp_path: Path):
+    class _BlockingReviewRunner:
+        def __init__(self):
+            self.release = threading.Event()
+
+        def run(self, *, participant, prompt, cwd, timeout_seconds=900, **kwargs):
+            if participant.alias.startswith('review'):
+                self.release.wait(5)
+            return _ok_result()
+
+    runner = _BlockingReviewRunner()
+    sink = EventSink()
+    engine = WorkflowEngine(
+        runner=runner,
+        command_executor=FakeCommandExecutor(tests_ok=True, lint_ok=True),
+        workflow_backend='classic',
+    )
+    review_started = threading.Event()
+
+    def on_event(event: dict) -> None:
+        sink(event)
+        if event.get('type') == 'review_started':
+            review_started.set()
+
+    try:
+        result = engine.run(
+            _parallel_review_config(tmp_path),
+            on_event=on_event,
+            should_cancel=lambda: review_started.is_set(),
+        )
+    finally:
+        runner.release.set()
+
+    assert result.status == 'canceled'
+    assert not any(e.get('type') == 'review' for e in sink.events)
+
+
+def test_workflow_parallel_debate_reviews_share_seed_and_merge_in_order(tmp_path: Path):
+    class _DebateRunner:
+        def __init__(self):
+            self.barrier = threading.Barrier(2, timeout=5)
+            self.debate_prompts: dict[str, str] = {}
+            self.discussion_prompts: list[str] = []
+
+        def run(self, *, participant, prompt, cwd, timeout_seconds=900, **kwargs):
+            if prompt.startswith('Debate mode step'):
+                self.debate_prompts[participant.participant_id] = prompt
+                self.barrier.wait()
+                if participant.participant_id == 'claude#review-B':
+                    time.sleep(0.05)
+                    return _ok_result()
+                raise RuntimeError('provider_limit provider=gemini')
+            if participant.participant_id == 'codex#author-A' and not self.discussion_prompts:
+                self.discussion_prompts.append(prompt)
+            return _ok_result()
+
+    runner = _DebateRunner()
+    sink = EventSink()
+    engine = WorkflowEngine(
+        runner=runner,
+        command_executor=FakeCommandExecutor(tests_ok=True, lint_ok=True),
+        parallel_debate=True,
+    )
+    config = replace(
+        _parallel_review_config(tmp_path, parallel_reviews=False),
+        reviewers=[parse_participant_id('claude#review-B'), parse_participant_id('gemini#review-C')],
+        debate_mode=True,
+    )
+
+    result = engine.run(config, on_event=sink)
+
+    assert result.status == 'passed'
+    seeds = {
+        participant: prompt.replace(participant, '<reviewer>')
+        for participant, prompt in runner.debate_prompts.items()
+    }
+    assert seeds['claude#review-B'] == seeds['gemini#review-C']
+    debate_reviews = [e for e in sink.events if e.get('type') == 'debate_review']
+    assert [(e['participant'], e['usable']) for e in debate_reviews] == [
+        ('claude#review-B', True),
+        ('gemini#review-C', False),
+    ]
+    started = next(e for e in sink.events if e.get('type') == 'debate_started')
+    assert started['parallel'] is True
+    completed = next(e for e in sink.events if e.get('type') == 'debate_completed')
+    assert completed['reviewers_total'] == 2
+    assert completed['reviewers_usable'] == 1
+    assert '[claude#review-B]' in runner.discussion_prompts[0]
+
+
+def test_workflow_parallel_reviews_keep_debate_sequential(tmp_path: Path):
+    class _ChainRunner:
+        def __init__(self):
+            self.debate_prompts: dict[str, str] = {}
+
+        def run(self, *, participant, prompt, cwd, timeout_seconds=900, **kwargs):
+            if prompt.startswith('Debate mode step'):
+                self.debate_prompts[participant.participant_id] = prompt
+                return AdapterResult(
+                    output=f'VERDICT: NO_BLOCKER\nInsight from {participant.participant_id} on src/app.py.',
+                    verdict='no_blocker',
+                    next_action=None,
+                    returncode=0,
+                    duration_seconds=0.1,
+                )
+            return _ok_result()
+
+    runner = _ChainRunner()
+    sink = EventSink()
+    engine = WorkflowEngine(runner=runner, command_executor=FakeCommandExecutor(tests_ok=True, lint_ok=True))
+    config = replace(
+        _parallel_review_config(tmp_path),
+        reviewers=[parse_participant_id('claude#review-B'), parse_participant_id('gemini#review-C')],
+        debate_mode=True,
+    )
+
+    engine.run(config, on_event=sink)
+
+    started = next(e for e in sink.events if e.get('type') == 'debate_started')
+    assert started['parallel'] is False
+    # The second reviewer still sees the first reviewer's reply.
+    assert 'Insight from claude#review-B' in runner.debate_prompts['gemini#review-C']
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 from pathlib import Path
+import threading
+import time
 
 import pytest
 
@@ -21,6 +23,8 @@ from awe_agentcheck.workflow_runtime import (
     resolve_model_for_participant,
     resolve_model_params_for_participant,
 )
+from awe_agentcheck.workflow_fanout import fan_out
+from awe_agentcheck.workflow_stream import ParticipantStreamCoalescer, run_participant
 from awe_agentcheck.workflow_text import clip_text, text_signature
 
 
@@ -109,3 +113,102 @@ def test_workflow_text_helpers():
     assert text_signature('Hello   World') == text_signature('hello world')
     long_sig = text_signature('A' * 2000, max_chars=20)
     assert len(long_sig) == 16
+
+
+def test_participant_stream_coalescer_merges_per_stream_by_window_and_size():
+    now = [0.0]
+    events: list[dict] = []
+    coalescer = ParticipantStreamCoalescer(
+        emit=events.append,
+        round_no=2,
+        stage='review',
+        participant='codex#review-B',
+        provider='codex',
+        window_ms=250,
+        max_bytes=16,
+        clock=lambda: now[0],
+    )
+    coalescer('stdout', 'a\n')
+    coalescer('stderr', 'warn\n')
+    coalescer('stdout', 'b\n')
+    coalescer('stdout', '')
+    assert events == []
+
+    now[0] = 0.3
+    coalescer.poll()
+    assert [(e['stream'], e['chunk'], e['chunk_count']) for e in events] == [
+        ('stdout', 'a\nb\n', 2),
+        ('stderr', 'warn\n', 1),
+    ]
+    assert events[0]['type'] == 'participant_stream'
+    assert events[0]['round'] == 2
+    assert events[0]['participant'] == 'codex#review-B'
+
+    events.clear()
+    coalescer('stdout', 'x' * 20)
+    assert [e['chunk_count'] for e in events] == [1]
+    coalescer('stdout', 'tail')
+    coalescer.flush()
+    assert events[-1]['chunk'] == 'tail'
+    coalescer.flush()
+    assert len(events) == 2
+
+
+def test_run_participant_flushes_coalescer_when_runner_returns():
+    events: list[dict] = []
+    coalescer = ParticipantStreamCoalescer(
+        emit=events.append,
+        round_no=1,
+        stage='discussion',
+        participant='claude#author-A',
+        provider='claude',
+        window_ms=60_000,
+    )
+
+    class _Runner:
+        def run(self, **kwargs):
+            kwargs['on_stream']('stdout', 'line-1\n')
+            kwargs['on_stream']('stdout', 'line-2\n')
+            return 'done'
+
+    assert run_participant(_Runner(), participant=None, on_stream=coalescer) == 'done'
+    assert [e['chunk'] for e in events] == ['line-1\nline-2\n']
+
+
+def test_fan_out_keeps_input_order_and_reports_errors_and_timeouts():
+    release = threading.Event()
+
+    def work(item):
+        if item == 'boom':
+            raise ValueError('boom')
+        if item == 'stuck':
+            release.wait(5)
+        return item.upper()
+
+    try:
+        outcomes = fan_out(['a', 'boom', 'stuck', 'b'], work, max_workers=4, timeout_seconds=0.3, poll_seconds=0.05)
+    finally:
+        release.set()
+    assert [o.value for o in outcomes] == ['A', None, None, 'B']
+    assert isinstance(outcomes[1].error, ValueError)
+    assert outcomes[2].timed_out is True
+    assert [o.ok for o in outcomes] == [True, False, False, True]
+    assert fan_out([], work) == []
+
+
+def test_fan_out_stops_running_items_before_returning_on_cancel():
+    stop = threading.Event()
+    started = threading.Event()
+    returned: list[str] = []
+
+    def work(item):
+        started.set()
+        while not stop.is_set():
+            time.sleep(0.01)
+        returned.append(item)
+        return item
+
+    outcomes = fan_out(['a', 'b'], work, max_workers=2, should_cancel=started.is_set, poll_seconds=0.01, stop=stop)
+    assert stop.is_set()
+    assert sorted(returned) == ['a', 'b']
+    assert [o.canceled for o in outcomes] == [True, True]
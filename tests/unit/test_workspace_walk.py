@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from awe_agentcheck.workspace_walk import walk_workspace
+
+
+def test_walk_workspace_prunes_ignored_dirs_before_descending(tmp_path: Path):
+    (tmp_path / 'src' / 'pkg').mkdir(parents=True)
+    (tmp_path / 'src' / 'pkg' / 'mod.py').write_text('x = 1\n', encoding='utf-8')
+    (tmp_path / 'README.md').write_text('readme\n', encoding='utf-8')
+    (tmp_path / 'node_modules' / 'dep').mkdir(parents=True)
+    (tmp_path / 'node_modules' / 'dep' / 'index.js').write_text('', encoding='utf-8')
+    (tmp_path / 'build').mkdir()
+    (tmp_path / 'build' / 'out.bin').write_bytes(b'\x00')
+
+    seen: list[str] = []
+
+    def exclude(rel: str) -> bool:
+        seen.append(rel)
+        return rel == 'build'
+
+    rows = list(walk_workspace(tmp_path, ignore_names={'node_modules'}, exclude=exclude))
+
+    assert [rel for rel, _ in rows] == ['README.md', 'src/pkg/mod.py']
+    assert rows[1][1].st_size == (tmp_path / 'src' / 'pkg' / 'mod.py').stat().st_size
+    assert not any(rel.startswith(('node_modules', 'build/')) for rel in seen)
+
+
+@pytest.mark.skipif(os.name == 'nt', reason='symlinks need extra privileges on Windows')
+def test_walk_workspace_follows_file_links_but_not_directory_links(tmp_path: Path):
+    outside = tmp_path / 'outside'
+    outside.mkdir()
+    (outside / 'secret.txt').write_text('s\n', encoding='utf-8')
+    root = tmp_path / 'root'
+    root.mkdir()
+    (root / 'real.txt').write_text('r\n', encoding='utf-8')
+    (root / 'linked.txt').symlink_to(root / 'real.txt')
+    (root / 'linked-dir').symlink_to(outside, target_is_directory=True)
+
+    assert [rel for rel, _ in walk_workspace(root)] == ['linked.txt', 'real.txt']
+    assert list(walk_workspace(tmp_path / 'missing')) == []
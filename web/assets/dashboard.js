@@ -1412,6 +1412,14 @@ import {
       if (!force && state.eventsByTask.has(taskId)) {
         return state.eventsByTask.get(taskId) || [];
       }
+      const cached = state.eventsByTask.get(taskId) || [];
+      const lastSeq = cached.length ? Number(cached[cached.length - 1].seq || 0) : 0;
+      if (lastSeq > 0) {
+        const tail = await api(`/api/tasks/${taskId}/events?after_seq=${lastSeq}`, { healthImpact: false });
+        const events = tail.length ? cached.concat(tail) : cached;
+        state.eventsByTask.set(taskId, events);
+        return events;
+      }
       const events = await api(`/api/tasks/${taskId}/events`, { healthImpact: false });
       state.eventsByTask.set(taskId, events);
       return events;
@@ -1804,6 +1812,107 @@ import {
       }
     }
 
+    function startIntervalPolling() {
+      if (state.timer) return;
+      state.timer = setInterval(async () => {
+        if (state.pollTickInFlight) {
+          return;
+        }
+        state.pollTickInFlight = true;
+        try {
+          await loadData();
+        } catch {
+        } finally {
+          state.pollTickInFlight = false;
+        }
+      }, 3500);
+    }
+
+    function scheduleLiveRefresh() {
+      if (state.liveRefreshTimer) return;
+      state.liveRefreshTimer = setTimeout(async () => {
+        state.liveRefreshTimer = null;
+        if (state.pollTickInFlight) {
+          scheduleLiveRefresh();
+          return;
+        }
+        state.pollTickInFlight = true;
+        try {
+          await loadData();
+          syncLiveStreamSelection();
+        } catch {
+        } finally {
+          state.pollTickInFlight = false;
+        }
+      }, 1000);
+    }
+
+    function closeLiveStream() {
+      if (state.liveStream) {
+        state.liveStream.close();
+        state.liveStream = null;
+      }
+      state.liveStreamTaskId = null;
+    }
+
+    function appendLiveEvent(row) {
+      const taskId = String((row && row.task_id) || '');
+      if (!taskId) return;
+      const events = state.eventsByTask.get(taskId) || [];
+      const lastSeq = events.length ? Number(events[events.length - 1].seq || 0) : 0;
+      if (Number(row.seq || 0) <= lastSeq) return;
+      events.push(row);
+      state.eventsByTask.set(taskId, events);
+      if (taskId === state.selectedTaskId) {
+        renderDialogue(events);
+      }
+    }
+
+    function openLiveStream() {
+      closeLiveStream();
+      const taskId = state.selectedTaskId || '';
+      const params = new URLSearchParams();
+      if (taskId) {
+        const cached = state.eventsByTask.get(taskId) || [];
+        const lastSeq = cached.length ? Number(cached[cached.length - 1].seq || 0) : 0;
+        params.set('task_id', taskId);
+        params.set('after_seq', String(lastSeq));
+      }
+      const source = new EventSource(`/api/events/stream?${params.toString()}`);
+      state.liveStream = source;
+      state.liveStreamTaskId = taskId || null;
+      source.addEventListener('ready', () => {
+        state.liveStreamFailures = 0;
+      });
+      source.addEventListener('task', () => scheduleLiveRefresh());
+      source.addEventListener('tasks_deleted', () => scheduleLiveRefresh());
+      source.addEventListener('resync', () => {
+        if (taskId) state.eventsByTask.delete(taskId);
+        scheduleLiveRefresh();
+      });
+      source.addEventListener('task_event', (message) => {
+        try {
+          appendLiveEvent(JSON.parse(message.data));
+        } catch {
+        }
+      });
+      source.onerror = () => {
+        state.liveStreamFailures += 1;
+        if (state.liveStreamFailures >= 3) {
+          // Stream keeps failing (proxy, old server): fall back to interval polling.
+          closeLiveStream();
+          startIntervalPolling();
+        }
+      };
+    }
+
+    function syncLiveStreamSelection() {
+      if (!state.liveStream) return;
+      if (state.liveStreamTaskId !== (state.selectedTaskId || null)) {
+        openLiveStream();
+      }
+    }
+
     function setPolling(enabled) {
       state.polling = enabled;
       el.pollBtn.textContent = `Background Refresh: ${enabled ? 'ON' : 'OFF'}`;
@@ -1815,20 +1924,15 @@ import {
         clearInterval(state.timer);
         state.timer = null;
       }
+      closeLiveStream();
+      state.liveStreamFailures = 0;
       state.pollTickInFlight = false;
       if (enabled) {
-        state.timer = setInterval(async () => {
-          if (state.pollTickInFlight) {
-            return;
-          }
-          state.pollTickInFlight = true;
-          try {
-            await loadData();
-          } catch {
-          } finally {
-            state.pollTickInFlight = false;
-          }
-        }, 3500);
+        if (typeof EventSource === 'function') {
+          openLiveStream();
+        } else {
+          startIntervalPolling();
+        }
       }
     }
 
@@ -1999,6 +2103,7 @@ import {
       renderTaskSnapshot();
       renderProjectHistory();
       await refreshConversation({ force: true });
+      syncLiveStreamSelection();
       await refreshGithubSummary({ force: true });
       await refreshPolicyTemplates();
     });
@@ -2020,6 +2125,7 @@ import {
         el.actionStatus.textContent = `Project tree load failed: ${String(err)}`;
       }
       await refreshConversation({ force: true });
+      syncLiveStreamSelection();
       await refreshGithubSummary({ force: true });
       await refreshPolicyTemplates();
     });
@@ -2035,7 +2141,7 @@ import {
       await refreshConversation();
     });
 
-    loadData({ forceEvents: true }).catch((err) => {
+    loadData({ forceEvents: true }).then(() => syncLiveStreamSelection()).catch((err) => {
       setApiHealth(false, String(err));
       el.statsLine.textContent = `Failed to load dashboard: ${String(err)}`;
     });
@@ -41,6 +41,10 @@ export function createInitialState() {
     showStreamDetails: false,
     timer: null,
     pollTickInFlight: false,
+    liveStream: null,
+    liveStreamTaskId: null,
+    liveStreamFailures: 0,
+    liveRefreshTimer: null,
     apiHealthy: false,
     apiFailureCount: 0,
     lastDialogueSignature: '',